@@ -117,3 +117,39 @@ class PermissionDeniedAPIError(APIException):
     status_code = status.HTTP_403_FORBIDDEN
     default_detail = "The user does not have permissions to perform this action."
     default_code = "permission_denied"
+
+
+class ServiceUnavailableAPIError(APIException):
+    """
+    Exception raised when the server is too busy to process the request, the client
+    should retry it after `wait` seconds.
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = (
+        "The server is busy processing other requests. Please try again later."
+    )
+    default_code = "service_unavailable"
+
+    def __init__(
+        self, detail: str | Dict[str, Any] = None, code: str = None, wait: int = 1
+    ) -> None:
+        self.wait = wait
+        super().__init__(detail=detail, code=code)
+
+
+class ThrottledAPIError(APIException):
+    """
+    Exception raised when a client exceeds the rate limit of an operation, the
+    client should retry it after `wait` seconds.
+    """
+
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    default_detail = "Too many attempts. Please try again later."
+    default_code = "throttled"
+
+    def __init__(
+        self, detail: str | Dict[str, Any] = None, code: str = None, wait: int = 1
+    ) -> None:
+        self.wait = wait
+        super().__init__(detail=detail, code=code)
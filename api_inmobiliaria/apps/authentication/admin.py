@@ -1,4 +1,7 @@
-from apps.authentication.models import JWT, JWTBlacklist
+from apps.authentication.models import JWT, JWTBlacklist, RefreshToken
+from apps.authentication.infrastructure.repositories import RefreshTokenRepository
+from django.db.models.query import QuerySet
+from django.http.request import HttpRequest
 from django.contrib import admin
 
 
@@ -31,3 +34,34 @@ class JWTBlacklistedAdminPanel(admin.ModelAdmin):
     search_fields = ["token"]
     readonly_fields = ["date_joined"]
     ordering = ["-date_joined"]
+
+
+@admin.register(RefreshToken)
+class RefreshTokenAdminPanel(admin.ModelAdmin):
+    """
+    Admin panel configuration for the RefreshToken model.
+    """
+
+    list_display = [
+        "id",
+        "user",
+        "family",
+        "expires_at",
+        "used_at",
+        "revoked_at",
+        "date_joined",
+    ]
+    search_fields = ["user__email", "family"]
+    readonly_fields = ["token_hash", "date_joined"]
+    ordering = ["-date_joined"]
+    actions = ["revoke_families"]
+
+    @admin.action(description="Revoke the sessions of the selected tokens")
+    def revoke_families(self, request: HttpRequest, queryset: QuerySet) -> None:
+        families = set(queryset.values_list("family", flat=True))
+        revoked = RefreshTokenRepository.revoke_families(families=families)
+
+        self.message_user(
+            request,
+            f"{revoked} refresh tokens of {len(families)} sessions revoked.",
+        )
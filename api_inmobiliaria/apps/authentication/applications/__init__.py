@@ -1,3 +1,4 @@
 from .login import JWTLogin
 from .logout import JWTLogout
 from .update import JWTUpdate
+from .refresh import JWTRefresh
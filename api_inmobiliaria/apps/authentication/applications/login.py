@@ -1,13 +1,18 @@
 from apps.authentication.typing import JSONWebToken
 from apps.authentication.jwt import AccessToken
+from apps.authentication.interfaces import IRefreshTokenRepository
+from apps.authentication.applications.refresh import JWTRefresh
+from apps.backends import aauthenticate
 from apps.users.constants import USER_ROLE_PERMISSIONS
 from apps.users.models import BaseUser
+from apps.users.activity import ACTIVITY_TRACKER
 from apps.api_exceptions import (
     PermissionDeniedAPIError,
     AuthenticationFailedAPIError,
 )
 from utils.messages import JWTErrorMessages
 from django.contrib.auth import authenticate
+from asgiref.sync import sync_to_async
 from typing import Dict
 
 
@@ -22,6 +27,32 @@ class JWTLogin:
     """
 
     _access_token_class = AccessToken
+    _refresh_class = JWTRefresh
+
+    @classmethod
+    def _authenticate(cls, credentials: Dict[str, str]) -> BaseUser:
+        """
+        Returns the user of the given credentials if they are valid, their account is
+        active and they have permission to authenticate with JSON Web Token.
+        """
+
+        base_user: BaseUser | None = authenticate(**credentials)
+
+        if not base_user:
+            raise AuthenticationFailedAPIError(detail=AUTHENTICATION_FAILED)
+        elif not base_user.is_active:
+            raise AuthenticationFailedAPIError(detail=INACTIVE_ACCOUNT)
+
+        user_role = base_user.content_type.model
+
+        if not base_user.has_perm(
+            perm=USER_ROLE_PERMISSIONS[user_role]["model_level"]["jwt_auth"]
+        ):
+            raise PermissionDeniedAPIError()
+
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
+        return base_user
 
     @classmethod
     def authenticate_user(cls, credentials: Dict[str, str]) -> JSONWebToken:
@@ -37,7 +68,51 @@ class JWTLogin:
         - PermissionDeniedAPIError: If the user does not have the required permissions.
         """
 
-        base_user: BaseUser | None = authenticate(**credentials)
+        return str(cls._access_token_class(user=cls._authenticate(credentials)))
+
+    @classmethod
+    def login(
+        cls,
+        credentials: Dict[str, str],
+        refresh_token_repository: IRefreshTokenRepository,
+    ) -> Dict[str, JSONWebToken]:
+        """
+        Authenticate a user with the given credentials and return the access token
+        along with a refresh token, if they are enabled.
+
+        #### Parameters:
+        - credentials: A dictionary containing the user's credentials.
+        - refresh_token_repository: A repository to store the refresh tokens.
+
+        #### Raises:
+        - AuthenticationFailedAPIError: If the credentials are invalid or the user is
+        inactive.
+        - PermissionDeniedAPIError: If the user does not have the required permissions.
+        """
+
+        base_user = cls._authenticate(credentials=credentials)
+
+        return cls._refresh_class(
+            refresh_token_repository=refresh_token_repository
+        ).issue_tokens(user=base_user)
+
+    @classmethod
+    async def _aauthenticate(cls, credentials: Dict[str, str]) -> BaseUser:
+        """
+        Async counterpart of `_authenticate`. The credentials are checked by the same
+        authentication backends, see `apps.backends.aauthenticate`.
+
+        #### Parameters:
+        - credentials: A dictionary containing the user's credentials.
+
+        #### Raises:
+        - AuthenticationFailedAPIError: If the credentials are invalid or the user is
+        inactive.
+        - PermissionDeniedAPIError: If the user does not have the required permissions.
+        - ServiceUnavailableAPIError: If the password hashing pool is full.
+        """
+
+        base_user: BaseUser | None = await aauthenticate(**credentials)
 
         if not base_user:
             raise AuthenticationFailedAPIError(detail=AUTHENTICATION_FAILED)
@@ -46,9 +121,56 @@ class JWTLogin:
 
         user_role = base_user.content_type.model
 
-        if not base_user.has_perm(
+        if not await sync_to_async(base_user.has_perm)(
             perm=USER_ROLE_PERMISSIONS[user_role]["model_level"]["jwt_auth"]
         ):
             raise PermissionDeniedAPIError()
 
-        return str(cls._access_token_class(user=base_user))
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
+        return base_user
+
+    @classmethod
+    async def aauthenticate_user(cls, credentials: Dict[str, str]) -> JSONWebToken:
+        """
+        Async counterpart of `authenticate_user`.
+
+        #### Parameters:
+        - credentials: A dictionary containing the user's credentials.
+
+        #### Raises:
+        - AuthenticationFailedAPIError: If the credentials are invalid or the user is
+        inactive.
+        - PermissionDeniedAPIError: If the user does not have the required permissions.
+        - ServiceUnavailableAPIError: If the password hashing pool is full.
+        """
+
+        base_user = await cls._aauthenticate(credentials=credentials)
+
+        return str(await cls._access_token_class.afor_user(user=base_user))
+
+    @classmethod
+    async def alogin(
+        cls,
+        credentials: Dict[str, str],
+        refresh_token_repository: IRefreshTokenRepository,
+    ) -> Dict[str, JSONWebToken]:
+        """
+        Async counterpart of `login`.
+
+        #### Parameters:
+        - credentials: A dictionary containing the user's credentials.
+        - refresh_token_repository: A repository to store the refresh tokens.
+
+        #### Raises:
+        - AuthenticationFailedAPIError: If the credentials are invalid or the user is
+        inactive.
+        - PermissionDeniedAPIError: If the user does not have the required permissions.
+        - ServiceUnavailableAPIError: If the password hashing pool is full.
+        """
+
+        base_user = await cls._aauthenticate(credentials=credentials)
+
+        return await cls._refresh_class(
+            refresh_token_repository=refresh_token_repository
+        ).aissue_tokens(user=base_user)
@@ -1,4 +1,6 @@
-from apps.authentication.jwt import AccessToken
+from apps.authentication.jwt import AccessToken, stateless_access_tokens
+from apps.authentication.interfaces import IRefreshTokenRepository
+from apps.authentication.applications.refresh import JWTRefresh
 
 
 class JWTLogout:
@@ -6,13 +8,50 @@ class JWTLogout:
     Use case of logout an authenticated user with JSON Web Token.
     """
 
+    _refresh_class = JWTRefresh
+
     @classmethod
-    def logout_user(cls, access_token: AccessToken) -> None:
+    def logout_user(
+        cls,
+        access_token: AccessToken,
+        refresh_token_repository: IRefreshTokenRepository = None,
+    ) -> None:
         """
-        Logout a user by adding the tokens to the blacklist.
+        Logout a user by adding the tokens to the blacklist and revoking the family
+        of the refresh token issued with the access token. The stateless access
+        tokens are not added to the blacklist, since it is not checked.
 
         #### Parameters:
         - access_token: The access token to be blacklisted.
+        - refresh_token_repository: A repository to revoke the refresh tokens.
+        """
+
+        if not stateless_access_tokens():
+            access_token.blacklist()
+
+        if refresh_token_repository:
+            cls._refresh_class(
+                refresh_token_repository=refresh_token_repository
+            ).revoke(access_token=access_token)
+
+    @classmethod
+    async def alogout_user(
+        cls,
+        access_token: AccessToken,
+        refresh_token_repository: IRefreshTokenRepository = None,
+    ) -> None:
         """
+        Async counterpart of `logout_user`.
+
+        #### Parameters:
+        - access_token: The access token to be blacklisted.
+        - refresh_token_repository: A repository to revoke the refresh tokens.
+        """
+
+        if not stateless_access_tokens():
+            await access_token.ablacklist()
 
-        access_token.blacklist()
+        if refresh_token_repository:
+            await cls._refresh_class(
+                refresh_token_repository=refresh_token_repository
+            ).arevoke(access_token=access_token)
@@ -0,0 +1,191 @@
+from apps.authentication.typing import JSONWebToken
+from apps.authentication.jwt import AccessToken
+from apps.authentication.interfaces import IRefreshTokenRepository
+from apps.authentication.constants import TOKEN_FAMILY_CLAIM
+from apps.users.models import BaseUser
+from apps.api_exceptions import AuthenticationFailedAPIError, JWTAPIError
+from utils.messages import JWTErrorMessages
+from rest_framework_simplejwt.utils import aware_utcnow
+from django.conf import settings
+from typing import Dict, Tuple
+from datetime import datetime
+from uuid import UUID, uuid4
+import hashlib
+import secrets
+
+
+# Error messages
+INVALID_OR_EXPIRED = JWTErrorMessages.INVALID_OR_EXPIRED.value
+REFRESH_REUSED = JWTErrorMessages.REFRESH_REUSED.value
+INACTIVE_ACCOUNT = JWTErrorMessages.INACTIVE_ACCOUNT.value
+
+
+class JWTRefresh:
+    """
+    Use case for issuing and rotating the refresh tokens of the users authenticated
+    with JSON Web Token.
+
+    A refresh token is an opaque random string, only its hash is stored. Each login
+    starts a new family of refresh tokens, and each rotation marks the presented
+    token as used and issues a new one of the same family. If a used token is
+    presented again, it has been stolen or replayed, so the whole family is revoked
+    and the session must be started again.
+    """
+
+    _access_token_class = AccessToken
+
+    def __init__(self, refresh_token_repository: IRefreshTokenRepository) -> None:
+        self._refresh_token_repository = refresh_token_repository
+
+    @staticmethod
+    def get_token_hash(refresh_token: str) -> str:
+        return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+    def _generate(self) -> Tuple[str, str, datetime]:
+        """
+        Returns a new refresh token, its hash and its expiration date.
+        """
+
+        refresh_token = secrets.token_urlsafe(32)
+        expires_at = aware_utcnow() + settings.REFRESH_TOKEN["LIFETIME"]
+
+        return refresh_token, self.get_token_hash(refresh_token), expires_at
+
+    def _new_access_token(self, user: BaseUser, family: UUID) -> AccessToken:
+        """
+        Returns an unsaved access token that carries the family of the refresh token,
+        so the family can be revoked when the user logs out.
+        """
+
+        # A new token does not need to be verified
+        access_token = self._access_token_class(
+            user=user, verify=False, save=False
+        )
+        access_token[TOKEN_FAMILY_CLAIM] = str(family)
+
+        return access_token
+
+    def issue_tokens(
+        self, user: BaseUser, family: UUID = None
+    ) -> Dict[str, JSONWebToken]:
+        """
+        Issues an access token and, if the refresh tokens are enabled in the
+        `REFRESH_TOKEN` setting, a refresh token.
+
+        #### Parameters:
+        - user: An instance of the BaseUser model.
+        - family: The family of the refresh token, a new one by default.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        if not settings.REFRESH_TOKEN["ENABLED"]:
+            return {"access_token": str(self._access_token_class(user=user))}
+
+        family = family or uuid4()
+        refresh_token, token_hash, expires_at = self._generate()
+        self._refresh_token_repository.create(
+            user=user, family=family, token_hash=token_hash, expires_at=expires_at
+        )
+        access_token = self._new_access_token(user=user, family=family)
+        access_token.save()
+
+        return {"access_token": str(access_token), "refresh_token": refresh_token}
+
+    async def aissue_tokens(
+        self, user: BaseUser, family: UUID = None
+    ) -> Dict[str, JSONWebToken]:
+        """
+        Async counterpart of `issue_tokens`.
+
+        #### Parameters:
+        - user: An instance of the BaseUser model.
+        - family: The family of the refresh token, a new one by default.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        if not settings.REFRESH_TOKEN["ENABLED"]:
+            access_token = await self._access_token_class.afor_user(user=user)
+
+            return {"access_token": str(access_token)}
+
+        family = family or uuid4()
+        refresh_token, token_hash, expires_at = self._generate()
+        await self._refresh_token_repository.acreate(
+            user=user, family=family, token_hash=token_hash, expires_at=expires_at
+        )
+        access_token = self._new_access_token(user=user, family=family)
+        await access_token.asave()
+
+        return {"access_token": str(access_token), "refresh_token": refresh_token}
+
+    def rotate(self, refresh_token: str) -> Dict[str, JSONWebToken]:
+        """
+        Exchanges a refresh token for a new access token and a new refresh token of
+        the same family.
+
+        #### Parameters:
+        - refresh_token: The refresh token of the user.
+
+        #### Raises:
+        - JWTAPIError: If the refresh token is invalid, expired or has already been
+        used, in which case its family is revoked.
+        - AuthenticationFailedAPIError: If the user is inactive.
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        token_hash = self.get_token_hash(refresh_token)
+        token = self._refresh_token_repository.get(token_hash=token_hash)
+
+        if not token or token.expires_at <= aware_utcnow():
+            raise JWTAPIError(
+                detail=INVALID_OR_EXPIRED.format(token_type="refresh")
+            )
+
+        if not self._refresh_token_repository.use(token_hash=token_hash):
+            self._refresh_token_repository.revoke_families(families=[token.family])
+
+            raise JWTAPIError(detail=REFRESH_REUSED)
+
+        if not token.user.is_active:
+            raise AuthenticationFailedAPIError(detail=INACTIVE_ACCOUNT)
+
+        return self.issue_tokens(user=token.user, family=token.family)
+
+    def revoke(self, access_token: AccessToken) -> None:
+        """
+        Revokes the family of the refresh token issued with the given access token,
+        if any.
+
+        #### Parameters:
+        - access_token: The access token of the user.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        family = access_token.payload.get(TOKEN_FAMILY_CLAIM)
+
+        if family:
+            self._refresh_token_repository.revoke_families(families=[family])
+
+    async def arevoke(self, access_token: AccessToken) -> None:
+        """
+        Async counterpart of `revoke`.
+
+        #### Parameters:
+        - access_token: The access token of the user.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        family = access_token.payload.get(TOKEN_FAMILY_CLAIM)
+
+        if family:
+            await self._refresh_token_repository.arevoke_families(
+                families=[family]
+            )
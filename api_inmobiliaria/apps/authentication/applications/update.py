@@ -4,15 +4,19 @@ from apps.authentication.interfaces import IJWTRepository
 from apps.users.interfaces import IUserRepository
 from apps.api_exceptions import ResourceNotFoundAPIError
 from utils.messages import JWTErrorMessages
+from django.conf import settings
 
 
 USER_NOT_FOUND = JWTErrorMessages.USER_NOT_FOUND.value
+UPDATE_DISABLED = JWTErrorMessages.UPDATE_DISABLED.value
 
 
 class JWTUpdate:
     """
     Use case for creating a new access token for a user authenticated with JSON Web
-    Token.
+    Token. It is disabled when the refresh tokens are enabled in the `REFRESH_TOKEN`
+    setting, since its access tokens would not belong to the family of a refresh
+    token and could not be revoked with it.
     """
 
     _access_token_class = AccessToken
@@ -23,6 +27,21 @@ class JWTUpdate:
         self._jwt_repository = jwt_repository
         self._user_repository = user_repository
 
+    @staticmethod
+    def check_enabled() -> None:
+        """
+        Check that the refresh tokens are disabled.
+
+        #### Raises:
+        - ResourceNotFoundAPIError: If the refresh tokens are enabled.
+        """
+
+        if settings.REFRESH_TOKEN["ENABLED"]:
+            raise ResourceNotFoundAPIError(
+                code=UPDATE_DISABLED["code"],
+                detail=UPDATE_DISABLED["detail"],
+            )
+
     def new_tokens(self, access_token: AccessToken) -> JSONWebToken:
         """
         Update the user access token.
@@ -31,9 +50,11 @@ class JWTUpdate:
         - access_token: The user access token.
 
         #### Raises:
-        - ResourceNotFoundAPIError: If the user does not exist.
+        - ResourceNotFoundAPIError: If the user does not exist, or if the refresh
+        tokens are enabled.
         """
 
+        self.check_enabled()
         base_user = self._user_repository.get_base_data(
             uuid=access_token.payload["user_uuid"], is_active=True
         )
@@ -45,3 +66,28 @@ class JWTUpdate:
             )
 
         return str(self._access_token_class(user=base_user))
+
+    async def anew_tokens(self, access_token: AccessToken) -> JSONWebToken:
+        """
+        Async counterpart of `new_tokens`.
+
+        #### Parameters:
+        - access_token: The user access token.
+
+        #### Raises:
+        - ResourceNotFoundAPIError: If the user does not exist, or if the refresh
+        tokens are enabled.
+        """
+
+        self.check_enabled()
+        base_user = await self._user_repository.aget_base_data(
+            uuid=access_token.payload["user_uuid"], is_active=True
+        )
+
+        if not base_user:
+            raise ResourceNotFoundAPIError(
+                code=USER_NOT_FOUND["code"],
+                detail=USER_NOT_FOUND["detail"],
+            )
+
+        return str(await self._access_token_class.afor_user(user=base_user))
@@ -0,0 +1,45 @@
+from apps.authentication.jwt import AccessToken
+from apps.users.infrastructure.repositories import UserRepository
+from apps.users.constants import UserRoles
+from apps.monitoring.benchmarks import Operation, get_client, check_response
+from rest_framework_simplejwt.utils import aware_utcnow
+from django.urls import reverse
+from uuid import uuid4
+
+
+def update_token() -> Operation:
+    """
+    Requests a new access token to `/auth/update` with an expired access token of
+    an active user, with the middleware of the project.
+    """
+
+    base_user = UserRepository.create(
+        data={
+            "base_data": {
+                "email": f"benchmark-{uuid4().hex}@example.com",
+                "password": uuid4().hex,
+            },
+            "role_data": {
+                "name": "Benchmark",
+                "last_name": "Benchmark",
+            },
+        },
+        user_role=UserRoles.SEARCHER.value,
+    )
+    base_user.is_active = True
+    base_user.save(update_fields=["is_active"])
+
+    access_token = AccessToken(user=base_user, save=False)
+    access_token.set_exp(from_time=aware_utcnow() - 2 * access_token.lifetime)
+
+    client = get_client()
+    path = reverse(viewname="update_jwt")
+    data = {"access_token": str(access_token)}
+
+    def operation() -> None:
+        response = client.post(
+            path=path, data=data, content_type="application/json"
+        )
+        check_response(response=response)
+
+    return operation
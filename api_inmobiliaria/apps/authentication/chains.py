@@ -0,0 +1,68 @@
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+from django.utils.module_loading import import_string
+from django.conf import settings
+from functools import lru_cache
+from typing import Any, List, Tuple, Type
+
+
+@lru_cache(maxsize=None)
+def _import_classes(paths: Tuple[str, ...]) -> List[Type[BaseAuthentication]]:
+    return [import_string(path) for path in paths]
+
+
+def get_authentication_classes(path: str) -> List[Type[BaseAuthentication]]:
+    """
+    Returns the authentication classes of the chain of the `AUTHENTICATION_CHAINS`
+    setting whose prefix is the longest one that the given path starts with, none if
+    no prefix matches.
+
+    #### Parameters:
+    - path: The path of the request, without the script prefix.
+    """
+
+    chains = settings.AUTHENTICATION_CHAINS
+    prefix = max(
+        (prefix for prefix in chains if path.startswith(prefix)),
+        key=len,
+        default=None,
+    )
+
+    if prefix is None:
+        return []
+
+    return _import_classes(tuple(chains[prefix]))
+
+
+class PathAuthentication(BaseAuthentication):
+    """
+    Authenticates the requests of the views that use the default authentication
+    classes with the chain of the `AUTHENTICATION_CHAINS` setting that matches the
+    path of the request. The API only accepts JWTs, so its anonymous requests do not
+    look up a session in the database.
+    """
+
+    def get_authenticators(self, request: Request) -> List[BaseAuthentication]:
+        return [
+            authentication_class()
+            for authentication_class in get_authentication_classes(
+                path=request._request.path_info
+            )
+        ]
+
+    def authenticate(self, request: Request) -> Tuple[Any, Any] | None:
+        for authenticator in self.get_authenticators(request=request):
+            user_auth_tuple = authenticator.authenticate(request)
+
+            if user_auth_tuple is not None:
+                return user_auth_tuple
+
+        return None
+
+    def authenticate_header(self, request: Request) -> str | None:
+        authenticators = self.get_authenticators(request=request)
+
+        if not authenticators:
+            return None
+
+        return authenticators[0].authenticate_header(request)
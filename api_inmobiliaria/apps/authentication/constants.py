@@ -1,4 +1,17 @@
+from enum import Enum
 from datetime import timedelta
 
 
 ACCESS_TOKEN_LIFETIME = timedelta(hours=2)
+
+# Claim of the access tokens with the family of the refresh token issued with them
+TOKEN_FAMILY_CLAIM = "token_family"
+
+
+class TokenStatus(Enum):
+    """
+    Status of a JSON Web Token whose signature has been verified.
+    """
+
+    VALID = "valid"
+    EXPIRED = "expired"
@@ -0,0 +1,50 @@
+from apps.users.models import BaseUser
+from utils.executors import BoundedExecutor
+from django.contrib.auth.hashers import make_password, verify_password
+
+
+# PBKDF2 releases the GIL, so the hashes run in parallel in the threads of the pool
+password_hashing_executor = BoundedExecutor(setting_name="PASSWORD_HASHING_POOL")
+
+
+async def acheck_password(user: BaseUser, raw_password: str) -> bool:
+    """
+    Async counterpart of `BaseUser.check_password`, the password is hashed in the
+    password hashing pool. If the hash of the user uses outdated parameters, it is
+    updated.
+
+    #### Parameters:
+    - user: An instance of the BaseUser model, with its password loaded.
+    - raw_password: The password to check.
+
+    #### Raises:
+    - ServiceUnavailableAPIError: If the password hashing pool is full.
+    """
+
+    is_correct, must_update = await password_hashing_executor.run(
+        verify_password, raw_password, user.password
+    )
+
+    if is_correct and must_update:
+        user.password = await password_hashing_executor.run(
+            make_password, raw_password
+        )
+        await user.asave(update_fields=["password"])
+
+    return is_correct
+
+
+async def ahash_password(raw_password: str) -> None:
+    """
+    Hashes a password in the password hashing pool and discards the result. It is
+    used when the user does not exist, to reduce the timing difference with an
+    existing user.
+
+    #### Parameters:
+    - raw_password: The password to hash.
+
+    #### Raises:
+    - ServiceUnavailableAPIError: If the password hashing pool is full.
+    """
+
+    await password_hashing_executor.run(make_password, raw_password)
@@ -1 +1,4 @@
 from .jwt import JWTRepository
+from .cache import CacheJWTRepository
+from .refresh import RefreshTokenRepository
+from .registry import get_jwt_repository, JWT_REPOSITORY_BACKENDS
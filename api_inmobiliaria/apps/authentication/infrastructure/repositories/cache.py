@@ -0,0 +1,210 @@
+from apps.authentication.models import JWT
+from apps.authentication.typing import JSONWebToken, JWTPayload
+from apps.users.models import BaseUser
+from rest_framework_simplejwt.utils import (
+    datetime_from_epoch,
+    datetime_to_epoch,
+    aware_utcnow,
+)
+from django.core.cache import caches, BaseCache
+from django.conf import settings
+from typing import Any, Dict
+from math import ceil
+
+
+class CacheJWTRepository:
+    """
+    CacheJWTRepository is a class that provides an abstraction of the operations
+    related to a JSON Web Token over a Django cache, selected with the
+    `CACHE_ALIAS` of the `JWT_REPOSITORY` setting.
+
+    Each outstanding or blacklisted token is stored with a timeout equal to the
+    remaining lifetime of the token, so the cache removes it when the token expires
+    and the `flushexpiredjwt` command is not needed. The cache must be shared by all
+    the processes of the server, for example a file based cache, a locmem cache is
+    only suitable for a single process.
+    """
+
+    _jwt_model = JWT
+    _outstanding_prefix = "jwt:outstanding"
+    _blacklist_prefix = "jwt:blacklist"
+
+    @classmethod
+    def _get_cache(cls) -> BaseCache:
+        return caches[settings.JWT_REPOSITORY["CACHE_ALIAS"]]
+
+    @staticmethod
+    def _get_timeout(expires_at: int) -> int:
+        """
+        Returns the seconds until the given expiration timestamp, at least one so the
+        cache does not store the value without expiration.
+        """
+
+        return max(ceil(expires_at - datetime_to_epoch(dt=aware_utcnow())), 1)
+
+    @classmethod
+    def _get_jti(cls, filters: Dict[str, Any]) -> str:
+        """
+        Returns the JTI of the lookup, the only filter supported by a cache.
+        """
+
+        if set(filters) != {"jti"}:
+            raise ValueError(
+                f"{cls.__name__} only supports lookups by jti, got {', '.join(filters)}."
+            )
+
+        return filters["jti"]
+
+    @classmethod
+    def _to_model(cls, jti: str, data: Dict[str, Any] | None) -> JWT | None:
+        """
+        Returns an unsaved instance of the `JWT` model with the cached data.
+        """
+
+        if data is None:
+            return None
+
+        return cls._jwt_model(
+            jti=jti,
+            token=data["token"],
+            user_id=data["user"],
+            expires_at=datetime_from_epoch(ts=data["exp"]),
+        )
+
+    @staticmethod
+    def _to_data(
+        token: JSONWebToken, payload: JWTPayload, user: BaseUser
+    ) -> Dict[str, Any]:
+        return {
+            "token": token,
+            "user": str(user.uuid) if user and user.uuid else None,
+            "exp": payload["exp"],
+        }
+
+    @classmethod
+    def get(cls, **filters) -> JWT:
+        """
+        Retrieve an outstanding JWT by its JTI.
+
+        #### Parameters:
+        - filters: The `jti` of the token.
+
+        #### Raises:
+        - ValueError: If the token is looked up by another field.
+        """
+
+        jti = cls._get_jti(filters=filters)
+        data = cls._get_cache().get(f"{cls._outstanding_prefix}:{jti}")
+
+        return cls._to_model(jti=jti, data=data)
+
+    @classmethod
+    def add_checklist(
+        cls, token: JSONWebToken, payload: JWTPayload, user: BaseUser
+    ) -> None:
+        """
+        Associate a JSON Web Token with a user by adding it to the checklist.
+
+        #### Parameters:
+        - token: A JSONWebToken.
+        - payload: The payload of the token.
+        - user: An instance of the BaseUser model.
+        """
+
+        cls._get_cache().set(
+            f"{cls._outstanding_prefix}:{payload['jti']}",
+            cls._to_data(token=token, payload=payload, user=user),
+            timeout=cls._get_timeout(expires_at=payload["exp"]),
+        )
+
+    @classmethod
+    def add_blacklist(cls, token: JWT) -> None:
+        """
+        Invalidates a JSON Web Token by adding it to the blacklist until it expires.
+
+        #### Parameters:
+        - token: An instance of the `JWT` model.
+        """
+
+        cls._get_cache().set(
+            f"{cls._blacklist_prefix}:{token.jti}",
+            True,
+            timeout=cls._get_timeout(
+                expires_at=datetime_to_epoch(dt=token.expires_at)
+            ),
+        )
+
+    @classmethod
+    def exists_in_blacklist(cls, jti: str) -> bool:
+        """
+        Check if a token exists in the blacklist.
+
+        #### Parameters:
+        - jti: The JTI of the token.
+        """
+
+        return cls._get_cache().has_key(f"{cls._blacklist_prefix}:{jti}")
+
+    @classmethod
+    async def aget(cls, **filters) -> JWT:
+        """
+        Async counterpart of `get`.
+
+        #### Parameters:
+        - filters: The `jti` of the token.
+
+        #### Raises:
+        - ValueError: If the token is looked up by another field.
+        """
+
+        jti = cls._get_jti(filters=filters)
+        data = await cls._get_cache().aget(f"{cls._outstanding_prefix}:{jti}")
+
+        return cls._to_model(jti=jti, data=data)
+
+    @classmethod
+    async def aadd_checklist(
+        cls, token: JSONWebToken, payload: JWTPayload, user: BaseUser
+    ) -> None:
+        """
+        Async counterpart of `add_checklist`.
+
+        #### Parameters:
+        - token: A JSONWebToken.
+        - payload: The payload of the token.
+        - user: An instance of the BaseUser model.
+        """
+
+        await cls._get_cache().aset(
+            f"{cls._outstanding_prefix}:{payload['jti']}",
+            cls._to_data(token=token, payload=payload, user=user),
+            timeout=cls._get_timeout(expires_at=payload["exp"]),
+        )
+
+    @classmethod
+    async def aadd_blacklist(cls, token: JWT) -> None:
+        """
+        Async counterpart of `add_blacklist`.
+
+        #### Parameters:
+        - token: An instance of the `JWT` model.
+        """
+
+        await cls._get_cache().aset(
+            f"{cls._blacklist_prefix}:{token.jti}",
+            True,
+            timeout=cls._get_timeout(
+                expires_at=datetime_to_epoch(dt=token.expires_at)
+            ),
+        )
+
+    @classmethod
+    async def aexists_in_blacklist(cls, jti: str) -> bool:
+        """
+        Async counterpart of `exists_in_blacklist`.
+
+        #### Parameters:
+        - jti: The JTI of the token.
+        """
+
+        return await cls._get_cache().ahas_key(f"{cls._blacklist_prefix}:{jti}")
@@ -112,3 +112,96 @@ class JWTRepository:
             # In the future, a retry system will be implemented when the database is
             # suddenly unavailable.
             raise DatabaseConnectionAPIError()
+
+    @classmethod
+    async def aget(cls, **filters) -> JWT:
+        """
+        Async counterpart of `get`.
+
+        #### Parameters:
+        - filters: Keyword arguments that define the filters to apply.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            token = (
+                await cls._jwt_model.objects.select_related("user")
+                .filter(**filters)
+                .afirst()
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+        return token
+
+    @classmethod
+    async def aadd_checklist(
+        cls, token: JSONWebToken, payload: JWTPayload, user: BaseUser
+    ) -> None:
+        """
+        Async counterpart of `add_checklist`.
+
+        #### Parameters:
+        - token: A JSONWebToken.
+        - payload: The payload of the token.
+        - user: An instance of the BaseUser model.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            await cls._jwt_model.objects.acreate(
+                jti=payload["jti"],
+                token=token,
+                user=user,
+                expires_at=datetime_from_epoch(ts=payload["exp"]),
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+    @classmethod
+    async def aadd_blacklist(cls, token: JWT) -> None:
+        """
+        Async counterpart of `add_blacklist`.
+
+        #### Parameters:
+        - token: An instance of the `JWT` model.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            await cls._blacklist_model.objects.acreate(token=token)
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+    @classmethod
+    async def aexists_in_blacklist(cls, jti: str) -> bool:
+        """
+        Async counterpart of `exists_in_blacklist`.
+
+        #### Parameters:
+        - jti: The JTI of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            return await cls._blacklist_model.objects.filter(
+                token__jti=jti
+            ).aexists()
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
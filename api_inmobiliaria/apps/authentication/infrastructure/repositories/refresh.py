@@ -0,0 +1,171 @@
+from apps.authentication.models import RefreshToken
+from apps.users.models import BaseUser
+from apps.api_exceptions import DatabaseConnectionAPIError
+from rest_framework_simplejwt.utils import aware_utcnow
+from django.db import OperationalError
+from typing import Iterable
+from datetime import datetime
+from uuid import UUID
+
+
+class RefreshTokenRepository:
+    """
+    RefreshTokenRepository is a class that provides an abstraction of the database
+    operations or queries related to a refresh token.
+    """
+
+    _model = RefreshToken
+
+    @classmethod
+    def create(
+        cls, user: BaseUser, family: UUID, token_hash: str, expires_at: datetime
+    ) -> RefreshToken:
+        """
+        Stores a new refresh token of the given family.
+
+        #### Parameters:
+        - user: An instance of the BaseUser model.
+        - family: The family of the token.
+        - token_hash: The hash of the token.
+        - expires_at: The expiration date of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            return cls._model.objects.create(
+                user=user,
+                family=family,
+                token_hash=token_hash,
+                expires_at=expires_at,
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+    @classmethod
+    def get(cls, token_hash: str) -> RefreshToken | None:
+        """
+        Retrieve a refresh token along with its user.
+
+        #### Parameters:
+        - token_hash: The hash of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            return (
+                cls._model.objects.select_related("user")
+                .filter(token_hash=token_hash)
+                .first()
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+    @classmethod
+    def use(cls, token_hash: str) -> bool:
+        """
+        Marks a refresh token as used with a conditional update, so only one of the
+        concurrent requests that present the same token can rotate it. Returns
+        whether the token was marked, that is, whether it was valid and unused.
+
+        #### Parameters:
+        - token_hash: The hash of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        now = aware_utcnow()
+
+        try:
+            updated = cls._model.objects.filter(
+                token_hash=token_hash,
+                used_at__isnull=True,
+                revoked_at__isnull=True,
+                expires_at__gt=now,
+            ).update(used_at=now)
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+        return updated == 1
+
+    @classmethod
+    def revoke_families(cls, families: Iterable[UUID]) -> int:
+        """
+        Revokes all the refresh tokens of the given families with a single update,
+        returns the number of tokens revoked.
+
+        #### Parameters:
+        - families: The families to revoke.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            return cls._model.objects.filter(
+                family__in=list(families), revoked_at__isnull=True
+            ).update(revoked_at=aware_utcnow())
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+    @classmethod
+    async def acreate(
+        cls, user: BaseUser, family: UUID, token_hash: str, expires_at: datetime
+    ) -> RefreshToken:
+        """
+        Async counterpart of `create`.
+
+        #### Parameters:
+        - user: An instance of the BaseUser model.
+        - family: The family of the token.
+        - token_hash: The hash of the token.
+        - expires_at: The expiration date of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            return await cls._model.objects.acreate(
+                user=user,
+                family=family,
+                token_hash=token_hash,
+                expires_at=expires_at,
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+    @classmethod
+    async def arevoke_families(cls, families: Iterable[UUID]) -> int:
+        """
+        Async counterpart of `revoke_families`.
+
+        #### Parameters:
+        - families: The families to revoke.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            return await cls._model.objects.filter(
+                family__in=list(families), revoked_at__isnull=True
+            ).aupdate(revoked_at=aware_utcnow())
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
@@ -0,0 +1,30 @@
+from apps.authentication.interfaces import IJWTRepository
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from django.conf import settings
+from typing import Dict
+
+
+# Backends that can be selected by name in the `JWT_REPOSITORY` setting
+JWT_REPOSITORY_BACKENDS: Dict[str, str] = {
+    "sql": "apps.authentication.infrastructure.repositories.jwt.JWTRepository",
+    "cache": "apps.authentication.infrastructure.repositories.cache.CacheJWTRepository",
+}
+
+
+def get_jwt_repository() -> IJWTRepository:
+    """
+    Returns the JWT repository selected by the `BACKEND` of the `JWT_REPOSITORY`
+    setting, which is the name of a registered backend or the dotted path of a
+    class that implements `IJWTRepository`.
+
+    #### Raises:
+    - ImproperlyConfigured: If the backend can not be imported.
+    """
+
+    backend = settings.JWT_REPOSITORY["BACKEND"]
+
+    try:
+        return import_string(JWT_REPOSITORY_BACKENDS.get(backend, backend))
+    except ImportError:
+        raise ImproperlyConfigured(f"Unknown JWT repository backend: {backend}.")
@@ -1,2 +1,7 @@
-from .serializers import LoginSerializerSchema, UpdateTokenSerializerSchema
-from .views import LoginSchema, LogoutSchema, UpdateTokenSchema
+from .serializers import (
+    LoginSerializerSchema,
+    UpdateTokenSerializerSchema,
+    RefreshTokenSerializerSchema,
+)
+from .views import LoginSchema, LogoutSchema, UpdateTokenSchema, RefreshTokenSchema
+from .extensions import JWTAuth
@@ -0,0 +1,25 @@
+from drf_spectacular.extensions import OpenApiAuthenticationExtension
+from drf_spectacular.openapi import AutoSchema
+from typing import Dict
+
+
+class JWTAuth(OpenApiAuthenticationExtension):
+    """
+    This class is used to add the JWT authentication schema to the OpenAPI documentation.
+    """
+
+    target_class = "apps.authentication.jwt.JWTAuthentication"
+    name = "JWTAuth"
+    match_subclasses = True
+
+    def get_security_definition(self, auto_schema: AutoSchema) -> Dict[str, str]:
+        """
+        This method is used to return the JWT authentication schema.
+        """
+
+        return {
+            "type": "http",
+            "scheme": "bearer",
+            "bearerFormat": "JWT",
+            "description": "To use endpoints that employ **JSON Web Token** as an authentication tool, you must enter the access token you obtained when using the endpoint (`POST api/v1/user/jwt/login/`).\n\n**Example:**\n\n<access_token>",
+        }
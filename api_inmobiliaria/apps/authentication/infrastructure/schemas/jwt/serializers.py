@@ -34,3 +34,18 @@ UpdateTokenSerializerSchema = extend_schema_serializer(
         ),
     ],
 )
+
+
+RefreshTokenSerializerSchema = extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            name="data_valid",
+            summary="Valid data for the request.",
+            description="Valid data for the request. The following validations will be applied:\n- **Refresh token:** It is required, must not be expired and must not have been used before.",
+            value={
+                "refresh_token": "Xq8Jw5N0m2Zc4v7yB1tR9sL3kD6hF0gP2aE5uI8oQ1w",
+            },
+            request_only=True,
+        ),
+    ],
+)
@@ -1 +1 @@
-from .jwt import LoginSerializer, UpdateTokenSerializer
+from .jwt import LoginSerializer, UpdateTokenSerializer, RefreshTokenSerializer
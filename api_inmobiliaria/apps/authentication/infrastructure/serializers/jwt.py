@@ -1,19 +1,14 @@
-from apps.authentication.infrastructure.schemas.jwt import (
-    UpdateTokenSerializerSchema,
-    LoginSerializerSchema,
-)
 from apps.authentication.jwt import AccessToken
 from apps.users.constants import BaseUserProperties
+from apps.docs.decorators import lazy_schema
 from utils.messages import (
     ErrorMessagesSerializer,
     JWTErrorMessages,
     ERROR_MESSAGES,
 )
 from apps.api_exceptions import JWTAPIError
-from settings.environments.base import SIMPLE_JWT
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework import serializers
-from jwt import decode, DecodeError, ExpiredSignatureError
 
 
 # Base user properties
@@ -21,11 +16,12 @@ EMAIL_MAX_LENGTH = BaseUserProperties.EMAIL_MAX_LENGTH.value
 PASSWORD_MAX_LENGTH = BaseUserProperties.PASSWORD_MAX_LENGTH.value
 
 # Error messages
-INVALID_OR_EXPIRED = JWTErrorMessages.INVALID_OR_EXPIRED.value
 ACCESS_NOT_EXPIRED = JWTErrorMessages.ACCESS_NOT_EXPIRED.value
 
 
-@LoginSerializerSchema
+@lazy_schema(
+    path="apps.authentication.infrastructure.schemas.jwt.LoginSerializerSchema"
+)
 class LoginSerializer(ErrorMessagesSerializer, serializers.Serializer):
     """
     Handles the data for user authentication. Checks that the provided email and
@@ -52,7 +48,9 @@ class LoginSerializer(ErrorMessagesSerializer, serializers.Serializer):
     )
 
 
-@UpdateTokenSerializerSchema
+@lazy_schema(
+    path="apps.authentication.infrastructure.schemas.jwt.UpdateTokenSerializerSchema"
+)
 class UpdateTokenSerializer(serializers.Serializer):
     """
     Handles data to update access token of a user.
@@ -60,9 +58,18 @@ class UpdateTokenSerializer(serializers.Serializer):
 
     access_token = serializers.CharField(required=True)
 
-    def __init__(self, **kwargs) -> None:
+    def __init__(self, check_blacklist: bool = True, **kwargs) -> None:
+        """
+        Initializes the serializer.
+
+        #### Parameters:
+        - check_blacklist: Whether the blacklist is checked during the validation,
+        the async views check it afterwards with the async ORM.
+        """
+
         super().__init__(**kwargs)
         self.access_token_class = AccessToken
+        self.check_blacklist = check_blacklist
 
     def validate_access_token(self, value: str) -> AccessToken:
         """
@@ -70,25 +77,35 @@ class UpdateTokenSerializer(serializers.Serializer):
         """
 
         try:
-            decode(
-                jwt=value,
-                key=SIMPLE_JWT["SIGNING_KEY"],
-                algorithms=[SIMPLE_JWT["ALGORITHM"]],
-            )
-        except ExpiredSignatureError:
-            access_token = self.access_token_class(token=value, verify=False)
-
-            try:
-                access_token.check_blacklist()
-            except TokenError as exc:
-                raise JWTAPIError(detail=exc.args[0])
+            parsed_token = self.access_token_class.parse(token=value)
+        except TokenError as exc:
+            raise JWTAPIError(detail=exc.args[0])
+
+        if not parsed_token.expired:
+            raise JWTAPIError(detail=ACCESS_NOT_EXPIRED)
 
+        # The payload is reused, the token is not decoded again
+        access_token = self.access_token_class(
+            token=value, payload=parsed_token.payload, verify=False
+        )
+
+        if not self.check_blacklist:
             return access_token
-        except DecodeError:
-            message = INVALID_OR_EXPIRED
 
-            raise JWTAPIError(
-                detail=message.format(token_type=AccessToken.token_type)
-            )
+        try:
+            access_token.check_blacklist()
+        except TokenError as exc:
+            raise JWTAPIError(detail=exc.args[0])
+
+        return access_token
+
+
+@lazy_schema(
+    path="apps.authentication.infrastructure.schemas.jwt.RefreshTokenSerializerSchema"
+)
+class RefreshTokenSerializer(serializers.Serializer):
+    """
+    Handles the data to rotate the refresh token of a user.
+    """
 
-        raise JWTAPIError(detail=ACCESS_NOT_EXPIRED)
+    refresh_token = serializers.CharField(required=True, max_length=128)
@@ -1,25 +1,46 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
+    AsyncLoginAPIView,
+    AsyncLogoutAPIView,
+    AsyncUpdateTokenAPIView,
     UpdateTokenAPIView,
     LoginAPIView,
     LogoutAPIView,
+    RefreshTokenAPIView,
 )
 
 
+if settings.ASYNC_AUTHENTICATION_VIEWS:
+    # Async variants for ASGI deployments
+    login_view = AsyncLoginAPIView.as_view()
+    update_view = AsyncUpdateTokenAPIView.as_view()
+    logout_view = AsyncLogoutAPIView.as_view()
+else:
+    login_view = LoginAPIView.as_view()
+    update_view = UpdateTokenAPIView.as_view()
+    logout_view = LogoutAPIView.as_view()
+
+
 urlpatterns = [
     path(
         route="jwt/login/",
-        view=LoginAPIView.as_view(),
+        view=login_view,
         name="login_jwt",
     ),
     path(
         route="jwt/update/",
-        view=UpdateTokenAPIView.as_view(),
+        view=update_view,
         name="update_jwt",
     ),
+    path(
+        route="jwt/refresh/",
+        view=RefreshTokenAPIView.as_view(),
+        name="refresh_jwt",
+    ),
     path(
         route="jwt/logout/",
-        view=LogoutAPIView.as_view(),
+        view=logout_view,
         name="logout_jwt",
     ),
 ]
@@ -1 +1,9 @@
-from .jwt import LoginAPIView, LogoutAPIView, UpdateTokenAPIView
+from .jwt import (
+    AsyncLoginAPIView,
+    AsyncLogoutAPIView,
+    AsyncUpdateTokenAPIView,
+    LoginAPIView,
+    LogoutAPIView,
+    RefreshTokenAPIView,
+    UpdateTokenAPIView,
+)
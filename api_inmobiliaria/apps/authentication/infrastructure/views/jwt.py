@@ -1,23 +1,33 @@
-from apps.authentication.infrastructure.repositories import JWTRepository
+from apps.authentication.infrastructure.repositories import (
+    RefreshTokenRepository,
+    get_jwt_repository,
+)
 from apps.authentication.infrastructure.serializers import (
+    RefreshTokenSerializer,
     UpdateTokenSerializer,
     LoginSerializer,
 )
-from apps.authentication.infrastructure.schemas.jwt import (
-    UpdateTokenSchema,
-    LoginSchema,
-    LogoutSchema,
+from apps.authentication.applications import (
+    JWTRefresh,
+    JWTLogout,
+    JWTLogin,
+    JWTUpdate,
 )
-from apps.authentication.applications import JWTLogout, JWTLogin, JWTUpdate
 from apps.authentication.jwt import JWTAuthentication
 from apps.users.infrastructure.repositories import UserRepository
-from utils.views import PermissionMixin
+from apps.api_exceptions import JWTAPIError
+from apps.docs.decorators import lazy_schema
+from utils.views import AsyncAPIView, PermissionMixin
+from utils.throttling import SlidingWindowRateLimiter, get_client_ip
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework.request import Request
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework import status
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse
 
 
 class LoginAPIView(TokenObtainPairView):
@@ -32,8 +42,12 @@ class LoginAPIView(TokenObtainPairView):
     permission_classes = [AllowAny]
     serializer_class = LoginSerializer
     application_class = JWTLogin
+    rate_limiter = SlidingWindowRateLimiter(scope="login")
+    query_budget = 8
+    # The tokens are secrets, see `CompressionMiddleware`
+    compress_response = False
 
-    @LoginSchema
+    @lazy_schema(path="apps.authentication.infrastructure.schemas.jwt.LoginSchema")
     def post(self, request: Request, *args, **kwargs) -> Response:
         """
         Handle POST requests for user authentication.
@@ -56,12 +70,18 @@ class LoginAPIView(TokenObtainPairView):
                 content_type="application/json",
             )
 
-        access_token = self.application_class.authenticate_user(
-            credentials=serializer.validated_data
+        # The throttled attempts are rejected before hashing the password
+        self.rate_limiter.check(
+            email=serializer.validated_data["email"],
+            ip=get_client_ip(request=request),
+        )
+        tokens = self.application_class.login(
+            credentials=serializer.validated_data,
+            refresh_token_repository=RefreshTokenRepository,
         )
 
         return Response(
-            data={"access_token": access_token},
+            data=tokens,
             status=status.HTTP_200_OK,
             content_type="application/json",
         )
@@ -77,8 +97,13 @@ class UpdateTokenAPIView(GenericAPIView):
     permission_classes = [AllowAny]
     serializer_class = UpdateTokenSerializer
     application_class = JWTUpdate
+    query_budget = 3
+    # The tokens are secrets, see `CompressionMiddleware`
+    compress_response = False
 
-    @UpdateTokenSchema
+    @lazy_schema(
+        path="apps.authentication.infrastructure.schemas.jwt.UpdateTokenSchema"
+    )
     def post(self, request: Request, *args, **kwargs) -> Response:
         """
         Handle POST requests for token refresh.
@@ -102,7 +127,7 @@ class UpdateTokenAPIView(GenericAPIView):
             )
 
         app = self.application_class(
-            jwt_repository=JWTRepository,
+            jwt_repository=get_jwt_repository(),
             user_repository=UserRepository,
         )
         new_access_token = app.new_tokens(
@@ -125,8 +150,11 @@ class LogoutAPIView(PermissionMixin, GenericAPIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
     application_class = JWTLogout
+    query_budget = 5
 
-    @LogoutSchema
+    @lazy_schema(
+        path="apps.authentication.infrastructure.schemas.jwt.LogoutSchema"
+    )
     def post(self, request: Request, *args, **kwargs) -> Response:
         """
         Handles POST requests for user logout.
@@ -136,9 +164,181 @@ class LogoutAPIView(PermissionMixin, GenericAPIView):
         access token by adding them to the blacklist.
         """
 
-        self.application_class.logout_user(access_token=request.auth)
+        self.application_class.logout_user(
+            access_token=request.auth,
+            refresh_token_repository=RefreshTokenRepository,
+        )
 
         return Response(
             status=status.HTTP_200_OK,
             content_type="application/json",
         )
+
+
+class RefreshTokenAPIView(GenericAPIView):
+    """
+    API View for rotating refresh tokens. This view handles the request to exchange
+    a refresh token for new tokens.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    serializer_class = RefreshTokenSerializer
+    application_class = JWTRefresh
+    query_budget = 5
+    # The tokens are secrets, see `CompressionMiddleware`
+    compress_response = False
+
+    @lazy_schema(
+        path="apps.authentication.infrastructure.schemas.jwt.RefreshTokenSchema"
+    )
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Handle POST requests for refresh token rotation.
+
+        This method exchanges a refresh token for a new access token and a new
+        refresh token of the same session. A refresh token can only be used once, if
+        it is used again all the refresh tokens of its session are revoked.
+        """
+
+        serializer = self.serializer_class(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(
+                data={
+                    "code": "invalid_request_data",
+                    "detail": serializer.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+                content_type="application/json",
+            )
+
+        app = self.application_class(
+            refresh_token_repository=RefreshTokenRepository
+        )
+        tokens = app.rotate(
+            refresh_token=serializer.validated_data["refresh_token"]
+        )
+
+        return Response(
+            data=tokens,
+            status=status.HTTP_200_OK,
+            content_type="application/json",
+        )
+
+
+class AsyncLoginAPIView(AsyncAPIView):
+    """
+    Async variant of `LoginAPIView` for ASGI deployments. The password is hashed in
+    a bounded thread pool, so a worker keeps many logins in flight and rejects the
+    excess ones with a `503` response.
+    """
+
+    serializer_class = LoginSerializer
+    application_class = JWTLogin
+    rate_limiter = SlidingWindowRateLimiter(scope="login")
+    query_budget = 8
+    # The tokens are secrets, see `CompressionMiddleware`
+    compress_response = False
+
+    async def post(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Handle POST requests for user authentication.
+        """
+
+        serializer = self.serializer_class(data=request.data)
+
+        if not serializer.is_valid():
+            return self.response(
+                data={
+                    "code": "invalid_request_data",
+                    "detail": serializer.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        await self.rate_limiter.acheck(
+            email=serializer.validated_data["email"],
+            ip=get_client_ip(request=request),
+        )
+        tokens = await self.application_class.alogin(
+            credentials=serializer.validated_data,
+            refresh_token_repository=RefreshTokenRepository,
+        )
+
+        return self.response(
+            data=tokens,
+            status=status.HTTP_200_OK,
+        )
+
+
+class AsyncUpdateTokenAPIView(AsyncAPIView):
+    """
+    Async variant of `UpdateTokenAPIView` for ASGI deployments.
+    """
+
+    serializer_class = UpdateTokenSerializer
+    application_class = JWTUpdate
+    query_budget = 4
+    # The tokens are secrets, see `CompressionMiddleware`
+    compress_response = False
+
+    async def post(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Handle POST requests for token refresh.
+        """
+
+        # The blacklist is checked below with the async ORM
+        serializer = self.serializer_class(
+            data=request.data, check_blacklist=False
+        )
+
+        if not serializer.is_valid():
+            return self.response(
+                data={
+                    "code": "invalid_request_data",
+                    "detail": serializer.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        access_token = serializer.validated_data["access_token"]
+
+        try:
+            await access_token.acheck_blacklist()
+        except TokenError as exc:
+            raise JWTAPIError(detail=exc.args[0])
+
+        app = self.application_class(
+            jwt_repository=get_jwt_repository(),
+            user_repository=UserRepository,
+        )
+        new_access_token = await app.anew_tokens(access_token=access_token)
+
+        return self.response(
+            data={"access_token": new_access_token},
+            status=status.HTTP_200_OK,
+        )
+
+
+class AsyncLogoutAPIView(AsyncAPIView):
+    """
+    Async variant of `LogoutAPIView` for ASGI deployments.
+    """
+
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    application_class = JWTLogout
+    query_budget = 5
+
+    async def post(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Handles POST requests for user logout.
+        """
+
+        await self.application_class.alogout_user(
+            access_token=request.auth,
+            refresh_token_repository=RefreshTokenRepository,
+        )
+
+        return self.response(status=status.HTTP_200_OK)
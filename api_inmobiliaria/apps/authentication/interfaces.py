@@ -1,7 +1,9 @@
-from apps.authentication.models import JWT
+from apps.authentication.models import JWT, RefreshToken
 from apps.authentication.typing import JSONWebToken, JWTPayload
 from apps.users.models import BaseUser
-from typing import Protocol
+from typing import Iterable, Protocol
+from datetime import datetime
+from uuid import UUID
 
 
 class IJWTRepository(Protocol):
@@ -75,3 +77,164 @@ class IJWTRepository(Protocol):
         """
 
         ...
+
+    @classmethod
+    async def aget(cls, **filters) -> JWT:
+        """
+        Async counterpart of `get`.
+
+        #### Parameters:
+        - filters: Keyword arguments that define the filters to apply.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+    @classmethod
+    async def aadd_checklist(
+        cls, token: JSONWebToken, payload: JWTPayload, user: BaseUser
+    ) -> None:
+        """
+        Async counterpart of `add_checklist`.
+
+        #### Parameters:
+        - token: A JSONWebToken.
+        - payload: The payload of the token.
+        - user: An instance of the BaseUser model.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+    @classmethod
+    async def aadd_blacklist(cls, token: JWT) -> None:
+        """
+        Async counterpart of `add_blacklist`.
+
+        #### Parameters:
+        - token: An instance of the `JWT` model.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+    @classmethod
+    async def aexists_in_blacklist(cls, jti: str) -> bool:
+        """
+        Async counterpart of `exists_in_blacklist`.
+
+        #### Parameters:
+        - jti: The JTI of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+
+class IRefreshTokenRepository(Protocol):
+    """
+    IRefreshTokenRepository is a protocol that defines the interface for a refresh
+    token repository.
+    """
+
+    @classmethod
+    def create(
+        cls, user: BaseUser, family: UUID, token_hash: str, expires_at: datetime
+    ) -> RefreshToken:
+        """
+        Stores a new refresh token of the given family.
+
+        #### Parameters:
+        - user: An instance of the BaseUser model.
+        - family: The family of the token.
+        - token_hash: The hash of the token.
+        - expires_at: The expiration date of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+    @classmethod
+    def get(cls, token_hash: str) -> RefreshToken | None:
+        """
+        Retrieve a refresh token along with its user.
+
+        #### Parameters:
+        - token_hash: The hash of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+    @classmethod
+    def use(cls, token_hash: str) -> bool:
+        """
+        Marks a refresh token as used, returns whether it was valid and unused.
+
+        #### Parameters:
+        - token_hash: The hash of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+    @classmethod
+    def revoke_families(cls, families: Iterable[UUID]) -> int:
+        """
+        Revokes all the refresh tokens of the given families.
+
+        #### Parameters:
+        - families: The families to revoke.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+    @classmethod
+    async def acreate(
+        cls, user: BaseUser, family: UUID, token_hash: str, expires_at: datetime
+    ) -> RefreshToken:
+        """
+        Async counterpart of `create`.
+
+        #### Parameters:
+        - user: An instance of the BaseUser model.
+        - family: The family of the token.
+        - token_hash: The hash of the token.
+        - expires_at: The expiration date of the token.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
+    @classmethod
+    async def arevoke_families(cls, families: Iterable[UUID]) -> int:
+        """
+        Async counterpart of `revoke_families`.
+
+        #### Parameters:
+        - families: The families to revoke.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
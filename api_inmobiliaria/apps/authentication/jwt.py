@@ -1,8 +1,11 @@
 from apps.users.infrastructure.repositories import UserRepository
 from apps.users.models import BaseUser
-from apps.authentication.infrastructure.repositories import JWTRepository
-from apps.authentication.constants import ACCESS_TOKEN_LIFETIME
-from apps.authentication.typing import JWTPayload
+from apps.users.activity import ACTIVITY_TRACKER
+from apps.authentication.infrastructure.repositories import get_jwt_repository
+from apps.authentication.interfaces import IJWTRepository
+from apps.authentication.constants import ACCESS_TOKEN_LIFETIME, TokenStatus
+from apps.authentication.typing import JWTPayload, ParsedToken
+from apps.monitoring.metrics import JWT_OPERATIONS
 from apps.api_exceptions import (
     AuthenticationFailedAPIError,
     ResourceNotFoundAPIError,
@@ -13,10 +16,20 @@ from rest_framework_simplejwt.tokens import Token as BaseToken
 from rest_framework_simplejwt.authentication import (
     JWTAuthentication as BaseJWTuthentication,
 )
-from rest_framework_simplejwt.utils import get_md5_hash_password, aware_utcnow
+from rest_framework_simplejwt.utils import (
+    get_md5_hash_password,
+    datetime_to_epoch,
+    aware_utcnow,
+)
 from rest_framework_simplejwt.exceptions import TokenError, TokenBackendError
 from rest_framework_simplejwt.settings import api_settings
-from typing import Any, Dict
+from rest_framework_simplejwt.state import token_backend
+from rest_framework.permissions import SAFE_METHODS
+from django.http.request import HttpRequest
+from django.conf import settings
+from typing import Any, Dict, Tuple
+from datetime import timedelta
+from jwt import decode, InvalidTokenError
 
 
 # Error messages
@@ -27,13 +40,47 @@ USER_NOT_FOUND = JWTErrorMessages.USER_NOT_FOUND.value
 INACTIVE_ACCOUNT = JWTErrorMessages.INACTIVE_ACCOUNT.value
 
 
+def get_access_token_lifetime() -> timedelta:
+    """
+    Returns the lifetime of the access tokens. When the refresh tokens are enabled,
+    the access tokens are renewed with them, so they only last the minutes of the
+    `ACCESS_TOKEN_LIFETIME` of the `REFRESH_TOKEN` setting.
+    """
+
+    config = settings.REFRESH_TOKEN
+
+    if config["ENABLED"]:
+        return timedelta(minutes=config["ACCESS_TOKEN_LIFETIME"])
+
+    return ACCESS_TOKEN_LIFETIME
+
+
+def stateless_access_tokens() -> bool:
+    """
+    Returns whether the access tokens are verified without checking the blacklist.
+    The `STATELESS_ACCESS_TOKENS` of the `REFRESH_TOKEN` setting only applies when
+    the refresh tokens are enabled, otherwise the access tokens last the lifetime of
+    the `SIMPLE_JWT` setting and the blacklist is the only way to revoke them.
+    """
+
+    config = settings.REFRESH_TOKEN
+
+    return config["ENABLED"] and config["STATELESS_ACCESS_TOKENS"]
+
+
 class Token(BaseToken):
     """
     A class which validates and wraps an existing JWT or can be used to build a new
     JWT.
     """
 
-    _jwt_repository = JWTRepository
+    @property
+    def _jwt_repository(self) -> IJWTRepository:
+        """
+        The repository selected by the `JWT_REPOSITORY` setting.
+        """
+
+        return get_jwt_repository()
 
     def __init__(
         self,
@@ -79,9 +126,58 @@ class Token(BaseToken):
 
             raise TokenError(message.format(token_type=self.token_type))
 
-        if verify:
+        # A new token is not verified, its claims have just been set and its JTI
+        # can not be in the blacklist
+        if token and verify:
             self.verify()
 
+    @classmethod
+    def parse(cls, token: str) -> ParsedToken:
+        """
+        Decodes the given token verifying its signature once, and returns its payload
+        along with whether it has expired. Unlike the constructor, an expired token
+        is not rejected, so the callers that accept expired tokens do not need to
+        decode them again.
+
+        #### Parameters:
+        - token: An encoded JSON Web Token.
+
+        #### Raises:
+        - TokenError: If the token is malformed, its signature is invalid or it is
+        not a token of this type.
+        """
+
+        try:
+            payload = decode(
+                jwt=token,
+                key=token_backend.get_verifying_key(token),
+                algorithms=[token_backend.algorithm],
+                audience=token_backend.audience,
+                issuer=token_backend.issuer,
+                options={
+                    "verify_aud": token_backend.audience is not None,
+                    "verify_exp": False,
+                },
+            )
+        except (InvalidTokenError, TokenBackendError):
+            payload = None
+
+        if (
+            not payload
+            or payload.get(api_settings.TOKEN_TYPE_CLAIM) != cls.token_type
+            or "exp" not in payload
+        ):
+            message = INVALID_OR_EXPIRED
+
+            raise TokenError(message.format(token_type=cls.token_type))
+
+        now = datetime_to_epoch(dt=aware_utcnow() - token_backend.get_leeway())
+        status = (
+            TokenStatus.EXPIRED if payload["exp"] <= now else TokenStatus.VALID
+        )
+
+        return ParsedToken(payload=payload, status=status)
+
     def save(self) -> None:
         """
         Saves the token to the outstanding token list.
@@ -90,6 +186,27 @@ class Token(BaseToken):
         self._jwt_repository.add_checklist(
             token=str(self), payload=self.payload, user=self.user
         )
+        JWT_OPERATIONS.inc(operation="issue", token_type=self.token_type)
+
+    async def asave(self) -> None:
+        """
+        Async counterpart of `save`.
+        """
+
+        await self._jwt_repository.aadd_checklist(
+            token=str(self), payload=self.payload, user=self.user
+        )
+        JWT_OPERATIONS.inc(operation="issue", token_type=self.token_type)
+
+    def verify(self, *args, **kwargs) -> None:
+        """
+        Performs additional validation steps which were not performed when this
+        token was decoded.
+        """
+
+        JWT_OPERATIONS.inc(operation="verify", token_type=self.token_type)
+
+        super().verify(*args, **kwargs)
 
 
 class BlacklistMixin:
@@ -99,7 +216,7 @@ class BlacklistMixin:
 
     payload: Dict[str, Any]
     token_type: str
-    _jwt_repository: JWTRepository
+    _jwt_repository: IJWTRepository
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -121,6 +238,18 @@ class BlacklistMixin:
 
             raise TokenError(message.format(token_type=self.token_type))
 
+    async def acheck_blacklist(self) -> None:
+        """
+        Async counterpart of `check_blacklist`.
+        """
+
+        jti = self.payload[api_settings.JTI_CLAIM]
+
+        if await self._jwt_repository.aexists_in_blacklist(jti=jti):
+            message = BLACKLISTED
+
+            raise TokenError(message.format(token_type=self.token_type))
+
     def blacklist(self) -> None:
         """
         Ensures this token is included in the outstanding token list and adds it to
@@ -142,6 +271,26 @@ class BlacklistMixin:
 
         self._jwt_repository.add_blacklist(token=token)
 
+    async def ablacklist(self) -> None:
+        """
+        Async counterpart of `blacklist`.
+        """
+
+        jti = self.payload[api_settings.JTI_CLAIM]
+
+        # Ensure outstanding token exists with given jti
+        token = await self._jwt_repository.aget(jti=jti)
+
+        if not token:
+            message = TOKEN_NOT_FOUND
+
+            raise ResourceNotFoundAPIError(
+                code=message["code"],
+                detail=message["detail"].format(token_type=self.token_type),
+            )
+
+        await self._jwt_repository.aadd_blacklist(token=token)
+
 
 class AccessToken(Token, BlacklistMixin):
     """
@@ -150,7 +299,15 @@ class AccessToken(Token, BlacklistMixin):
     """
 
     token_type = "access"
-    lifetime = ACCESS_TOKEN_LIFETIME
+
+    @property
+    def lifetime(self) -> timedelta:
+        """
+        The lifetime of the new tokens, the short `ACCESS_TOKEN_LIFETIME` of the
+        `REFRESH_TOKEN` setting when the refresh tokens are enabled.
+        """
+
+        return get_access_token_lifetime()
 
     def __init__(
         self,
@@ -158,6 +315,7 @@ class AccessToken(Token, BlacklistMixin):
         token: Token = None,
         payload: JWTPayload = None,
         verify: bool = True,
+        save: bool = True,
     ) -> None:
         super().__init__(token=token, payload=payload, verify=verify, user=user)
 
@@ -171,13 +329,57 @@ class AccessToken(Token, BlacklistMixin):
             self[api_settings.USER_ID_CLAIM] = user_id
             self["user_role"] = self.user.content_type.model
 
-            self.save()
+            if save:
+                self.save()
+
+    @classmethod
+    async def afor_user(cls, user: BaseUser) -> "AccessToken":
+        """
+        Async counterpart of `AccessToken(user=user)`, the new token is saved with
+        the async ORM.
+        """
+
+        # A new token does not need to be verified
+        access_token = cls(user=user, verify=False, save=False)
+        await access_token.asave()
+
+        return access_token
+
+    @classmethod
+    async def aload(cls, token: str) -> "AccessToken":
+        """
+        Async counterpart of `AccessToken(token=token)`, the blacklist is checked
+        with the async ORM.
+        """
+
+        parsed_token = cls.parse(token=token)
+
+        if parsed_token.expired:
+            message = INVALID_OR_EXPIRED
+
+            raise TokenError(message.format(token_type=cls.token_type))
+
+        access_token = cls(token=token, payload=parsed_token.payload, verify=False)
+        await access_token.averify()
+
+        return access_token
 
     def verify(self, *args, **kwargs) -> None:
-        self.check_blacklist()
+        if not stateless_access_tokens():
+            self.check_blacklist()
 
         super().verify(*args, **kwargs)
 
+    async def averify(self) -> None:
+        """
+        Async counterpart of `verify`.
+        """
+
+        if not stateless_access_tokens():
+            await self.acheck_blacklist()
+
+        super().verify()
+
 
 class JWTAuthentication(BaseJWTuthentication):
     """
@@ -232,4 +434,117 @@ class JWTAuthentication(BaseJWTuthentication):
                     detail="The user's password has been changed.",
                 )
 
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
+        return base_user
+
+    def authenticate(self, request: HttpRequest) -> Tuple[BaseUser, Token] | None:
+        """
+        Authenticates the request with the access token of its `Authorization`
+        header. The sub-requests of a batch share the `batch_cache` dictionary, so
+        the same header is only authenticated once per batch, until a sub-request
+        with an unsafe method, such as a logout, may revoke it.
+        """
+
+        cache = getattr(request, "batch_cache", None)
+
+        if cache is None:
+            return super().authenticate(request)
+
+        key = ("authentication", self.get_header(request))
+
+        if request.method not in SAFE_METHODS:
+            # The next sub-requests authenticate the header again
+            cache.pop(key, None)
+
+            return super().authenticate(request)
+
+        if key not in cache:
+            cache[key] = super().authenticate(request)
+
+        return cache[key]
+
+    async def aauthenticate(
+        self, request: HttpRequest
+    ) -> Tuple[BaseUser, AccessToken] | None:
+        """
+        Async counterpart of `authenticate`, used by the async views.
+        """
+
+        cache = getattr(request, "batch_cache", None)
+
+        if cache is None:
+            return await self._aauthenticate(request=request)
+
+        key = ("authentication", self.get_header(request))
+
+        if request.method not in SAFE_METHODS:
+            cache.pop(key, None)
+
+            return await self._aauthenticate(request=request)
+
+        if key not in cache:
+            cache[key] = await self._aauthenticate(request=request)
+
+        return cache[key]
+
+    async def _aauthenticate(
+        self, request: HttpRequest
+    ) -> Tuple[BaseUser, AccessToken] | None:
+        header = self.get_header(request)
+
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+
+        if raw_token is None:
+            return None
+
+        try:
+            validated_token = await AccessToken.aload(token=raw_token)
+        except TokenError as e:
+            raise JWTAPIError(detail=e.args[0])
+
+        return (
+            await self.aget_user(validated_token=validated_token),
+            validated_token,
+        )
+
+    async def aget_user(self, validated_token: Token) -> BaseUser:
+        """
+        Async counterpart of `get_user`.
+        """
+
+        try:
+            user_uuid = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise JWTAPIError(
+                detail="Token contained no recognizable user identification"
+            )
+
+        base_user = await self._user_repository.aget_base_data(
+            uuid=user_uuid, is_active=True
+        )
+
+        if not base_user:
+            message = USER_NOT_FOUND
+
+            raise ResourceNotFoundAPIError(
+                code=message["code"], detail=message["detail"]
+            )
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # The password is deferred by the repository
+            await base_user.arefresh_from_db(fields=["password"])
+
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(base_user.password):
+                raise AuthenticationFailedAPIError(
+                    detail="The user's password has been changed.",
+                )
+
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
         return base_user
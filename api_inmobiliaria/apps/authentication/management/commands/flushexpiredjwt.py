@@ -1,18 +1,18 @@
 from django.core.management.base import BaseCommand
 from rest_framework_simplejwt.utils import aware_utcnow
-from apps.authentication.models import JWT
+from apps.authentication.models import JWT, RefreshToken
 
 
 class Command(BaseCommand):
     """
-    Flushes any expired tokens in the JWT model.
+    Flushes any expired tokens in the JWT and RefreshToken models.
     """
 
-    help = "Flushes any expired tokens in the JWT model"
+    help = "Flushes any expired tokens in the JWT and RefreshToken models"
 
     def handle(self, *args, **kwargs) -> None:
         """
-        Flushes any expired tokens in the JWT model
+        Flushes any expired tokens in the JWT and RefreshToken models
         """
 
         query_set = JWT.objects.filter(expires_at__lte=aware_utcnow())
@@ -20,5 +20,13 @@ class Command(BaseCommand):
         query_set.delete()
 
         self.stdout.write(
-            msg=f"{self.style.MIGRATE_LABEL(text=number_expired_tokens)} expired JWTs were found and removed."
+            msg=f"{self.style.MIGRATE_LABEL(number_expired_tokens)} expired JWTs were found and removed."
+        )
+
+        number_expired_refresh_tokens, _ = RefreshToken.objects.filter(
+            expires_at__lte=aware_utcnow()
+        ).delete()
+
+        self.stdout.write(
+            msg=f"{self.style.MIGRATE_LABEL(number_expired_refresh_tokens)} expired refresh tokens were found and removed."
         )
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.1 on 2026-10-18 22:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RefreshToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        db_column="id", primary_key=True, serialize=False
+                    ),
+                ),
+                ("family", models.UUIDField(db_column="family", db_index=True)),
+                (
+                    "token_hash",
+                    models.CharField(
+                        db_column="token_hash", max_length=64, unique=True
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(db_column="expires_at")),
+                (
+                    "used_at",
+                    models.DateTimeField(
+                        blank=True, db_column="used_at", null=True
+                    ),
+                ),
+                (
+                    "revoked_at",
+                    models.DateTimeField(
+                        blank=True, db_column="revoked_at", null=True
+                    ),
+                ),
+                (
+                    "date_joined",
+                    models.DateTimeField(
+                        auto_now_add=True, db_column="date_joined"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_column="user",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Refresh token",
+                "verbose_name_plural": "Refresh tokens",
+            },
+        ),
+    ]
@@ -66,3 +66,50 @@ class JWTBlacklist(models.Model):
     def __str__(self) -> str:
 
         return f"Blacklisted token for {self.token.user}"
+
+
+class RefreshToken(models.Model):
+    """
+    This model represents an opaque refresh token, only its hash is stored.
+
+    The tokens issued by rotating a refresh token belong to the same family as the
+    rotated token, so the whole session can be revoked at once.
+    """
+
+    id = models.BigAutoField(
+        db_column="id", primary_key=True, null=False, blank=False
+    )
+    user = models.ForeignKey(
+        db_column="user",
+        to=BaseUser,
+        to_field="uuid",
+        on_delete=models.CASCADE,
+        null=False,
+        blank=False,
+    )
+    family = models.UUIDField(
+        db_column="family", null=False, blank=False, db_index=True
+    )
+    token_hash = models.CharField(
+        db_column="token_hash",
+        max_length=64,
+        null=False,
+        blank=False,
+        unique=True,
+    )
+    expires_at = models.DateTimeField(
+        db_column="expires_at", null=False, blank=False
+    )
+    used_at = models.DateTimeField(db_column="used_at", null=True, blank=True)
+    revoked_at = models.DateTimeField(
+        db_column="revoked_at", null=True, blank=True
+    )
+    date_joined = models.DateTimeField(db_column="date_joined", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Refresh token"
+        verbose_name_plural = "Refresh tokens"
+
+    def __str__(self) -> str:
+
+        return f"Refresh token for {self.user_id} ({self.family})"
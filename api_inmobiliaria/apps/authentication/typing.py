@@ -1,4 +1,5 @@
-from typing import NewType, Dict, Any
+from apps.authentication.constants import TokenStatus
+from typing import NamedTuple, NewType, Dict, Any
 
 
 JSONWebToken = NewType("JSONWebToken", str)
@@ -26,3 +27,17 @@ JWTPayload.__doc__ = """
         'role': 'searcheruser'
     }
 """
+
+
+class ParsedToken(NamedTuple):
+    """
+    The result of parsing a JSON Web Token whose signature has been verified, its
+    payload and whether it has expired.
+    """
+
+    payload: JWTPayload
+    status: TokenStatus
+
+    @property
+    def expired(self) -> bool:
+        return self.status is TokenStatus.EXPIRED
@@ -1,13 +1,25 @@
 from apps.users.infrastructure.repositories import UserRepository
 from apps.users.models import BaseUser
+from apps.authentication.hashers import acheck_password, ahash_password
 from rest_framework.request import Request
+from django.contrib.auth import _clean_credentials, _get_backends
 from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.signals import user_login_failed
+from django.core.exceptions import PermissionDenied
+from django.http.request import HttpRequest
+from django.views.decorators.debug import sensitive_variables
+from asgiref.sync import sync_to_async
+import inspect
 
 
 class EmailPasswordBackend(ModelBackend):
     """
     A `custom authentication backend` that authenticates users based on their email
     and password.
+
+    The email and password credentials are only checked by this backend, the
+    following backends of the `AUTHENTICATION_BACKENDS` setting would look up the
+    same user and hash the same password again.
     """
 
     _user_repository = UserRepository
@@ -17,11 +29,90 @@ class EmailPasswordBackend(ModelBackend):
     ) -> BaseUser | None:
         """
         Authenticate a user with the given email and password.
+
+        #### Raises:
+        - PermissionDenied: If the credentials are invalid, so that the following
+        backends do not check them again.
         """
 
         user = self._user_repository.get_base_data(email=email)
 
         if not user:
-            return None
+            # Reduces the timing difference with an existing user
+            self._user_repository.model().set_password(raw_password=password)
+
+            raise PermissionDenied()
+        elif not user.check_password(raw_password=password):
+            raise PermissionDenied()
+
+        return user
+
+    async def aauthenticate(
+        self, request: HttpRequest, email: str, password: str
+    ) -> BaseUser | None:
+        """
+        Async counterpart of `authenticate`. The password is hashed in the password
+        hashing pool, so the event loop keeps serving other requests.
+
+        #### Raises:
+        - PermissionDenied: If the credentials are invalid.
+        - ServiceUnavailableAPIError: If the password hashing pool is full.
+        """
+
+        user = await self._user_repository.aget_credentials(email=email)
+
+        if not user:
+            await ahash_password(raw_password=password)
+
+            raise PermissionDenied()
+        elif not await acheck_password(user=user, raw_password=password):
+            raise PermissionDenied()
+
+        return user
+
+
+@sensitive_variables("credentials")
+async def aauthenticate(
+    request: HttpRequest | None = None, **credentials
+) -> BaseUser | None:
+    """
+    Async counterpart of `django.contrib.auth.authenticate`, it goes through the
+    same backends and sends the same `user_login_failed` signal.
+
+    The `aauthenticate` of Django 5.1 runs `authenticate` in the single thread of
+    the sync code, so the password hashes of all the logins would run one after the
+    other. This function awaits the `aauthenticate` method of the backends that
+    have one, as Django 5.2 does, and runs the other backends in that thread.
+    """
+
+    for backend, backend_path in _get_backends(return_tuples=True):
+        try:
+            inspect.signature(backend.authenticate).bind(request, **credentials)
+        except TypeError:
+            # This backend does not accept these credentials
+            continue
+
+        method = getattr(backend, "aauthenticate", None) or sync_to_async(
+            backend.authenticate
+        )
+
+        try:
+            user = await method(request, **credentials)
+        except PermissionDenied:
+            # This backend says that the user is not allowed in at all
+            break
+
+        if user is None:
+            continue
+
+        user.backend = backend_path
+
+        return user
+
+    await user_login_failed.asend(
+        sender=__name__,
+        credentials=_clean_credentials(credentials),
+        request=request,
+    )
 
-        return user if user.check_password(raw_password=password) else None
+    return None
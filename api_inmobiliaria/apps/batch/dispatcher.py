@@ -0,0 +1,190 @@
+from apps.monitoring.middleware import get_query_budget
+from utils.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework import status
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.handlers.exception import response_for_exception
+from django.core.handlers.wsgi import WSGIRequest
+from django.http.request import HttpRequest
+from django.http.response import HttpResponseBase
+from django.urls import Resolver404, resolve
+from django.conf import settings
+from typing import Any, Dict, List
+from time import monotonic
+from io import BytesIO
+import json
+
+
+# Keys of the environ of the batch request that describe its own body
+BODY_KEYS = ("CONTENT_TYPE", "CONTENT_LENGTH", "wsgi.input")
+
+
+class BatchDispatcher:
+    """
+    Dispatches the sub-requests of a batch request to the views of the API, one
+    after the other and in the same process. The sub-requests inherit the headers of
+    the batch request and share the `batch_cache` dictionary, so the views
+    authenticate the same credentials once per batch (see `JWTAuthentication`).
+
+    The sub-requests that have not started when the `TIMEOUT` of the
+    `BATCH_REQUESTS` setting is reached are not dispatched, a running view is never
+    interrupted.
+    """
+
+    def __init__(self, request: HttpRequest) -> None:
+        config = getattr(settings, "BATCH_REQUESTS", {})
+
+        self.request = request
+        self.timeout = config.get("TIMEOUT")
+        self.cache: Dict[Any, Any] = {}
+        # The sum of the budgets of the views, none if a view does not declare one
+        self.query_budget: int | None = 0
+
+    def dispatch(self, sub_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Dispatches the sub-requests in order and returns the status and the body of
+        each response, in the same order.
+
+        #### Parameters:
+        - sub_requests: The validated data of the sub-requests, with the `method`,
+        `path`, `body` and `headers` of each one.
+        """
+
+        deadline = None if self.timeout is None else monotonic() + self.timeout
+        responses = []
+
+        for sub_request in sub_requests:
+            if deadline is not None and monotonic() >= deadline:
+                responses.append(
+                    {
+                        "status": status.HTTP_504_GATEWAY_TIMEOUT,
+                        "body": {
+                            "code": "batch_timeout",
+                            "detail": "The time limit of the batch was reached before dispatching the request.",
+                        },
+                    }
+                )
+                continue
+
+            response = self.get_response(
+                request=self.build_request(sub_request=sub_request)
+            )
+            responses.append(
+                {"status": response.status_code, "body": self.get_body(response)}
+            )
+
+        return responses
+
+    def build_request(self, sub_request: Dict[str, Any]) -> HttpRequest:
+        """
+        Builds the request of a sub-request from the environ of the batch request,
+        with a JSON body.
+
+        #### Parameters:
+        - sub_request: The validated data of the sub-request.
+        """
+
+        path, _, query_string = sub_request["path"].partition("?")
+        body = (
+            b""
+            if sub_request.get("body") is None
+            else JSONRenderer().render(data=sub_request["body"])
+        )
+        environ = {
+            key: value
+            for key, value in self.request.META.items()
+            if key not in BODY_KEYS
+        }
+        environ.update(
+            {
+                "PATH_INFO": path,
+                "QUERY_STRING": query_string,
+                "REQUEST_METHOD": sub_request["method"],
+                "CONTENT_TYPE": "application/json",
+                "CONTENT_LENGTH": str(len(body)),
+                "wsgi.input": BytesIO(body),
+                "wsgi.url_scheme": self.request.scheme,
+            }
+        )
+
+        # The headers are validated by the serializer, they are filtered again so
+        # that a sub-request never sets the proxy headers read as the client IP
+        allowed_headers = {
+            name.lower()
+            for name in getattr(settings, "BATCH_REQUESTS", {}).get(
+                "ALLOWED_HEADERS", []
+            )
+        }
+
+        for name, value in sub_request.get("headers", {}).items():
+            if name.lower() in allowed_headers:
+                environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+
+        request = WSGIRequest(environ)
+        request.batch_cache = self.cache
+
+        return request
+
+    def get_response(self, request: HttpRequest) -> HttpResponseBase:
+        """
+        Passes the request to the view of its path. The exceptions of the view are
+        converted to responses, like the request handler does.
+        """
+
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return Response(
+                data={
+                    "code": "not_found",
+                    "detail": "The requested resource does not exist.",
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        request.resolver_match = match
+        self.add_query_budget(view_func=match.func, method=request.method)
+        view = match.func
+
+        if iscoroutinefunction(view):
+            view = async_to_sync(view)
+
+        try:
+            return view(request, *match.args, **match.kwargs)
+        except Exception as exc:
+            return response_for_exception(request, exc)
+
+    def add_query_budget(self, view_func: Any, method: str) -> None:
+        budget = get_query_budget(view_func=view_func, method=method)
+
+        if budget is None or self.query_budget is None:
+            self.query_budget = None
+        else:
+            self.query_budget += budget
+
+    @staticmethod
+    def get_body(response: HttpResponseBase) -> Any:
+        """
+        Returns the data of the responses of Django REST framework, and the decoded
+        content of any other response.
+        """
+
+        if isinstance(response, Response):
+            return response.data
+
+        if callable(getattr(response, "render", None)):
+            response.render()
+
+        content = (
+            b"".join(response.streaming_content)
+            if response.streaming
+            else response.content
+        )
+
+        if not content:
+            return None
+
+        if response.get("Content-Type", "").startswith("application/json"):
+            return json.loads(content)
+
+        return content.decode(response.charset, errors="replace")
@@ -0,0 +1,2 @@
+from .serializers import BatchSerializerSchema
+from .views import BatchSchema
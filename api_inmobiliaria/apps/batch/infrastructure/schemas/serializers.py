@@ -0,0 +1,31 @@
+from drf_spectacular.utils import (
+    extend_schema_serializer,
+    OpenApiExample,
+)
+
+
+BatchSerializerSchema = extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            name="data_valid",
+            summary="Valid data for the request.",
+            description="The requests performed by the client on startup. The following validations will be applied:\n- **Requests:** This field is required, it must be a non-empty list that does not exceed the maximum number of requests of a batch.\n- **Method:** This field is required and must be one of `GET`, `POST`, `PUT`, `PATCH` or `DELETE`.\n- **Path:** This field is required, it must be a path of the user or authentication endpoints and can include a query string.\n- **Body:** This field is optional, it is sent as the JSON body of the request.\n- **Headers:** This field is optional, they are added to the headers of the batch request. Only the `Authorization`, `Accept`, `Accept-Language` and `If-None-Match` headers are allowed.\n\nRequest responses that include messages in Spanish indicate that these are messages intended for use on the frontend by the client.",
+            value={
+                "requests": [
+                    {
+                        "method": "POST",
+                        "path": "/api/v1/auth/jwt/refresh/",
+                        "body": {
+                            "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
+                        },
+                    },
+                    {
+                        "method": "GET",
+                        "path": "/api/v1/user/searcher/?fields=name,last_name",
+                    },
+                ],
+            },
+            request_only=True,
+        ),
+    ],
+)
@@ -0,0 +1,88 @@
+from utils.messages import ERROR_MESSAGES
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiResponse,
+    OpenApiExample,
+)
+from django.conf import settings
+
+
+BatchSchema = extend_schema(
+    operation_id="batch_requests",
+    tags=["Batch"],
+    responses={
+        200: OpenApiResponse(
+            description="**(OK)** The requests have been dispatched, the status and the body of the response of each request are returned in the same order as the requests.",
+            response={
+                "properties": {
+                    "responses": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "status": {"type": "integer"},
+                                "body": {},
+                            },
+                        },
+                    },
+                }
+            },
+            examples=[
+                OpenApiExample(
+                    name="response_ok",
+                    summary="Requests dispatched",
+                    description="Each request is authenticated by its endpoint with the `Authorization` header of the batch, which is only validated once. The requests that have not started when the time limit of the batch is reached are not dispatched and get a response with the status **504**.",
+                    value={
+                        "responses": [
+                            {
+                                "status": 200,
+                                "body": {
+                                    "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                                    "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                                },
+                            },
+                            {
+                                "status": 504,
+                                "body": {
+                                    "code": "batch_timeout",
+                                    "detail": "The time limit of the batch was reached before dispatching the request.",
+                                },
+                            },
+                        ]
+                    },
+                ),
+            ],
+        ),
+        400: OpenApiResponse(
+            description="**(BAD_REQUEST)** The request data are invalid, error message(s) are returned for each field that did not pass the validations.",
+            response={
+                "properties": {
+                    "code": {"type": "string"},
+                    "detail": {"type": "object"},
+                }
+            },
+            examples=[
+                OpenApiExample(
+                    name="invalid_data",
+                    summary="Invalid data",
+                    description="These are the possible error messages for each field.",
+                    value={
+                        "code": "invalid_request_data",
+                        "detail": {
+                            "requests": [
+                                ERROR_MESSAGES["required"],
+                                ERROR_MESSAGES["null"],
+                                ERROR_MESSAGES["empty"],
+                                ERROR_MESSAGES["max_length_list"].format(
+                                    max_length=settings.BATCH_REQUESTS[
+                                        "MAX_REQUESTS"
+                                    ],
+                                ),
+                            ],
+                        },
+                    },
+                ),
+            ],
+        ),
+    },
+)
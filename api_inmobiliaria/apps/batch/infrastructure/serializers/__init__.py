@@ -0,0 +1 @@
+from .batch import BatchSerializer, SubRequestSerializer
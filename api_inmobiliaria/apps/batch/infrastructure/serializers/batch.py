@@ -0,0 +1,102 @@
+from apps.docs.decorators import lazy_schema
+from utils.messages import ErrorMessagesSerializer, ERROR_MESSAGES
+from rest_framework import serializers
+from django.conf import settings
+from typing import Any, Dict, List
+
+
+# HTTP methods of the sub-requests
+METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+
+class SubRequestSerializer(ErrorMessagesSerializer, serializers.Serializer):
+    """
+    Handles the data of a sub-request of a batch request. Checks that its path is
+    one of the paths of the API that can be requested in a batch.
+    """
+
+    method = serializers.ChoiceField(
+        required=True,
+        choices=METHODS,
+        error_messages={
+            "invalid_choice": ERROR_MESSAGES["invalid_choice"].format(
+                input="{input}"
+            ),
+        },
+    )
+    path = serializers.CharField(required=True, max_length=2048)
+    body = serializers.JSONField(required=False, allow_null=True)
+    headers = serializers.DictField(
+        required=False, child=serializers.CharField(allow_blank=True)
+    )
+
+    def validate_path(self, value: str) -> str:
+        """
+        Check that the path starts with one of the `ALLOWED_PREFIXES` of the
+        `BATCH_REQUESTS` setting.
+        """
+
+        allowed_prefixes = getattr(settings, "BATCH_REQUESTS", {}).get(
+            "ALLOWED_PREFIXES", []
+        )
+
+        if not value.partition("?")[0].startswith(tuple(allowed_prefixes)):
+            raise serializers.ValidationError(ERROR_MESSAGES["invalid"])
+
+        return value
+
+    def validate_headers(self, value: Dict[str, str]) -> Dict[str, str]:
+        """
+        Check that the headers are in the `ALLOWED_HEADERS` of the `BATCH_REQUESTS`
+        setting, the names are case-insensitive.
+        """
+
+        allowed_headers = {
+            name.lower()
+            for name in getattr(settings, "BATCH_REQUESTS", {}).get(
+                "ALLOWED_HEADERS", []
+            )
+        }
+
+        if any(name.lower() not in allowed_headers for name in value):
+            raise serializers.ValidationError(ERROR_MESSAGES["invalid"])
+
+        return value
+
+
+@lazy_schema(path="apps.batch.infrastructure.schemas.BatchSerializerSchema")
+class BatchSerializer(serializers.Serializer):
+    """
+    Handles the data of a batch request, a list of at most `MAX_REQUESTS`
+    sub-requests of the `BATCH_REQUESTS` setting.
+    """
+
+    requests = SubRequestSerializer(
+        many=True,
+        required=True,
+        allow_empty=False,
+        error_messages={
+            "required": ERROR_MESSAGES["required"],
+            "null": ERROR_MESSAGES["null"],
+            "empty": ERROR_MESSAGES["empty"],
+            "not_a_list": ERROR_MESSAGES["not_a_list"].format(
+                input_type="{input_type}"
+            ),
+        },
+    )
+
+    def validate_requests(
+        self, value: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Check that the batch does not exceed the maximum number of sub-requests.
+        """
+
+        max_requests = getattr(settings, "BATCH_REQUESTS", {}).get("MAX_REQUESTS")
+
+        if max_requests is not None and len(value) > max_requests:
+            raise serializers.ValidationError(
+                ERROR_MESSAGES["max_length_list"].format(max_length=max_requests)
+            )
+
+        return value
@@ -0,0 +1,11 @@
+from django.urls import path
+from .views import BatchAPIView
+
+
+urlpatterns = [
+    path(
+        route="",
+        view=BatchAPIView.as_view(),
+        name="batch",
+    ),
+]
@@ -0,0 +1,63 @@
+from apps.batch.infrastructure.serializers import BatchSerializer
+from apps.batch.dispatcher import BatchDispatcher
+from apps.docs.decorators import lazy_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+from rest_framework.request import Request
+from rest_framework import status
+
+
+class BatchAPIView(GenericAPIView):
+    """
+    API View for batch requests.
+
+    This view handles the `POST` request to perform several requests to the API in a
+    single HTTP call, the client saves a round trip for each request of the batch.
+    """
+
+    # Each request of the batch is authenticated by its own view
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    serializer_class = BatchSerializer
+    dispatcher_class = BatchDispatcher
+    # The responses of the batch may carry tokens, see `CompressionMiddleware`
+    compress_response = False
+
+    @lazy_schema(path="apps.batch.infrastructure.schemas.BatchSchema")
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Handle POST requests to perform a batch of requests.
+
+        This method dispatches the requests of the batch in order to the views of the
+        API, within the time limit of the batch, and returns the status and the body
+        of the response of each request. The requests share the headers of the batch
+        request, so its access token is only validated once.
+        """
+
+        serializer = self.serializer_class(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(
+                data={
+                    "code": "invalid_request_data",
+                    "detail": serializer.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+                content_type="application/json",
+            )
+
+        dispatcher = self.dispatcher_class(request=request._request)
+        responses = dispatcher.dispatch(
+            sub_requests=serializer.validated_data["requests"]
+        )
+
+        # The queries of the batch are the ones of its requests
+        if hasattr(request._request, "query_budget"):
+            request._request.query_budget = dispatcher.query_budget
+
+        return Response(
+            data={"responses": responses},
+            status=status.HTTP_200_OK,
+            content_type="application/json",
+        )
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class DeploymentConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.deployment"
+
+    def ready(self) -> None:
+        # Registers the system checks
+        import apps.deployment.checks
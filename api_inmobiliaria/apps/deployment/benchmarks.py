@@ -0,0 +1,96 @@
+from apps.deployment.middleware import (
+    CompressionMiddleware,
+    PathMiddlewareDispatcher,
+)
+from apps.users.benchmarks import get_real_estate_entity_profiles
+from apps.monitoring.benchmarks import Operation
+from utils.renderers import JSONRenderer
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse
+from django.test import RequestFactory
+
+
+# Number of real estate entity profiles of the compressed listing
+LISTED_PROFILES = 100
+
+
+def _compress(encoding: str) -> Operation:
+    content = JSONRenderer().render(
+        data=get_real_estate_entity_profiles(count=LISTED_PROFILES)
+    )
+    request = RequestFactory().get(path="/", HTTP_ACCEPT_ENCODING=encoding)
+    middleware = CompressionMiddleware(get_response=lambda request: None)
+
+    def operation() -> HttpResponse:
+        return middleware.compress(
+            request=request,
+            response=HttpResponse(
+                content=content, content_type="application/json"
+            ),
+        )
+
+    response = operation()
+    compressed_size = len(response.content)
+    operation.note = (
+        f"{response.get('Content-Encoding', 'identity')}: {len(content)} -> "
+        f"{compressed_size} bytes, {1 - compressed_size / len(content):.1%} saved"
+    )
+
+    return operation
+
+
+def gzip() -> Operation:
+    """
+    Compresses a JSON listing of `LISTED_PROFILES` real estate entity profiles with
+    gzip, at the level of the `application/json` rule of the `RESPONSE_COMPRESSION`
+    setting.
+    """
+
+    return _compress(encoding="gzip")
+
+
+def brotli() -> Operation:
+    """
+    Compresses a JSON listing of `LISTED_PROFILES` real estate entity profiles with
+    brotli, at the level of the `application/json` rule of the
+    `RESPONSE_COMPRESSION` setting. The listing is not compressed if the `brotli`
+    package is not installed.
+    """
+
+    return _compress(encoding="br")
+
+
+def _dispatch(path: str) -> Operation:
+    def view(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(content=b"{}", content_type="application/json")
+
+    def get_response(request: HttpRequest) -> HttpResponse:
+        return dispatcher.process_view(
+            request=request, view_func=view, view_args=(), view_kwargs={}
+        ) or view(request)
+
+    dispatcher = PathMiddlewareDispatcher(get_response=get_response)
+    factory = RequestFactory()
+
+    def operation() -> HttpResponse:
+        return dispatcher(factory.get(path=path))
+
+    return operation
+
+
+def full_chain() -> Operation:
+    """
+    Passes a request of the admin through the middleware of the `PATH_MIDDLEWARE`
+    setting, to an empty view.
+    """
+
+    return _dispatch(path="/admin/")
+
+
+def lean_chain() -> Operation:
+    """
+    Passes a request of the API through the `PathMiddlewareDispatcher`, which skips
+    the middleware of the `PATH_MIDDLEWARE` setting, to an empty view.
+    """
+
+    return _dispatch(path="/api/v1/user/searcher/")
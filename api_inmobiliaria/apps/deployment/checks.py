@@ -0,0 +1,63 @@
+from django.core.checks import CheckMessage, Error, Tags, register
+from django.utils.module_loading import import_string
+from django.conf import settings
+from typing import Any, List
+
+
+# Middleware that the admin requires, checked by admin.E408, admin.E409 and
+# admin.E410 against the MIDDLEWARE setting only
+ADMIN_MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+]
+
+DISPATCHER = "apps.deployment.middleware.PathMiddlewareDispatcher"
+
+
+def _contains_subclass(class_path: str, candidate_paths: List[str]) -> bool:
+    middleware_class = import_string(class_path)
+
+    for path in candidate_paths:
+        try:
+            candidate = import_string(path)
+        except ImportError:
+            continue
+
+        if isinstance(candidate, type) and issubclass(candidate, middleware_class):
+            return True
+
+    return False
+
+
+@register(Tags.admin)
+def check_admin_middleware(
+    app_configs: Any = None, **kwargs
+) -> List[CheckMessage]:
+    """
+    Checks that the middleware required by the admin is run for its requests,
+    either by the MIDDLEWARE setting or by the `PathMiddlewareDispatcher` with the
+    `PATH_MIDDLEWARE` setting. It replaces the admin checks of the middleware,
+    which are silenced since they only look at the MIDDLEWARE setting.
+    """
+
+    if "django.contrib.admin" not in settings.INSTALLED_APPS:
+        return []
+
+    middleware = list(settings.MIDDLEWARE)
+
+    if DISPATCHER in middleware:
+        middleware += getattr(settings, "PATH_MIDDLEWARE", {}).get(
+            "MIDDLEWARE", []
+        )
+
+    return [
+        Error(
+            f"'{path}' must be in MIDDLEWARE, or in the MIDDLEWARE of PATH_MIDDLEWARE "
+            f"with '{DISPATCHER}' in MIDDLEWARE, in order to use the admin "
+            "application.",
+            id="deployment.E001",
+        )
+        for path in ADMIN_MIDDLEWARE
+        if not _contains_subclass(class_path=path, candidate_paths=middleware)
+    ]
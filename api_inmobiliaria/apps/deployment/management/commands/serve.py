@@ -0,0 +1,160 @@
+from apps.deployment.startup import (
+    get_unapplied_migrations,
+    get_static_sources_hash,
+    read_manifest_sources_hash,
+    write_manifest_sources_hash,
+    preload_application,
+)
+from apps.docs.schema import (
+    SchemaArtifact,
+    get_schema_directory,
+    get_sources_hash as get_schema_sources_hash,
+)
+from django.core.management.base import BaseCommand
+from django.core.management import call_command
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connections
+from django.conf import settings
+from importlib import import_module
+from typing import Callable
+from time import perf_counter
+
+
+class Command(BaseCommand):
+    """
+    Entrypoint of the containers. It prepares the project and starts gunicorn,
+    skipping the steps whose result is already up to date so the containers start
+    faster:
+
+    - The migrations are only applied if the `django_migrations` table shows that
+    some of them are missing.
+    - The static files are only collected if the hash of their sources does not
+    match the one stored in the manifest of the last collection.
+    - The OpenAPI schema is only built if the hash of the sources it was generated
+    from does not match the one of the current code.
+    - The expired sessions are removed, so the session table does not grow.
+    - The WSGI application is loaded before gunicorn forks its workers.
+
+    The gunicorn settings are read from the `GUNICORN_CMD_ARGS` environment
+    variable.
+    """
+
+    help = (
+        "Prepares the project and starts gunicorn with the application preloaded"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--no-serve",
+            action="store_true",
+            help="Only prepare the project, without starting gunicorn.",
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database to check for unapplied migrations.",
+        )
+
+    def run_phase(self, name: str, phase: Callable[[], str]) -> None:
+        """
+        Runs a phase of the startup and reports the time spent in it.
+        """
+
+        start = perf_counter()
+        detail = phase()
+        elapsed = perf_counter() - start
+
+        self.stdout.write(
+            msg=f"{name:<12}{self.style.MIGRATE_LABEL(f'{elapsed:>8.3f} s')}  {detail}"
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Prepares the project and starts gunicorn.
+        """
+
+        self.run_phase(
+            name="migrations",
+            phase=lambda: self.migrate(database=options["database"]),
+        )
+        self.run_phase(name="static", phase=self.collect_static)
+        self.run_phase(name="schema", phase=self.build_schema)
+        self.run_phase(name="sessions", phase=self.clear_sessions)
+        self.run_phase(name="preload", phase=self.preload)
+
+        if not options["no_serve"]:
+            self.serve(application=self.application)
+
+    def migrate(self, database: str) -> str:
+        unapplied = get_unapplied_migrations(database=database)
+
+        if not unapplied:
+            return "No unapplied migrations."
+
+        call_command("migrate", database=database, interactive=False, verbosity=0)
+
+        return f"{len(unapplied)} migrations applied."
+
+    def collect_static(self) -> str:
+        sources_hash = get_static_sources_hash()
+
+        if read_manifest_sources_hash() == sources_hash:
+            return "Static files up to date, collectstatic skipped."
+
+        call_command("collectstatic", interactive=False, clear=True, verbosity=0)
+        write_manifest_sources_hash(sources_hash=sources_hash)
+
+        return "Static files collected."
+
+    def build_schema(self) -> str:
+        directory = get_schema_directory()
+        artifact = SchemaArtifact.load(directory=directory)
+
+        if (
+            artifact is not None
+            and artifact.sources_hash == get_schema_sources_hash()
+        ):
+            return "OpenAPI schema up to date, build skipped."
+
+        artifact = SchemaArtifact.build(directory=directory)
+
+        return f"OpenAPI schema {artifact.hash} built."
+
+    def clear_sessions(self) -> str:
+        import_module(settings.SESSION_ENGINE).SessionStore.clear_expired()
+
+        return "Expired sessions removed."
+
+    def preload(self) -> str:
+        self.application = preload_application()
+
+        return "WSGI application loaded."
+
+    def serve(self, application: WSGIHandler) -> None:
+        """
+        Starts gunicorn with the given application, which is shared by the workers
+        through the fork.
+        """
+
+        # The workers must not inherit the connections opened by the master
+        connections.close_all()
+
+        # gunicorn is only imported when serving, it is not needed to prepare the
+        # project
+        from gunicorn.app.base import BaseApplication
+
+        class PreloadedApplication(BaseApplication):
+            def load_config(self) -> None:
+                parser = self.cfg.parser()
+                env_args = parser.parse_args(self.cfg.get_cmd_args_from_env())
+
+                for key, value in vars(env_args).items():
+                    if value is not None and key in self.cfg.settings:
+                        self.cfg.set(key, value)
+
+                self.cfg.set("preload_app", True)
+
+            def load(self) -> WSGIHandler:
+                return application
+
+        PreloadedApplication().run()
@@ -0,0 +1,392 @@
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse, StreamingHttpResponse
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.cache import patch_vary_headers
+from django.utils.module_loading import import_string
+from django.conf import settings
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Protocol,
+    Tuple,
+)
+from gzip import GzipFile
+from io import BytesIO
+import secrets
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Encodings supported by the middleware, in order of preference
+ENCODINGS = ("br", "gzip")
+
+
+class Compressor(Protocol):
+    """
+    Incremental compressor of a response body, the interface of `brotli.Compressor`.
+    """
+
+    def process(self, data: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    """
+    Incremental gzip compressor. The header of each stream carries a file name of a
+    random length of up to `max_random_bytes` bytes, which randomizes the length of
+    the compressed body as the `GZipMiddleware` of Django does against BREACH.
+    """
+
+    def __init__(self, level: int, max_random_bytes: int) -> None:
+        self._buffer = BytesIO()
+        self._file = GzipFile(
+            filename=b"a" * secrets.randbelow(max_random_bytes + 1),
+            mode="wb",
+            compresslevel=level,
+            fileobj=self._buffer,
+            mtime=0,
+        )
+
+    def _read(self) -> bytes:
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+        return data
+
+    def process(self, data: bytes) -> bytes:
+        self._file.write(data)
+
+        return self._read()
+
+    def finish(self) -> bytes:
+        self._file.close()
+
+        return self._read()
+
+
+def get_accepted_encodings(header: str) -> Dict[str, float]:
+    """
+    Returns the quality value of each encoding of an `Accept-Encoding` header.
+    """
+
+    accepted = {}
+
+    for item in header.split(","):
+        encoding, *params = item.split(";")
+        quality = 1.0
+
+        for param in params:
+            name, _, value = param.strip().partition("=")
+
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        if encoding.strip():
+            accepted[encoding.strip().lower()] = quality
+
+    return accepted
+
+
+class CompressionMiddleware:
+    """
+    Middleware that compresses the response bodies with the encoding preferred by
+    the `Accept-Encoding` header of the request, brotli if the `brotli` package is
+    installed, or gzip.
+
+    The options are read from the `RESPONSE_COMPRESSION` setting. Only the bodies
+    whose content type has a rule in `CONTENT_TYPES`, with the level of each encoding
+    allowed, are compressed. The bodies smaller than `MIN_SIZE` bytes are sent as
+    they are, and the streaming bodies are compressed as they are sent if `STREAMING`
+    is enabled. The responses already encoded, such as the precompressed schema and
+    static files, are not compressed again.
+
+    Against BREACH, the error responses, which may reflect the input of the request,
+    are not compressed unless `COMPRESS_ERRORS` is enabled, nor are those of the views
+    with `compress_response = False`, such as the ones that issue tokens.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        config = getattr(settings, "RESPONSE_COMPRESSION", {})
+
+        if not config.get("ENABLED", False):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.min_size: int = config["MIN_SIZE"]
+        self.streaming: bool = config["STREAMING"]
+        self.compress_errors: bool = config["COMPRESS_ERRORS"]
+        self.max_random_bytes: int = config["MAX_RANDOM_BYTES"]
+        self.content_types: Dict[str, Dict[str, int]] = config["CONTENT_TYPES"]
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+
+        if not getattr(request, "compress_response", True):
+            return response
+
+        return self.compress(request=request, response=response)
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable,
+        view_args: Tuple[Any],
+        view_kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Looks up whether the view that will handle the request allows compressing
+        its responses.
+        """
+
+        view_class = getattr(view_func, "view_class", None)
+        request.compress_response = getattr(view_class, "compress_response", True)
+
+    def get_rule(self, response: HttpResponse) -> Dict[str, int] | None:
+        """
+        Returns the level of each encoding allowed for the body of the response, or
+        `None` if it must not be compressed.
+        """
+
+        if response.has_header("Content-Encoding"):
+            return None
+
+        if response.status_code >= 400 and not self.compress_errors:
+            return None
+
+        if response.streaming:
+            if not self.streaming:
+                return None
+        elif len(response.content) < self.min_size:
+            return None
+
+        content_type = response.get("Content-Type", "").split(";")[0].strip()
+
+        return self.content_types.get(content_type.lower())
+
+    def get_encoding(
+        self, request: HttpRequest, rule: Dict[str, int]
+    ) -> str | None:
+        """
+        Returns the encoding of the rule preferred by the client, or `None` if the
+        client does not accept any of them.
+        """
+
+        accepted = get_accepted_encodings(
+            header=request.headers.get("Accept-Encoding", "")
+        )
+        candidates = [
+            encoding
+            for encoding in ENCODINGS
+            if encoding in rule
+            and (encoding != "br" or brotli is not None)
+            and accepted.get(encoding, accepted.get("*", 0.0)) > 0
+        ]
+
+        if not candidates:
+            return None
+
+        # The order of ENCODINGS breaks the ties
+        return max(
+            candidates,
+            key=lambda encoding: accepted.get(encoding, accepted.get("*", 0.0)),
+        )
+
+    def get_compressor(self, encoding: str, level: int) -> Compressor:
+        if encoding == "br":
+            return brotli.Compressor(quality=level)
+
+        return GzipCompressor(level=level, max_random_bytes=self.max_random_bytes)
+
+    def compress(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+        """
+        Compresses the body of the response, if its content type, size and status
+        allow it and the client accepts an encoding of its rule.
+        """
+
+        rule = self.get_rule(response=response)
+
+        if rule is None:
+            return response
+
+        # The response depends on the header even when it is not compressed
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = self.get_encoding(request=request, rule=rule)
+
+        if encoding is None:
+            return response
+
+        compressor = self.get_compressor(encoding=encoding, level=rule[encoding])
+
+        if response.streaming:
+            self._compress_stream(response=response, compressor=compressor)
+            del response.headers["Content-Length"]
+        else:
+            content = compressor.process(response.content) + compressor.finish()
+
+            if len(content) >= len(response.content):
+                return response
+
+            response.content = content
+            response.headers["Content-Length"] = str(len(content))
+
+        # The compressed body is not byte-for-byte equal to the uncompressed one
+        etag = response.get("ETag")
+
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = f"W/{etag}"
+
+        response.headers["Content-Encoding"] = encoding
+
+        return response
+
+    @staticmethod
+    def _compress_stream(
+        response: StreamingHttpResponse, compressor: Compressor
+    ) -> None:
+        if response.is_async:
+            content: AsyncIterator[bytes] = response.streaming_content
+
+            async def compress_async() -> AsyncIterator[bytes]:
+                async for chunk in content:
+                    if data := compressor.process(chunk):
+                        yield data
+
+                yield compressor.finish()
+
+            response.streaming_content = compress_async()
+        else:
+            content: Iterable[bytes] = response.streaming_content
+
+            def compress() -> Iterator[bytes]:
+                for chunk in content:
+                    if data := compressor.process(chunk):
+                        yield data
+
+                yield compressor.finish()
+
+            response.streaming_content = compress()
+
+
+class PathMiddlewareDispatcher:
+    """
+    Middleware that runs the middleware of the `MIDDLEWARE` of the `PATH_MIDDLEWARE`
+    setting, in that order, only for the requests whose path does not start with one
+    of its `LEAN_PREFIXES`. The API authenticates with JWTs, so its requests skip
+    the sessions, the CSRF protection, the messages and the session user of the
+    admin. The paths that also start with one of its `FULL_PREFIXES`, such as those
+    of the HTML views of the API, run the whole chain.
+
+    The hooks of the dispatched middleware are called from the hooks of the
+    dispatcher, so it must be placed where they would be in the `MIDDLEWARE`
+    setting.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        config = getattr(settings, "PATH_MIDDLEWARE", {})
+        self.get_response = get_response
+        self.lean_prefixes: Tuple[str, ...] = tuple(
+            config.get("LEAN_PREFIXES", ())
+        )
+        self.full_prefixes: Tuple[str, ...] = tuple(
+            config.get("FULL_PREFIXES", ())
+        )
+        self._view_middleware: List[Callable] = []
+        self._template_response_middleware: List[Callable] = []
+        self._exception_middleware: List[Callable] = []
+        handler = get_response
+
+        # Built as Django builds its chain in `BaseHandler.load_middleware`
+        for middleware_path in reversed(config.get("MIDDLEWARE", [])):
+            try:
+                middleware = import_string(middleware_path)(handler)
+            except MiddlewareNotUsed:
+                continue
+
+            if hasattr(middleware, "process_view"):
+                self._view_middleware.insert(0, middleware.process_view)
+            if hasattr(middleware, "process_template_response"):
+                self._template_response_middleware.append(
+                    middleware.process_template_response
+                )
+            if hasattr(middleware, "process_exception"):
+                self._exception_middleware.append(middleware.process_exception)
+
+            handler = convert_exception_to_response(middleware)
+
+        self.full_chain = handler
+
+    def is_lean(self, request: HttpRequest) -> bool:
+        """
+        Check if the request skips the dispatched middleware.
+        """
+
+        path = request.path_info
+
+        return path.startswith(self.lean_prefixes) and not path.startswith(
+            self.full_prefixes
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.is_lean(request=request):
+            return self.get_response(request)
+
+        return self.full_chain(request)
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable,
+        view_args: Tuple[Any],
+        view_kwargs: Dict[str, Any],
+    ) -> HttpResponse | None:
+        if self.is_lean(request=request):
+            return None
+
+        for process_view in self._view_middleware:
+            response = process_view(request, view_func, view_args, view_kwargs)
+
+            if response is not None:
+                return response
+
+        return None
+
+    def process_template_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+        if self.is_lean(request=request):
+            return response
+
+        for process_template_response in self._template_response_middleware:
+            response = process_template_response(request, response)
+
+        return response
+
+    def process_exception(
+        self, request: HttpRequest, exception: Exception
+    ) -> HttpResponse | None:
+        if self.is_lean(request=request):
+            return None
+
+        for process_exception in self._exception_middleware:
+            response = process_exception(request, exception)
+
+            if response is not None:
+                return response
+
+        return None
@@ -0,0 +1,171 @@
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.wsgi import get_wsgi_application
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.utils import DatabaseError
+from django.urls import get_resolver
+from typing import Dict, List, Set, Tuple
+import hashlib
+import json
+
+
+# Key of the static files manifest that stores the hash of the static sources
+SOURCES_HASH_KEY = "sources_hash"
+
+MigrationKey = Tuple[str, str]
+
+
+def get_applied_migrations(database: str) -> Set[MigrationKey]:
+    """
+    Returns the migrations applied to the database with a single query against the
+    `django_migrations` table, an empty set if the table does not exist yet.
+
+    #### Parameters:
+    - database: The alias of the database.
+    """
+
+    try:
+        return set(
+            MigrationRecorder.Migration.objects.using(database).values_list(
+                "app", "name"
+            )
+        )
+    except DatabaseError:
+        return set()
+
+
+def get_unapplied_migrations(database: str = "default") -> List[MigrationKey]:
+    """
+    Returns the migrations of the project that have not been applied to the
+    database, without the introspection queries executed by the `migrate` command.
+
+    #### Parameters:
+    - database: The alias of the database.
+    """
+
+    # The loader reads the migrations from disk, it does not query the database
+    # when it is not given a connection
+    loader = MigrationLoader(connection=None, ignore_no_migrations=True)
+    applied = get_applied_migrations(database=database)
+    unapplied = []
+
+    for key in sorted(loader.graph.nodes):
+        if key in applied:
+            continue
+
+        # A squashed migration is applied if all the migrations it replaces are
+        replaces = loader.graph.nodes[key].replaces
+
+        if replaces and all(tuple(replaced) in applied for replaced in replaces):
+            continue
+
+        unapplied.append(key)
+
+    return unapplied
+
+
+def get_static_sources() -> Dict[str, Tuple[str, Storage]]:
+    """
+    Returns the static files found by the static files finders, which are the files
+    copied by the `collectstatic` command, by their name in `STATIC_ROOT`.
+    """
+
+    sources: Dict[str, Tuple[str, Storage]] = {}
+
+    for finder in finders.get_finders():
+        for path, storage in finder.list(ignore_patterns=[]):
+            prefix = getattr(storage, "prefix", None)
+            name = f"{prefix}/{path}" if prefix else path
+
+            # As in the collectstatic command, the first file found is used
+            sources.setdefault(name, (path, storage))
+
+    return sources
+
+
+def get_static_sources_hash() -> str:
+    """
+    Returns a hash of the names and content of the static sources.
+    """
+
+    digest = hashlib.sha256()
+
+    for name, (path, storage) in sorted(get_static_sources().items()):
+        digest.update(name.encode())
+
+        with storage.open(path) as file:
+            for chunk in iter(lambda: file.read(65536), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def read_manifest_sources_hash() -> str | None:
+    """
+    Returns the hash of the static sources stored in the manifest of the static
+    files storage, `None` if the storage does not use a manifest or the static
+    files have not been collected.
+    """
+
+    if not hasattr(staticfiles_storage, "read_manifest"):
+        return None
+
+    content = staticfiles_storage.read_manifest()
+
+    if content is None:
+        return None
+
+    try:
+        return json.loads(content).get(SOURCES_HASH_KEY)
+    except ValueError:
+        return None
+
+
+def write_manifest_sources_hash(sources_hash: str) -> None:
+    """
+    Stores the hash of the static sources in the manifest written by the
+    `collectstatic` command. Django and whitenoise ignore the unknown keys of the
+    manifest.
+
+    #### Parameters:
+    - sources_hash: The hash of the static sources.
+    """
+
+    if not hasattr(staticfiles_storage, "read_manifest"):
+        return
+
+    content = staticfiles_storage.read_manifest()
+
+    if content is None:
+        return
+
+    manifest = json.loads(content)
+    manifest[SOURCES_HASH_KEY] = sources_hash
+    manifest_storage = staticfiles_storage.manifest_storage
+    manifest_name = staticfiles_storage.manifest_name
+
+    if manifest_storage.exists(manifest_name):
+        manifest_storage.delete(manifest_name)
+
+    manifest_storage.save(
+        manifest_name, ContentFile(json.dumps(manifest).encode())
+    )
+
+
+def preload_application() -> WSGIHandler:
+    """
+    Returns the WSGI application with its middleware loaded and the URL
+    configuration, along with the views, already imported. Django imports the URL
+    configuration on the first request, so when the application is loaded before
+    the workers fork, they share these modules and serve their first request
+    without importing them.
+    """
+
+    application = get_wsgi_application()
+    get_resolver().url_patterns
+
+    return application
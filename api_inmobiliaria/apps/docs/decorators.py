@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+from typing import Callable, List, Tuple, TypeVar
+import threading
+
+
+T = TypeVar("T")
+
+# Views and serializers whose schema decorator has not been attached yet
+_pending: List[Tuple[object, str]] = []
+_lock = threading.Lock()
+
+
+def lazy_schema(path: str) -> Callable[[T], T]:
+    """
+    Returns a decorator that attaches the drf-spectacular decorator found at the
+    given dotted path, such as the ones built with `extend_schema`, only when the
+    OpenAPI schema is generated.
+
+    This way the modules with the documentation of the endpoints, which are large,
+    are not imported when the workers start. If `LAZY_DECORATORS` is disabled in the
+    `API_SCHEMA` setting, the decorator is attached immediately.
+
+    #### Parameters:
+    - path: The dotted path of the drf-spectacular decorator.
+    """
+
+    def decorator(target: T) -> T:
+        if not settings.API_SCHEMA.get("LAZY_DECORATORS", True):
+            return import_string(path)(target)
+
+        with _lock:
+            _pending.append((target, path))
+
+        return target
+
+    return decorator
+
+
+def attach_schemas() -> None:
+    """
+    Attaches the pending drf-spectacular decorators to their views and serializers.
+    The decorators modify their target in place, so the views that have already
+    been imported use them from now on.
+    """
+
+    with _lock:
+        pending = list(_pending)
+        _pending.clear()
+
+    for target, path in pending:
+        import_string(path)(target)
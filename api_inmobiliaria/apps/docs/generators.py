@@ -0,0 +1,25 @@
+from apps.docs.decorators import attach_schemas
+from drf_spectacular.generators import SchemaGenerator as BaseSchemaGenerator
+from rest_framework.request import Request
+from django.conf import settings
+from typing import Any, Dict
+from importlib import import_module
+
+
+class SchemaGenerator(BaseSchemaGenerator):
+    """
+    Schema generator that attaches the drf-spectacular decorators declared with
+    `lazy_schema` before inspecting the endpoints, and imports the modules with the
+    extensions listed in the `API_SCHEMA` setting.
+    """
+
+    def parse(self, input_request: Request, public: bool) -> Dict[str, Any]:
+        # Enumerating the endpoints imports the views, which registers their
+        # pending decorators
+        self._initialise_endpoints()
+        attach_schemas()
+
+        for module in settings.API_SCHEMA.get("EXTENSIONS", []):
+            import_module(module)
+
+        return super().parse(input_request, public)
@@ -0,0 +1,21 @@
+from django.urls import path
+from .views import SchemaView, SwaggerView
+
+
+urlpatterns = [
+    path(
+        route="",
+        view=SwaggerView.as_view(),
+        name="api_schema",
+    ),
+    path(
+        route="doc/schema/",
+        view=SchemaView.as_view(),
+        name="schema",
+    ),
+    path(
+        route="doc/schema/<str:schema_hash>/",
+        view=SchemaView.as_view(),
+        name="schema_versioned",
+    ),
+]
@@ -0,0 +1 @@
+from .schema import SchemaView, SwaggerView
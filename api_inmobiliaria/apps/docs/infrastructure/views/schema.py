@@ -0,0 +1,114 @@
+from apps.docs.schema import ENCODINGS, get_schema_artifact, get_schema_directory
+from apps.deployment.middleware import get_accepted_encodings
+from drf_spectacular.views import SpectacularSwaggerView
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.http.request import HttpRequest
+from django.http.response import (
+    HttpResponse,
+    HttpResponseNotModified,
+    HttpResponseRedirect,
+)
+from django.views.generic import View
+from django.utils.http import parse_etags
+from django.conf import settings
+from django.urls import reverse
+
+
+class SchemaView(View):
+    """
+    View that serves the pre-generated OpenAPI schema of the API.
+
+    The schema is served precompressed according to the `Accept-Encoding` header of
+    the request. The versioned URL, which contains the hash of the schema, can be
+    cached forever; the unversioned URL is cached for `MAX_AGE` seconds of the
+    `API_SCHEMA` setting and is revalidated with its `ETag`.
+    """
+
+    content_type = "application/vnd.oai.openapi+json"
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Handles the GET request to download the schema.
+        """
+
+        artifact = get_schema_artifact(directory=get_schema_directory())
+        schema_hash = kwargs.get("schema_hash")
+
+        if schema_hash is not None and schema_hash != artifact.hash:
+            # The schema changed after the client loaded the documentation
+            return HttpResponseRedirect(
+                redirect_to=reverse(
+                    viewname="schema_versioned",
+                    kwargs={"schema_hash": artifact.hash},
+                )
+            )
+
+        accepted = get_accepted_encodings(
+            header=request.headers.get("Accept-Encoding", "")
+        )
+        encoding = next(
+            (
+                encoding
+                for encoding in ENCODINGS
+                if encoding in artifact.content
+                and (
+                    encoding == "identity"
+                    or accepted.get(encoding, accepted.get("*", 0.0)) > 0
+                )
+            )
+        )
+        etag = f'"{artifact.hash}-{encoding}"'
+
+        if self.etag_matches(
+            header=request.headers.get("If-None-Match", ""), etag=etag
+        ):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                content=artifact.content[encoding], content_type=self.content_type
+            )
+
+            if encoding != "identity":
+                response["Content-Encoding"] = encoding
+
+        response["ETag"] = etag
+        response["Vary"] = "Accept-Encoding"
+        response["Cache-Control"] = (
+            "public, max-age=31536000, immutable"
+            if schema_hash is not None
+            else f"public, max-age={settings.API_SCHEMA['MAX_AGE']}"
+        )
+
+        return response
+
+    @staticmethod
+    def etag_matches(header: str, etag: str) -> bool:
+        """
+        Returns whether an `If-None-Match` header matches the ETag, with the weak
+        comparison of the RFC 9110.
+        """
+
+        etags = parse_etags(header)
+
+        return "*" in etags or etag in (
+            value.removeprefix("W/") for value in etags
+        )
+
+
+@method_decorator(
+    cache_control(public=True, max_age=settings.API_SCHEMA["MAX_AGE"]),
+    name="dispatch",
+)
+class SwaggerView(SpectacularSwaggerView):
+    """
+    View that serves the Swagger UI documentation, pointing it to the versioned URL
+    of the pre-generated schema.
+    """
+
+    def _get_schema_url(self, request: HttpRequest) -> str:
+        artifact = get_schema_artifact(directory=get_schema_directory())
+
+        return reverse(
+            viewname="schema_versioned", kwargs={"schema_hash": artifact.hash}
+        )
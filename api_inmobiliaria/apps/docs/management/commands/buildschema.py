@@ -0,0 +1,48 @@
+from apps.docs.schema import SchemaArtifact, get_schema_directory
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Generates the OpenAPI schema of the API and writes it to the directory of the
+    `API_SCHEMA` setting, so the documentation endpoints serve it without building
+    it on each request.
+    """
+
+    help = "Generates the OpenAPI schema served by the documentation endpoints"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only check that the written schema matches the code.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Generates the OpenAPI schema of the API.
+        """
+
+        directory = get_schema_directory()
+
+        if options["check"]:
+            artifact = SchemaArtifact.load(directory=directory)
+            expected_hash = SchemaArtifact.get_hash(
+                content=SchemaArtifact.generate()
+            )
+
+            if artifact is None or artifact.hash != expected_hash:
+                raise CommandError(
+                    "The OpenAPI schema does not match the code, run the buildschema command to regenerate it."
+                )
+
+            self.stdout.write(
+                msg=f"The OpenAPI schema {self.style.MIGRATE_LABEL(artifact.hash)} matches the code."
+            )
+            return
+
+        artifact = SchemaArtifact.build(directory=directory)
+
+        self.stdout.write(
+            msg=f"The OpenAPI schema {self.style.MIGRATE_LABEL(artifact.hash)} was written to {directory}."
+        )
@@ -0,0 +1,178 @@
+from drf_spectacular.renderers import OpenApiJsonRenderer
+from drf_spectacular.settings import spectacular_settings
+import drf_spectacular
+from django.conf import settings
+from typing import Dict
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import json
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+MANIFEST_NAME = "manifest.json"
+
+# File extension of each content encoding of the schema
+ENCODINGS = {"br": ".br", "gzip": ".gz", "identity": ""}
+
+# Packages of the project whose modules define the endpoints and their schemas
+SOURCE_PACKAGES = ["apps", "utils", "settings"]
+
+
+def get_sources_hash() -> str:
+    """
+    Returns a hash of the inputs of the schema generator: the Python modules of the
+    project, the drf-spectacular settings and its version. It only takes a read of
+    the sources, so it can be compared with the stored schema on each startup.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(drf_spectacular.__version__.encode())
+    digest.update(
+        json.dumps(
+            settings.SPECTACULAR_SETTINGS, sort_keys=True, default=str
+        ).encode()
+    )
+
+    for package in SOURCE_PACKAGES:
+        for path in sorted((Path(settings.BASE_DIR) / package).rglob("*.py")):
+            digest.update(str(path.relative_to(settings.BASE_DIR)).encode())
+            digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+class SchemaArtifact:
+    """
+    The OpenAPI schema of the API generated ahead of time, so it is not rebuilt from
+    the `extend_schema` decorators on each request.
+
+    The schema is written to the directory of the `API_SCHEMA` setting in a file
+    named after the API version and the hash of its content, along with its gzip
+    and, if the `brotli` package is installed, brotli compressed versions. A
+    manifest file points to the current schema, along with the hash of the sources
+    it was generated from.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        hash: str,
+        content: Dict[str, bytes],
+        sources_hash: str | None = None,
+    ) -> None:
+        self.version = version
+        self.hash = hash
+        self.content = content
+        self.sources_hash = sources_hash
+
+    @staticmethod
+    def generate() -> bytes:
+        """
+        Generates the OpenAPI schema of the API from the code.
+        """
+
+        generator_class = spectacular_settings.DEFAULT_GENERATOR_CLASS
+        schema = generator_class().get_schema(request=None, public=True)
+
+        return OpenApiJsonRenderer().render(data=schema, renderer_context={})
+
+    @staticmethod
+    def get_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()[:16]
+
+    @staticmethod
+    def get_file_name(version: str, hash: str) -> str:
+        return f"openapi-{version}-{hash}.json"
+
+    @classmethod
+    def build(cls, directory: Path) -> "SchemaArtifact":
+        """
+        Generates the schema and writes it to the given directory.
+
+        #### Parameters:
+        - directory: The directory of the schema files.
+        """
+
+        sources_hash = get_sources_hash()
+        schema = cls.generate()
+        version = spectacular_settings.VERSION
+        hash = cls.get_hash(content=schema)
+        content = {"identity": schema, "gzip": gzip.compress(schema, mtime=0)}
+
+        if brotli is not None:
+            content["br"] = brotli.compress(schema)
+
+        directory.mkdir(parents=True, exist_ok=True)
+        file_name = cls.get_file_name(version=version, hash=hash)
+
+        for encoding, data in content.items():
+            (directory / f"{file_name}{ENCODINGS[encoding]}").write_bytes(data)
+
+        (directory / MANIFEST_NAME).write_text(
+            json.dumps(
+                {
+                    "version": version,
+                    "hash": hash,
+                    "file": file_name,
+                    "encodings": list(content),
+                    "sources_hash": sources_hash,
+                }
+            )
+        )
+
+        return cls(
+            version=version, hash=hash, content=content, sources_hash=sources_hash
+        )
+
+    @classmethod
+    def load(cls, directory: Path) -> "SchemaArtifact | None":
+        """
+        Loads the schema of the given directory, returns `None` if it has not been
+        built.
+
+        #### Parameters:
+        - directory: The directory of the schema files.
+        """
+
+        try:
+            manifest = json.loads((directory / MANIFEST_NAME).read_text())
+            content = {
+                encoding: (
+                    directory / f"{manifest['file']}{ENCODINGS[encoding]}"
+                ).read_bytes()
+                for encoding in manifest["encodings"]
+            }
+        except FileNotFoundError:
+            return None
+
+        return cls(
+            version=manifest["version"],
+            hash=manifest["hash"],
+            content=content,
+            sources_hash=manifest.get("sources_hash"),
+        )
+
+
+@lru_cache
+def get_schema_artifact(directory: Path) -> SchemaArtifact:
+    """
+    Returns the schema of the given directory, it is built if the directory does not
+    contain it yet. The schema is kept in memory, since it only changes on deploys.
+
+    #### Parameters:
+    - directory: The directory of the schema files.
+    """
+
+    return SchemaArtifact.load(directory=directory) or SchemaArtifact.build(
+        directory=directory
+    )
+
+
+def get_schema_directory() -> Path:
+    return Path(settings.API_SCHEMA["DIRECTORY"])
@@ -1,5 +1,5 @@
 from apps.emails.applications.managers import ActionLinkManager
-from apps.emails.constants import SubjectsMail
+from apps.emails.constants import SubjectsMail, TOKEN_EXPIRATION
 from apps.emails.typing import Token
 from apps.emails.paths import TEMPLATES
 from apps.users.typing import UserUUID
@@ -8,14 +8,21 @@ from apps.api_exceptions import (
     AccountActivationAPIError,
     ResourceNotFoundAPIError,
 )
-from utils.messages import ActivationErrors
+from apps.view_exceptions import ResourceNotFoundViewError, TokenViewError
+from utils.messages import ActivationErrors, ActionLinkManagerErrors
 from rest_framework.request import Request
 from django.http.request import HttpRequest
+from django.db import transaction
+from django.utils import timezone
+from django.conf import settings
+from uuid import UUID
 
 
 # Error messages
 USER_NOT_FOUND = ActivationErrors.USER_NOT_FOUND.value
 ACTIVE_ACCOUNT = ActivationErrors.ACTIVE_ACCOUNT.value
+DEFAULT = ActionLinkManagerErrors.DEFAULT.value
+TOKEN_INVALID = ActionLinkManagerErrors.TOKEN_INVALID.value
 
 
 class AccountActivation(ActionLinkManager):
@@ -39,11 +46,69 @@ class AccountActivation(ActionLinkManager):
 
         super().send_email(user=user, request=request)
 
+    def _is_authentic(self, token: Token, user_uuid: UserUUID) -> bool:
+        """
+        Check the HMAC of the token for the inactive account of the user, without
+        querying it, as the HMAC is bound to the UUID and the `is_active` field.
+        """
+
+        if self._token_class.get_timestamp(token=token) is None:
+            return False
+
+        return self._token_class.check_token(
+            user=BaseUser(uuid=UUID(str(user_uuid)), is_active=False), token=token
+        )
+
+    def _activate(self, token: Token, user_uuid: UserUUID) -> bool:
+        """
+        Consumes the token and activates the account in a single transaction, with
+        a DELETE and a conditional UPDATE, returning whether the account was
+        activated. Nothing is changed if the token was already consumed or expired,
+        or if the account is not inactive. Without the Token table, the activation is
+        a single UPDATE.
+        """
+
+        if settings.EMAIL_TOKENS["STATELESS"]:
+            return not self._token_class.is_expired(
+                token=token
+            ) and self._user_repository.activate(uuid=user_uuid)
+
+        with transaction.atomic():
+            consumed = self._token_repository.consume(
+                token=token, created_after=timezone.now() - TOKEN_EXPIRATION
+            )
+            activated = consumed and self._user_repository.activate(uuid=user_uuid)
+
+            if consumed and not activated:
+                # The account is not inactive, the token is kept
+                transaction.set_rollback(True)
+
+        return activated
+
     def check_token(
         self, token: Token, user_uuid: UserUUID, request: HttpRequest
     ) -> None:
 
+        if self._is_authentic(token=token, user_uuid=user_uuid) and self._activate(
+            token=token, user_uuid=user_uuid
+        ):
+            return
+
+        # The activation failed, the user and the token are queried to explain why
         self.user = self._user_repository.get_base_data(uuid=user_uuid)
+
+        if self.user and self.user.is_active:
+            raise TokenViewError(
+                request=request,
+                context=TOKEN_INVALID,
+                template_name=TEMPLATES["account_management"]["error"],
+            )
+
         super().check_token(token=token, user_uuid=user_uuid, request=request)
-        self.user.is_active = True
-        self.user.save()
+
+        # The token was consumed by a simultaneous request
+        raise ResourceNotFoundViewError(
+            request=request,
+            template_name=TEMPLATES["account_management"]["error"],
+            context=DEFAULT,
+        )
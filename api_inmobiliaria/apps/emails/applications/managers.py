@@ -1,9 +1,11 @@
 from apps.emails.interfaces import ITokenGenerator, ITokenRepository
 from apps.emails.typing import Token
 from apps.emails.paths import TEMPLATES
+from apps.emails.rendering import get_email_template
 from apps.users.typing import UserUUID
 from apps.users.interfaces import IUserRepository
 from apps.users.models import BaseUser
+from apps.monitoring.metrics import SMTP_SEND_DURATION
 from apps.view_exceptions import (
     ResourceNotFoundViewError,
     TokenViewError,
@@ -11,10 +13,10 @@ from apps.view_exceptions import (
 from utils.messages import ActionLinkManagerErrors
 from rest_framework.request import Request
 from django.contrib.sites.shortcuts import get_current_site
-from django.template.loader import render_to_string
 from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
 from django.core.mail import EmailMessage
+from django.conf import settings
 from django.http.request import HttpRequest
 from django.urls import reverse
 from typing import Any, Dict
@@ -31,10 +33,17 @@ class ActionLinkManager:
     """
     This class encapsulates the logic in charge of e-mail communication related to user
     account management.
+
+    With the `STATELESS` option of the `EMAIL_TOKENS` setting, the expiration and
+    integrity of the tokens are validated from the timestamp and the HMAC they embed,
+    without querying the Token table, which is only written when the `AUDIT` option
+    is enabled.
     """
 
     subject: str
     email_body: str
+    # Context variables of the email body that change with each message
+    email_fields = ("email", "user_uuidb64", "token")
     action: str
 
     def __init__(
@@ -50,60 +59,70 @@ class ActionLinkManager:
         self.path_send_mail = path_send_mail
         self.user = None
 
+    @property
+    def store_tokens(self) -> bool:
+        """
+        Whether the tokens sent are stored in the Token table.
+        """
+
+        return (
+            not settings.EMAIL_TOKENS["STATELESS"]
+            or settings.EMAIL_TOKENS["AUDIT"]
+        )
+
     def _get_message_data(
-        self, user: BaseUser, token: Token, request: Request
+        self, user: BaseUser, token: Token, domain: str
     ) -> Dict[str, Any]:
         """
         Constructs and returns a dictionary containing the subject, body, and
         recipient of the message.
 
-        The email body is rendered from a predefined template with context variables
-        including the user's email, the current site domain, a base64 encoded user id,
-        and a unique token.
+        The email body is rendered from the skeleton of a predefined template for the
+        site domain, with the user's email, a base64 encoded user id, and a unique
+        token.
 
         #### Parameters:
         - user: An instance of the BaseUser model.
         - token: A unique identifier that guarantees the security and validity of the
         initiated process.
-        - request: This object comes from the view and contains the request
-        information.
+        - domain: The domain of the links of the message.
         """
 
+        template = get_email_template(
+            template_name=self.email_body,
+            fields=self.email_fields,
+            domain=domain,
+        )
+
         return {
             "subject": self.subject,
-            "body": render_to_string(
-                template_name=self.email_body,
-                context={
-                    "email": user.email,
-                    "domain": get_current_site(request),
-                    "user_uuidb64": urlsafe_base64_encode(
-                        s=force_bytes(s=user.uuid)
-                    ),
-                    "token": token,
-                },
+            "body": template.render(
+                email=user.email,
+                user_uuidb64=urlsafe_base64_encode(s=force_bytes(s=user.uuid)),
+                token=token,
             ),
             "to": [user.email],
         }
 
-    def _compose_and_dispatch(
-        self, user: BaseUser, token: Token, request: Request
-    ) -> None:
+    def dispatch(self, user: BaseUser, token: Token, domain: str) -> None:
         """
-        Compose and send the message to the user's email.
+        Compose and send the message with an already generated token to the user's
+        email.
 
         #### Parameters:
         - user: A instance of the BaseUser model.
         - token: This is a unique identifier that guarantees the security and validity
         of the initiated process.
-        - request: This object comes from the view and contains the request
-        information.
+        - domain: The domain of the links of the message.
         """
 
         email = EmailMessage(
-            **self._get_message_data(user=user, token=token, request=request)
+            **self._get_message_data(user=user, token=token, domain=domain)
         )
         email.content_subtype = "html"
-        email.send()
+
+        with SMTP_SEND_DURATION.time(manager=self.__class__.__name__):
+            email.send()
 
     def send_email(self, user: BaseUser | None, request: Request) -> None:
         """
@@ -119,8 +138,13 @@ class ActionLinkManager:
         """
 
         token = self._token_class.make_token(user=user)
-        self._token_repository.create(token=token)
-        self._compose_and_dispatch(user=user, token=token, request=request)
+
+        if self.store_tokens:
+            self._token_repository.create(token=token)
+
+        self.dispatch(
+            user=user, token=token, domain=str(get_current_site(request))
+        )
 
     def check_token(
         self, token: Token, user_uuid: UserUUID, request: HttpRequest
@@ -150,15 +174,23 @@ class ActionLinkManager:
                 context=USER_NOT_FOUND,
             )
 
-        token_obj = self._token_repository.get(token=token)
+        if settings.EMAIL_TOKENS["STATELESS"]:
+            token_found = self._token_class.get_timestamp(token=token) is not None
+            token_expired = token_found and self._token_class.is_expired(
+                token=token
+            )
+        else:
+            token_obj = self._token_repository.get(token=token)
+            token_found = bool(token_obj)
+            token_expired = token_found and token_obj.is_expired()
 
-        if not token_obj:
+        if not token_found:
             raise ResourceNotFoundViewError(
                 request=request,
                 template_name=TEMPLATES["account_management"]["error"],
                 context=DEFAULT,
             )
-        elif token_obj.is_expired():
+        elif token_expired:
             context = TOKEN_EXPIRED
             context["redirect"]["url"] = reverse(
                 viewname=self.path_send_mail,
@@ -0,0 +1,280 @@
+from django.core.mail.backends.smtp import EmailBackend
+from django.core.mail.message import EmailMessage, sanitize_address
+from django.conf import settings
+from typing import Callable, Dict, List, Sequence, Tuple
+from time import monotonic
+import threading
+import smtplib
+import logging
+import atexit
+import os
+
+
+logger = logging.getLogger(__name__)
+
+# Reply code of a server that is closing the session
+SERVICE_NOT_AVAILABLE = 421
+
+
+def _close_connection(connection: smtplib.SMTP) -> None:
+    try:
+        connection.quit()
+    except (smtplib.SMTPException, OSError):
+        connection.close()
+
+
+def _is_disconnection(exc: smtplib.SMTPException) -> bool:
+    """
+    Check if the error means that the session is no longer usable, so the message
+    can be sent again with a new session.
+    """
+
+    return isinstance(exc, smtplib.SMTPServerDisconnected) or (
+        isinstance(exc, smtplib.SMTPResponseException)
+        and exc.smtp_code == SERVICE_NOT_AVAILABLE
+    )
+
+
+class SMTPConnectionPool:
+    """
+    A bounded pool of authenticated SMTP sessions of the current process, shared by
+    its threads. The idle sessions are reused from the most recently released, those
+    idle for more than `IDLE_TIMEOUT` seconds are closed, and those idle for more
+    than `HEALTH_CHECK_INTERVAL` seconds are checked with a NOOP before reusing them.
+
+    The options are read from the `EMAIL_POOL` setting when the pool is created.
+    """
+
+    def __init__(self) -> None:
+        config = settings.EMAIL_POOL
+        self.max_connections: int = config["MAX_CONNECTIONS"]
+        self.idle_timeout: float = config["IDLE_TIMEOUT"]
+        self.health_check_interval: float = config["HEALTH_CHECK_INTERVAL"]
+        self.acquire_timeout: float = config["ACQUIRE_TIMEOUT"]
+        self._reset()
+
+        os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.close)
+
+    def _reset(self) -> None:
+        """
+        Discards the sessions inherited from the parent process without closing
+        them, their sockets belong to the parent.
+        """
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(value=self.max_connections)
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+
+    def _is_alive(self, connection: smtplib.SMTP) -> bool:
+        try:
+            return connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def acquire(self, connect: Callable[[], smtplib.SMTP]) -> smtplib.SMTP:
+        """
+        Returns an idle session, or a new one if there is none. Each session acquired
+        must be released with `release`.
+
+        #### Parameters:
+        - connect: Opens and authenticates a new session.
+
+        #### Raises:
+        - SMTPConnectError: If all the sessions are in use for `ACQUIRE_TIMEOUT`
+        seconds.
+        - OSError: If the new session can not be opened.
+        """
+
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise smtplib.SMTPConnectError(
+                SERVICE_NOT_AVAILABLE,
+                "All the SMTP sessions of the pool are in use.",
+            )
+
+        try:
+            while True:
+                with self._lock:
+                    if not self._idle:
+                        break
+
+                    connection, released_at = self._idle.pop()
+
+                idle = monotonic() - released_at
+
+                if idle >= self.idle_timeout or (
+                    idle >= self.health_check_interval
+                    and not self._is_alive(connection=connection)
+                ):
+                    _close_connection(connection=connection)
+                    continue
+
+                return connection
+
+            return connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(
+        self, connection: smtplib.SMTP | None, discard: bool = False
+    ) -> None:
+        """
+        Returns a session to the pool, or closes it if it may be broken.
+
+        #### Parameters:
+        - connection: The session returned by `acquire`, `None` if it was lost.
+        - discard: Whether to close the session instead of reusing it.
+        """
+
+        if connection is not None:
+            if discard:
+                _close_connection(connection=connection)
+            else:
+                with self._lock:
+                    self._idle.append((connection, monotonic()))
+
+        self._slots.release()
+
+    def close(self) -> None:
+        """
+        Closes the idle sessions.
+        """
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for connection, _ in idle:
+            _close_connection(connection=connection)
+
+
+# Pools of the current process, by server and account
+_POOLS: Dict[Tuple, SMTPConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(key: Tuple) -> SMTPConnectionPool:
+    """
+    Returns the pool of the given server and account, creating it if needed.
+    """
+
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = SMTPConnectionPool()
+
+        return _POOLS[key]
+
+
+class PooledEmailBackend(EmailBackend):
+    """
+    SMTP email backend that sends the messages through the sessions of a
+    `SMTPConnectionPool`, instead of opening a new session with its STARTTLS
+    handshake and login for each message. A message whose session was closed by the
+    server is sent again once with a new session.
+
+    The sessions belong to the pool, so `open` and `close` do nothing.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.pool = get_pool(
+            key=(
+                self.host,
+                self.port,
+                self.username,
+                self.use_tls,
+                self.use_ssl,
+            )
+        )
+
+    def open(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        pass
+
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Opens and authenticates a new session.
+
+        #### Raises:
+        - OSError: If the session can not be opened.
+        """
+
+        self.connection = None
+
+        if super().open() is None:
+            raise smtplib.SMTPConnectError(
+                SERVICE_NOT_AVAILABLE, "The SMTP session could not be opened."
+            )
+
+        connection, self.connection = self.connection, None
+
+        return connection
+
+    def _reconnect(self) -> None:
+        _close_connection(connection=self.connection)
+        self.connection = None
+        self.connection = self._connect()
+
+    def _send(self, email_message: EmailMessage) -> bool:
+        if not email_message.recipients():
+            return False
+
+        encoding = email_message.encoding or settings.DEFAULT_CHARSET
+        from_email = sanitize_address(email_message.from_email, encoding)
+        recipients = [
+            sanitize_address(addr, encoding) for addr in email_message.recipients()
+        ]
+        message = email_message.message().as_bytes(linesep="\r\n")
+
+        try:
+            try:
+                self.connection.sendmail(from_email, recipients, message)
+            except smtplib.SMTPException as exc:
+                if not _is_disconnection(exc=exc):
+                    raise
+
+                logger.info("The SMTP session was closed, reconnecting: %s", exc)
+                self._reconnect()
+                self.connection.sendmail(from_email, recipients, message)
+        except smtplib.SMTPException:
+            if not self.fail_silently:
+                raise
+
+            return False
+
+        return True
+
+    def send_messages(self, email_messages: Sequence[EmailMessage]) -> int:
+        if not email_messages:
+            return 0
+
+        with self._lock:
+            try:
+                self.connection = self.pool.acquire(connect=self._connect)
+            except OSError:
+                if not self.fail_silently:
+                    raise
+
+                return 0
+
+            num_sent = 0
+            broken = True
+
+            try:
+                for message in email_messages:
+                    if self.connection is None:
+                        # The session was lost and could not be opened again
+                        break
+
+                    if self._send(message):
+                        num_sent += 1
+
+                broken = False
+            finally:
+                # The session may be in the middle of a transaction
+                self.pool.release(connection=self.connection, discard=broken)
+                self.connection = None
+
+        return num_sent
@@ -0,0 +1,170 @@
+from apps.emails.rendering import get_email_template
+from apps.emails.paths import TEMPLATES
+from apps.monitoring.benchmarks import Operation
+from django.core.mail import EmailMessage, get_connection
+from django.template.loader import render_to_string
+from django.utils.http import urlsafe_base64_encode
+from django.utils.encoding import force_bytes
+from uuid import uuid4
+from time import sleep
+import socketserver
+import threading
+
+
+# Delay of the greeting of the sink, a stand-in for the network round-trips and the
+# STARTTLS handshake of a remote server
+HANDSHAKE_DELAY = 0.02
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """
+    Accepts the commands of a SMTP session without TLS nor authentication, and
+    discards the messages.
+    """
+
+    def _reply(self, line: bytes) -> None:
+        self.wfile.write(line + b"\r\n")
+
+    def handle(self) -> None:
+        with self.server.lock:
+            self.server.connections += 1
+
+        sleep(self.server.handshake_delay)
+        self._reply(b"220 sink ESMTP")
+        in_data = False
+
+        for line in self.rfile:
+            if in_data:
+                if line == b".\r\n":
+                    in_data = False
+
+                    with self.server.lock:
+                        self.server.messages += 1
+
+                    self._reply(b"250 OK")
+
+                continue
+
+            command = line[:4].upper()
+
+            if command == b"DATA":
+                in_data = True
+                self._reply(b"354 End data with <CR><LF>.<CR><LF>")
+            elif command == b"QUIT":
+                self._reply(b"221 Bye")
+                break
+            else:
+                self._reply(b"250 OK")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """
+    A local SMTP server that discards the messages, run in a daemon thread. It
+    counts the sessions opened and the messages received.
+
+    #### Parameters:
+    - handshake_delay: Seconds waited before greeting each new session,
+    `HANDSHAKE_DELAY` by default.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handshake_delay: float | None = None) -> None:
+        super().__init__(("127.0.0.1", 0), SMTPSinkHandler)
+        self.handshake_delay = (
+            HANDSHAKE_DELAY if handshake_delay is None else handshake_delay
+        )
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages = 0
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> "SMTPSink":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+        return self
+
+
+def _send_mail(backend: str) -> Operation:
+    sink = SMTPSink().start()
+    connection = get_connection(
+        backend=backend,
+        host=sink.server_address[0],
+        port=sink.port,
+        username="",
+        password="",
+        use_tls=False,
+    )
+
+    def operation() -> None:
+        EmailMessage(
+            subject="Benchmark",
+            body="Benchmark",
+            to=["benchmark@example.com"],
+            connection=connection,
+        ).send()
+
+    return operation
+
+
+def smtp() -> Operation:
+    """
+    Sends a message to a local SMTP sink with the SMTP backend of Django, which
+    opens a new session for each message, for comparison.
+    """
+
+    return _send_mail(backend="django.core.mail.backends.smtp.EmailBackend")
+
+
+def pooled_smtp() -> Operation:
+    """
+    Sends a message to a local SMTP sink with the `PooledEmailBackend`.
+    """
+
+    return _send_mail(backend="apps.emails.backends.PooledEmailBackend")
+
+
+# Template of the rendering benchmarks
+EMAIL_BODY = TEMPLATES["account_management"]["activation"]["email_body"]
+
+
+def _activation_context() -> dict:
+    return {
+        "email": f"{uuid4().hex}@example.com",
+        "user_uuidb64": urlsafe_base64_encode(s=force_bytes(s=uuid4())),
+        "token": uuid4().hex,
+    }
+
+
+def render_template() -> Operation:
+    """
+    Renders the activation email with the template engine, for comparison.
+    """
+
+    context = _activation_context()
+
+    def operation() -> None:
+        render_to_string(
+            template_name=EMAIL_BODY, context={**context, "domain": "example.com"}
+        )
+
+    return operation
+
+
+def render_skeleton() -> Operation:
+    """
+    Renders the activation email from its skeleton.
+    """
+
+    context = _activation_context()
+
+    def operation() -> None:
+        get_email_template(
+            template_name=EMAIL_BODY, fields=tuple(context), domain="example.com"
+        ).render(**context)
+
+    return operation
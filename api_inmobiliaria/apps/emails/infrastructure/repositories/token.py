@@ -2,6 +2,8 @@ from apps.emails.typing import Token
 from apps.emails import models
 from apps.api_exceptions import DatabaseConnectionAPIError
 from django.db import OperationalError
+from typing import List
+from datetime import datetime
 
 
 class TokenRepository:
@@ -29,6 +31,27 @@ class TokenRepository:
         except OperationalError:
             raise DatabaseConnectionAPIError()
 
+    @classmethod
+    def bulk_create(cls, tokens: List[Token], batch_size: int = 500) -> None:
+        """
+        Inserts the given tokens into the database, with an INSERT per batch.
+
+        #### Parameters:
+        - tokens: Tokens to be inserted.
+        - batch_size: Number of tokens inserted by each query.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            cls._model.objects.bulk_create(
+                objs=[cls._model(token=token) for token in tokens],
+                batch_size=batch_size,
+            )
+        except OperationalError:
+            raise DatabaseConnectionAPIError()
+
     @classmethod
     def get(cls, **filters) -> models.Token:
         """
@@ -49,3 +72,27 @@ class TokenRepository:
             raise DatabaseConnectionAPIError()
 
         return token
+
+    @classmethod
+    def consume(cls, token: Token, created_after: datetime) -> bool:
+        """
+        Deletes the given token with a single DELETE if it was created after the
+        given date, returning whether it was deleted. A token can only be consumed
+        once.
+
+        #### Parameters:
+        - token: Token to be consumed.
+        - created_after: The tokens created before this date are expired.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        try:
+            deleted, _ = cls._model.objects.filter(
+                token=token, date_joined__gt=created_after
+            ).delete()
+        except OperationalError:
+            raise DatabaseConnectionAPIError()
+
+        return bool(deleted)
@@ -32,6 +32,7 @@ class AccountActivationView(View):
     application_class = AccountActivation
     serializer_class = Base64UserTokenSerializer
     path_send_mail = None
+    query_budget = 6
 
     def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         """
@@ -3,6 +3,7 @@ from apps.emails.applications import ActionLinkManager
 from apps.users.infrastructure.repositories import UserRepository
 from utils.generators import TokenGenerator
 from utils.validators import is_valid_uuid
+from utils.throttling import SlidingWindowRateLimiter, get_client_ip
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.generics import GenericAPIView
@@ -25,6 +26,8 @@ class SendTokenAPIView(GenericAPIView):
     permission_classes = [AllowAny]
     application_class = None
     action = None
+    rate_limiter = SlidingWindowRateLimiter(scope="send_token")
+    query_budget = 2
     _user_repository = UserRepository
 
     def get(self, request: Request, *args, **kwargs) -> Response:
@@ -45,6 +48,10 @@ class SendTokenAPIView(GenericAPIView):
                 content_type="application/json",
             )
 
+        # Limits the emails sent to a user, before querying the database
+        self.rate_limiter.check(
+            user=kwargs["user_uuid"], ip=get_client_ip(request=request)
+        )
         base_user = self._user_repository.get_base_data(uuid=kwargs["user_uuid"])
 
         application: ActionLinkManager = self.application_class(
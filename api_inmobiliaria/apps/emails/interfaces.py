@@ -1,7 +1,8 @@
 from apps.users.models import BaseUser
 from apps.emails.typing import Token
 from apps.emails import models
-from typing import Protocol
+from typing import List, Protocol
+from datetime import datetime
 
 
 class ITokenRepository(Protocol):
@@ -23,6 +24,21 @@ class ITokenRepository(Protocol):
 
         ...
 
+    @classmethod
+    def bulk_create(cls, tokens: List[Token], batch_size: int = 500) -> None:
+        """
+        Inserts the given tokens into the database, with an INSERT per batch.
+
+        #### Parameters:
+        - tokens: Tokens to be inserted.
+        - batch_size: Number of tokens inserted by each query.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
     @classmethod
     def get(cls, **filters) -> models.Token:
         """
@@ -37,6 +53,23 @@ class ITokenRepository(Protocol):
 
         ...
 
+    @classmethod
+    def consume(cls, token: Token, created_after: datetime) -> bool:
+        """
+        Deletes the given token with a single DELETE if it was created after the
+        given date, returning whether it was deleted. A token can only be consumed
+        once.
+
+        #### Parameters:
+        - token: Token to be consumed.
+        - created_after: The tokens created before this date are expired.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the database.
+        """
+
+        ...
+
 
 class ITokenGenerator(Protocol):
     """
@@ -63,3 +96,25 @@ class ITokenGenerator(Protocol):
         """
 
         ...
+
+    def get_timestamp(self, token: Token) -> int | None:
+        """
+        Returns the timestamp embedded in the token, `None` if the token is
+        malformed.
+
+        #### Parameters:
+        - token: The token to be parsed.
+        """
+
+        ...
+
+    def is_expired(self, token: Token) -> bool:
+        """
+        Check if the timestamp embedded in the token is older than the expiration of
+        the tokens.
+
+        #### Parameters:
+        - token: A token whose timestamp can be parsed.
+        """
+
+        ...
@@ -0,0 +1,225 @@
+from apps.emails.infrastructure.repositories import TokenRepository
+from apps.emails.applications.account_management import AccountActivation
+from apps.emails.constants import TOKEN_EXPIRATION
+from apps.users.infrastructure.repositories import UserRepository
+from apps.users.models import BaseUser
+from utils.generators import TokenGenerator
+from utils.executors import RateLimitedExecutor
+from rest_framework_simplejwt.utils import aware_utcnow
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from typing import Any, Dict, Iterable, Iterator, List
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from uuid import UUID
+import json
+import os
+
+
+# Default location of the checkpoint of the campaign in progress
+DEFAULT_CHECKPOINT_PATH = (
+    Path(settings.BASE_DIR) / "data" / "resendactivationmails.checkpoint.json"
+)
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Command(BaseCommand):
+    """
+    Sends a new activation email to the users whose account has not been activated
+    and whose activation link has expired.
+
+    The users are streamed by UUID and processed in chunks. The tokens of a chunk
+    are generated and inserted with a single query, and its emails are sent by a
+    thread pool that respects the per-minute quota of the provider. After each chunk,
+    the progress is saved to a checkpoint file, so an interrupted campaign resumes
+    after the last completed chunk. The checkpoint is removed when the campaign
+    ends.
+    """
+
+    help = (
+        "Sends a new activation email to the users whose activation link expired"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--domain",
+            required=True,
+            help="Domain of the activation links.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of users fetched and processed at a time.",
+        )
+        parser.add_argument(
+            "--rate",
+            type=int,
+            default=100,
+            help="Maximum number of emails sent per minute.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of emails sent at the same time.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=str(DEFAULT_CHECKPOINT_PATH),
+            help="Path of the checkpoint used to resume the campaign.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the checkpoint and start a new campaign.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the users, without storing tokens nor sending emails.",
+        )
+
+    def load_checkpoint(self, path: Path, restart: bool) -> Dict[str, Any]:
+        """
+        Returns the progress of the campaign in progress, or of a new one.
+        """
+
+        if not restart and path.is_file():
+            try:
+                checkpoint = json.loads(path.read_text())
+                checkpoint["joined_before"] = datetime.fromisoformat(
+                    checkpoint["joined_before"]
+                )
+            except (ValueError, KeyError) as exc:
+                raise CommandError(
+                    f"The checkpoint {path} is not valid, use --restart: {exc}"
+                )
+
+            self.stdout.write(
+                msg=f"Resuming the campaign after {self.style.MIGRATE_LABEL(checkpoint['sent'])} emails."
+            )
+
+            return checkpoint
+
+        # The users that join once the campaign has started still have a valid link
+        return {
+            "joined_before": aware_utcnow() - TOKEN_EXPIRATION,
+            "cursor": None,
+            "sent": 0,
+            "failed": 0,
+        }
+
+    def save_checkpoint(self, path: Path, checkpoint: Dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.tmp")
+        temporary_path.write_text(
+            json.dumps(
+                {
+                    **checkpoint,
+                    "joined_before": checkpoint["joined_before"].isoformat(),
+                }
+            )
+        )
+        os.replace(temporary_path, path)
+
+    def send_chunk(
+        self,
+        users: List[BaseUser],
+        application: AccountActivation,
+        token_generator: TokenGenerator,
+        executor: RateLimitedExecutor,
+        domain: str,
+    ) -> int:
+        """
+        Generates and stores the tokens of the users, and sends their emails.
+        Returns the number of emails that could not be sent.
+        """
+
+        tokens = [token_generator.make_token(user=user) for user in users]
+
+        if application.store_tokens:
+            TokenRepository.bulk_create(tokens=tokens)
+
+        futures = [
+            executor.submit(
+                application.dispatch, user=user, token=token, domain=domain
+            )
+            for user, token in zip(users, tokens)
+        ]
+        failed = 0
+
+        for user, future in zip(users, futures):
+            try:
+                future.result()
+            except OSError as exc:
+                failed += 1
+                self.stderr.write(msg=f"The email to {user.email} failed: {exc}")
+
+        return failed
+
+    def handle(self, *args, **options) -> None:
+        """
+        Runs the campaign.
+        """
+
+        for option in ("chunk_size", "rate", "workers"):
+            if options[option] < 1:
+                raise CommandError(
+                    f"--{option.replace('_', '-')} must be positive."
+                )
+
+        path = Path(options["checkpoint"])
+        checkpoint = self.load_checkpoint(path=path, restart=options["restart"])
+        users = UserRepository.iter_inactive(
+            joined_before=checkpoint["joined_before"],
+            after=UUID(checkpoint["cursor"]) if checkpoint["cursor"] else None,
+            chunk_size=options["chunk_size"],
+        )
+
+        if options["dry_run"]:
+            count = sum(1 for _ in users)
+
+            self.stdout.write(
+                msg=f"{self.style.MIGRATE_LABEL(count)} users would receive an activation email."
+            )
+
+            return
+
+        token_generator = TokenGenerator()
+        application = AccountActivation(
+            token_class=token_generator, token_repository=TokenRepository
+        )
+
+        with RateLimitedExecutor(
+            max_workers=options["workers"], rate=options["rate"]
+        ) as executor:
+            for chunk in _chunks(users, size=options["chunk_size"]):
+                failed = self.send_chunk(
+                    users=chunk,
+                    application=application,
+                    token_generator=token_generator,
+                    executor=executor,
+                    domain=options["domain"],
+                )
+                checkpoint["cursor"] = str(chunk[-1].uuid)
+                checkpoint["sent"] += len(chunk) - failed
+                checkpoint["failed"] += failed
+                self.save_checkpoint(path=path, checkpoint=checkpoint)
+
+                self.stdout.write(
+                    msg=f"{self.style.MIGRATE_LABEL(checkpoint['sent'])} emails sent."
+                )
+
+        path.unlink(missing_ok=True)
+
+        self.stdout.write(
+            msg=f"{self.style.MIGRATE_LABEL(checkpoint['sent'])} activation emails sent, {checkpoint['failed']} failed."
+        )
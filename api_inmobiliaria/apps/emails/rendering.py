@@ -0,0 +1,307 @@
+from django.template.loader import render_to_string
+from django.utils.html import escape
+from html.parser import HTMLParser
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple
+from uuid import uuid4
+import re
+
+
+# A compound selector that can be inlined, a type or `*` and any classes
+COMPOUND_SELECTOR = re.compile(r"^(\*|[a-zA-Z][\w-]*)?((?:\.[\w-]+)*)$")
+STYLE_ATTRIBUTE = re.compile(r"""\sstyle\s*=\s*("[^"]*"|'[^']*'|[^\s>]+)""", re.I)
+# The compound selectors of a selector, as (type, classes), and the rules
+Selector = List[Tuple[str, Set[str]]]
+Rule = Tuple[Selector, str]
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+
+
+def parse_css(css: str) -> Tuple[List[Rule], str]:
+    """
+    Splits a style sheet into the rules that can be inlined and the CSS that must
+    be kept in the `<style>` block.
+
+    The rules that can be inlined have selectors made of types, `*` and classes
+    joined by the descendant combinator. The at-rules, such as the media queries,
+    and the selectors that target the elements added by the email clients, such as
+    attribute, id or sibling selectors, are kept.
+
+    #### Parameters:
+    - css: The content of the `<style>` block.
+    """
+
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    rules = []
+    kept = []
+    position = 0
+
+    while (start := css.find("{", position)) != -1:
+        prelude = css[position:start].strip()
+
+        if prelude.startswith("@"):
+            # The block of an at-rule ends at its matching brace
+            depth, end = 0, start
+
+            for end in range(start, len(css)):
+                depth += {"{": 1, "}": -1}.get(css[end], 0)
+
+                if depth == 0:
+                    break
+
+            kept.append(css[position : end + 1].strip())
+            position = end + 1
+            continue
+
+        end = css.find("}", start)
+        end = len(css) if end == -1 else end
+        declarations = " ".join(css[start + 1 : end].split()).strip("; ")
+        not_inlined = []
+
+        for selector in prelude.split(","):
+            compounds = [
+                COMPOUND_SELECTOR.match(compound) for compound in selector.split()
+            ]
+
+            if compounds and all(compounds):
+                rules.append(
+                    (
+                        [
+                            (
+                                (match.group(1) or "*").lower(),
+                                set(match.group(2).split(".")[1:]),
+                            )
+                            for match in compounds
+                        ],
+                        declarations,
+                    )
+                )
+            else:
+                not_inlined.append(selector.strip())
+
+        if not_inlined:
+            kept.append(f"{', '.join(not_inlined)} {{ {declarations}; }}")
+
+        position = end + 1
+
+    return rules, "\n".join(kept)
+
+
+class CSSInliner(HTMLParser):
+    """
+    Moves the rules of the `<style>` blocks of an HTML document that can be inlined
+    to the `style` attribute of the elements of its body, see `parse_css`. The
+    declarations of the rules are added before the ones of the attribute, in order
+    of specificity, so the attribute still wins.
+    """
+
+    def __init__(self, html: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.html = html
+        self.rules: List[Rule] = []
+        # Start offsets of the lines of the document, to locate the tags
+        self._lines = [0] + [match.end() for match in re.finditer("\n", html)]
+        self._stack: List[Tuple[str, Set[str]]] = []
+        self._in_body = False
+        # Replacements of the document, as (start, end, text)
+        self._replacements: List[Tuple[int, int, str]] = []
+
+    def inline(self) -> str:
+        for match in re.finditer(
+            r"(<style[^>]*>)(.*?)(</style>)", self.html, re.S
+        ):
+            rules, kept = parse_css(css=match.group(2))
+            self.rules.extend(rules)
+            self._replacements.append(
+                (
+                    match.start(),
+                    match.end(),
+                    f"{match.group(1)}\n{kept}\n{match.group(3)}" if kept else "",
+                )
+            )
+
+        if self.rules:
+            self.feed(self.html)
+            self.close()
+
+        html = self.html
+
+        for start, end, text in sorted(self._replacements, reverse=True):
+            html = html[:start] + text + html[end:]
+
+        return html
+
+    def _matches(self, selector: Selector, element: Tuple[str, Set[str]]) -> bool:
+        def match(
+            compound: Tuple[str, Set[str]], candidate: Tuple[str, Set[str]]
+        ) -> bool:
+            tag, classes = compound
+
+            return tag in ("*", candidate[0]) and classes <= candidate[1]
+
+        if not match(selector[-1], element):
+            return False
+
+        ancestors = iter(reversed(self._stack))
+
+        return all(
+            any(match(compound, ancestor) for ancestor in ancestors)
+            for compound in reversed(selector[:-1])
+        )
+
+    def handle_starttag(
+        self, tag: str, attrs: List[Tuple[str, str | None]]
+    ) -> None:
+        attributes: Dict[str, str | None] = dict(attrs)
+        element = (tag, set((attributes.get("class") or "").split()))
+        self._in_body = self._in_body or tag == "body"
+
+        if self._in_body:
+            matches = sorted(
+                (
+                    (
+                        sum(len(classes) for _, classes in selector),
+                        sum(name != "*" for name, _ in selector),
+                    ),
+                    index,
+                    declarations,
+                )
+                for index, (selector, declarations) in enumerate(self.rules)
+                if self._matches(selector=selector, element=element)
+            )
+
+            if matches:
+                self._add_style(
+                    declarations=[declarations for _, _, declarations in matches],
+                    style=attributes.get("style"),
+                )
+
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(element)
+
+    def handle_startendtag(
+        self, tag: str, attrs: List[Tuple[str, str | None]]
+    ) -> None:
+        self.handle_starttag(tag=tag, attrs=attrs)
+
+        if tag not in VOID_ELEMENTS:
+            self._stack.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        # Pops the unclosed elements too
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                del self._stack[index:]
+                break
+
+    def _add_style(self, declarations: List[str], style: str | None) -> None:
+        line, offset = self.getpos()
+        start = self._lines[line - 1] + offset
+        text = self.get_starttag_text()
+        value = escape(
+            "; ".join(declarations + ([style.strip()] if style else []))
+        )
+
+        if STYLE_ATTRIBUTE.search(text):
+            new_text = STYLE_ATTRIBUTE.sub(f' style="{value}"', text, count=1)
+        else:
+            closing = "/>" if text.endswith("/>") else ">"
+            new_text = f'{text[: -len(closing)].rstrip()} style="{value}"{closing}'
+
+        self._replacements.append((start, start + len(text), new_text))
+
+
+def inline_css(html: str) -> str:
+    """
+    Returns the HTML document with the CSS rules of its `<style>` blocks that can
+    be inlined moved to the `style` attribute of the elements, see `CSSInliner`.
+
+    #### Parameters:
+    - html: The HTML document.
+    """
+
+    return CSSInliner(html=html).inline()
+
+
+class EmailTemplate:
+    """
+    An email template rendered once into a skeleton, with placeholders for the
+    fields that change with each message. Rendering a message only joins the static
+    parts of the skeleton with the values of the fields, without parsing the
+    template nor resolving its tags.
+
+    The values are HTML-escaped, as the template would do, so the values of the
+    fields used in URLs must already be URL-safe. The CSS rules of the template
+    that can be inlined are moved to the elements when the skeleton is rendered.
+    """
+
+    def __init__(
+        self, template_name: str, fields: Tuple[str, ...], **context
+    ) -> None:
+        """
+        Renders the skeleton of the template.
+
+        #### Parameters:
+        - template_name: The name of the template.
+        - fields: The names of the context variables that change with each message.
+        - context: The context variables shared by all the messages.
+        """
+
+        # The placeholders pass unchanged through the escaping and the URL quoting
+        # of the template
+        marker = uuid4().hex
+        skeleton = inline_css(
+            html=render_to_string(
+                template_name=template_name,
+                context={
+                    **context,
+                    **{field: f"{marker}{field}{marker}" for field in fields},
+                },
+            )
+        )
+        self.fields = fields
+        # The static parts, with the name of a field between each two parts
+        self._parts: List[str] = re.split(f"{marker}(\\w+?){marker}", skeleton)
+
+    def render(self, **values) -> str:
+        """
+        Renders a message with the given values of the fields.
+
+        #### Raises:
+        - KeyError: If the value of a field is missing.
+        """
+
+        parts = self._parts.copy()
+        parts[1::2] = [escape(values[field]) for field in self._parts[1::2]]
+
+        return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def get_email_template(
+    template_name: str, fields: Tuple[str, ...], domain: str
+) -> EmailTemplate:
+    """
+    Returns the skeleton of the given template for the given domain, rendering it
+    on the first call of each process.
+
+    #### Parameters:
+    - template_name: The name of the template.
+    - fields: The names of the context variables that change with each message.
+    - domain: The domain of the links of the message.
+    """
+
+    return EmailTemplate(template_name=template_name, fields=fields, domain=domain)
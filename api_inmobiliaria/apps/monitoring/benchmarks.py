@@ -0,0 +1,147 @@
+from django.test import Client
+from django.conf import settings
+from django.utils.module_loading import import_string
+from typing import Any, Callable, Dict, List, NamedTuple
+from time import perf_counter
+from math import ceil
+
+
+# Benchmarks that can be run with the `benchmark` command, by name. Each one is the
+# dotted path of a function that prepares the data of the benchmark and returns the
+# operation to measure.
+BENCHMARKS: Dict[str, str] = {
+    "auth.update": "apps.authentication.benchmarks.update_token",
+    "deployment.brotli": "apps.deployment.benchmarks.brotli",
+    "deployment.full_chain": "apps.deployment.benchmarks.full_chain",
+    "deployment.gzip": "apps.deployment.benchmarks.gzip",
+    "deployment.lean_chain": "apps.deployment.benchmarks.lean_chain",
+    "emails.pooled_smtp": "apps.emails.benchmarks.pooled_smtp",
+    "emails.render_skeleton": "apps.emails.benchmarks.render_skeleton",
+    "emails.render_template": "apps.emails.benchmarks.render_template",
+    "emails.smtp": "apps.emails.benchmarks.smtp",
+    "users.breached_password": "apps.users.benchmarks.breached_password",
+    "users.common_password": "apps.users.benchmarks.common_password",
+    "users.render_json": "apps.users.benchmarks.render_json",
+    "users.render_orjson": "apps.users.benchmarks.render_orjson",
+}
+
+# An operation may have a `note` attribute, a text reported along with its results,
+# such as the size of its output
+Operation = Callable[[], Any]
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    The time spent in each iteration of a benchmark, in seconds, and the private
+    memory allocated by the process while preparing and running it, in bytes.
+    """
+
+    name: str
+    timings: List[float]
+    memory: int | None = None
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Operations per second.
+        """
+
+        return len(self.timings) / self.total if self.total else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the given percentile of the timings, with the nearest-rank method.
+        """
+
+        timings = sorted(self.timings)
+        rank = max(ceil(percent / 100 * len(timings)), 1)
+
+        return timings[rank - 1]
+
+
+def get_benchmark(name: str) -> Callable[[], Operation]:
+    """
+    Returns the function that prepares the given benchmark.
+
+    #### Parameters:
+    - name: The name of the benchmark in `BENCHMARKS`.
+
+    #### Raises:
+    - KeyError: If there is no benchmark with the given name.
+    """
+
+    return import_string(BENCHMARKS[name])
+
+
+def get_private_memory() -> int | None:
+    """
+    Returns the private memory of the process in bytes, the resident memory that is
+    not shared with other processes through files, `None` if the platform does not
+    report it.
+    """
+
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    return None
+
+
+def run_benchmark(
+    name: str, operation: Operation, iterations: int, warmup: int = 0
+) -> BenchmarkResult:
+    """
+    Runs the given operation and measures each iteration.
+
+    #### Parameters:
+    - name: The name of the benchmark.
+    - operation: The operation to measure.
+    - iterations: Number of measured iterations.
+    - warmup: Number of iterations run before measuring, to fill the caches.
+    """
+
+    for _ in range(warmup):
+        operation()
+
+    timings = []
+
+    for _ in range(iterations):
+        start = perf_counter()
+        operation()
+        timings.append(perf_counter() - start)
+
+    return BenchmarkResult(name=name, timings=timings)
+
+
+def get_client() -> Client:
+    """
+    Returns a test client whose requests are accepted by the `ALLOWED_HOSTS`
+    setting, to measure the views along with the middleware.
+    """
+
+    hosts = [host for host in settings.ALLOWED_HOSTS if host and "*" not in host]
+
+    return Client(HTTP_HOST=hosts[0].lstrip(".") if hosts else "localhost")
+
+
+def check_response(response, status_code: int = 200) -> None:
+    """
+    Fails the benchmark if a request does not return the expected status code, so
+    errors are not measured as fast responses.
+
+    #### Raises:
+    - RuntimeError: If the status code is not the expected one.
+    """
+
+    if response.status_code != status_code:
+        raise RuntimeError(
+            f"Expected status code {status_code}, got {response.status_code}: {response.content[:200]!r}"
+        )
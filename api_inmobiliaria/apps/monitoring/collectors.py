@@ -0,0 +1,86 @@
+from typing import Any, Callable, Dict
+from collections import Counter
+from time import perf_counter
+import re
+
+
+# Patterns used to normalize the SQL of a query into its fingerprint
+IN_CLAUSE = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+WHITESPACES = re.compile(r"\s+")
+
+
+def get_fingerprint(sql: str) -> str:
+    """
+    Normalizes the SQL of a query so that queries that only differ in their
+    parameters share the same fingerprint.
+    """
+
+    sql = IN_CLAUSE.sub("(%s, ...)", sql)
+    sql = LITERALS.sub("?", sql)
+
+    return WHITESPACES.sub(" ", sql).strip()
+
+
+class QueryTimer:
+    """
+    Database execute wrapper that counts the queries executed and accumulates the
+    time spent running them.
+
+    It is designed to be installed with `connection.execute_wrapper()` during the
+    request-response cycle.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(
+        self,
+        execute: Callable,
+        sql: str,
+        params: Any,
+        many: bool,
+        context: Dict[str, Any],
+    ) -> Any:
+        start = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += perf_counter() - start
+            self.count += 1
+
+
+class QueryCollector(QueryTimer):
+    """
+    Database execute wrapper that, in addition to counting and timing the queries,
+    groups them by fingerprint to detect repeated queries such as the ones caused by
+    N+1 access patterns.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fingerprints: Counter = Counter()
+
+    def __call__(
+        self,
+        execute: Callable,
+        sql: str,
+        params: Any,
+        many: bool,
+        context: Dict[str, Any],
+    ) -> Any:
+        self.fingerprints[get_fingerprint(sql=sql)] += 1
+
+        return super().__call__(execute, sql, params, many, context)
+
+    def duplicates(self) -> Dict[str, int]:
+        """
+        Returns the fingerprints of the queries that were executed more than once and
+        the number of times they were executed.
+        """
+
+        return {
+            sql: count for sql, count in self.fingerprints.items() if count > 1
+        }
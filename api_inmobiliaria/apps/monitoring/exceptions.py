@@ -0,0 +1,5 @@
+class QueryBudgetExceededError(Exception):
+    """
+    Exception raised when a view executes more database queries than its declared
+    query budget allows.
+    """
@@ -0,0 +1,93 @@
+from django.conf import settings
+from typing import List, NamedTuple
+import subprocess
+import sys
+import os
+
+
+# Prefix of the lines written by the `-X importtime` option of the interpreter
+IMPORT_TIME_PREFIX = "import time:"
+
+
+class ImportTime(NamedTuple):
+    """
+    Time spent importing a module, in microseconds. The cumulative time includes
+    the modules imported by the module.
+    """
+
+    module: str
+    self_time: int
+    cumulative_time: int
+    depth: int
+
+
+def parse_import_times(output: str) -> List[ImportTime]:
+    """
+    Returns the import times reported by the `-X importtime` option of the
+    interpreter, ignoring the header and any other output.
+
+    #### Parameters:
+    - output: The standard error of the interpreter.
+    """
+
+    import_times = []
+
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+
+        try:
+            self_time, cumulative_time, module = line[
+                len(IMPORT_TIME_PREFIX) :
+            ].split("|")
+            self_time, cumulative_time = int(self_time), int(cumulative_time)
+        except ValueError:
+            # Header of the report
+            continue
+
+        # Nested imports are indented two spaces per level
+        name = module.lstrip()
+        depth = (len(module) - len(name) - 1) // 2
+        import_times.append(
+            ImportTime(
+                module=name,
+                self_time=self_time,
+                cumulative_time=cumulative_time,
+                depth=depth,
+            )
+        )
+
+    return import_times
+
+
+def measure_import_times(modules: List[str]) -> List[ImportTime]:
+    """
+    Imports the given modules in a new interpreter, after setting up Django with
+    the current settings, and returns the time spent importing each module. A new
+    interpreter is used because the modules are already imported in the current
+    process, as happens when a gunicorn worker boots.
+
+    #### Parameters:
+    - modules: The dotted paths of the modules to import.
+
+    #### Raises:
+    - RuntimeError: If the modules could not be imported.
+    """
+
+    code = "; ".join(
+        ["import django", "django.setup()"]
+        + [f"import {module}" for module in modules]
+    )
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    return parse_import_times(output=process.stderr)
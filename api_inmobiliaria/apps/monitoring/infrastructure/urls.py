@@ -0,0 +1,16 @@
+from django.urls import path
+from .views import MetricsView, ProfileView
+
+
+urlpatterns = [
+    path(
+        route="metrics/",
+        view=MetricsView.as_view(),
+        name="metrics",
+    ),
+    path(
+        route="profile/",
+        view=ProfileView.as_view(),
+        name="profile",
+    ),
+]
@@ -0,0 +1,2 @@
+from .metrics import MetricsView
+from .profile import ProfileView
@@ -0,0 +1,56 @@
+from apps.monitoring.metrics import REGISTRY
+from utils.throttling import get_client_ip
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse, HttpResponseNotFound
+from django.views.generic import View
+from django.conf import settings
+import hmac
+
+
+class MetricsView(View):
+    """
+    Internal view that exposes the metrics of all the processes in the Prometheus
+    text format. Only the addresses of the `ALLOWED_IPS` list of the `METRICS`
+    setting can access it, with the `TOKEN` of the setting as a bearer token when it
+    is set. The view does not exist for any other client.
+
+    The address of the client is read behind the trusted proxies of the
+    `RATE_LIMITS` setting, see `get_client_ip`, so the requests forwarded by a
+    reverse proxy of the same host are not taken as local.
+    """
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Handles the GET request to scrape the metrics.
+        """
+
+        if not self.is_allowed(request=request):
+            return HttpResponseNotFound()
+
+        return HttpResponse(
+            content=REGISTRY.render(), content_type=self.content_type
+        )
+
+    @staticmethod
+    def is_allowed(request: HttpRequest) -> bool:
+        """
+        Check that the client address is allowed and that the request has the
+        bearer token of the metrics, when there is one.
+        """
+
+        config = getattr(settings, "METRICS", {})
+
+        if get_client_ip(request=request) not in config.get("ALLOWED_IPS", []):
+            return False
+
+        token = config.get("TOKEN")
+
+        if not token:
+            return True
+
+        return hmac.compare_digest(
+            request.headers.get("Authorization", "").encode(),
+            f"Bearer {token}".encode(),
+        )
@@ -0,0 +1,28 @@
+from apps.monitoring.profiler import SAMPLER
+from django.contrib.admin.views.decorators import staff_member_required
+from django.utils.decorators import method_decorator
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse
+from django.views.generic import View
+
+
+@method_decorator(staff_member_required, name="dispatch")
+class ProfileView(View):
+    """
+    Admin-only view that serves the folded stacks collected by the profiler as a
+    collapsed-stack file, which can be passed to flamegraph tools. The `route` query
+    parameter limits the file to the stacks of a route pattern.
+    """
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Handles the GET request to download the collapsed-stack file.
+        """
+
+        response = HttpResponse(
+            content=SAMPLER.render(route=request.GET.get("route")),
+            content_type="text/plain; charset=utf-8",
+        )
+        response["Content-Disposition"] = 'attachment; filename="profile.folded"'
+
+        return response
@@ -0,0 +1,104 @@
+from apps.monitoring.benchmarks import (
+    BENCHMARKS,
+    get_benchmark,
+    get_private_memory,
+    run_benchmark,
+)
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    """
+    Runs the benchmarks of the project and reports their throughput and latency.
+    Each benchmark runs inside a transaction that is rolled back, so the data it
+    creates is not kept in the database.
+    """
+
+    help = "Runs the benchmarks of the project and reports their throughput"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help="Benchmarks to run, all of them by default.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Number of measured iterations of each benchmark.",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=20,
+            help="Number of iterations run before measuring each benchmark.",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="List the available benchmarks.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Runs the benchmarks.
+        """
+
+        if options["list"]:
+            for name in BENCHMARKS:
+                self.stdout.write(name)
+
+            return
+
+        names = options["names"] or list(BENCHMARKS)
+        unknown = [name for name in names if name not in BENCHMARKS]
+
+        if unknown:
+            raise CommandError(f"Unknown benchmarks: {', '.join(unknown)}.")
+
+        if options["iterations"] < 1:
+            raise CommandError("At least one iteration is required.")
+
+        self.stdout.write(
+            f"{'benchmark':<24}{'ops/s':>10}{'p50 (us)':>10}{'p99 (us)':>10}{'mem (MB)':>10}"
+        )
+
+        for name in names:
+            initial_memory = get_private_memory()
+
+            with transaction.atomic():
+                try:
+                    operation = get_benchmark(name=name)()
+                    result = run_benchmark(
+                        name=name,
+                        operation=operation,
+                        iterations=options["iterations"],
+                        warmup=options["warmup"],
+                    )
+                except RuntimeError as exc:
+                    raise CommandError(f"The benchmark {name} failed: {exc}")
+                finally:
+                    transaction.set_rollback(True)
+
+            if initial_memory is not None:
+                result = result._replace(
+                    memory=get_private_memory() - initial_memory
+                )
+
+            memory = (
+                "-"
+                if result.memory is None
+                else f"{result.memory / 1024 / 1024:.1f}"
+            )
+
+            self.stdout.write(
+                f"{name:<24}{self.style.MIGRATE_LABEL(f'{result.throughput:>10.1f}')}"
+                f"{result.percentile(50) * 1e6:>10.1f}{result.percentile(99) * 1e6:>10.1f}{memory:>10}"
+            )
+
+            note = getattr(operation, "note", None)
+
+            if note:
+                self.stdout.write(f"  {note}")
@@ -0,0 +1,45 @@
+from apps.monitoring.profiler import SAMPLER
+from django.core.management.base import BaseCommand, CommandError
+from pathlib import Path
+
+
+class Command(BaseCommand):
+    """
+    Writes the folded stacks collected by the profiler of every process to a
+    collapsed-stack file for flamegraph tools.
+    """
+
+    help = "Writes the folded stacks collected by the profiler to a collapsed-stack file"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--route",
+            help="Only write the stacks of this route pattern.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of the collapsed-stack file, the standard output by default.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Writes the folded stacks collected by the profiler of every process.
+        """
+
+        if SAMPLER.directory is None:
+            raise CommandError(
+                "The DIRECTORY of the PROFILER setting is required to read the stacks of the server processes."
+            )
+
+        content = SAMPLER.render(route=options["route"])
+
+        if not options["output"]:
+            self.stdout.write(content, ending="")
+            return
+
+        Path(options["output"]).write_text(content)
+        number_stacks = len(content.splitlines())
+
+        self.stdout.write(
+            msg=f"{self.style.MIGRATE_LABEL(number_stacks)} folded stacks were written to {options['output']}."
+        )
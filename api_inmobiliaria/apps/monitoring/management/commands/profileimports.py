@@ -0,0 +1,75 @@
+from apps.monitoring.importtime import measure_import_times
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+
+
+class Command(BaseCommand):
+    """
+    Reports the slowest imports performed when a worker boots, that is, when the
+    WSGI application and the URL configuration are loaded.
+    """
+
+    help = "Reports the slowest imports performed when a worker boots"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "modules",
+            nargs="*",
+            help="Modules to import, the WSGI application and the URL configuration by default.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of imports to report.",
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Sort the imports by their cumulative time or by their own time.",
+        )
+        parser.add_argument(
+            "--prefix",
+            help="Only report the modules whose name starts with this prefix.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Reports the slowest imports.
+        """
+
+        modules = options["modules"] or [
+            settings.WSGI_APPLICATION.rsplit(".", 1)[0],
+            settings.ROOT_URLCONF,
+        ]
+
+        try:
+            import_times = measure_import_times(modules=modules)
+        except RuntimeError as exc:
+            raise CommandError(f"The modules could not be imported: {exc}")
+
+        total = sum(
+            item.cumulative_time for item in import_times if item.depth == 0
+        )
+
+        if options["prefix"]:
+            import_times = [
+                item
+                for item in import_times
+                if item.module.startswith(options["prefix"])
+            ]
+
+        key = "cumulative_time" if options["sort"] == "cumulative" else "self_time"
+        import_times.sort(key=lambda item: getattr(item, key), reverse=True)
+
+        self.stdout.write(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+
+        for item in import_times[: options["limit"]]:
+            self.stdout.write(
+                f"{item.cumulative_time / 1000:>16.1f} {item.self_time / 1000:>10.1f}  {item.module}"
+            )
+
+        self.stdout.write(
+            msg=f"The imports took {self.style.MIGRATE_LABEL(f'{total / 1000:.1f} ms')} in total, including the interpreter startup."
+        )
@@ -0,0 +1,372 @@
+from django.conf import settings
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from time import monotonic, perf_counter
+from pathlib import Path
+import threading
+import atexit
+import json
+import os
+
+
+# Default buckets of the histograms, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric(ABC):
+    """
+    Base class for the metrics of the registry. A metric is identified by its name
+    and stores one value for each combination of its label values. The subclasses
+    define how the values of the processes are merged and exposed.
+    """
+
+    type: str
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        registry: "MetricsRegistry" = None,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[LabelValues, Any] = {}
+        self._registry = registry or REGISTRY
+        self._registry.register(metric=self)
+
+    def _get_key(self, labels: Dict[str, Any]) -> LabelValues:
+        """
+        Returns the label values in the order in which the label names were declared.
+        """
+
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as exc:
+            raise ValueError(
+                f"Missing label {exc.args[0]} for the {self.name} metric."
+            )
+
+    def _format_labels(self, key: LabelValues, **extra: str) -> str:
+        """
+        Returns the labels of a sample in the Prometheus text format.
+        """
+
+        labels = {**dict(zip(self.labelnames, key)), **extra}
+
+        if not labels:
+            return ""
+
+        values = ",".join(
+            '{}="{}"'.format(
+                name,
+                value.replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n"),
+            )
+            for name, value in labels.items()
+        )
+
+        return f"{{{values}}}"
+
+    def reset(self) -> None:
+        """
+        Removes all the values recorded by the metric.
+        """
+
+        self._values = {}
+
+    @abstractmethod
+    def merge(self, value: Any, other: Any) -> Any:
+        """
+        Adds the value recorded by another process to the given value, which is
+        `None` if it has not been recorded by any process yet.
+        """
+
+    @abstractmethod
+    def samples(self, values: Dict[LabelValues, Any]) -> List[str]:
+        """
+        Returns the samples of the metric in the Prometheus text format.
+        """
+
+
+class Counter(Metric):
+    """
+    A metric whose value can only increase, such as the number of requests served.
+    """
+
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """
+        Increments the counter of the given label values.
+        """
+
+        key = self._get_key(labels=labels)
+
+        with self._registry.lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def merge(self, value: float | None, other: float) -> float:
+        return other if value is None else value + other
+
+    def samples(self, values: Dict[LabelValues, float]) -> List[str]:
+        return [
+            f"{self.name}{self._format_labels(key)} {value}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class Histogram(Metric):
+    """
+    A metric that counts observations, such as request durations, in configurable
+    buckets and also keeps their sum and count.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        *args,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """
+        Records an observation for the given label values.
+        """
+
+        key = self._get_key(labels=labels)
+
+        with self._registry.lock:
+            # One counter for each bucket plus the +Inf bucket, the sum and the count
+            data = self._values.get(key)
+
+            if data is None:
+                data = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[index] += 1
+                    break
+            else:
+                data[len(self.buckets)] += 1
+
+            data[-2] += value
+            data[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """
+        Context manager that observes the time spent executing its block.
+        """
+
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - start, **labels)
+
+    def merge(self, value: List[float] | None, other: List[float]) -> List[float]:
+        if value is None:
+            return list(other)
+
+        return [count + other_count for count, other_count in zip(value, other)]
+
+    def samples(self, values: Dict[LabelValues, List[float]]) -> List[str]:
+        samples = []
+
+        for key, data in sorted(values.items()):
+            cumulative = 0
+
+            for bound, count in zip(self.buckets + ("+Inf",), data):
+                cumulative += count
+                labels = self._format_labels(key, le=str(bound))
+                samples.append(f"{self.name}_bucket{labels} {cumulative}")
+
+            labels = self._format_labels(key)
+            samples.append(f"{self.name}_sum{labels} {data[-2]}")
+            samples.append(f"{self.name}_count{labels} {data[-1]}")
+
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Registry that keeps the metrics of the current process and exposes the metrics
+    of all the processes in the Prometheus text format.
+
+    When gunicorn runs several workers, each worker has its own values. If a
+    directory is configured in the `METRICS` setting, every worker periodically
+    writes a snapshot of its values to a file of that directory named after its
+    PID, and the values of all the files are added up when the metrics are
+    collected. The directory must be emptied before the workers are started.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self._metrics: Dict[str, Metric] = {}
+        self._last_flush = 0.0
+
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+        atexit.register(self.flush, force=True)
+
+    @property
+    def directory(self) -> Path | None:
+        """
+        Returns the directory shared by the processes, if any.
+        """
+
+        directory = getattr(settings, "METRICS", {}).get("DIRECTORY")
+
+        return Path(directory) if directory else None
+
+    def register(self, metric: Metric) -> None:
+        """
+        Adds a metric to the registry.
+        """
+
+        if metric.name in self._metrics:
+            raise ValueError(f"The {metric.name} metric is already registered.")
+
+        self._metrics[metric.name] = metric
+
+    def _reset_after_fork(self) -> None:
+        """
+        Discards the values inherited from the parent process, they are already
+        accounted for by the parent.
+        """
+
+        self.lock = threading.Lock()
+        self._last_flush = 0.0
+
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def _snapshot(self) -> Dict[str, List[Tuple[LabelValues, Any]]]:
+        """
+        Returns a copy of the values of the current process.
+        """
+
+        with self.lock:
+            return {
+                name: [
+                    (key, list(value) if isinstance(value, list) else value)
+                    for key, value in metric._values.items()
+                ]
+                for name, metric in self._metrics.items()
+            }
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Writes the values of the current process to the shared directory, at most
+        once per `FLUSH_INTERVAL` seconds unless `force` is used.
+        """
+
+        directory = self.directory
+
+        if directory is None:
+            return
+
+        interval = settings.METRICS.get("FLUSH_INTERVAL", 5)
+
+        if not force and monotonic() - self._last_flush < interval:
+            return
+
+        self._last_flush = monotonic()
+        path = directory / f"metrics_{os.getpid()}.json"
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(self._snapshot()))
+        os.replace(temporary_path, path)
+
+    def collect(self) -> Dict[str, Dict[LabelValues, Any]]:
+        """
+        Returns the values of all the processes added up.
+        """
+
+        snapshots = [self._snapshot()]
+        directory = self.directory
+
+        if directory is not None:
+            own_file = f"metrics_{os.getpid()}.json"
+
+            for path in directory.glob("metrics_*.json"):
+                if path.name == own_file:
+                    continue
+                try:
+                    snapshots.append(json.loads(path.read_text()))
+                except (OSError, ValueError):
+                    # The file was removed or is being replaced
+                    continue
+
+        collected: Dict[str, Dict[LabelValues, Any]] = defaultdict(dict)
+
+        for snapshot in snapshots:
+            for name, values in snapshot.items():
+                metric = self._metrics.get(name)
+
+                if metric is None:
+                    continue
+
+                for key, value in values:
+                    key = tuple(key)
+                    collected[name][key] = metric.merge(
+                        collected[name].get(key), value
+                    )
+
+        return collected
+
+    def render(self) -> str:
+        """
+        Returns the metrics of all the processes in the Prometheus text format.
+        """
+
+        collected = self.collect()
+        lines = []
+
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            lines.extend(metric.samples(collected.get(name, {})))
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+# Application metrics
+REQUEST_DURATION = Histogram(
+    name="http_request_duration_seconds",
+    documentation="Time spent processing a request.",
+    labelnames=("route", "method"),
+)
+RESPONSES = Counter(
+    name="http_responses_total",
+    documentation="Number of responses by status code.",
+    labelnames=("route", "method", "status"),
+)
+REQUEST_DB_DURATION = Histogram(
+    name="http_request_db_duration_seconds",
+    documentation="Time spent running database queries during a request.",
+    labelnames=("route", "method"),
+)
+SMTP_SEND_DURATION = Histogram(
+    name="smtp_send_duration_seconds",
+    documentation="Time spent sending an email through the SMTP server.",
+    labelnames=("manager",),
+)
+JWT_OPERATIONS = Counter(
+    name="jwt_operations_total",
+    documentation="Number of JSON Web Tokens issued and verified.",
+    labelnames=("operation", "token_type"),
+)
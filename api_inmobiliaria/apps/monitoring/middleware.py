@@ -0,0 +1,263 @@
+from apps.monitoring.collectors import QueryCollector, QueryTimer
+from apps.monitoring.exceptions import QueryBudgetExceededError
+from apps.monitoring.metrics import (
+    REGISTRY,
+    REQUEST_DB_DURATION,
+    REQUEST_DURATION,
+    RESPONSES,
+)
+from apps.monitoring.profiler import SAMPLER
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse
+from django.core.exceptions import MiddlewareNotUsed
+from django.conf import settings
+from django.db import connections
+from contextlib import ExitStack
+from time import perf_counter
+from typing import Any, Callable, Dict, Tuple
+import threading
+import logging
+import random
+
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseTimingMiddleware:
+    """
+    Middleware that reports, for every request, the time spent establishing database
+    connections versus the time spent running queries.
+
+    The report is logged at `INFO` level and, if the `DATABASE_TIMING_HEADER` setting
+    is enabled, it is also added to the response in the `Server-Timing` header. The
+    connection setup time is only available for the database backends of
+    `utils.db.backends`.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        self.timing_header = getattr(settings, "DATABASE_TIMING_HEADER", False)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        timer = QueryTimer()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                connection.connection_setup_time = 0.0
+                stack.enter_context(connection.execute_wrapper(timer))
+
+            response = self.get_response(request)
+
+        setup_time = sum(
+            connection.connection_setup_time for connection in connections.all()
+        )
+
+        logger.info(
+            "%s %s: database connection setup %.2fms, %d queries in %.2fms",
+            request.method,
+            request.path,
+            setup_time * 1000,
+            timer.count,
+            timer.duration * 1000,
+        )
+
+        if self.timing_header:
+            response["Server-Timing"] = (
+                f"db-connect;dur={setup_time * 1000:.2f}, "
+                f'db-query;dur={timer.duration * 1000:.2f};desc="{timer.count} queries"'
+            )
+
+        return response
+
+
+def get_query_budget(view_func: Callable, method: str) -> int | None:
+    """
+    Returns the query budget that the view declares for the given HTTP method, none
+    if the view does not declare one.
+
+    #### Parameters:
+    - view_func: The view function, as returned by `as_view`.
+    - method: The HTTP method of the request.
+    """
+
+    view_class = getattr(view_func, "view_class", None)
+    budget_mapping = getattr(view_class, "query_budget_mapping", None) or {}
+
+    return budget_mapping.get(method, getattr(view_class, "query_budget", None))
+
+
+class QueryBudgetMiddleware:
+    """
+    Middleware that records the number of queries, the repeated query fingerprints and
+    the database time of each request, and checks the number of queries against the
+    budget declared by the view that handled the request.
+
+    Views declare their budget per HTTP method with the `query_budget_mapping`
+    attribute (see `utils.views.MethodHTTPMapped`), or for every method with the
+    `query_budget` attribute. The middleware is configured with the `QUERY_BUDGETS`
+    setting and is only used if it is enabled there.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        config = getattr(settings, "QUERY_BUDGETS", {})
+
+        if not config.get("ENABLED", False):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.raise_exception = config.get("RAISE_EXCEPTION", False)
+        self.default_budget = config.get("DEFAULT_BUDGET")
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        collector = QueryCollector()
+        request.query_budget = self.default_budget
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(collector))
+
+            response = self.get_response(request)
+
+        self._check_budget(request=request, collector=collector)
+
+        return response
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable,
+        view_args: Tuple[Any],
+        view_kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Looks up the query budget declared by the view that will handle the request.
+        """
+
+        budget = get_query_budget(view_func=view_func, method=request.method)
+
+        if budget is not None:
+            request.query_budget = budget
+
+    def _check_budget(
+        self, request: HttpRequest, collector: QueryCollector
+    ) -> None:
+        """
+        Reports the queries executed during the request and checks that they do not
+        exceed the budget of the view.
+
+        #### Raises:
+        - QueryBudgetExceededError: If the budget is exceeded and the middleware is
+        configured to raise exceptions.
+        """
+
+        duplicates = collector.duplicates()
+
+        logger.info(
+            "%s %s: %d queries (%d repeated fingerprints) in %.2fms",
+            request.method,
+            request.path,
+            collector.count,
+            len(duplicates),
+            collector.duration * 1000,
+        )
+
+        budget = request.query_budget
+
+        if budget is None or collector.count <= budget:
+            return
+
+        message = (
+            f"{request.method} {request.path} executed {collector.count} queries, "
+            f"exceeding its budget of {budget}."
+        )
+
+        if duplicates:
+            message += "".join(
+                f"\n  {count}x {sql}" for sql, count in duplicates.items()
+            )
+
+        if self.raise_exception:
+            raise QueryBudgetExceededError(message)
+
+        logger.warning(message)
+
+
+class MetricsMiddleware:
+    """
+    Middleware that records the latency, the status code and the database time of
+    every request in the metrics exposed by the `apps.monitoring` metrics endpoint.
+
+    Requests are labeled with the route pattern that resolved them instead of their
+    path, so that the number of series does not grow with the URL parameters.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        config = getattr(settings, "METRICS", {})
+
+        if not config.get("ENABLED", False):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        timer = QueryTimer()
+        start = perf_counter()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+
+            response = self.get_response(request)
+
+        duration = perf_counter() - start
+        resolver_match = getattr(request, "resolver_match", None)
+        route = resolver_match.route if resolver_match else "<unmatched>"
+
+        REQUEST_DURATION.observe(duration, route=route, method=request.method)
+        REQUEST_DB_DURATION.observe(
+            timer.duration, route=route, method=request.method
+        )
+        RESPONSES.inc(
+            route=route, method=request.method, status=response.status_code
+        )
+        REGISTRY.flush()
+
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Middleware that profiles a random sample of the requests with the stack sampler
+    of `apps.monitoring.profiler`. The folded stacks are aggregated by the route
+    pattern that resolved each request.
+
+    The middleware is configured with the `PROFILER` setting and is only used if it
+    is enabled there, the `SAMPLE_RATE` is the fraction of requests profiled.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        config = getattr(settings, "PROFILER", {})
+
+        if not config.get("ENABLED", False):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.sample_rate = config.get("SAMPLE_RATE", 0.01)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        thread_id = threading.get_ident()
+        SAMPLER.start(thread_id=thread_id)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            resolver_match = getattr(request, "resolver_match", None)
+            SAMPLER.stop(
+                thread_id=thread_id,
+                route=resolver_match.route if resolver_match else "<unmatched>",
+            )
+
+        return response
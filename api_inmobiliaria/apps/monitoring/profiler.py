@@ -0,0 +1,226 @@
+from django.conf import settings
+from typing import Dict, List
+from collections import Counter, defaultdict
+from types import FrameType
+from time import monotonic, sleep
+from pathlib import Path
+import threading
+import json
+import sys
+import os
+
+
+# Stack that accumulates the samples discarded once a route reaches `MAX_STACKS`
+TRUNCATED_STACK = "[truncated]"
+
+
+def fold_stack(frame: FrameType) -> str:
+    """
+    Returns the stack of the given frame in the collapsed format used by flamegraph
+    tools, from the outermost frame to the innermost one separated by semicolons.
+    """
+
+    names = []
+
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        # The qualified names of the code objects were added in Python 3.11
+        code = frame.f_code
+        names.append(f"{module}:{getattr(code, 'co_qualname', code.co_name)}")
+        frame = frame.f_back
+
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """
+    Statistical profiler that samples the stacks of the threads that are processing
+    a profiled request.
+
+    A single background thread wakes up every `INTERVAL` seconds of the `PROFILER`
+    setting while there are profiled requests, and takes a snapshot of the stacks of
+    their threads. When a request finishes, its samples are added to the folded
+    stacks of its route. If a directory is configured in the `PROFILER` setting, the
+    stacks of every process are also written to that directory so they can be
+    collected from any process.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        """
+        Initializes the state of the sampler, a forked process starts without the
+        stacks and the sampling thread of its parent.
+        """
+
+        self._lock = threading.Lock()
+        self._active = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._samples: Dict[int, Counter] = {}
+        self._profiles: Dict[str, Counter] = defaultdict(Counter)
+        self._last_flush = 0.0
+
+    @property
+    def config(self) -> Dict:
+        return getattr(settings, "PROFILER", {})
+
+    @property
+    def directory(self) -> Path | None:
+        """
+        Returns the directory shared by the processes, if any.
+        """
+
+        directory = self.config.get("DIRECTORY")
+
+        return Path(directory) if directory else None
+
+    def start(self, thread_id: int) -> None:
+        """
+        Starts sampling the stack of the given thread.
+        """
+
+        with self._lock:
+            self._samples[thread_id] = Counter()
+            self._active.set()
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="stack-sampler", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self, thread_id: int, route: str) -> None:
+        """
+        Stops sampling the stack of the given thread and adds its samples to the
+        folded stacks of the route.
+        """
+
+        max_stacks = self.config.get("MAX_STACKS", 2000)
+
+        with self._lock:
+            samples = self._samples.pop(thread_id, Counter())
+
+            if not self._samples:
+                self._active.clear()
+
+            profile = self._profiles[route]
+
+            for stack, count in samples.items():
+                if stack not in profile and len(profile) >= max_stacks:
+                    stack = TRUNCATED_STACK
+
+                profile[stack] += count
+
+        self.flush()
+
+    def _run(self) -> None:
+        """
+        Loop of the sampling thread, it sleeps while there are no profiled requests.
+        """
+
+        interval = self.config.get("INTERVAL", 0.005)
+
+        while True:
+            self._active.wait()
+            sleep(interval)
+            frames = sys._current_frames()
+
+            with self._lock:
+                for thread_id, samples in self._samples.items():
+                    frame = frames.get(thread_id)
+
+                    if frame is not None:
+                        samples[fold_stack(frame=frame)] += 1
+
+    def profiles(self) -> Dict[str, Counter]:
+        """
+        Returns a copy of the folded stacks of the current process.
+        """
+
+        with self._lock:
+            return {
+                route: Counter(stacks) for route, stacks in self._profiles.items()
+            }
+
+    def clear(self) -> None:
+        """
+        Removes the folded stacks of the current process.
+        """
+
+        with self._lock:
+            self._profiles.clear()
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Writes the folded stacks of the current process to the shared directory, at
+        most once per `FLUSH_INTERVAL` seconds unless `force` is used.
+        """
+
+        directory = self.directory
+
+        if directory is None:
+            return
+
+        interval = self.config.get("FLUSH_INTERVAL", 5)
+
+        if not force and monotonic() - self._last_flush < interval:
+            return
+
+        self._last_flush = monotonic()
+        path = directory / f"profile_{os.getpid()}.json"
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(self.profiles()))
+        os.replace(temporary_path, path)
+
+    def collect(self) -> Dict[str, Counter]:
+        """
+        Returns the folded stacks of all the processes added up.
+        """
+
+        collected: Dict[str, Counter] = defaultdict(Counter)
+        snapshots = [self.profiles()]
+        directory = self.directory
+
+        if directory is not None:
+            own_file = f"profile_{os.getpid()}.json"
+
+            for path in directory.glob("profile_*.json"):
+                if path.name == own_file:
+                    continue
+                try:
+                    snapshots.append(json.loads(path.read_text()))
+                except (OSError, ValueError):
+                    # The file was removed or is being replaced
+                    continue
+
+        for snapshot in snapshots:
+            for route, stacks in snapshot.items():
+                collected[route].update(stacks)
+
+        return collected
+
+    def render(self, route: str = None) -> str:
+        """
+        Returns the folded stacks of all the processes as a collapsed-stack file,
+        the route is added as the outermost frame of each stack.
+
+        #### Parameters:
+        - route: If provided, only the stacks of this route are returned.
+        """
+
+        lines: List[str] = []
+
+        for stacks_route, stacks in sorted(self.collect().items()):
+            if route is not None and stacks_route != route:
+                continue
+
+            for stack, count in stacks.most_common():
+                lines.append(f"{stacks_route};{stack} {count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+SAMPLER = StackSampler()
@@ -0,0 +1,139 @@
+from apps.users.infrastructure.repositories import UserRepository
+from apps.api_exceptions import DatabaseConnectionAPIError
+from rest_framework_simplejwt.utils import aware_utcnow
+from django.conf import settings
+from django.db import DatabaseError
+from typing import Any, Dict
+from datetime import datetime
+from time import monotonic
+from uuid import UUID
+import threading
+import logging
+import atexit
+import os
+
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityTracker:
+    """
+    Records the last activity of the users in the memory of the current process and
+    writes it to the `last_login` field of the users in batches, so the requests do
+    not wait for an UPDATE.
+
+    The pending timestamps are written at most once per `FLUSH_INTERVAL` seconds of
+    the `ACTIVITY_TRACKING` setting, with a single UPDATE per `BATCH_SIZE` users, and
+    the activity of a user is written at most once per `WINDOW` seconds. The flush
+    runs when a request finishes and when the process exits, so the activity of the
+    last interval is lost if the process is killed.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+        os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.flush, force=True)
+
+    def _reset(self) -> None:
+        """
+        Discards the activity inherited from the parent process, the parent writes
+        it.
+        """
+
+        self.lock = threading.Lock()
+        self._pending: Dict[UUID, datetime] = {}
+        self._written: Dict[UUID, float] = {}
+        self._last_flush = monotonic()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return settings.ACTIVITY_TRACKING
+
+    def record(self, user_uuid: UUID) -> None:
+        """
+        Records the activity of a user at the current time, unless it has already
+        been written in the last `WINDOW` seconds.
+
+        #### Parameters:
+        - user_uuid: The UUID of the user.
+        """
+
+        config = self.config
+
+        if not config["ENABLED"]:
+            return
+
+        written = self._written.get(user_uuid)
+
+        if written is not None and monotonic() - written < config["WINDOW"]:
+            return
+
+        with self.lock:
+            self._pending[user_uuid] = aware_utcnow()
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Writes the pending activity to the database, at most once per
+        `FLUSH_INTERVAL` seconds unless `force` is used. Returns the number of users
+        written, the activity is kept for the next flush if the database is not
+        available.
+        """
+
+        config = self.config
+        now = monotonic()
+
+        if not force and now - self._last_flush < config["FLUSH_INTERVAL"]:
+            return 0
+
+        with self.lock:
+            self._last_flush = now
+            pending, self._pending = self._pending, {}
+
+            # Forgets the users whose window has ended
+            self._written = {
+                user_uuid: written
+                for user_uuid, written in self._written.items()
+                if now - written < config["WINDOW"]
+            }
+
+        if not pending:
+            return 0
+
+        items = list(pending.items())
+        batch_size = config["BATCH_SIZE"]
+
+        for start in range(0, len(items), batch_size):
+            batch = dict(items[start : start + batch_size])
+
+            try:
+                UserRepository.update_last_login(activity=batch)
+            except (DatabaseError, DatabaseConnectionAPIError) as exc:
+                logger.warning(
+                    "The activity of the users could not be written: %s", exc
+                )
+
+                with self.lock:
+                    for user_uuid, at in items[start:]:
+                        # A newer activity may have been recorded in the meantime
+                        self._pending.setdefault(user_uuid, at)
+
+                return start
+
+            with self.lock:
+                for user_uuid in batch:
+                    self._written[user_uuid] = now
+
+        return len(items)
+
+
+ACTIVITY_TRACKER = ActivityTracker()
+
+
+def flush_activity(**kwargs) -> None:
+    """
+    Receiver of the `request_finished` signal, connected before the receiver that
+    closes the database connections of the request, see `UserConfig.ready`.
+    """
+
+    ACTIVITY_TRACKER.flush()
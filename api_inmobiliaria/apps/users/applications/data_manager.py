@@ -3,6 +3,7 @@ from apps.users.interfaces import IUserRepository
 from apps.users.models import BaseUser
 from apps.api_exceptions import PermissionDeniedAPIError
 from django.db.models import Model
+from typing import Sequence
 
 
 class UserDataManager:
@@ -33,12 +34,15 @@ class UserDataManager:
         if not user.has_perm(perm=permission):
             raise PermissionDeniedAPIError()
 
-    def get(self, base_user: BaseUser) -> Model:
+    def get(
+        self, base_user: BaseUser, fields: Sequence[str] | None = None
+    ) -> Model:
         """
         Get the role data of a user.
 
         #### Parameters:
         - base_user: An instance of the BaseUser model.
+        - fields: The names of the fields to load, all of them by default.
 
         #### Raises:
         - PermissionDeniedAPIError: If the user does not have the required permissions.
@@ -49,7 +53,9 @@ class UserDataManager:
         perm = model_level_perm["view_base_data"]
         self._has_permission_model_level(user=base_user, permission=perm)
 
-        return self._user_repository.get_role_data(base_user=base_user)
+        return self._user_repository.get_role_data(
+            base_user=base_user, fields=fields
+        )
 
     def update(self, base_user: BaseUser, data: dict) -> Model:
         """
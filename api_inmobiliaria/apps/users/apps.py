@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class UserConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.users"
+
+    def ready(self) -> None:
+        from apps.users.activity import flush_activity
+        from django.core.signals import request_finished
+        from django.db import close_old_connections
+
+        # The activity is flushed before the connections of the request are closed,
+        # so its UPDATE does not open a connection outside the lifecycle of the
+        # requests. The receivers are called in the order they were connected.
+        request_finished.disconnect(close_old_connections)
+        request_finished.connect(
+            flush_activity, dispatch_uid="apps.users.activity.flush_activity"
+        )
+        request_finished.connect(close_old_connections)
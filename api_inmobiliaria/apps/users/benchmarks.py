@@ -0,0 +1,147 @@
+from apps.users.infrastructure.serializers import (
+    RealEstateEntityReadOnlySerializer,
+)
+from apps.users.password_validation import BreachedPasswordValidator
+from apps.users.constants import DOCUMENTS_REQUESTED_REAL_ESTATE_ENTITY, UserRoles
+from apps.users.models import BaseUser, RealEstateEntity
+from apps.monitoring.benchmarks import Operation
+from utils.renderers import JSONRenderer
+from utils.bloom import BloomFilter
+from rest_framework.renderers import JSONRenderer as DRFJSONRenderer
+from rest_framework.renderers import BaseRenderer
+from django.contrib.auth.password_validation import CommonPasswordValidator
+from django.core.exceptions import ValidationError
+from typing import Any, Dict, List
+from uuid import uuid4
+from itertools import cycle
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import os
+
+
+# Number of breached hashes of the filter of the benchmark
+BREACHED_PASSWORDS = 1_000_000
+
+# Number of profiles rendered by each iteration of the rendering benchmarks
+RENDERED_PROFILES = 10_000
+
+
+def _passwords() -> cycle:
+    return cycle([os.urandom(12).hex() for _ in range(1000)])
+
+
+def breached_password() -> Operation:
+    """
+    Validates random passwords against a memory-mapped filter with
+    `BREACHED_PASSWORDS` random hashes. The memory reported includes the bit array
+    built in memory by the benchmark, the validator itself only maps the file.
+    """
+
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "breached_passwords.bloom"
+        BloomFilter.build(
+            digests=(os.urandom(20) for _ in range(BREACHED_PASSWORDS)),
+            count=BREACHED_PASSWORDS,
+            path=path,
+        )
+        validator = BreachedPasswordValidator(filter_path=path)
+        # The mapping remains valid once the file is removed
+        validator.get_filter()
+
+    passwords = _passwords()
+
+    def operation() -> None:
+        try:
+            validator.validate(password=next(passwords))
+        except ValidationError:
+            # False positive
+            pass
+
+    return operation
+
+
+def common_password() -> Operation:
+    """
+    Validates random passwords with the `CommonPasswordValidator` of Django, which
+    loads its list into a set of each process, for comparison.
+    """
+
+    validator = CommonPasswordValidator()
+    passwords = _passwords()
+
+    def operation() -> None:
+        validator.validate(password=next(passwords))
+
+    return operation
+
+
+def get_real_estate_entity_profiles(count: int) -> List[Dict[str, Any]]:
+    """
+    Returns the serialized data of the given number of real estate entity profiles,
+    built in memory.
+    """
+
+    type_entity = UserRoles.CONSTRUCTION_COMPANY.value
+    profiles = []
+
+    for number in range(count):
+        role_instance = RealEstateEntity(
+            uuid=uuid4(),
+            type_entity=type_entity,
+            logo=f"https://cdn.example.com/logos/{uuid4().hex}.png",
+            name=f"Constructora número {number}",
+            description="Constructora de vivienda nueva en el Valle de Aburrá. "
+            * 4,
+            nit=str(9_000_000_000 + number),
+            phone_numbers=f"+5731111{number:05},+5732222{number:05}",
+            department="Antioquia",
+            municipality="Medellín",
+            region="Región Eje Cafetero - Antioquia",
+            coordinate=f"6.{number:05}, -75.{number:05}",
+            documents={
+                document: f"https://cdn.example.com/documents/{uuid4().hex}.pdf"
+                for document in DOCUMENTS_REQUESTED_REAL_ESTATE_ENTITY[type_entity]
+            },
+            is_phones_verified={"+573111100000": True, "+573222200000": False},
+            communication_channels={
+                "email": True,
+                "phone": True,
+                "whatsapp": False,
+            },
+            verified=True,
+        )
+        profiles.append(
+            RealEstateEntityReadOnlySerializer(
+                instance=BaseUser(email=f"entity{number}@example.com"),
+                role_instance=role_instance,
+            ).data
+        )
+
+    return profiles
+
+
+def _render(renderer: BaseRenderer) -> Operation:
+    profiles = get_real_estate_entity_profiles(count=RENDERED_PROFILES)
+
+    def operation() -> None:
+        renderer.render(data=profiles, accepted_media_type="application/json")
+
+    return operation
+
+
+def render_json() -> Operation:
+    """
+    Renders `RENDERED_PROFILES` real estate entity profiles with the JSON renderer
+    of DRF, built on the `json` module, for comparison.
+    """
+
+    return _render(renderer=DRFJSONRenderer())
+
+
+def render_orjson() -> Operation:
+    """
+    Renders `RENDERED_PROFILES` real estate entity profiles with the JSON renderer
+    of the API, built on `orjson` if it is installed.
+    """
+
+    return _render(renderer=JSONRenderer())
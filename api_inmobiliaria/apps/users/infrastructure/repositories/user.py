@@ -2,8 +2,10 @@ from apps.users.models import BaseUser
 from apps.api_exceptions import DatabaseConnectionAPIError
 from django.contrib.contenttypes.models import ContentType
 from django.db import OperationalError
-from django.db.models import Model
-from typing import Dict, Any
+from django.db.models import Model, Case, When, Value, DateTimeField
+from typing import Dict, Any, Iterator, Sequence
+from datetime import datetime
+from uuid import UUID
 
 
 class UserRepository:
@@ -75,12 +77,76 @@ class UserRepository:
         return base_user
 
     @classmethod
-    def get_role_data(cls, base_user: BaseUser) -> Model:
+    async def aget_base_data(cls, **filters) -> BaseUser | None:
+        """
+        Async counterpart of `get_base_data`.
+
+        #### Parameters:
+        - filters: Keyword arguments that define the filters to apply.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        try:
+            base_user = (
+                await cls.model.objects.select_related("content_type")
+                .defer(
+                    "password",
+                    "last_login",
+                    "is_superuser",
+                    "is_staff",
+                    "date_joined",
+                )
+                .filter(**filters)
+                .afirst()
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+        return base_user
+
+    @classmethod
+    async def aget_credentials(cls, **filters) -> BaseUser | None:
+        """
+        Retrieves a user base data from the database based on the provided filters,
+        including the fields needed to authenticate and authorize the user.
+
+        #### Parameters:
+        - filters: Keyword arguments that define the filters to apply.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        try:
+            base_user = (
+                await cls.model.objects.select_related("content_type")
+                .defer("last_login", "date_joined")
+                .filter(**filters)
+                .afirst()
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+        return base_user
+
+    @classmethod
+    def get_role_data(
+        cls, base_user: BaseUser, fields: Sequence[str] | None = None
+    ) -> Model:
         """
         Retrieves a user role data from the database.
 
         #### Parameters:
         - base_user: An instance of the BaseUser model.
+        - fields: The names of the fields to load, all of them by default.
 
         #### Raises:
         - DatabaseConnectionAPIError: If there is an operational error with the
@@ -90,9 +156,12 @@ class UserRepository:
         related_model = base_user.content_type.model_class()
 
         try:
-            user_role = related_model.objects.filter(
-                uuid=base_user.role_data_uuid
-            ).first()
+            queryset = related_model.objects.filter(uuid=base_user.role_data_uuid)
+
+            if fields is not None:
+                queryset = queryset.only(*fields)
+
+            user_role = queryset.first()
         except OperationalError:
             # In the future, a retry system will be implemented when the database is
             # suddenly unavailable.
@@ -148,6 +217,31 @@ class UserRepository:
 
         return exists
 
+    @classmethod
+    def activate(cls, uuid: UUID | str) -> bool:
+        """
+        Activates the account of a user with a conditional UPDATE, returning whether
+        the account was inactive. Two simultaneous activations can not both succeed.
+
+        #### Parameters:
+        - uuid: The UUID of the user.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        try:
+            updated = cls.model.objects.filter(uuid=uuid, is_active=False).update(
+                is_active=True
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+        return bool(updated)
+
     @classmethod
     def update_role_data(
         cls,
@@ -180,3 +274,76 @@ class UserRepository:
             raise DatabaseConnectionAPIError()
 
         return role_data
+
+    @classmethod
+    def update_last_login(cls, activity: Dict[UUID, datetime]) -> int:
+        """
+        Updates the last login of several users with a single UPDATE, returning the
+        number of users updated.
+
+        #### Parameters:
+        - activity: The last login of each user by their UUID.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        if not activity:
+            return 0
+
+        try:
+            updated = cls.model.objects.filter(uuid__in=activity.keys()).update(
+                last_login=Case(
+                    *(
+                        When(uuid=user_uuid, then=Value(last_login))
+                        for user_uuid, last_login in activity.items()
+                    ),
+                    output_field=DateTimeField(),
+                )
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
+
+        return updated
+
+    @classmethod
+    def iter_inactive(
+        cls,
+        joined_before: datetime,
+        after: UUID | None = None,
+        chunk_size: int = 500,
+    ) -> Iterator[BaseUser]:
+        """
+        Streams the users whose account has not been activated, ordered by UUID and
+        fetched `chunk_size` at a time, with the fields needed to send them a token.
+
+        #### Parameters:
+        - joined_before: Only the users that joined before this date.
+        - after: Only the users whose UUID is greater than this one, to resume.
+        - chunk_size: Number of users fetched from the database at a time.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        queryset = cls.model.objects.filter(
+            is_active=False, is_deleted=False, date_joined__lt=joined_before
+        )
+
+        if after is not None:
+            queryset = queryset.filter(uuid__gt=after)
+
+        try:
+            yield from (
+                queryset.only("uuid", "email", "is_active")
+                .order_by("uuid")
+                .iterator(chunk_size=chunk_size)
+            )
+        except OperationalError:
+            # In the future, a retry system will be implemented when the database is
+            # suddenly unavailable.
+            raise DatabaseConnectionAPIError()
@@ -10,6 +10,7 @@ from drf_spectacular.utils import (
     extend_schema,
     OpenApiResponse,
     OpenApiExample,
+    OpenApiParameter,
 )
 
 
@@ -138,6 +139,16 @@ POSTSearcherSchema = extend_schema(
 GETSearcherSchema = extend_schema(
     operation_id="get_searcher",
     tags=["Users"],
+    parameters=[
+        OpenApiParameter(
+            name="fields",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="Comma-separated fields of the role data to return, all of them by default.",
+            examples=[OpenApiExample(name="fields", value="name,last_name")],
+        ),
+    ],
     responses={
         200: OpenApiResponse(
             description="**(OK)** The requested user information is returned.",
@@ -167,6 +178,33 @@ GETSearcherSchema = extend_schema(
                 )
             ],
         ),
+        400: OpenApiResponse(
+            description="**(BAD_REQUEST)** The `fields` query parameter is invalid.",
+            response={
+                "properties": {
+                    "code": {"type": "string"},
+                    "detail": {"type": "object"},
+                }
+            },
+            examples=[
+                OpenApiExample(
+                    name="invalid_fields",
+                    summary="Invalid fields",
+                    description="These are the possible error messages of the `fields` query parameter.",
+                    value={
+                        "code": "invalid_request_data",
+                        "detail": {
+                            "fields": [
+                                ERROR_MESSAGES["invalid_choice"].format(
+                                    input="password"
+                                ),
+                                ERROR_MESSAGES["blank"],
+                            ],
+                        },
+                    },
+                )
+            ],
+        ),
         401: OpenApiResponse(
             description="**(UNAUTHORIZED)** The user's JSON Web Token is not valid for logout.",
             response={
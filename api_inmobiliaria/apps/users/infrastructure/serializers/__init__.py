@@ -1,4 +1,8 @@
-from .base import BaseUserReadOnlySerializer, BaseUserSerializer
+from .base import (
+    BaseUserReadOnlySerializer,
+    BaseUserSerializer,
+    SparseFieldsMixin,
+)
 from .searcher import (
     RegisterSearcherSerializer,
     SearcherReadOnlySerializer,
@@ -5,6 +5,7 @@ from rest_framework import serializers
 from django.core.validators import RegexValidator
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from typing import Sequence, Tuple, Type
 
 
 # Base user properties
@@ -71,18 +72,23 @@ class BaseUserSerializer(ErrorMessagesSerializer, serializers.Serializer):
 
     def validate_password(self, value: str) -> str:
         """
-        Validate that the password is not a common password and has at least one
-        uppercase and one lowercase letter.
+        Validate that the password is not a common or breached password and has at
+        least one uppercase and one lowercase letter.
         """
 
         try:
             validate_password(value)
-        except ValidationError:
+        except ValidationError as exc:
             if value.isdecimal():
                 raise serializers.ValidationError(
                     code="invalid_data",
                     detail=ERROR_MESSAGES["password_no_upper_lower"],
                 )
+            if any(error.code == "password_breached" for error in exc.error_list):
+                raise serializers.ValidationError(
+                    code="invalid_data",
+                    detail=ERROR_MESSAGES["password_breached"],
+                )
             raise serializers.ValidationError(
                 code="invalid_data",
                 detail=ERROR_MESSAGES["password_common"],
@@ -97,3 +103,67 @@ class BaseUserReadOnlySerializer(serializers.Serializer):
     """
 
     email = serializers.EmailField(read_only=True)
+
+
+class SparseFieldsMixin:
+    """
+    Allows a read only serializer of a user to include only some fields of the role
+    data, those selected by the client with the `fields` query parameter, a
+    comma-separated list of field names.
+    """
+
+    role_serializer_class: Type[serializers.Serializer]
+
+    @classmethod
+    def parse_fields(cls, value: str | None) -> Tuple[str, ...] | None:
+        """
+        Returns the fields of the role data selected in the `fields` query
+        parameter, or None if it was not provided.
+
+        #### Parameters:
+        - value: The value of the `fields` query parameter.
+
+        #### Raises:
+        - ValidationError: If a field is not a field of the role data.
+        """
+
+        if value is None:
+            return None
+
+        fields = tuple(
+            dict.fromkeys(
+                field.strip() for field in value.split(",") if field.strip()
+            )
+        )
+        declared_fields = cls.role_serializer_class._declared_fields
+        errors = [
+            ERROR_MESSAGES["invalid_choice"].format(input=field)
+            for field in fields
+            if field not in declared_fields
+        ]
+
+        if not fields:
+            errors.append(ERROR_MESSAGES["blank"])
+
+        if errors:
+            raise serializers.ValidationError(
+                code="invalid_data", detail={"fields": errors}
+            )
+
+        return fields
+
+    def get_role_serializer(
+        self, fields: Sequence[str] | None
+    ) -> serializers.Serializer:
+        """
+        Returns the serializer of the role data, without the fields that were not
+        selected.
+        """
+
+        serializer = self.role_serializer_class()
+
+        if fields is not None:
+            for field in set(serializer.fields) - set(fields):
+                serializer.fields.pop(field)
+
+        return serializer
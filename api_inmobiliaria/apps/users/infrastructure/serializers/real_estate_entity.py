@@ -1,8 +1,8 @@
 from apps.users.infrastructure.repositories import UserRepository
-from apps.users.infrastructure.schemas import RegisterRealEstateEntitySchema
 from apps.users.infrastructure.serializers import (
     BaseUserReadOnlySerializer,
     BaseUserSerializer,
+    SparseFieldsMixin,
 )
 from apps.users.constants import (
     DOCUMENTS_REQUESTED_REAL_ESTATE_ENTITY,
@@ -10,12 +10,13 @@ from apps.users.constants import (
     UserRoles,
 )
 from apps.users.models import BaseUser, RealEstateEntity
+from apps.docs.decorators import lazy_schema
 from utils.messages import ERROR_MESSAGES
 from rest_framework import serializers
 from django.core.validators import RegexValidator
 from phonenumbers import PhoneNumberFormat, PhoneNumber, parse, format_number
 from phonenumber_field.serializerfields import PhoneNumberField
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 
 
 # User toles
@@ -365,7 +366,9 @@ class RealEstateEntityRoleReadOnlySerializer(serializers.Serializer):
     verified = serializers.BooleanField(read_only=True)
 
 
-@RegisterRealEstateEntitySchema
+@lazy_schema(
+    path="apps.users.infrastructure.schemas.RegisterRealEstateEntitySchema"
+)
 class RegisterRealEstateEntitySerializer(RealEstateEntityRoleSerializer):
     """
     Defines the fields that are required for the real estate entity user registration.
@@ -396,16 +399,26 @@ class RegisterRealEstateEntitySerializer(RealEstateEntityRoleSerializer):
         return data
 
 
-class RealEstateEntityReadOnlySerializer(serializers.Serializer):
+class RealEstateEntityReadOnlySerializer(
+    SparseFieldsMixin, serializers.Serializer
+):
     """
     Defines the fields of the real estate entity information for reading.
     """
 
-    def __init__(self, role_instance: RealEstateEntity, *args, **kwargs) -> None:
+    role_serializer_class = RealEstateEntityRoleReadOnlySerializer
+
+    def __init__(
+        self,
+        role_instance: RealEstateEntity,
+        *args,
+        fields: Sequence[str] | None = None,
+        **kwargs,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self.role_instance = role_instance
         self.base_data = BaseUserReadOnlySerializer()
-        self.role_data = RealEstateEntityRoleReadOnlySerializer()
+        self.role_data = self.get_role_serializer(fields=fields)
 
     def to_representation(self, instance: BaseUser) -> Dict[str, Any]:
         """
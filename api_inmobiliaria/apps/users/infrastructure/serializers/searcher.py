@@ -2,19 +2,17 @@ from apps.users.infrastructure.repositories import UserRepository
 from apps.users.infrastructure.serializers import (
     BaseUserReadOnlySerializer,
     BaseUserSerializer,
-)
-from apps.users.infrastructure.schemas import (
-    RegisterSearcherSchema,
-    SearcherSchema,
+    SparseFieldsMixin,
 )
 from apps.users.constants import UserRoles, SearcherProperties
 from apps.users.models import BaseUser, Searcher
+from apps.docs.decorators import lazy_schema
 from utils.messages import ErrorMessagesSerializer, ERROR_MESSAGES
 from rest_framework import serializers
 from django.core.validators import RegexValidator
 from phonenumbers import PhoneNumberFormat, PhoneNumber, parse, format_number
 from phonenumber_field.serializerfields import PhoneNumberField
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 
 
 # User toles
@@ -28,7 +26,7 @@ CC_MAX_LENGTH = SearcherProperties.CC_MAX_LENGTH.value
 PHONE_NUMBER_MAX_LENGTH = SearcherProperties.PHONE_NUMBER_MAX_LENGTH.value
 
 
-@SearcherSchema
+@lazy_schema(path="apps.users.infrastructure.schemas.SearcherSchema")
 class SearcherRoleSerializer(ErrorMessagesSerializer, serializers.Serializer):
     """
     Defines the fields that are required for the searcher user profile.
@@ -167,7 +165,7 @@ class SearcherRoleReadOnlySerializer(serializers.Serializer):
     is_phone_verified = serializers.BooleanField(read_only=True)
 
 
-@RegisterSearcherSchema
+@lazy_schema(path="apps.users.infrastructure.schemas.RegisterSearcherSchema")
 class RegisterSearcherSerializer(BaseUserSerializer, SearcherRoleSerializer):
     """
     Defines the fields that are required for the searcher user registration.
@@ -211,16 +209,24 @@ class RegisterSearcherSerializer(BaseUserSerializer, SearcherRoleSerializer):
         return data
 
 
-class SearcherReadOnlySerializer(serializers.Serializer):
+class SearcherReadOnlySerializer(SparseFieldsMixin, serializers.Serializer):
     """
     Defines the fields of the searcher user information for reading.
     """
 
-    def __init__(self, role_instance: Searcher, *args, **kwargs) -> None:
+    role_serializer_class = SearcherRoleReadOnlySerializer
+
+    def __init__(
+        self,
+        role_instance: Searcher,
+        *args,
+        fields: Sequence[str] | None = None,
+        **kwargs,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self.role_instance = role_instance
         self.base_data = BaseUserReadOnlySerializer()
-        self.role_data = SearcherRoleReadOnlySerializer()
+        self.role_data = self.get_role_serializer(fields=fields)
 
     def to_representation(self, instance: BaseUser) -> Dict[str, Any]:
         """
@@ -3,16 +3,13 @@ from apps.users.infrastructure.serializers import (
     RealEstateEntityReadOnlySerializer,
     RegisterRealEstateEntitySerializer,
 )
-from apps.users.infrastructure.schemas import (
-    POSTRealEstateEntitySchema,
-    GETRealEstateEntitySchema,
-)
 from apps.users.applications import RegisterUser, UserDataManager
 from apps.users.permissions import IsRealEstateEntity
 from apps.authentication.jwt import JWTAuthentication
+from apps.docs.decorators import lazy_schema
 from utils.views import MethodHTTPMapped, PermissionMixin
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework.serializers import Serializer
+from rest_framework.serializers import Serializer, ValidationError
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.generics import GenericAPIView
@@ -37,25 +34,44 @@ class RealEstateEntityAPIView(MethodHTTPMapped, PermissionMixin, GenericAPIView)
         "GET": RealEstateEntityReadOnlySerializer,
         "POST": RegisterRealEstateEntitySerializer,
     }
+    query_budget_mapping = {"POST": 18, "GET": 6}
 
-    @GETRealEstateEntitySchema
+    @lazy_schema(
+        path="apps.users.infrastructure.schemas.GETRealEstateEntitySchema"
+    )
     def get(self, request: Request, *args, **kwargs) -> Response:
         """
         Handle GET requests to obtain user information.
 
         This method returns the user account information associated with the request's
         access token, without revealing sensitive data, provided the user has
-        permission to read their own information.
+        permission to read their own information. The `fields` query parameter
+        limits the role data to the given comma-separated fields, which are the only
+        ones loaded from the database.
         """
 
+        serializer_class = self.get_serializer_class()
+
+        try:
+            fields = serializer_class.parse_fields(
+                value=request.query_params.get("fields")
+            )
+        except ValidationError as exc:
+            return Response(
+                data={
+                    "code": "invalid_request_data",
+                    "detail": exc.detail,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+                content_type="application/json",
+            )
+
         data_manager: UserDataManager = self.get_application_class(
             user_repository=UserRepository
         )
-        user_role = data_manager.get(base_user=request.user)
-
-        serializer_class = self.get_serializer_class()
+        user_role = data_manager.get(base_user=request.user, fields=fields)
         serializer: Serializer = serializer_class(
-            instance=request.user, role_instance=user_role
+            instance=request.user, role_instance=user_role, fields=fields
         )
 
         return Response(
@@ -64,7 +80,9 @@ class RealEstateEntityAPIView(MethodHTTPMapped, PermissionMixin, GenericAPIView)
             content_type="application/json",
         )
 
-    @POSTRealEstateEntitySchema
+    @lazy_schema(
+        path="apps.users.infrastructure.schemas.POSTRealEstateEntitySchema"
+    )
     def post(self, request: Request, *args, **kwargs) -> Response:
         """
         Handle POST requests for real estate entity registration.
@@ -4,17 +4,13 @@ from apps.users.infrastructure.serializers import (
     SearcherReadOnlySerializer,
     SearcherRoleSerializer,
 )
-from apps.users.infrastructure.schemas import (
-    POSTSearcherSchema,
-    GETSearcherSchema,
-    PATCHearcherSchema,
-)
 from apps.users.applications import RegisterUser, UserDataManager
 from apps.users.permissions import IsSearcher
 from apps.authentication.jwt import JWTAuthentication
+from apps.docs.decorators import lazy_schema
 from utils.views import MethodHTTPMapped, PermissionMixin
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.serializers import Serializer
+from rest_framework.serializers import Serializer, ValidationError
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.generics import GenericAPIView
@@ -49,25 +45,42 @@ class SearcherAPIView(MethodHTTPMapped, PermissionMixin, GenericAPIView):
         "GET": SearcherReadOnlySerializer,
         "PATCH": SearcherRoleSerializer,
     }
+    query_budget_mapping = {"POST": 8, "GET": 6, "PATCH": 11}
 
-    @GETSearcherSchema
+    @lazy_schema(path="apps.users.infrastructure.schemas.GETSearcherSchema")
     def get(self, request: Request, *args, **kwargs) -> Response:
         """
         Handle GET requests to obtain user information.
 
         This method returns the user account information associated with the request's
         access token, without revealing sensitive data, provided the user has
-        permission to read their own information.
+        permission to read their own information. The `fields` query parameter
+        limits the role data to the given comma-separated fields, which are the only
+        ones loaded from the database.
         """
 
+        serializer_class = self.get_serializer_class()
+
+        try:
+            fields = serializer_class.parse_fields(
+                value=request.query_params.get("fields")
+            )
+        except ValidationError as exc:
+            return Response(
+                data={
+                    "code": "invalid_request_data",
+                    "detail": exc.detail,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+                content_type="application/json",
+            )
+
         data_manager: UserDataManager = self.get_application_class(
             user_repository=UserRepository
         )
-        user_role = data_manager.get(base_user=request.user)
-
-        serializer_class = self.get_serializer_class()
+        user_role = data_manager.get(base_user=request.user, fields=fields)
         serializer: Serializer = serializer_class(
-            instance=request.user, role_instance=user_role
+            instance=request.user, role_instance=user_role, fields=fields
         )
 
         return Response(
@@ -76,7 +89,7 @@ class SearcherAPIView(MethodHTTPMapped, PermissionMixin, GenericAPIView):
             content_type="application/json",
         )
 
-    @POSTSearcherSchema
+    @lazy_schema(path="apps.users.infrastructure.schemas.POSTSearcherSchema")
     def post(self, request: Request, *args, **kwargs) -> Response:
         """
         Handle POST requests for searcher user registration.
@@ -109,7 +122,7 @@ class SearcherAPIView(MethodHTTPMapped, PermissionMixin, GenericAPIView):
 
         return Response(status=status.HTTP_201_CREATED)
 
-    @PATCHearcherSchema
+    @lazy_schema(path="apps.users.infrastructure.schemas.PATCHearcherSchema")
     def patch(self, request: Request, *args, **kwargs) -> Response:
         """
         Handle PATCH requests to update searcher user information.
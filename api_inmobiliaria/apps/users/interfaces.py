@@ -1,6 +1,8 @@
 from django.db.models import Model
 from apps.users.models import BaseUser
-from typing import Dict, Any, Protocol
+from typing import Dict, Any, Iterator, Protocol, Sequence
+from datetime import datetime
+from uuid import UUID
 
 
 class IUserRepository(Protocol):
@@ -40,12 +42,46 @@ class IUserRepository(Protocol):
         ...
 
     @classmethod
-    def get_role_data(cls, base_user: BaseUser) -> Model:
+    async def aget_base_data(cls, **filters) -> BaseUser | None:
+        """
+        Async counterpart of `get_base_data`.
+
+        #### Parameters:
+        - filters: Keyword arguments that define the filters to apply.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        ...
+
+    @classmethod
+    async def aget_credentials(cls, **filters) -> BaseUser | None:
+        """
+        Retrieves a user base data from the database based on the provided filters,
+        including the fields needed to authenticate and authorize the user.
+
+        #### Parameters:
+        - filters: Keyword arguments that define the filters to apply.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        ...
+
+    @classmethod
+    def get_role_data(
+        cls, base_user: BaseUser, fields: Sequence[str] | None = None
+    ) -> Model:
         """
         Retrieves the role data of a user.
 
         #### Parameters:
         - base_user: An instance of the BaseUser model.
+        - fields: The names of the fields to load, all of them by default.
 
         #### Raises:
         - DatabaseConnectionAPIError: If there is an operational error with the
@@ -85,6 +121,22 @@ class IUserRepository(Protocol):
 
         ...
 
+    @classmethod
+    def activate(cls, uuid: UUID | str) -> bool:
+        """
+        Activates the account of a user with a conditional UPDATE, returning whether
+        the account was inactive. Two simultaneous activations can not both succeed.
+
+        #### Parameters:
+        - uuid: The UUID of the user.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        ...
+
     @classmethod
     def update_role_data(
         cls,
@@ -104,3 +156,42 @@ class IUserRepository(Protocol):
         """
 
         ...
+
+    @classmethod
+    def update_last_login(cls, activity: Dict[UUID, datetime]) -> int:
+        """
+        Updates the last login of several users with a single UPDATE, returning the
+        number of users updated.
+
+        #### Parameters:
+        - activity: The last login of each user by their UUID.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        ...
+
+    @classmethod
+    def iter_inactive(
+        cls,
+        joined_before: datetime,
+        after: UUID | None = None,
+        chunk_size: int = 500,
+    ) -> Iterator[BaseUser]:
+        """
+        Streams the users whose account has not been activated, ordered by UUID and
+        fetched `chunk_size` at a time, with the fields needed to send them a token.
+
+        #### Parameters:
+        - joined_before: Only the users that joined before this date.
+        - after: Only the users whose UUID is greater than this one, to resume.
+        - chunk_size: Number of users fetched from the database at a time.
+
+        #### Raises:
+        - DatabaseConnectionAPIError: If there is an operational error with the
+        database.
+        """
+
+        ...
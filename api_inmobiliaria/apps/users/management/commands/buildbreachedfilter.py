@@ -0,0 +1,113 @@
+from apps.users.password_validation import get_breached_filter_path
+from utils.bloom import BloomFilter
+from django.core.management.base import BaseCommand, CommandError
+from typing import Iterator
+from pathlib import Path
+
+
+# Length of a SHA-1 digest in hexadecimal
+SHA1_HEX_LENGTH = 40
+
+
+class Command(BaseCommand):
+    """
+    Builds the Bloom filter used by the `BreachedPasswordValidator` from a local
+    list of SHA-1 hashes of breached passwords, one per line in hexadecimal and
+    optionally followed by `:count`, as in the lists of Have I Been Pwned. The
+    filter replaces the previous one atomically.
+    """
+
+    help = "Builds the breached passwords filter from a local list of SHA-1 hashes"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "source",
+            help="File with a SHA-1 hash per line, optionally followed by :count.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of the filter, the one of the password validator by default.",
+        )
+        parser.add_argument(
+            "--false-positive-rate",
+            type=float,
+            default=0.001,
+            help="Rate of passwords wrongly rejected as breached.",
+        )
+        parser.add_argument(
+            "--min-count",
+            type=int,
+            default=1,
+            help="Only add the hashes that appear at least this number of times.",
+        )
+
+    def read_digests(self, source: Path, min_count: int) -> Iterator[bytes]:
+        """
+        Yields the digests of the source, skipping the invalid lines.
+        """
+
+        self.invalid_lines = 0
+
+        with open(source, encoding="ascii", errors="replace") as file:
+            for line in file:
+                value, _, count = line.strip().partition(":")
+
+                try:
+                    if len(value) != SHA1_HEX_LENGTH:
+                        raise ValueError(value)
+
+                    digest = bytes.fromhex(value)
+
+                    if count and int(count) < min_count:
+                        continue
+                except ValueError:
+                    self.invalid_lines += 1
+                    continue
+
+                yield digest
+
+    def handle(self, *args, **options) -> None:
+        """
+        Builds the filter.
+        """
+
+        source = Path(options["source"])
+        output = Path(options["output"] or get_breached_filter_path())
+
+        if not source.is_file():
+            raise CommandError(f"The source {source} does not exist.")
+
+        if not 0 < options["false_positive_rate"] < 1:
+            raise CommandError("The false positive rate must be between 0 and 1.")
+
+        # The filter is sized with a first pass over the source
+        count = sum(
+            1
+            for _ in self.read_digests(
+                source=source, min_count=options["min_count"]
+            )
+        )
+
+        if not count:
+            raise CommandError(f"The source {source} has no valid hashes.")
+
+        added = BloomFilter.build(
+            digests=self.read_digests(
+                source=source, min_count=options["min_count"]
+            ),
+            count=count,
+            path=output,
+            false_positive_rate=options["false_positive_rate"],
+        )
+        size = output.stat().st_size / 1024 / 1024
+
+        if self.invalid_lines:
+            self.stdout.write(
+                msg=self.style.WARNING(
+                    f"{self.invalid_lines} invalid lines skipped."
+                )
+            )
+
+        self.stdout.write(
+            msg=f"{self.style.MIGRATE_LABEL(f'{added} hashes')} added to {output} ({size:.1f} MB)."
+        )
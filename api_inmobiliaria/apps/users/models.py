@@ -311,7 +311,8 @@ class RealEstateEntity(models.Model):
 
     def __init__(self, *args, **kwargs):
         super(RealEstateEntity, self).__init__(*args, **kwargs)
-        if isinstance(self.phone_numbers, str):
+        # A deferred field is not in the instance dict, and reading it would load it
+        if isinstance(self.__dict__.get("phone_numbers"), str):
             self.phone_numbers = self.phone_numbers.split(",")
 
     uuid = models.UUIDField(db_column="uuid", default=uuid4, primary_key=True)
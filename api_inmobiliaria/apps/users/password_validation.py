@@ -0,0 +1,89 @@
+from utils.bloom import BloomFilter
+from django.core.exceptions import ValidationError
+from django.contrib.auth.password_validation import get_default_password_validators
+from django.conf import settings
+from pathlib import Path
+import threading
+import hashlib
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+# Default location of the filter built by the `buildbreachedfilter` command
+DEFAULT_FILTER_PATH = Path(settings.BASE_DIR) / "data" / "breached_passwords.bloom"
+
+
+class BreachedPasswordValidator:
+    """
+    Validates that the password is not in a list of breached passwords, checking
+    its SHA-1 digest against a Bloom filter built by the `buildbreachedfilter`
+    command. The filter is memory-mapped, so the workers share it instead of loading
+    the list in each process, and the check works offline.
+
+    The passwords are rejected with the false positive rate of the filter. If the
+    filter file does not exist, the validator accepts all the passwords.
+    """
+
+    def __init__(self, filter_path: str | Path = DEFAULT_FILTER_PATH) -> None:
+        self.filter_path = Path(filter_path)
+        self._filter: BloomFilter | None = None
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def get_filter(self) -> BloomFilter | None:
+        """
+        Maps the filter on the first call of each validator.
+        """
+
+        if self._loaded:
+            return self._filter
+
+        with self._lock:
+            if not self._loaded:
+                try:
+                    self._filter = BloomFilter(path=self.filter_path)
+                except FileNotFoundError:
+                    logger.warning(
+                        "The breached passwords filter %s does not exist, the passwords are not checked.",
+                        self.filter_path,
+                    )
+                except (OSError, ValueError) as exc:
+                    logger.error(
+                        "The breached passwords filter could not be loaded: %s",
+                        exc,
+                    )
+
+                self._loaded = True
+
+        return self._filter
+
+    def validate(self, password: str, user=None) -> None:
+        breached_filter = self.get_filter()
+
+        if breached_filter is None:
+            return
+
+        if hashlib.sha1(password.encode()).digest() in breached_filter:
+            raise ValidationError(
+                "This password has appeared in a data breach.",
+                code="password_breached",
+            )
+
+    def get_help_text(self) -> str:
+        return (
+            "Your password can't be a password that has appeared in a data breach."
+        )
+
+
+def get_breached_filter_path() -> Path:
+    """
+    Returns the path of the filter used by the configured
+    `BreachedPasswordValidator`, the default one if it is not configured.
+    """
+
+    for validator in get_default_password_validators():
+        if isinstance(validator, BreachedPasswordValidator):
+            return validator.filter_path
+
+    return DEFAULT_FILTER_PATH
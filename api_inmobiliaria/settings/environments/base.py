@@ -24,7 +24,15 @@ BASE_APPS = [
     "django.contrib.staticfiles",
 ]
 
-LOCAL_APPS = ["apps.users", "apps.emails", "apps.authentication"]
+LOCAL_APPS = [
+    "apps.users",
+    "apps.emails",
+    "apps.authentication",
+    "apps.monitoring",
+    "apps.docs",
+    "apps.deployment",
+    "apps.batch",
+]
 
 THIRD_APPS = [
     "rest_framework_simplejwt",
@@ -38,17 +46,37 @@ THIRD_APPS = [
 INSTALLED_APPS = BASE_APPS + LOCAL_APPS + THIRD_APPS
 
 MIDDLEWARE = [
+    "apps.monitoring.middleware.DatabaseTimingMiddleware",
+    "apps.monitoring.middleware.QueryBudgetMiddleware",
+    "apps.monitoring.middleware.MetricsMiddleware",
+    "apps.monitoring.middleware.ProfilingMiddleware",
+    "apps.deployment.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.deployment.middleware.PathMiddlewareDispatcher",
 ]
 
+# Middleware skipped by the requests of the API, run by PathMiddlewareDispatcher for
+# the admin, the monitoring views and the HTML views of the API
+PATH_MIDDLEWARE = {
+    "LEAN_PREFIXES": ["/api/v1/"],
+    # The account activation pages
+    "FULL_PREFIXES": ["/api/v1/email/token/"],
+    "MIDDLEWARE": [
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+        "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    ],
+}
+
+# The middleware required by the admin is run by PathMiddlewareDispatcher, these
+# checks only look at MIDDLEWARE and are replaced by deployment.E001
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
 ROOT_URLCONF = "settings.urls"
 
 TEMPLATES = [
@@ -85,6 +113,13 @@ AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
     },
+    # Memory-mapped filter built with the buildbreachedfilter command
+    {
+        "NAME": "apps.users.password_validation.BreachedPasswordValidator",
+        "OPTIONS": {
+            "filter_path": BASE_DIR / "data" / "breached_passwords.bloom",
+        },
+    },
 ]
 
 
@@ -123,13 +158,90 @@ AUTHENTICATION_BACKENDS = [
 
 # API settings
 REST_FRAMEWORK = {
+    # The chains of AUTHENTICATION_CHAINS, by path
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "apps.authentication.jwt.JWTAuthentication",
-        "rest_framework.authentication.SessionAuthentication",
+        "apps.authentication.chains.PathAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
     "EXCEPTION_HANDLER": "utils.exceptions.api_view_exception_handler",
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Built on orjson if it is installed
+    "DEFAULT_RENDERER_CLASSES": [
+        "utils.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "utils.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
+# Authentication classes of the DRF views that use the default ones, by the prefix
+# of their path, the longest matching prefix wins. The API only accepts JWTs.
+AUTHENTICATION_CHAINS = {
+    "/api/v1/": ["apps.authentication.jwt.JWTAuthentication"],
+    "/": [
+        "apps.authentication.jwt.JWTAuthentication",
+        "rest_framework.authentication.SessionAuthentication",
+    ],
+}
+
+# Password hashing pool used by the async authentication views. The calls beyond
+# MAX_WORKERS + MAX_PENDING are rejected with a 503 response.
+PASSWORD_HASHING_POOL = {
+    "MAX_WORKERS": 4,
+    "MAX_PENDING": 16,
+    "RETRY_AFTER": 1,
+}
+
+# Sliding-window rate limits per scope, as (limit, window in seconds) per key. The
+# attempts are counted in the cache of CACHE_ALIAS, which must be shared by the
+# workers to limit the attempts across them.
+RATE_LIMITS = {
+    "ENABLED": True,
+    "CACHE_ALIAS": "ratelimit",
+    # META key of the header with the client IP set by the reverse proxy, such as
+    # HTTP_X_FORWARDED_FOR, and the number of trusted proxies that append to it.
+    # Without a header the IP is REMOTE_ADDR.
+    "CLIENT_IP_HEADER": None,
+    "NUM_PROXIES": 1,
+    "SCOPES": {
+        "login": {"email": (10, 300), "ip": (100, 300)},
+        "send_token": {"user": (3, 3600), "ip": (30, 3600)},
+    },
+}
+
+# Serve the async variants of the authentication views, for ASGI deployments
+ASYNC_AUTHENTICATION_VIEWS = False
+
+# Query budget settings, the budgets are declared in the views
+QUERY_BUDGETS = {
+    "ENABLED": False,
+    "RAISE_EXCEPTION": False,
+    "DEFAULT_BUDGET": None,
+}
+
+# Metrics settings, the metrics are exposed in the Prometheus text format. The
+# directory is shared by the gunicorn workers and must be emptied on startup.
+METRICS = {
+    "ENABLED": True,
+    "DIRECTORY": None,
+    "FLUSH_INTERVAL": 5,
+    "ALLOWED_IPS": ["127.0.0.1"],
+    # Bearer token required to scrape the metrics, on top of the allowed IPs
+    "TOKEN": None,
+}
+
+# Profiler settings, the folded stacks are served to the staff as a collapsed-stack
+# file for flamegraph tools
+PROFILER = {
+    "ENABLED": False,
+    "SAMPLE_RATE": 0.01,
+    "INTERVAL": 0.005,
+    "MAX_STACKS": 2000,
+    "DIRECTORY": None,
+    "FLUSH_INTERVAL": 5,
 }
 
 # SMTP settings
@@ -141,6 +253,23 @@ EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 EMAIL_PORT = config("EMAIL_PORT", cast=int)
 EMAIL_USE_TLS = True
 
+# SMTP connection pool of the PooledEmailBackend, in each process. The sessions idle
+# for more than HEALTH_CHECK_INTERVAL seconds are checked with a NOOP before reusing
+# them, and those idle for more than IDLE_TIMEOUT seconds are closed.
+EMAIL_POOL = {
+    "MAX_CONNECTIONS": 4,
+    "IDLE_TIMEOUT": 60,
+    "HEALTH_CHECK_INTERVAL": 10,
+    "ACQUIRE_TIMEOUT": 10,
+}
+
+# Email tokens settings. With STATELESS, the tokens are validated from the timestamp
+# and the HMAC they embed, and only stored in the Token table for AUDIT.
+EMAIL_TOKENS = {
+    "STATELESS": False,
+    "AUDIT": False,
+}
+
 
 # JWT authentication settings
 SIMPLE_JWT = {
@@ -177,6 +306,65 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSlidingSerializer",
 }
 
+# Activity tracking, the last login of the users is recorded in the memory of each
+# worker and written with one UPDATE per BATCH_SIZE users every FLUSH_INTERVAL
+# seconds, at most once per user every WINDOW seconds.
+ACTIVITY_TRACKING = {
+    "ENABLED": SIMPLE_JWT["UPDATE_LAST_LOGIN"],
+    "FLUSH_INTERVAL": 60,
+    "WINDOW": 3600,
+    "BATCH_SIZE": 500,
+}
+
+
+# Rotating refresh tokens, issued on login when enabled. With STATELESS_ACCESS_TOKENS
+# the access tokens are verified without checking the blacklist, which is only safe
+# with a short ACCESS_TOKEN_LIFETIME since the logout then only revokes the refresh
+# tokens of the session. It is ignored when the refresh tokens are disabled.
+REFRESH_TOKEN = {
+    "ENABLED": False,
+    "LIFETIME": timedelta(days=7),
+    # Minutes, replaces the lifetime of the access tokens when enabled
+    "ACCESS_TOKEN_LIFETIME": 15,
+    "STATELESS_ACCESS_TOKENS": False,
+}
+
+# Backend of the outstanding and blacklisted tokens, "sql" stores them in the JWT
+# tables and "cache" in the cache of CACHE_ALIAS, where they expire on their own
+JWT_REPOSITORY = {
+    "BACKEND": "sql",
+    "CACHE_ALIAS": "tokens",
+}
+
+
+# Cache settings
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Shared by the gunicorn workers of the same host
+    "tokens": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / ".cache" / "tokens",
+    },
+    # Sessions of the admin, shared by the gunicorn workers of the same host
+    "sessions": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / ".cache" / "sessions",
+    },
+    # Counters of the rate limits, a local memory cache counts them per worker
+    "ratelimit": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "ratelimit",
+    },
+}
+
+# Sessions of the admin, read from the cache and written through to the database.
+# The cache must be shared by the workers, a session changed by a worker would be
+# stale in the local cache of the others.
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+SESSION_CACHE_ALIAS = "sessions"
 
 # drf-spectacular settings
 SPECTACULAR_SETTINGS = {
@@ -192,6 +380,10 @@ SPECTACULAR_SETTINGS = {
             "name": "Authentication",
             "description": "Includes all endpoints that manage all functionality related to authenticating a user in the API.",
         },
+        {
+            "name": "Batch",
+            "description": "Includes the endpoint that performs several requests to the API in a single HTTP call.",
+        },
     ],
     "SERVE_INCLUDE_SCHEMA": False,
     "SERVE_PERMISSIONS": ["rest_framework.permissions.AllowAny"],
@@ -204,4 +396,57 @@ SPECTACULAR_SETTINGS = {
         "url": "https://opensource.org/licenses/MIT",
     },
     "SCHEMA_PATH_PREFIX": "/api_inmobiliaria",
+    "DEFAULT_GENERATOR_CLASS": "apps.docs.generators.SchemaGenerator",
+}
+
+# Compression of the responses, negotiated with the Accept-Encoding header. Only the
+# bodies with a rule for their content type are compressed, with the level of each
+# encoding of the rule; brotli is only used if the brotli package is installed.
+RESPONSE_COMPRESSION = {
+    "ENABLED": True,
+    # Smaller bodies fit in a single TCP segment anyway
+    "MIN_SIZE": 1400,
+    "STREAMING": True,
+    # The error responses may reflect the input of the request (BREACH)
+    "COMPRESS_ERRORS": False,
+    # Maximum length of the random padding of the gzip header (BREACH)
+    "MAX_RANDOM_BYTES": 100,
+    "CONTENT_TYPES": {
+        "application/json": {"br": 4, "gzip": 6},
+        "application/vnd.oai.openapi+json": {"br": 9, "gzip": 9},
+        "text/plain": {"br": 4, "gzip": 6},
+        "text/css": {"br": 4, "gzip": 6},
+        "text/javascript": {"br": 4, "gzip": 6},
+        # The admin pages carry the CSRF token, only gzip pads the body
+        "text/html": {"gzip": 6},
+    },
+}
+
+# Batch requests, the requests of a batch are dispatched one after the other to the
+# views of the API in the same process
+BATCH_REQUESTS = {
+    "MAX_REQUESTS": 10,
+    # Seconds, the requests that have not started by then are not dispatched
+    "TIMEOUT": 10,
+    # Paths that can be requested in a batch
+    "ALLOWED_PREFIXES": ["/api/v1/user/", "/api/v1/auth/"],
+    # Headers that a request can set, the others are rejected. Host and the proxy
+    # headers, such as the CLIENT_IP_HEADER of the rate limits, must never be
+    # allowed.
+    "ALLOWED_HEADERS": [
+        "Authorization",
+        "Accept",
+        "Accept-Language",
+        "If-None-Match",
+    ],
+}
+
+# Pre-generated OpenAPI schema, built with the buildschema command
+API_SCHEMA = {
+    "DIRECTORY": BASE_DIR / "openapi",
+    "MAX_AGE": 300,
+    # The extend_schema decorators are only attached when the schema is generated
+    "LAZY_DECORATORS": True,
+    # Modules with drf-spectacular extensions, imported when the schema is generated
+    "EXTENSIONS": ["apps.authentication.infrastructure.schemas.jwt.extensions"],
 }
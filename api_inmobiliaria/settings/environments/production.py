@@ -1,4 +1,5 @@
 from .base import *
+from decouple import Csv
 
 
 # SECURITY WARNING: don't run with debug turned on in production!
@@ -37,7 +38,7 @@ CORS_ORIGIN_WHITELIST = [
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.mysql",
+        "ENGINE": "utils.db.backends.mysql",
         "NAME": config("MYSQL_DB_NAME", cast=str),
         "USER": config("MYSQL_DB_USER", cast=str),
         "PASSWORD": config("MYSQL_DB_PASSWORD", cast=str),
@@ -45,15 +46,34 @@ DATABASES = {
         "OPTIONS": {
             "sql_mode": "STRICT_TRANS_TABLES",
         },
+        # Persistent connections, one per gunicorn worker
+        "CONN_MAX_AGE": config("MYSQL_DB_CONN_MAX_AGE", cast=int, default=300),
+        "CONN_HEALTH_CHECKS": True,
+        "CONN_MAX_USES": config("MYSQL_DB_CONN_MAX_USES", cast=int, default=1000),
     }
 }
 
 
+# Password validation
+AUTH_PASSWORD_VALIDATORS[-1]["OPTIONS"]["filter_path"] = config(
+    "BREACHED_PASSWORDS_FILTER",
+    cast=str,
+    default=str(AUTH_PASSWORD_VALIDATORS[-1]["OPTIONS"]["filter_path"]),
+)
+
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/4.2/howto/static-files/
 STATIC_ROOT = Path.joinpath(BASE_DIR, "staticfiles")
 
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
 
 
 # LOGGING settings
@@ -69,11 +89,34 @@ LOGGING = {
         "handlers": ["console"],
         "level": "WARNING",
     },
+    "loggers": {
+        "apps.monitoring": {
+            "level": config("MONITORING_LOG_LEVEL", cast=str, default="WARNING"),
+        },
+    },
 }
 
 
 # SMTP settings
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_BACKEND = "apps.emails.backends.PooledEmailBackend"
+
+EMAIL_TIMEOUT = config("EMAIL_TIMEOUT", cast=int, default=10)
+
+EMAIL_POOL["MAX_CONNECTIONS"] = config(
+    "EMAIL_POOL_MAX_CONNECTIONS", cast=int, default=4
+)
+
+EMAIL_POOL["IDLE_TIMEOUT"] = config(
+    "EMAIL_POOL_IDLE_TIMEOUT", cast=int, default=60
+)
+
+
+# Email tokens settings
+EMAIL_TOKENS["STATELESS"] = config(
+    "EMAIL_TOKENS_STATELESS", cast=bool, default=False
+)
+
+EMAIL_TOKENS["AUDIT"] = config("EMAIL_TOKENS_AUDIT", cast=bool, default=False)
 
 
 # drf-spectacular settings
@@ -83,3 +126,114 @@ SPECTACULAR_SETTINGS["SERVERS"] = [
         "description": "PythonAnyWhere Server",
     }
 ]
+
+
+# Refresh token settings
+REFRESH_TOKEN["ENABLED"] = config(
+    "REFRESH_TOKEN_ENABLED", cast=bool, default=False
+)
+
+REFRESH_TOKEN["ACCESS_TOKEN_LIFETIME"] = config(
+    "REFRESH_ACCESS_TOKEN_LIFETIME", cast=int, default=15
+)
+
+REFRESH_TOKEN["STATELESS_ACCESS_TOKENS"] = config(
+    "STATELESS_ACCESS_TOKENS", cast=bool, default=False
+)
+
+
+# JWT repository settings
+JWT_REPOSITORY["BACKEND"] = config(
+    "JWT_REPOSITORY_BACKEND", cast=str, default="sql"
+)
+
+CACHES["tokens"]["LOCATION"] = config(
+    "TOKENS_CACHE_DIR", cast=str, default=str(CACHES["tokens"]["LOCATION"])
+)
+
+
+# Session settings
+CACHES["sessions"]["LOCATION"] = config(
+    "SESSIONS_CACHE_DIR", cast=str, default=str(CACHES["sessions"]["LOCATION"])
+)
+
+
+# Rate limit settings, the counters are shared by the workers through Redis
+RATE_LIMITS["ENABLED"] = config("RATE_LIMITS_ENABLED", cast=bool, default=True)
+
+RATE_LIMITS["CLIENT_IP_HEADER"] = (
+    config(
+        "RATE_LIMITS_CLIENT_IP_HEADER", cast=str, default="HTTP_X_FORWARDED_FOR"
+    )
+    or None
+)
+
+RATE_LIMITS["NUM_PROXIES"] = config("RATE_LIMITS_NUM_PROXIES", cast=int, default=1)
+
+if config("RATE_LIMITS_REDIS_URL", cast=str, default=""):
+    CACHES["ratelimit"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config("RATE_LIMITS_REDIS_URL", cast=str),
+    }
+
+
+# Activity tracking settings
+ACTIVITY_TRACKING["FLUSH_INTERVAL"] = config(
+    "ACTIVITY_FLUSH_INTERVAL", cast=int, default=60
+)
+
+ACTIVITY_TRACKING["WINDOW"] = config("ACTIVITY_WINDOW", cast=int, default=3600)
+
+
+# Query budget settings
+QUERY_BUDGETS["ENABLED"] = config(
+    "QUERY_BUDGETS_ENABLED", cast=bool, default=False
+)
+
+
+# Metrics settings
+METRICS["DIRECTORY"] = config("METRICS_DIR", cast=str, default=None)
+
+METRICS["ALLOWED_IPS"] = config(
+    "METRICS_ALLOWED_IPS", cast=Csv(), default="127.0.0.1"
+)
+
+METRICS["TOKEN"] = config("METRICS_TOKEN", cast=str, default=None)
+
+
+# Profiler settings
+PROFILER["ENABLED"] = config("PROFILER_ENABLED", cast=bool, default=False)
+
+PROFILER["SAMPLE_RATE"] = config("PROFILER_SAMPLE_RATE", cast=float, default=0.01)
+
+PROFILER["DIRECTORY"] = METRICS["DIRECTORY"]
+
+
+# Response compression settings, disabled when the reverse proxy compresses
+RESPONSE_COMPRESSION["ENABLED"] = config(
+    "RESPONSE_COMPRESSION_ENABLED", cast=bool, default=True
+)
+
+RESPONSE_COMPRESSION["MIN_SIZE"] = config(
+    "RESPONSE_COMPRESSION_MIN_SIZE", cast=int, default=1400
+)
+
+
+# Batch requests settings
+BATCH_REQUESTS["MAX_REQUESTS"] = config("BATCH_MAX_REQUESTS", cast=int, default=10)
+
+BATCH_REQUESTS["TIMEOUT"] = config("BATCH_TIMEOUT", cast=float, default=10)
+
+
+# Async authentication settings
+ASYNC_AUTHENTICATION_VIEWS = config(
+    "ASYNC_AUTHENTICATION_VIEWS", cast=bool, default=False
+)
+
+PASSWORD_HASHING_POOL["MAX_WORKERS"] = config(
+    "PASSWORD_HASHING_MAX_WORKERS", cast=int, default=4
+)
+
+PASSWORD_HASHING_POOL["MAX_PENDING"] = config(
+    "PASSWORD_HASHING_MAX_PENDING", cast=int, default=16
+)
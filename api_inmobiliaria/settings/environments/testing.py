@@ -11,12 +11,38 @@ ALLOWED_HOSTS = []
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
+        "ENGINE": "utils.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
         "TEST": {"NAME": "test_db.sqlite3"},
     }
 }
 
 
+# Cache settings
+CACHES["tokens"] = {
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "tokens",
+}
+
+CACHES["sessions"] = {
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "sessions",
+}
+
+
+# Rate limit settings, enabled by the tests of the rate limiter
+RATE_LIMITS["ENABLED"] = False
+
+
+# Activity tracking settings, enabled by the tests of the activity tracker
+ACTIVITY_TRACKING["ENABLED"] = False
+
+
 # SMTP settings
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+
+# Query budget settings
+QUERY_BUDGETS["ENABLED"] = True
+
+QUERY_BUDGETS["RAISE_EXCEPTION"] = True
@@ -19,22 +19,14 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
 
 urlpatterns = [
-    path(
-        route="",
-        view=SpectacularSwaggerView.as_view(url_name="schema"),
-        name="api_schema",
-    ),
-    path(
-        route="doc/schema/",
-        view=SpectacularAPIView.as_view(),
-        name="schema",
-    ),
+    path("", include("apps.docs.infrastructure.urls")),
     path("admin/", admin.site.urls),
     path("api/v1/user/", include("apps.users.infrastructure.urls")),
     path("api/v1/auth/", include("apps.authentication.infrastructure.urls")),
     path("api/v1/email/", include("apps.emails.infrastructure.urls")),
+    path("api/v1/batch/", include("apps.batch.infrastructure.urls")),
+    path("monitoring/", include("apps.monitoring.infrastructure.urls")),
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
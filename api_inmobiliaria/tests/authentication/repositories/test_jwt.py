@@ -0,0 +1,164 @@
+from apps.authentication.infrastructure.repositories import (
+    JWT_REPOSITORY_BACKENDS,
+    CacheJWTRepository,
+    get_jwt_repository,
+)
+from apps.authentication.interfaces import IJWTRepository
+from apps.authentication.jwt import AccessToken
+from apps.users.models import BaseUser
+from tests.factory import UserFactory
+from rest_framework_simplejwt.utils import datetime_to_epoch, aware_utcnow
+from rest_framework_simplejwt.exceptions import TokenError
+from django.core.exceptions import ImproperlyConfigured
+from django.core.cache import caches
+from asgiref.sync import async_to_sync
+from datetime import timedelta
+from uuid import uuid4
+import pytest
+
+
+@pytest.fixture(params=list(JWT_REPOSITORY_BACKENDS))
+def repository(request, settings) -> IJWTRepository:
+    """
+    Selects each registered backend of the JWT repository.
+    """
+
+    settings.JWT_REPOSITORY = {**settings.JWT_REPOSITORY, "BACKEND": request.param}
+    caches[settings.JWT_REPOSITORY["CACHE_ALIAS"]].clear()
+
+    yield get_jwt_repository()
+
+    caches[settings.JWT_REPOSITORY["CACHE_ALIAS"]].clear()
+
+
+@pytest.fixture
+def base_user(db) -> BaseUser:
+    return UserFactory.searcher_user(active=True, save=True, add_perm=False)[0]
+
+
+def get_payload(lifetime: timedelta = timedelta(minutes=5)) -> dict:
+    return {
+        "jti": uuid4().hex,
+        "exp": datetime_to_epoch(dt=aware_utcnow() + lifetime),
+    }
+
+
+@pytest.mark.django_db
+class TestJWTRepositoryConformance:
+    """
+    This class encapsulates the tests that every backend of the JWT repository must
+    pass, they are run against each registered backend.
+    """
+
+    def test_add_checklist(self, repository: IJWTRepository, base_user) -> None:
+        """
+        This test is responsible for validating that an outstanding token can be
+        retrieved by its JTI.
+        """
+
+        payload = get_payload()
+        repository.add_checklist(token="token", payload=payload, user=base_user)
+        token = repository.get(jti=payload["jti"])
+
+        assert token.jti == payload["jti"]
+        assert token.token == "token"
+        assert str(token.user_id) == str(base_user.uuid)
+        assert datetime_to_epoch(dt=token.expires_at) == payload["exp"]
+        assert repository.get(jti=uuid4().hex) is None
+
+    def test_add_blacklist(self, repository: IJWTRepository, base_user) -> None:
+        """
+        This test is responsible for validating that only the blacklisted tokens are
+        reported as blacklisted.
+        """
+
+        payload = get_payload()
+        repository.add_checklist(token="token", payload=payload, user=base_user)
+
+        assert not repository.exists_in_blacklist(jti=payload["jti"])
+
+        repository.add_blacklist(token=repository.get(jti=payload["jti"]))
+
+        assert repository.exists_in_blacklist(jti=payload["jti"])
+        assert not repository.exists_in_blacklist(jti=uuid4().hex)
+
+    def test_async_counterparts(
+        self, repository: IJWTRepository, base_user
+    ) -> None:
+        """
+        This test is responsible for validating that the async methods share the
+        data of the sync methods.
+        """
+
+        payload = get_payload()
+        async_to_sync(repository.aadd_checklist)(
+            token="token", payload=payload, user=base_user
+        )
+        token = async_to_sync(repository.aget)(jti=payload["jti"])
+
+        assert token.jti == repository.get(jti=payload["jti"]).jti
+        assert not async_to_sync(repository.aexists_in_blacklist)(jti=token.jti)
+
+        async_to_sync(repository.aadd_blacklist)(token=token)
+
+        assert async_to_sync(repository.aexists_in_blacklist)(jti=token.jti)
+        assert repository.exists_in_blacklist(jti=token.jti)
+
+    def test_access_token_flow(
+        self, repository: IJWTRepository, base_user
+    ) -> None:
+        """
+        This test is responsible for validating that the access tokens are saved,
+        blacklisted and rejected through the selected backend.
+        """
+
+        access_token = AccessToken(user=base_user)
+        jti = access_token.payload["jti"]
+
+        assert repository.get(jti=jti) is not None
+
+        access_token.blacklist()
+
+        assert repository.exists_in_blacklist(jti=jti)
+
+        with pytest.raises(TokenError):
+            AccessToken(token=str(access_token))
+
+
+class TestCacheJWTRepository:
+    """
+    This class encapsulates the tests of the behavior specific to the cache backend.
+    """
+
+    def test_expiration(self, settings) -> None:
+        """
+        This test is responsible for validating that the tokens are stored for their
+        remaining lifetime.
+        """
+
+        lifetime = timedelta(minutes=5)
+        timeout = CacheJWTRepository._get_timeout(
+            expires_at=get_payload(lifetime=lifetime)["exp"]
+        )
+
+        assert lifetime.total_seconds() - 1 <= timeout <= lifetime.total_seconds()
+        assert CacheJWTRepository._get_timeout(expires_at=0) == 1
+
+    def test_lookup_by_other_field(self) -> None:
+        """
+        This test is responsible for validating that only lookups by JTI are
+        supported.
+        """
+
+        with pytest.raises(ValueError):
+            CacheJWTRepository.get(token="token")
+
+    def test_unknown_backend(self, settings) -> None:
+        """
+        This test is responsible for validating that an unknown backend is reported.
+        """
+
+        settings.JWT_REPOSITORY = {"BACKEND": "missing", "CACHE_ALIAS": "tokens"}
+
+        with pytest.raises(ImproperlyConfigured):
+            get_jwt_repository()
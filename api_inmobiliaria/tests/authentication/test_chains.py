@@ -0,0 +1,61 @@
+from apps.authentication.chains import (
+    PathAuthentication,
+    get_authentication_classes,
+)
+from apps.authentication.jwt import JWTAuthentication
+from apps.users.models import BaseUser
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.request import Request
+from django.test import RequestFactory
+import pytest
+
+
+@pytest.mark.parametrize(
+    argnames="path, authentication_classes",
+    argvalues=[
+        ("/api/v1/user/searcher/", [JWTAuthentication]),
+        ("/monitoring/profile/", [JWTAuthentication, SessionAuthentication]),
+    ],
+    ids=["api", "monitoring"],
+)
+def test_authentication_classes(path: str, authentication_classes: list) -> None:
+    """
+    This test is responsible for validating that the chain of the longest prefix
+    that matches the path is used.
+    """
+
+    assert get_authentication_classes(path=path) == authentication_classes
+
+
+def test_no_matching_prefix(settings) -> None:
+    """
+    This test is responsible for validating that no authentication is used when no
+    prefix matches the path.
+    """
+
+    settings.AUTHENTICATION_CHAINS = {
+        "/api/v1/": settings.AUTHENTICATION_CHAINS["/"]
+    }
+
+    assert get_authentication_classes(path="/admin/") == []
+
+
+@pytest.mark.parametrize(
+    argnames="path, authenticated",
+    argvalues=[("/api/v1/user/searcher/", False), ("/monitoring/profile/", True)],
+    ids=["api", "monitoring"],
+)
+def test_session_user(path: str, authenticated: bool) -> None:
+    """
+    This test is responsible for validating that the session user is only
+    authenticated out of the API.
+    """
+
+    user = BaseUser(email="admin@email.com", is_active=True)
+    http_request = RequestFactory().get(path=path)
+    http_request.user = user
+    request = Request(request=http_request)
+
+    user_auth_tuple = PathAuthentication().authenticate(request=request)
+
+    assert (user_auth_tuple == (user, None)) is authenticated
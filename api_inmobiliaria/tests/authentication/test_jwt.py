@@ -0,0 +1,134 @@
+from apps.authentication.jwt import AccessToken
+from apps.authentication.constants import ACCESS_TOKEN_LIFETIME, TokenStatus
+from apps.users.constants import UserRoles
+from utils.messages import JWTErrorMessages
+from tests.factory import JWTFactory, UserFactory
+from rest_framework_simplejwt.exceptions import TokenError
+from settings.environments.base import SIMPLE_JWT
+from django.test import Client
+from django.urls import reverse
+from jwt import encode
+from datetime import timedelta
+import pytest
+
+
+# Error messages
+INVALID_OR_EXPIRED = JWTErrorMessages.INVALID_OR_EXPIRED.value
+
+
+@pytest.mark.django_db
+class TestParseToken:
+    """
+    This class encapsulates the tests of the parsing of the JSON Web Tokens, which
+    verifies their signature once and reports whether they have expired.
+    """
+
+    user_factory = UserFactory
+    jwt_factory = JWTFactory
+
+    @pytest.mark.parametrize(
+        argnames="exp, status",
+        argvalues=[(True, TokenStatus.EXPIRED), (False, TokenStatus.VALID)],
+        ids=["expired", "valid"],
+    )
+    def test_parse(self, exp: bool, status: TokenStatus) -> None:
+        """
+        This test is responsible for validating that the payload and the status of a
+        token are returned, without querying the database.
+        """
+
+        token_data = self.jwt_factory.access(exp=exp, save=False)
+        parsed_token = AccessToken.parse(token=token_data["token"])
+
+        assert parsed_token.payload == token_data["payload"]
+        assert parsed_token.status is status
+        assert parsed_token.expired is (status is TokenStatus.EXPIRED)
+
+    @pytest.mark.parametrize(
+        argnames="token",
+        argvalues=[
+            "invalid",
+            JWTFactory.access(exp=False, save=False)["token"][:-2],
+            JWTFactory.access_invalid(),
+            encode(
+                payload={"token_type": "refresh", "exp": 1, "jti": "jti"},
+                key=SIMPLE_JWT["SIGNING_KEY"],
+                algorithm=SIMPLE_JWT["ALGORITHM"],
+            ),
+        ],
+        ids=["malformed", "invalid_signature", "corrupted", "other_token_type"],
+    )
+    def test_invalid_token(self, token: str) -> None:
+        """
+        This test is responsible for validating that an error is raised when the
+        token can not be trusted.
+        """
+
+        with pytest.raises(
+            TokenError,
+            match=INVALID_OR_EXPIRED.format(token_type=AccessToken.token_type),
+        ):
+            AccessToken.parse(token=token)
+
+    def test_new_token(self, django_assert_num_queries) -> None:
+        """
+        This test is responsible for validating that a new token is not verified
+        against the blacklist, only saved to the outstanding tokens.
+        """
+
+        base_user, _, _ = self.user_factory.user(
+            user_role=UserRoles.SEARCHER.value,
+            active=True,
+            save=True,
+            add_perm=False,
+        )
+
+        with django_assert_num_queries(num=1):
+            AccessToken(user=base_user)
+
+    def test_update_view(self, django_assert_num_queries) -> None:
+        """
+        This test is responsible for validating that the expired token is decoded
+        once and the view only queries the blacklist, the user and saves the new
+        token.
+        """
+
+        base_user, _, _ = self.user_factory.user(
+            user_role=UserRoles.SEARCHER.value,
+            active=True,
+            save=True,
+            add_perm=False,
+        )
+        token_data = self.jwt_factory.access(user=base_user, exp=True, save=True)
+
+        with django_assert_num_queries(num=3):
+            response = Client().post(
+                path=reverse(viewname="update_jwt"),
+                data={"access_token": token_data["token"]},
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+
+
+@pytest.mark.parametrize(
+    argnames="enabled, lifetime",
+    argvalues=[(False, ACCESS_TOKEN_LIFETIME), (True, timedelta(minutes=15))],
+    ids=["refresh_tokens_disabled", "refresh_tokens_enabled"],
+)
+def test_access_token_lifetime(
+    settings, enabled: bool, lifetime: timedelta
+) -> None:
+    """
+    This test is responsible for validating that the access tokens are short-lived
+    when the refresh tokens are enabled.
+    """
+
+    settings.REFRESH_TOKEN = {
+        **settings.REFRESH_TOKEN,
+        "ENABLED": enabled,
+        "ACCESS_TOKEN_LIFETIME": 15,
+    }
+    access_token = AccessToken(verify=False, save=False)
+
+    assert access_token["exp"] - access_token["iat"] == lifetime.total_seconds()
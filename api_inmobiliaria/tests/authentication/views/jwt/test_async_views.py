@@ -0,0 +1,299 @@
+from apps.authentication.infrastructure.views import (
+    AsyncLoginAPIView,
+    AsyncLogoutAPIView,
+    AsyncUpdateTokenAPIView,
+)
+from apps.authentication.hashers import password_hashing_executor
+from apps.authentication.models import JWT, JWTBlacklist
+from apps.backends import EmailPasswordBackend
+from apps.users.constants import UserRoles
+from apps.api_exceptions import (
+    AuthenticationFailedAPIError,
+    NotAuthenticatedAPIError,
+    ServiceUnavailableAPIError,
+    JWTAPIError,
+)
+from utils.messages import JWTErrorMessages
+from tests.factory import JWTFactory, UserFactory
+from rest_framework import status
+from django.http.response import HttpResponse
+from django.contrib.auth.signals import user_login_failed
+from django.test import RequestFactory
+from unittest.mock import Mock, patch
+from asgiref.sync import async_to_sync
+from typing import Any, Dict
+import json
+import pytest
+
+
+# User roles
+SEARCHER = UserRoles.SEARCHER.value
+
+# Error messages
+AUTHENTICATION_FAILED = JWTErrorMessages.AUTHENTICATION_FAILED.value
+BLACKLISTED = JWTErrorMessages.BLACKLISTED.value
+
+
+def post(view_class: Any, data: Dict[str, Any], **headers: str) -> HttpResponse:
+    """
+    Simulates a POST request to an async view.
+    """
+
+    request = RequestFactory().post(
+        path="/", data=data, content_type="application/json", **headers
+    )
+
+    return async_to_sync(view_class.as_view())(request)
+
+
+@pytest.mark.django_db
+class TestAsyncLoginAPIView:
+    """
+    This class encapsulates the tests of the async variant of the view in charge of
+    handling authentication requests for users with JSON Web Token.
+    """
+
+    view_class = AsyncLoginAPIView
+    user_factory = UserFactory
+
+    def test_if_valid_data(self, setup_database) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the request data is valid.
+        """
+
+        # Creating the user data to be used in the test
+        _, _, data = self.user_factory.user(
+            user_role=SEARCHER, active=True, save=True, add_perm=True
+        )
+
+        # Simulating the request
+        response = post(
+            view_class=self.view_class,
+            data={"email": data["email"], "password": data["password"]},
+        )
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_200_OK
+        assert "access_token" in json.loads(response.content)
+        assert JWT.objects.count() == 1
+
+    @pytest.mark.parametrize(
+        argnames="password",
+        argvalues=["contraseña1234", "contraseña4321"],
+        ids=["user_not_found", "wrong_password"],
+    )
+    def test_if_credentials_invalid(self, password: str, setup_database) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the credentials provided are invalid.
+        """
+
+        # Creating the user data to be used in the test
+        _, _, data = self.user_factory.user(
+            user_role=SEARCHER, active=True, save=True, add_perm=True
+        )
+        email = (
+            data["email"] if password != data["password"] else "user1@email.com"
+        )
+
+        # Simulating the request
+        response = post(
+            view_class=self.view_class,
+            data={"email": email, "password": password},
+        )
+        response_data = json.loads(response.content)
+
+        # Asserting that response data is correct
+        assert response.status_code == AuthenticationFailedAPIError.status_code
+        assert response_data["code"] == AuthenticationFailedAPIError.default_code
+        assert response_data["detail"] == AUTHENTICATION_FAILED
+
+    def test_if_authentication_backends_used(self, setup_database) -> None:
+        """
+        This test is responsible for validating that the credentials are checked by
+        the async method of the authentication backend, and that the failed logins
+        are signaled as in the sync view.
+        """
+
+        # Creating the user data to be used in the test
+        _, _, data = self.user_factory.user(
+            user_role=SEARCHER, active=True, save=True, add_perm=True
+        )
+        receiver = Mock()
+        user_login_failed.connect(receiver=receiver)
+
+        # Simulating the request
+        try:
+            with patch.object(
+                EmailPasswordBackend,
+                "authenticate",
+                autospec=True,
+                side_effect=EmailPasswordBackend.authenticate,
+            ) as authenticate:
+                response = post(
+                    view_class=self.view_class,
+                    data={"email": data["email"], "password": "contraseña4321"},
+                )
+        finally:
+            user_login_failed.disconnect(receiver=receiver)
+
+        # Asserting that response data is correct
+        assert response.status_code == AuthenticationFailedAPIError.status_code
+        assert receiver.call_count == 1
+        assert receiver.call_args.kwargs["credentials"]["email"] == data["email"]
+        authenticate.assert_not_called()
+
+    def test_if_invalid_data(self) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the request data is invalid.
+        """
+
+        # Simulating the request
+        response = post(view_class=self.view_class, data={})
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert json.loads(response.content)["code"] == "invalid_request_data"
+
+    def test_if_hashing_pool_full(self, settings) -> None:
+        """
+        This test is responsible for validating that the login is rejected with
+        backpressure when the password hashing pool is full.
+        """
+
+        settings.PASSWORD_HASHING_POOL = {
+            "MAX_WORKERS": 1,
+            "MAX_PENDING": 0,
+            "RETRY_AFTER": 2,
+        }
+        password_hashing_executor.in_flight = 1
+
+        try:
+            # Simulating the request
+            response = post(
+                view_class=self.view_class,
+                data={"email": "user1@email.com", "password": "contraseña1234"},
+            )
+        finally:
+            password_hashing_executor.in_flight = 0
+
+        # Asserting that response data is correct
+        assert response.status_code == ServiceUnavailableAPIError.status_code
+        assert response["Retry-After"] == "2"
+        assert (
+            json.loads(response.content)["code"]
+            == ServiceUnavailableAPIError.default_code
+        )
+
+
+@pytest.mark.django_db
+class TestAsyncUpdateTokenAPIView:
+    """
+    This class encapsulates the tests of the async variant of the view in charge of
+    creating new JWTs when the access token has expired.
+    """
+
+    view_class = AsyncUpdateTokenAPIView
+    user_factory = UserFactory
+    jwt_factory = JWTFactory
+
+    def test_if_valid_data(self) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the request data is valid.
+        """
+
+        # Creating the JWTs to be used in the test
+        base_user, _, _ = self.user_factory.user(
+            user_role=SEARCHER, active=True, save=True, add_perm=False
+        )
+        access_token_data = self.jwt_factory.access(
+            user_role=base_user.content_type.model,
+            user=base_user,
+            exp=True,
+            save=True,
+        )
+
+        # Simulating the request
+        response = post(
+            view_class=self.view_class,
+            data={"access_token": access_token_data["token"]},
+        )
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_200_OK
+        assert "access_token" in json.loads(response.content)
+        assert JWT.objects.count() == 2
+
+    def test_if_token_blacklisted(self, setup_database) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the access token is blacklisted.
+        """
+
+        # Creating the JWTs to be used in the test
+        access_token_data = self.jwt_factory.access(
+            exp=True, save=True, add_blacklist=True
+        )
+
+        # Simulating the request
+        response = post(
+            view_class=self.view_class,
+            data={"access_token": access_token_data["token"]},
+        )
+        response_data = json.loads(response.content)
+
+        # Asserting that response data is correct
+        assert response.status_code == JWTAPIError.status_code
+        assert response_data["detail"] == BLACKLISTED.format(token_type="access")
+
+
+@pytest.mark.django_db
+class TestAsyncLogoutAPIView:
+    """
+    This class encapsulates the tests of the async variant of the view in charge of
+    handling a user's logout requests.
+    """
+
+    view_class = AsyncLogoutAPIView
+    jwt_factory = JWTFactory
+
+    def test_if_valid_data(self, setup_database) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the request data is valid.
+        """
+
+        # Creating the JWTs to be used in the test
+        access_token_data = self.jwt_factory.access(exp=False, save=True)
+
+        # Simulating the request
+        response = post(
+            view_class=self.view_class,
+            data={},
+            HTTP_AUTHORIZATION=f"Bearer {access_token_data['token']}",
+        )
+
+        # Asserting that the token was blacklisted
+        assert response.status_code == status.HTTP_200_OK
+        assert JWTBlacklist.objects.filter(
+            token__jti=access_token_data["payload"]["jti"]
+        ).exists()
+
+    def test_if_access_token_not_provided(self) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the access token is not provided.
+        """
+
+        # Simulating the request
+        response = post(view_class=self.view_class, data={})
+
+        # Asserting that response data is correct
+        assert response.status_code == NotAuthenticatedAPIError.status_code
+        assert (
+            json.loads(response.content)["code"]
+            == NotAuthenticatedAPIError.default_code
+        )
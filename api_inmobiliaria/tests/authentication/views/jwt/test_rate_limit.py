@@ -0,0 +1,217 @@
+from apps.authentication.infrastructure.views import AsyncLoginAPIView
+from apps.api_exceptions import ThrottledAPIError
+from utils.throttling import SlidingWindowRateLimiter, get_client_ip
+from rest_framework import status
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from asgiref.sync import async_to_sync
+from unittest.mock import Mock, patch
+import pytest
+
+
+@pytest.fixture
+def login_limits(settings, rate_limits) -> None:
+    """
+    Sets small limits for the login attempts.
+    """
+
+    settings.RATE_LIMITS = {
+        **settings.RATE_LIMITS,
+        "SCOPES": {
+            **settings.RATE_LIMITS["SCOPES"],
+            "login": {"email": (2, 60), "ip": (3, 60)},
+        },
+    }
+
+
+@pytest.mark.django_db
+class TestLoginRateLimit:
+    """
+    This class encapsulates the tests of the rate limits of the login, per email and
+    per client IP. The throttled attempts must be rejected before authenticating the
+    user, so they do not spend time hashing passwords.
+    """
+
+    path = reverse(viewname="login_jwt")
+    client = Client()
+
+    def _login(self, email: str, ip: str = "127.0.0.1"):
+        return self.client.post(
+            path=self.path,
+            data={"email": email, "password": "contraseña1234"},
+            content_type="application/json",
+            REMOTE_ADDR=ip,
+        )
+
+    @patch(
+        target="apps.authentication.infrastructure.views.jwt.JWTLogin.login",
+        return_value={"access_token": "token"},
+    )
+    def test_email_limit(self, login: Mock, login_limits) -> None:
+        """
+        This test is responsible for validating that the attempts beyond the limit of
+        an email are rejected without authenticating the user, even from other IPs.
+        """
+
+        for ip in ["10.0.0.1", "10.0.0.2"]:
+            assert self._login(email="user@example.com", ip=ip).status_code == (
+                status.HTTP_200_OK
+            )
+
+        # The email is normalized
+        response = self._login(email=" User@Example.com", ip="10.0.0.3")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.json()["code"] == ThrottledAPIError.default_code
+        assert int(response["Retry-After"]) >= 1
+        assert login.call_count == 2
+
+    @patch(
+        target="apps.authentication.infrastructure.views.jwt.JWTLogin.login",
+        return_value={"access_token": "token"},
+    )
+    def test_ip_limit(self, login: Mock, login_limits) -> None:
+        """
+        This test is responsible for validating that the attempts beyond the limit of
+        a client IP are rejected, whatever email they use.
+        """
+
+        for index in range(3):
+            assert self._login(email=f"user{index}@example.com").status_code == (
+                status.HTTP_200_OK
+            )
+
+        response = self._login(email="other@example.com")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert login.call_count == 3
+
+    @patch(
+        target="apps.authentication.infrastructure.views.jwt.JWTLogin.alogin",
+        return_value={"access_token": "token"},
+    )
+    def test_async_view(self, alogin: Mock, login_limits) -> None:
+        """
+        This test is responsible for validating that the async variant of the view
+        applies the same limits.
+        """
+
+        def post():
+            request = RequestFactory().post(
+                path="/",
+                data={"email": "user@example.com", "password": "contraseña1234"},
+                content_type="application/json",
+            )
+
+            return async_to_sync(AsyncLoginAPIView.as_view())(request)
+
+        assert [post().status_code for _ in range(3)] == [
+            status.HTTP_200_OK,
+            status.HTTP_200_OK,
+            status.HTTP_429_TOO_MANY_REQUESTS,
+        ]
+
+    @patch(
+        target="apps.authentication.infrastructure.views.jwt.JWTLogin.login",
+        return_value={"access_token": "token"},
+    )
+    def test_disabled(self, login: Mock) -> None:
+        """
+        This test is responsible for validating that no attempt is throttled when the
+        rate limits are disabled.
+        """
+
+        for _ in range(15):
+            assert self._login(email="user@example.com").status_code == (
+                status.HTTP_200_OK
+            )
+
+
+class TestSlidingWindow:
+    """
+    This class encapsulates the tests of the estimation of the attempts in the
+    sliding window, from the counters of the current and previous windows.
+    """
+
+    @pytest.mark.parametrize(
+        argnames="current, previous, now, wait",
+        argvalues=[
+            # 3 + 4 * 0.5 = 5 attempts, within the limit
+            (3, 4, 30, None),
+            # 4 + 4 * 0.5 = 6 attempts, the previous window weighs 0.25 at 45 s
+            (4, 4, 30, 15),
+            # The current window alone reaches the limit, it ends at 60 s
+            (6, 0, 30, 30),
+        ],
+        ids=["within_limit", "previous_window", "current_window"],
+    )
+    def test_get_wait(self, current: int, previous: int, now: float, wait) -> None:
+        """
+        This test is responsible for validating the estimated attempts and the
+        seconds to wait until they are below the limit.
+        """
+
+        assert (
+            SlidingWindowRateLimiter._get_wait(
+                current=current, previous=previous, limit=5, window=60, now=now
+            )
+            == wait
+        )
+
+    def test_previous_window(self, rate_limits, settings) -> None:
+        """
+        This test is responsible for validating that the attempts of the previous
+        window are counted.
+        """
+
+        settings.RATE_LIMITS = {
+            **settings.RATE_LIMITS,
+            "SCOPES": {"test": {"key": (2, 60)}},
+        }
+        limiter = SlidingWindowRateLimiter(scope="test")
+
+        with patch(target="utils.throttling.time.time", return_value=59.0):
+            limiter.check(key="value")
+            limiter.check(key="value")
+
+        with patch(target="utils.throttling.time.time", return_value=61.0):
+            with pytest.raises(ThrottledAPIError):
+                limiter.check(key="value")
+
+        # The previous window is out of the sliding window
+        with patch(target="utils.throttling.time.time", return_value=180.0):
+            limiter.check(key="value")
+
+    @pytest.mark.parametrize(
+        argnames="header, num_proxies, forwarded_for, ip",
+        argvalues=[
+            (None, 1, "10.0.0.1", "127.0.0.1"),
+            ("HTTP_X_FORWARDED_FOR", 1, "1.1.1.1, 10.0.0.1", "10.0.0.1"),
+            ("HTTP_X_FORWARDED_FOR", 2, "1.1.1.1, 10.0.0.1, 10.0.0.2", "10.0.0.1"),
+            ("HTTP_X_FORWARDED_FOR", 1, "", "127.0.0.1"),
+        ],
+        ids=["no_proxy", "one_proxy", "two_proxies", "header_missing"],
+    )
+    def test_client_ip(
+        self,
+        settings,
+        header: str | None,
+        num_proxies: int,
+        forwarded_for: str,
+        ip: str,
+    ) -> None:
+        """
+        This test is responsible for validating that the client IP is read from the
+        header of the trusted proxies, ignoring the addresses set by the client.
+        """
+
+        settings.RATE_LIMITS = {
+            **settings.RATE_LIMITS,
+            "CLIENT_IP_HEADER": header,
+            "NUM_PROXIES": num_proxies,
+        }
+        request = RequestFactory().post(
+            path="/", REMOTE_ADDR="127.0.0.1", HTTP_X_FORWARDED_FOR=forwarded_for
+        )
+
+        assert get_client_ip(request=request) == ip
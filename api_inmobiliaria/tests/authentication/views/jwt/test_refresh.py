@@ -0,0 +1,243 @@
+from apps.authentication.applications import JWTRefresh
+from apps.authentication.models import RefreshToken, JWTBlacklist
+from apps.authentication.constants import TOKEN_FAMILY_CLAIM
+from apps.authentication.jwt import AccessToken
+from apps.users.constants import UserRoles
+from apps.api_exceptions import JWTAPIError
+from utils.messages import JWTErrorMessages
+from tests.factory import UserFactory
+from rest_framework_simplejwt.utils import aware_utcnow
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework import status
+from django.test import Client
+from django.urls import reverse
+from datetime import timedelta
+from typing import Dict
+from jwt import decode
+import pytest
+
+
+# Error messages
+INVALID_OR_EXPIRED = JWTErrorMessages.INVALID_OR_EXPIRED.value
+REFRESH_REUSED = JWTErrorMessages.REFRESH_REUSED.value
+
+
+@pytest.fixture
+def refresh_tokens(settings) -> None:
+    """
+    Enables the refresh tokens.
+    """
+
+    settings.REFRESH_TOKEN = {**settings.REFRESH_TOKEN, "ENABLED": True}
+
+
+@pytest.mark.django_db
+class TestRefreshTokenAPIView:
+    """
+    This class encapsulates all the tests of the view in charge of rotating the
+    refresh tokens.
+
+    A refresh token is issued on login and can be exchanged once for a new access
+    token and a new refresh token of the same family. Presenting a used refresh
+    token again revokes its whole family.
+    """
+
+    path = reverse(viewname="refresh_jwt")
+    login_path = reverse(viewname="login_jwt")
+    logout_path = reverse(viewname="logout_jwt")
+    user_factory = UserFactory
+    client = Client()
+
+    def _login(self) -> Dict[str, str]:
+        """
+        Logs in a new searcher user and returns the tokens of the response.
+        """
+
+        _, _, data = self.user_factory.user(
+            user_role=UserRoles.SEARCHER.value,
+            active=True,
+            save=True,
+            add_perm=True,
+        )
+        response = self.client.post(
+            path=self.login_path,
+            data={"email": data["email"], "password": data["password"]},
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        return response.json()
+
+    def _rotate(self, refresh_token: str):
+        return self.client.post(
+            path=self.path,
+            data={"refresh_token": refresh_token},
+            content_type="application/json",
+        )
+
+    def test_login(self, setup_database, refresh_tokens, settings) -> None:
+        """
+        This test is responsible for validating that the login returns a refresh
+        token, whose family is carried by the access token.
+        """
+
+        tokens = self._login()
+        payload = decode(
+            jwt=tokens["access_token"],
+            key=settings.SIMPLE_JWT["SIGNING_KEY"],
+            algorithms=[settings.SIMPLE_JWT["ALGORITHM"]],
+        )
+        refresh_token = RefreshToken.objects.get()
+
+        assert refresh_token.token_hash == JWTRefresh.get_token_hash(
+            tokens["refresh_token"]
+        )
+        assert payload[TOKEN_FAMILY_CLAIM] == str(refresh_token.family)
+
+    def test_login_disabled(self, setup_database) -> None:
+        """
+        This test is responsible for validating that the login only returns the
+        access token when the refresh tokens are disabled.
+        """
+
+        tokens = self._login()
+
+        assert list(tokens) == ["access_token"]
+        assert not RefreshToken.objects.exists()
+
+    def test_rotate(self, setup_database, refresh_tokens) -> None:
+        """
+        This test is responsible for validating that a refresh token is exchanged
+        for new tokens of the same family and can not be used again.
+        """
+
+        tokens = self._login()
+        response = self._rotate(refresh_token=tokens["refresh_token"])
+        new_tokens = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert new_tokens["refresh_token"] != tokens["refresh_token"]
+
+        used, issued = RefreshToken.objects.order_by("id")
+
+        assert used.used_at is not None
+        assert issued.used_at is None
+        assert used.family == issued.family
+
+    def test_reuse(self, setup_database, refresh_tokens) -> None:
+        """
+        This test is responsible for validating that presenting a used refresh token
+        revokes all the tokens of its family.
+        """
+
+        tokens = self._login()
+        new_tokens = self._rotate(refresh_token=tokens["refresh_token"]).json()
+
+        response = self._rotate(refresh_token=tokens["refresh_token"])
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json() == {
+            "code": JWTAPIError.default_code,
+            "detail": REFRESH_REUSED,
+        }
+        assert not RefreshToken.objects.filter(revoked_at__isnull=True).exists()
+
+        # Asserting that the token issued by the rotation was revoked too
+        response = self._rotate(refresh_token=new_tokens["refresh_token"])
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.parametrize(
+        argnames="expired",
+        argvalues=[True, False],
+        ids=["expired", "unknown"],
+    )
+    def test_invalid(self, expired: bool, setup_database, refresh_tokens) -> None:
+        """
+        This test is responsible for validating that expired and unknown refresh
+        tokens are rejected.
+        """
+
+        tokens = self._login()
+        refresh_token = tokens["refresh_token"]
+
+        if expired:
+            RefreshToken.objects.update(expires_at=aware_utcnow() - timedelta(1))
+        else:
+            refresh_token = "unknown"
+
+        response = self._rotate(refresh_token=refresh_token)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["detail"] == INVALID_OR_EXPIRED.format(
+            token_type="refresh"
+        )
+
+    def test_logout(self, setup_database, refresh_tokens) -> None:
+        """
+        This test is responsible for validating that the logout revokes the family
+        of the refresh token issued with the access token.
+        """
+
+        tokens = self._login()
+        response = self.client.post(
+            path=self.logout_path,
+            HTTP_AUTHORIZATION=f"Bearer {tokens['access_token']}",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert JWTBlacklist.objects.count() == 1
+        assert RefreshToken.objects.get().revoked_at is not None
+
+    def test_stateless_access_tokens(self, setup_database, settings) -> None:
+        """
+        This test is responsible for validating that the blacklist is not checked
+        when the access tokens are stateless.
+        """
+
+        settings.REFRESH_TOKEN = {
+            **settings.REFRESH_TOKEN,
+            "ENABLED": True,
+            "STATELESS_ACCESS_TOKENS": True,
+        }
+        tokens = self._login()
+        self.client.post(
+            path=self.logout_path,
+            HTTP_AUTHORIZATION=f"Bearer {tokens['access_token']}",
+        )
+
+        # The access token is not blacklisted and is still accepted until it
+        # expires, but its session can not be refreshed
+        AccessToken(token=tokens["access_token"])
+
+        assert JWTBlacklist.objects.count() == 0
+
+        assert self._rotate(refresh_token=tokens["refresh_token"]).status_code == (
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_stateless_without_refresh_tokens(
+        self, setup_database, settings
+    ) -> None:
+        """
+        This test is responsible for validating that the blacklist is checked when
+        the access tokens are stateless but the refresh tokens are disabled.
+        """
+
+        settings.REFRESH_TOKEN = {
+            **settings.REFRESH_TOKEN,
+            "ENABLED": False,
+            "STATELESS_ACCESS_TOKENS": True,
+        }
+        tokens = self._login()
+        response = self.client.post(
+            path=self.logout_path,
+            HTTP_AUTHORIZATION=f"Bearer {tokens['access_token']}",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert JWTBlacklist.objects.count() == 1
+
+        with pytest.raises(TokenError):
+            AccessToken(token=tokens["access_token"])
@@ -23,6 +23,7 @@ USER_NOT_FOUND = JWTErrorMessages.USER_NOT_FOUND.value
 BLACKLISTED = JWTErrorMessages.BLACKLISTED.value
 INVALID_OR_EXPIRED = JWTErrorMessages.INVALID_OR_EXPIRED.value
 ACCESS_NOT_EXPIRED = JWTErrorMessages.ACCESS_NOT_EXPIRED.value
+UPDATE_DISABLED = JWTErrorMessages.UPDATE_DISABLED.value
 
 
 @pytest.mark.django_db
@@ -81,6 +82,41 @@ class TestUpdateTokensAPIView:
         assert response.status_code == status.HTTP_200_OK
         assert "access_token" in response.data
 
+    def test_if_refresh_tokens_enabled(self, settings) -> None:
+        """
+        This test is responsible for validating that no access token is renewed when
+        the refresh tokens are enabled, since it would escape the revocation of the
+        token families.
+        """
+
+        settings.REFRESH_TOKEN = {**settings.REFRESH_TOKEN, "ENABLED": True}
+
+        # Creating the JWTs to be used in the test
+        base_user, _, _ = self.user_factory.user(
+            user_role=UserRoles.SEARCHER.value,
+            active=True,
+            save=True,
+            add_perm=False,
+        )
+        access_token_data = self.jwt_factory.access(
+            user_role=base_user.content_type.model,
+            user=base_user,
+            exp=True,
+            save=True,
+        )
+
+        # Simulating the request
+        response = self.client.post(
+            path=self.path,
+            data={"access_token": access_token_data["token"]},
+            content_type="application/json",
+        )
+
+        # Asserting that response data is correct
+        assert response.status_code == ResourceNotFoundAPIError.status_code
+        assert response.data["code"] == UPDATE_DISABLED["code"]
+        assert response.data["detail"] == UPDATE_DISABLED["detail"]
+
     def test_if_empty_data(self) -> None:
         """
         This test is responsible for validating the expected behavior of the view
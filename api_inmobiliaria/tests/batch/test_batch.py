@@ -0,0 +1,261 @@
+from apps.authentication.jwt import JWTAuthentication
+from apps.batch.dispatcher import BatchDispatcher
+from utils.throttling import get_client_ip
+from utils.messages import ERROR_MESSAGES
+from tests.factory import UserFactory, JWTFactory
+from rest_framework import status
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from unittest.mock import patch
+from typing import Any, Dict, List
+import pytest
+
+
+@pytest.mark.django_db
+class TestBatchAPIView:
+    """
+    This class encapsulates the tests for the view responsible for performing batch
+    requests.
+    """
+
+    path = reverse(viewname="batch")
+    user_factory = UserFactory
+    jwt_factory = JWTFactory
+    client = Client()
+
+    def test_if_batch_dispatched(self, setup_database) -> None:
+        """
+        This test is responsible for validating that the requests of the batch are
+        dispatched in order, and that the access token of the batch is only
+        validated once.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=True, save=True, add_perm=True
+        )
+        access_token = self.jwt_factory.access(
+            user_role=base_user.content_type.model,
+            user=base_user,
+            exp=False,
+            save=True,
+        ).get("token")
+
+        # Simulating the request
+        with patch.object(
+            JWTAuthentication,
+            "get_user",
+            autospec=True,
+            side_effect=JWTAuthentication.get_user,
+        ) as get_user:
+            response = self.client.post(
+                path=self.path,
+                data={
+                    "requests": [
+                        {"method": "GET", "path": "/api/v1/user/searcher/"},
+                        {
+                            "method": "GET",
+                            "path": "/api/v1/user/searcher/?fields=name",
+                        },
+                        {
+                            "method": "POST",
+                            "path": "/api/v1/auth/jwt/login/",
+                            "body": {"email": base_user.email},
+                        },
+                        {"method": "GET", "path": "/api/v1/user/unknown/"},
+                    ]
+                },
+                HTTP_AUTHORIZATION=f"Bearer {access_token}",
+                content_type="application/json",
+            )
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_200_OK
+        assert get_user.call_count == 1
+
+        profile, sparse_profile, login, unknown = response.data["responses"]
+
+        assert profile["status"] == status.HTTP_200_OK
+        assert profile["body"]["base_data"]["email"] == base_user.email
+        assert sparse_profile["status"] == status.HTTP_200_OK
+        assert list(sparse_profile["body"]["role_data"]) == ["name"]
+        assert login["status"] == status.HTTP_400_BAD_REQUEST
+        assert login["body"]["detail"] == {
+            "password": [ERROR_MESSAGES["required"]]
+        }
+        assert unknown["status"] == status.HTTP_404_NOT_FOUND
+
+    def test_if_token_revoked_in_batch(self, setup_database) -> None:
+        """
+        This test is responsible for validating that the requests that follow a
+        logout in the batch authenticate the revoked access token again.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=True, save=True, add_perm=True
+        )
+        access_token = self.jwt_factory.access(
+            user_role=base_user.content_type.model,
+            user=base_user,
+            exp=False,
+            save=True,
+        ).get("token")
+
+        # Simulating the request
+        response = self.client.post(
+            path=self.path,
+            data={
+                "requests": [
+                    {"method": "GET", "path": "/api/v1/user/searcher/"},
+                    {"method": "POST", "path": "/api/v1/auth/jwt/logout/"},
+                    {"method": "GET", "path": "/api/v1/user/searcher/"},
+                ]
+            },
+            HTTP_AUTHORIZATION=f"Bearer {access_token}",
+            content_type="application/json",
+        )
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            sub_response["status"] for sub_response in response.data["responses"]
+        ] == [
+            status.HTTP_200_OK,
+            status.HTTP_200_OK,
+            status.HTTP_401_UNAUTHORIZED,
+        ]
+
+    @pytest.mark.parametrize(
+        argnames="sub_requests, max_requests",
+        argvalues=[
+            ([], 10),
+            ([{"method": "GET", "path": "/admin/"}], 10),
+            ([{"method": "POST", "path": "/api/v1/batch/"}], 10),
+            ([{"method": "TRACE", "path": "/api/v1/user/searcher/"}], 10),
+            ([{"method": "GET", "path": "/api/v1/user/searcher/"}] * 2, 1),
+            (
+                [
+                    {
+                        "method": "POST",
+                        "path": "/api/v1/auth/jwt/login/",
+                        "headers": {"X-Forwarded-For": "10.0.0.1"},
+                    }
+                ],
+                10,
+            ),
+            (
+                [
+                    {
+                        "method": "GET",
+                        "path": "/api/v1/user/searcher/",
+                        "headers": {"Host": "example.com"},
+                    }
+                ],
+                10,
+            ),
+        ],
+        ids=[
+            "empty_batch",
+            "path_out_of_the_api",
+            "nested_batch",
+            "invalid_method",
+            "too_many_requests",
+            "proxy_header",
+            "host_header",
+        ],
+    )
+    def test_if_invalid_data(
+        self, settings, sub_requests: List[Dict[str, Any]], max_requests: int
+    ) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the batch is invalid, none of its requests are dispatched.
+        """
+
+        settings.BATCH_REQUESTS = {
+            **settings.BATCH_REQUESTS,
+            "MAX_REQUESTS": max_requests,
+        }
+
+        # Simulating the request
+        response = self.client.post(
+            path=self.path,
+            data={"requests": sub_requests},
+            content_type="application/json",
+        )
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["code"] == "invalid_request_data"
+        assert "requests" in response.data["detail"]
+
+    def test_if_time_limit_reached(self, settings) -> None:
+        """
+        This test is responsible for validating that the requests that have not
+        started when the time limit of the batch is reached are not dispatched.
+        """
+
+        settings.BATCH_REQUESTS = {**settings.BATCH_REQUESTS, "TIMEOUT": 0}
+
+        # Simulating the request
+        response = self.client.post(
+            path=self.path,
+            data={
+                "requests": [
+                    {"method": "GET", "path": "/api/v1/user/searcher/"},
+                ]
+            },
+            content_type="application/json",
+        )
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["responses"] == [
+            {
+                "status": status.HTTP_504_GATEWAY_TIMEOUT,
+                "body": {
+                    "code": "batch_timeout",
+                    "detail": "The time limit of the batch was reached before dispatching the request.",
+                },
+            }
+        ]
+
+
+class TestBatchDispatcher:
+    """
+    This class encapsulates the tests for the dispatcher of the requests of a batch.
+    """
+
+    def test_client_ip(self, settings) -> None:
+        """
+        This test is responsible for validating that a request of the batch can not
+        change the client IP of the batch request, the headers that are not allowed
+        are ignored.
+        """
+
+        settings.RATE_LIMITS = {
+            **settings.RATE_LIMITS,
+            "CLIENT_IP_HEADER": "HTTP_X_FORWARDED_FOR",
+            "NUM_PROXIES": 1,
+        }
+        batch_request = RequestFactory().post(
+            path="/api/v1/batch/",
+            HTTP_X_FORWARDED_FOR="203.0.113.7",
+            HTTP_ACCEPT_LANGUAGE="es",
+        )
+
+        request = BatchDispatcher(request=batch_request).build_request(
+            sub_request={
+                "method": "POST",
+                "path": "/api/v1/auth/jwt/login/",
+                "headers": {
+                    "X-Forwarded-For": "10.0.0.1",
+                    "Host": "example.com",
+                    "Accept-Language": "en",
+                },
+            }
+        )
+
+        # Asserting that the request has the expected headers
+        assert get_client_ip(request=request) == "203.0.113.7"
+        assert request.get_host() == batch_request.get_host()
+        assert request.META["HTTP_ACCEPT_LANGUAGE"] == "en"
@@ -3,6 +3,7 @@ from apps.users.interfaces import IUserRepository
 from apps.authentication.interfaces import IJWTRepository
 from apps.emails.interfaces import ITokenRepository, ITokenGenerator
 from django.contrib.auth.models import Group, Permission
+from django.core.cache import caches
 from django.db.models.query import QuerySet
 from unittest.mock import Mock
 import pytest
@@ -29,6 +30,16 @@ def setup_database(db) -> None:
             group.permissions.add(perm)
 
 
+@pytest.fixture
+def rate_limits(settings) -> None:
+    """
+    Enables the rate limits with empty counters.
+    """
+
+    settings.RATE_LIMITS = {**settings.RATE_LIMITS, "ENABLED": True}
+    caches[settings.RATE_LIMITS["CACHE_ALIAS"]].clear()
+
+
 @pytest.fixture
 def queryset() -> Mock:
     """
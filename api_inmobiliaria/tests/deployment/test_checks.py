@@ -0,0 +1,32 @@
+from apps.deployment.checks import check_admin_middleware
+import pytest
+
+
+@pytest.mark.parametrize(
+    argnames="removed, errors",
+    argvalues=[
+        (None, 0),
+        ("django.contrib.auth.middleware.AuthenticationMiddleware", 1),
+        ("apps.deployment.middleware.PathMiddlewareDispatcher", 3),
+    ],
+    ids=["complete_chain", "middleware_removed", "dispatcher_removed"],
+)
+def test_admin_middleware(settings, removed: str | None, errors: int) -> None:
+    """
+    This test is responsible for validating that the check reports the middleware
+    of the admin that is not run by MIDDLEWARE or by the PathMiddlewareDispatcher.
+    """
+
+    settings.MIDDLEWARE = [path for path in settings.MIDDLEWARE if path != removed]
+    settings.PATH_MIDDLEWARE = {
+        **settings.PATH_MIDDLEWARE,
+        "MIDDLEWARE": [
+            path
+            for path in settings.PATH_MIDDLEWARE["MIDDLEWARE"]
+            if path != removed
+        ],
+    }
+    messages = check_admin_middleware()
+
+    assert len(messages) == errors
+    assert all(message.id == "deployment.E001" for message in messages)
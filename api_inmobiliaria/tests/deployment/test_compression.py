@@ -0,0 +1,148 @@
+from apps.deployment.middleware import (
+    CompressionMiddleware,
+    get_accepted_encodings,
+)
+from apps.authentication.infrastructure.views import LoginAPIView
+from django.http.response import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from unittest.mock import patch
+from typing import Dict
+import gzip
+import pytest
+
+
+# A JSON body larger than the minimum size
+CONTENT = b'{"name": "Constructora"}' * 100
+
+
+def compress(
+    response: HttpResponse, headers: Dict[str, str] | None = None
+) -> HttpResponse:
+    request = RequestFactory().get(path="/", headers=headers or {})
+    middleware = CompressionMiddleware(get_response=lambda request: response)
+
+    return middleware(request)
+
+
+def test_accepted_encodings() -> None:
+    """
+    This test is responsible for validating the quality values of the encodings of
+    an `Accept-Encoding` header.
+    """
+
+    assert get_accepted_encodings(header="gzip, br;q=0.5, identity;q=0") == {
+        "gzip": 1.0,
+        "br": 0.5,
+        "identity": 0.0,
+    }
+
+
+def test_compress() -> None:
+    """
+    This test is responsible for validating that a JSON body is compressed with
+    gzip when the client accepts it.
+    """
+
+    with patch(target="apps.deployment.middleware.brotli", new=None):
+        response = compress(
+            response=HttpResponse(
+                content=CONTENT, content_type="application/json"
+            ),
+            headers={"Accept-Encoding": "gzip, deflate, br"},
+        )
+
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Vary"] == "Accept-Encoding"
+    assert int(response["Content-Length"]) == len(response.content)
+    assert gzip.decompress(response.content) == CONTENT
+
+
+@pytest.mark.parametrize(
+    argnames="response, headers",
+    argvalues=[
+        (
+            HttpResponse(content=CONTENT, content_type="application/json"),
+            {"Accept-Encoding": "gzip;q=0"},
+        ),
+        (
+            HttpResponse(content=CONTENT[:100], content_type="application/json"),
+            {"Accept-Encoding": "gzip"},
+        ),
+        (
+            HttpResponse(content=CONTENT, content_type="image/png"),
+            {"Accept-Encoding": "gzip"},
+        ),
+        (
+            HttpResponse(
+                content=CONTENT, content_type="application/json", status=400
+            ),
+            {"Accept-Encoding": "gzip"},
+        ),
+        (
+            HttpResponse(
+                content=CONTENT,
+                content_type="application/json",
+                headers={"Content-Encoding": "br"},
+            ),
+            {"Accept-Encoding": "gzip"},
+        ),
+    ],
+    ids=[
+        "encoding_not_accepted",
+        "small_body",
+        "content_type_without_rule",
+        "error_response",
+        "already_encoded",
+    ],
+)
+def test_not_compressed(response: HttpResponse, headers: Dict[str, str]) -> None:
+    """
+    This test is responsible for validating that the body is sent as it is when it
+    must not be compressed.
+    """
+
+    response = compress(response=response, headers=headers)
+
+    assert response.get("Content-Encoding") != "gzip"
+    assert response.content == CONTENT[: len(response.content)]
+
+
+def test_compress_stream() -> None:
+    """
+    This test is responsible for validating that a streaming body is compressed as
+    it is sent.
+    """
+
+    response = compress(
+        response=StreamingHttpResponse(
+            streaming_content=(CONTENT for _ in range(3)),
+            content_type="application/json",
+        ),
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(b"".join(response.streaming_content)) == CONTENT * 3
+
+
+def test_view_not_compressed() -> None:
+    """
+    This test is responsible for validating that the responses of the views that
+    issue tokens are not compressed.
+    """
+
+    request = RequestFactory().post(path="/", headers={"Accept-Encoding": "gzip"})
+    middleware = CompressionMiddleware(
+        get_response=lambda request: HttpResponse(
+            content=CONTENT, content_type="application/json"
+        )
+    )
+    middleware.process_view(
+        request=request,
+        view_func=LoginAPIView.as_view(),
+        view_args=(),
+        view_kwargs={},
+    )
+    response = middleware(request)
+
+    assert not response.has_header("Content-Encoding")
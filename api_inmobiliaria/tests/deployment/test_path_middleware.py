@@ -0,0 +1,61 @@
+from apps.deployment.middleware import PathMiddlewareDispatcher
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse
+from django.test import RequestFactory
+import pytest
+
+
+def view(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(content=b"{}", content_type="application/json")
+
+
+def dispatch(request: HttpRequest) -> HttpResponse:
+    def get_response(request: HttpRequest) -> HttpResponse:
+        return dispatcher.process_view(
+            request=request, view_func=view, view_args=(), view_kwargs={}
+        ) or view(request)
+
+    dispatcher = PathMiddlewareDispatcher(get_response=get_response)
+
+    return dispatcher(request)
+
+
+@pytest.mark.parametrize(
+    argnames="path, lean",
+    argvalues=[
+        ("/api/v1/user/searcher/", True),
+        ("/api/v1/email/token/activation/uuid/token/", False),
+        ("/admin/", False),
+    ],
+    ids=["api", "activation_page", "admin"],
+)
+def test_dispatch(path: str, lean: bool) -> None:
+    """
+    This test is responsible for validating that only the requests of the API skip
+    the sessions and the session user.
+    """
+
+    request = RequestFactory().get(path=path)
+    response = dispatch(request=request)
+
+    assert response.status_code == 200
+    assert hasattr(request, "session") is not lean
+    assert hasattr(request, "user") is not lean
+    assert response.has_header("X-Frame-Options") is not lean
+
+
+@pytest.mark.parametrize(
+    argnames="path, status_code",
+    argvalues=[("/api/v1/user/searcher/", 200), ("/admin/", 403)],
+    ids=["api", "admin"],
+)
+def test_csrf(path: str, status_code: int) -> None:
+    """
+    This test is responsible for validating that the CSRF protection is only
+    enforced out of the API, through the views hook of the dispatcher.
+    """
+
+    request = RequestFactory().post(path=path)
+    request._dont_enforce_csrf_checks = False
+
+    assert dispatch(request=request).status_code == status_code
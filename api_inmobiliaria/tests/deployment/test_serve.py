@@ -0,0 +1,127 @@
+from apps.deployment.startup import (
+    get_unapplied_migrations,
+    read_manifest_sources_hash,
+    get_static_sources_hash,
+)
+from apps.docs.schema import get_schema_artifact
+from django.core.management import call_command
+from django.db.migrations.recorder import MigrationRecorder
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from unittest.mock import patch
+from pathlib import Path
+from io import StringIO
+import pytest
+
+
+@pytest.fixture
+def static_directories(settings, tmp_path: Path) -> Path:
+    """
+    Uses temporary directories for the static sources and the collected static
+    files, with a manifest based storage.
+    """
+
+    sources = tmp_path / "sources"
+    sources.mkdir()
+    (sources / "app.css").write_text("body { color: black; }")
+    settings.STATICFILES_DIRS = [sources]
+    settings.STATICFILES_FINDERS = [
+        "django.contrib.staticfiles.finders.FileSystemFinder"
+    ]
+    settings.STATIC_ROOT = tmp_path / "static"
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"
+        },
+    }
+    settings.API_SCHEMA = {
+        **settings.API_SCHEMA,
+        "DIRECTORY": tmp_path / "openapi",
+    }
+    get_schema_artifact.cache_clear()
+
+    yield sources
+
+    get_schema_artifact.cache_clear()
+
+
+@pytest.mark.django_db
+def test_unapplied_migrations() -> None:
+    """
+    This test is responsible for validating that the unapplied migrations are
+    found with a single query.
+    """
+
+    with CaptureQueriesContext(connection) as queries:
+        assert get_unapplied_migrations() == []
+
+    assert len(queries) == 1
+
+    MigrationRecorder.Migration.objects.filter(
+        app="users", name="0001_initial"
+    ).delete()
+
+    assert get_unapplied_migrations() == [("users", "0001_initial")]
+
+
+@pytest.mark.django_db
+class TestServeCommand:
+    """
+    This class encapsulates the tests of the command in charge of preparing the
+    project and starting gunicorn.
+    """
+
+    def test_phases(self, static_directories: Path) -> None:
+        """
+        This test is responsible for validating that the time of each phase is
+        reported and that the static files are only collected when their sources
+        change.
+        """
+
+        stdout = StringIO()
+        call_command("serve", no_serve=True, stdout=stdout)
+        output = stdout.getvalue()
+
+        for phase in ["migrations", "static", "schema", "sessions", "preload"]:
+            assert phase in output
+
+        assert "No unapplied migrations." in output
+        assert "Static files collected." in output
+        assert "OpenAPI schema" in output
+        assert "Expired sessions removed." in output
+        assert read_manifest_sources_hash() == get_static_sources_hash()
+
+        # Asserting that the static files are not collected again
+        stdout = StringIO()
+        call_command("serve", no_serve=True, stdout=stdout)
+
+        assert "collectstatic skipped" in stdout.getvalue()
+        assert "OpenAPI schema up to date, build skipped." in stdout.getvalue()
+
+        # Asserting that the static files are collected when a source changes
+        (static_directories / "app.css").write_text("body { color: white; }")
+        stdout = StringIO()
+        call_command("serve", no_serve=True, stdout=stdout)
+
+        assert "Static files collected." in stdout.getvalue()
+
+    def test_schema_rebuilt(self, static_directories: Path) -> None:
+        """
+        This test is responsible for validating that the OpenAPI schema is built
+        again when the sources it was generated from change.
+        """
+
+        call_command("serve", no_serve=True, stdout=StringIO())
+
+        # Simulating a deploy that changes the views
+        stdout = StringIO()
+
+        with patch(
+            target="apps.deployment.management.commands.serve.get_schema_sources_hash",
+            return_value="0" * 64,
+        ):
+            call_command("serve", no_serve=True, stdout=stdout)
+
+        assert "OpenAPI schema" in stdout.getvalue()
+        assert "build skipped" not in stdout.getvalue()
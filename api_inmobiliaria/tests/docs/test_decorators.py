@@ -0,0 +1,85 @@
+from apps.docs.decorators import lazy_schema, attach_schemas
+from apps.docs.schema import SchemaArtifact
+from drf_spectacular.utils import extend_schema
+import subprocess
+import json
+import sys
+import os
+
+
+ExampleSchema = extend_schema(operation_id="example_operation")
+
+
+class TestLazySchema:
+    """
+    This class encapsulates the tests of the decorator in charge of attaching the
+    drf-spectacular decorators only when the OpenAPI schema is generated.
+    """
+
+    path = "tests.docs.test_decorators.ExampleSchema"
+
+    def test_lazy(self, settings) -> None:
+        """
+        This test is responsible for validating that the decorator is attached when
+        the schema is generated and not when the target is defined.
+        """
+
+        settings.API_SCHEMA = {**settings.API_SCHEMA, "LAZY_DECORATORS": True}
+
+        @lazy_schema(path=self.path)
+        def view() -> None: ...
+
+        assert not hasattr(view, "kwargs")
+
+        attach_schemas()
+
+        assert "schema" in view.kwargs
+
+    def test_eager(self, settings) -> None:
+        """
+        This test is responsible for validating that the decorator is attached
+        immediately when the lazy mode is disabled.
+        """
+
+        settings.API_SCHEMA = {**settings.API_SCHEMA, "LAZY_DECORATORS": False}
+
+        @lazy_schema(path=self.path)
+        def view() -> None: ...
+
+        assert "schema" in view.kwargs
+
+    def test_schema_modules_not_imported(self, settings) -> None:
+        """
+        This test is responsible for validating that the modules with the
+        documentation of the endpoints are not imported along with the views.
+        """
+
+        code = "; ".join(
+            [
+                "import django, sys",
+                "django.setup()",
+                f"import {settings.ROOT_URLCONF}",
+                "print([name for name in sys.modules if name.startswith('apps.') and '.schemas' in name])",
+            ]
+        )
+        process = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE},
+            capture_output=True,
+            text=True,
+        )
+
+        assert process.stdout.strip() == "[]"
+
+    def test_generated_schema(self) -> None:
+        """
+        This test is responsible for validating that the generated schema includes
+        the documentation attached lazily and the extensions.
+        """
+
+        schema = json.loads(SchemaArtifact.generate())
+        login = schema["paths"]["/api/v1/auth/jwt/login/"]["post"]
+
+        assert login["operationId"] == "jwt_authenticate_user"
+        assert "JWTAuth" in schema["components"]["securitySchemes"]
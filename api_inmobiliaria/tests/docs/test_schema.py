@@ -0,0 +1,175 @@
+from apps.docs.schema import SchemaArtifact, get_schema_artifact
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import Client
+from django.urls import reverse
+from pathlib import Path
+import gzip
+import json
+import pytest
+
+
+@pytest.fixture
+def schema_directory(settings, tmp_path: Path) -> Path:
+    """
+    Uses a temporary directory for the schema files.
+    """
+
+    settings.API_SCHEMA = {"DIRECTORY": tmp_path, "MAX_AGE": 300}
+    get_schema_artifact.cache_clear()
+
+    yield tmp_path
+
+    get_schema_artifact.cache_clear()
+
+
+class TestBuildSchemaCommand:
+    """
+    This class encapsulates the tests of the command in charge of generating the
+    OpenAPI schema of the API.
+    """
+
+    def test_build(self, schema_directory: Path) -> None:
+        """
+        This test is responsible for validating that the schema and its compressed
+        version are written to the directory.
+        """
+
+        call_command("buildschema")
+        artifact = SchemaArtifact.load(directory=schema_directory)
+        schema = json.loads(artifact.content["identity"])
+
+        assert "/api/v1/auth/jwt/login/" in schema["paths"]
+        assert (
+            gzip.decompress(artifact.content["gzip"])
+            == artifact.content["identity"]
+        )
+        assert artifact.hash == SchemaArtifact.get_hash(
+            content=artifact.content["identity"]
+        )
+
+    def test_check(self, schema_directory: Path) -> None:
+        """
+        This test is responsible for validating that the check fails when the
+        written schema does not match the code.
+        """
+
+        # Asserting that the check fails when the schema has not been written
+        with pytest.raises(CommandError):
+            call_command("buildschema", check=True)
+
+        call_command("buildschema")
+        call_command("buildschema", check=True)
+
+        # Simulating a change in the code
+        manifest_path = schema_directory / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["hash"] = "0" * 16
+        manifest_path.write_text(json.dumps(manifest))
+
+        with pytest.raises(CommandError):
+            call_command("buildschema", check=True)
+
+
+class TestSchemaView:
+    """
+    This class encapsulates the tests of the views that serve the pre-generated
+    OpenAPI schema.
+    """
+
+    path = reverse(viewname="schema")
+
+    def test_precompressed(self, client: Client, schema_directory: Path) -> None:
+        """
+        This test is responsible for validating that the compressed schema is served
+        to the clients that accept it, with caching headers.
+        """
+
+        response = client.get(self.path, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        artifact = SchemaArtifact.load(directory=schema_directory)
+
+        assert response.status_code == 200
+        assert response["Content-Encoding"] == "gzip"
+        assert response["ETag"] == f'"{artifact.hash}-gzip"'
+        assert response["Cache-Control"] == "public, max-age=300"
+        assert gzip.decompress(response.content) == artifact.content["identity"]
+
+    @pytest.mark.parametrize(
+        argnames="accept_encoding, encoding",
+        argvalues=[("gzip;q=0, deflate", "identity"), ("xgzip", "identity")],
+        ids=["refused_encoding", "unknown_encoding"],
+    )
+    def test_encoding_negotiated(
+        self,
+        client: Client,
+        schema_directory: Path,
+        accept_encoding: str,
+        encoding: str,
+    ) -> None:
+        """
+        This test is responsible for validating that the schema is only served with
+        the encodings accepted with a quality value above zero.
+        """
+
+        response = client.get(self.path, HTTP_ACCEPT_ENCODING=accept_encoding)
+
+        assert response.get("Content-Encoding", "identity") == encoding
+
+    @pytest.mark.parametrize(
+        argnames="if_none_match",
+        argvalues=['"other", {etag}', "W/{etag}", "*"],
+        ids=["etag_list", "weak_etag", "any_etag"],
+    )
+    def test_not_modified(
+        self, client: Client, schema_directory: Path, if_none_match: str
+    ) -> None:
+        """
+        This test is responsible for validating that the schema is revalidated with
+        its ETag.
+        """
+
+        etag = client.get(self.path)["ETag"]
+        response = client.get(
+            self.path, HTTP_IF_NONE_MATCH=if_none_match.format(etag=etag)
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_versioned(self, client: Client, schema_directory: Path) -> None:
+        """
+        This test is responsible for validating that the versioned URL of the schema
+        can be cached forever, and that outdated versions are redirected.
+        """
+
+        artifact = get_schema_artifact(directory=schema_directory)
+        path = reverse(
+            viewname="schema_versioned", kwargs={"schema_hash": artifact.hash}
+        )
+        response = client.get(path)
+
+        assert response.status_code == 200
+        assert response["Cache-Control"] == "public, max-age=31536000, immutable"
+        assert not response.has_header("Content-Encoding")
+
+        response = client.get(
+            reverse(
+                viewname="schema_versioned", kwargs={"schema_hash": "outdated"}
+            )
+        )
+
+        assert response.status_code == 302
+        assert response["Location"] == path
+
+    @pytest.mark.django_db
+    def test_swagger(self, client: Client, schema_directory: Path) -> None:
+        """
+        This test is responsible for validating that the documentation points to the
+        versioned URL of the schema.
+        """
+
+        artifact = get_schema_artifact(directory=schema_directory)
+        response = client.get(reverse(viewname="api_schema"))
+
+        assert response.status_code == 200
+        assert f"/doc/schema/{artifact.hash}/" in response.content.decode()
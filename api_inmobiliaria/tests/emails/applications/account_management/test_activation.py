@@ -159,6 +159,98 @@ class TestApplicationCheckToken:
 
         assert user.is_active
 
+    def test_check_token_statements(self, django_assert_num_queries) -> None:
+        """
+        This test is responsible for validating that the token is consumed and the
+        user activated with two statements.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=False, save=True, add_perm=False
+        )
+        token = TokenGenerator().make_token(user=base_user)
+        Token.objects.create(token=token)
+
+        with django_assert_num_queries(num=4) as context:
+            self.application_class(
+                token_class=TokenGenerator(),
+                user_repository=UserRepository,
+                token_repository=TokenRepository,
+                path_send_mail="send_activation_mail",
+            ).check_token(
+                token=token,
+                user_uuid=base_user.uuid,
+                request=RequestFactory().post("/"),
+            )
+
+        # The savepoint of the transaction is created within the one of the test
+        statements = [
+            query["sql"].split()[0]
+            for query in context.captured_queries
+            if "SAVEPOINT" not in query["sql"]
+        ]
+
+        assert statements == ["DELETE", "UPDATE"]
+        assert BaseUser.objects.get(uuid=base_user.uuid).is_active
+        assert not Token.objects.filter(token=token).exists()
+
+    def test_if_user_already_active(self) -> None:
+        """
+        This test is responsible for validating that the token is not consumed when
+        the account is already active, and that the activation is reported as used.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=False, save=True, add_perm=False
+        )
+        token = TokenGenerator().make_token(user=base_user)
+        Token.objects.create(token=token)
+        BaseUser.objects.filter(uuid=base_user.uuid).update(is_active=True)
+
+        with pytest.raises(TokenViewError):
+            self.application_class(
+                token_class=TokenGenerator(),
+                user_repository=UserRepository,
+                token_repository=TokenRepository,
+                path_send_mail="send_activation_mail",
+            ).check_token(
+                token=token,
+                user_uuid=base_user.uuid,
+                request=RequestFactory().post("/"),
+            )
+
+        assert Token.objects.filter(token=token).exists()
+
+    def test_if_token_used_twice(self) -> None:
+        """
+        This test is responsible for validating that a token can only activate the
+        account once.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=False, save=True, add_perm=False
+        )
+        token = TokenGenerator().make_token(user=base_user)
+        Token.objects.create(token=token)
+        application = self.application_class(
+            token_class=TokenGenerator(),
+            user_repository=UserRepository,
+            token_repository=TokenRepository,
+            path_send_mail="send_activation_mail",
+        )
+        application.check_token(
+            token=token,
+            user_uuid=base_user.uuid,
+            request=RequestFactory().post("/"),
+        )
+
+        with pytest.raises(TokenViewError):
+            application.check_token(
+                token=token,
+                user_uuid=base_user.uuid,
+                request=RequestFactory().post("/"),
+            )
+
     def test_if_user_not_found(self, user_repository: Mock) -> None:
         """
         This test is responsible for validating the expected behavior of the
@@ -293,3 +385,130 @@ class TestApplicationCheckToken:
             user = BaseUser.objects.get(uuid=base_user.uuid)
 
             assert not user.is_active
+
+
+@pytest.fixture
+def stateless_tokens(settings) -> None:
+    """
+    Enables the validation of the tokens without the Token table.
+    """
+
+    settings.EMAIL_TOKENS = {**settings.EMAIL_TOKENS, "STATELESS": True}
+
+
+@pytest.mark.django_db
+class TestApplicationStatelessToken:
+    """
+    This class encapsulates the tests for the use case when the tokens are validated
+    from the timestamp and the HMAC they embed, without the Token table.
+    """
+
+    application_class = AccountActivation
+    user_factory = UserFactory
+
+    def _get_application(self) -> AccountActivation:
+        return self.application_class(
+            token_class=TokenGenerator(),
+            user_repository=UserRepository,
+            token_repository=TokenRepository,
+            path_send_mail="send_activation_mail",
+        )
+
+    def test_send_email(self, stateless_tokens, settings) -> None:
+        """
+        This test is responsible for validating that the token is only stored when
+        the audit is enabled.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=False, save=True, add_perm=False
+        )
+        self._get_application().send_email(
+            user=base_user, request=RequestFactory().post("/")
+        )
+
+        assert len(mail.outbox) == 1
+        assert Token.objects.count() == 0
+
+        settings.EMAIL_TOKENS = {**settings.EMAIL_TOKENS, "AUDIT": True}
+        self._get_application().send_email(
+            user=base_user, request=RequestFactory().post("/")
+        )
+
+        assert len(mail.outbox) == 2
+        assert Token.objects.count() == 1
+
+    def test_check_token_success(
+        self, stateless_tokens, django_assert_num_queries
+    ) -> None:
+        """
+        This test is responsible for validating that a token that is not stored is
+        accepted, and that it can not be used again.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=False, save=True, add_perm=False
+        )
+        token = TokenGenerator().make_token(user=base_user)
+
+        # Activating the user with a single UPDATE
+        with django_assert_num_queries(num=1):
+            self._get_application().check_token(
+                token=token,
+                user_uuid=base_user.uuid,
+                request=RequestFactory().post("/"),
+            )
+
+        assert BaseUser.objects.get(uuid=base_user.uuid).is_active
+
+        with pytest.raises(TokenViewError):
+            self._get_application().check_token(
+                token=token,
+                user_uuid=base_user.uuid,
+                request=RequestFactory().post("/"),
+            )
+
+    def test_if_token_expired(self, stateless_tokens) -> None:
+        """
+        This test is responsible for validating that a token whose timestamp is older
+        than the expiration is rejected.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=False, save=True, add_perm=False
+        )
+        generator = TokenGenerator()
+        token = generator._make_token_with_timestamp(
+            base_user,
+            generator._num_seconds(
+                generator._now() - TOKEN_EXPIRATION - timedelta(minutes=1)
+            ),
+            generator.secret,
+        )
+
+        with pytest.raises(TokenViewError):
+            self._get_application().check_token(
+                token=token,
+                user_uuid=base_user.uuid,
+                request=RequestFactory().post("/"),
+            )
+
+        assert not BaseUser.objects.get(uuid=base_user.uuid).is_active
+
+    def test_if_token_malformed(self, stateless_tokens) -> None:
+        """
+        This test is responsible for validating that a malformed token is rejected.
+        """
+
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=False, save=True, add_perm=False
+        )
+
+        with pytest.raises(ResourceNotFoundViewError):
+            self._get_application().check_token(
+                token="token1234",
+                user_uuid=base_user.uuid,
+                request=RequestFactory().post("/"),
+            )
+
+        assert not BaseUser.objects.get(uuid=base_user.uuid).is_active
@@ -0,0 +1,151 @@
+from apps.emails.backends import PooledEmailBackend
+from apps.emails.benchmarks import SMTPSink
+from django.core.mail import EmailMessage
+from unittest.mock import patch
+import smtplib
+import pytest
+
+
+@pytest.fixture
+def sink() -> SMTPSink:
+    """
+    Runs a local SMTP server that discards the messages.
+    """
+
+    server = SMTPSink(handshake_delay=0).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def email_pool(settings) -> None:
+    settings.EMAIL_POOL = {
+        "MAX_CONNECTIONS": 1,
+        "IDLE_TIMEOUT": 60,
+        "HEALTH_CHECK_INTERVAL": 60,
+        "ACQUIRE_TIMEOUT": 0.1,
+    }
+
+
+class TestPooledEmailBackend:
+    """
+    This class encapsulates the tests of the email backend in charge of sending the
+    messages through a pool of SMTP sessions.
+    """
+
+    def _get_backend(self, sink: SMTPSink) -> PooledEmailBackend:
+        return PooledEmailBackend(
+            host=sink.server_address[0],
+            port=sink.port,
+            username="",
+            password="",
+            use_tls=False,
+        )
+
+    def _send(self, sink: SMTPSink) -> int:
+        return EmailMessage(
+            subject="Subject",
+            body="Body",
+            to=["user@email.com"],
+            connection=self._get_backend(sink=sink),
+        ).send()
+
+    def test_reuse_session(self, sink, email_pool) -> None:
+        """
+        This test is responsible for validating that the messages are sent with the
+        same session.
+        """
+
+        for _ in range(3):
+            assert self._send(sink=sink) == 1
+
+        assert sink.messages == 3
+        assert sink.connections == 1
+
+    def test_idle_timeout(self, sink, email_pool, settings) -> None:
+        """
+        This test is responsible for validating that the idle sessions are not reused
+        after the idle timeout.
+        """
+
+        settings.EMAIL_POOL["IDLE_TIMEOUT"] = 0
+
+        for _ in range(2):
+            self._send(sink=sink)
+
+        assert sink.messages == 2
+        assert sink.connections == 2
+
+    def test_health_check(self, sink, email_pool, settings) -> None:
+        """
+        This test is responsible for validating that a session closed while idle is
+        replaced before sending the message.
+        """
+
+        settings.EMAIL_POOL["HEALTH_CHECK_INTERVAL"] = 0
+        backend = self._get_backend(sink=sink)
+        self._send(sink=sink)
+        backend.pool._idle[0][0].close()
+
+        assert self._send(sink=sink) == 1
+        assert sink.messages == 2
+        assert sink.connections == 2
+
+    def test_reconnect(self, sink, email_pool) -> None:
+        """
+        This test is responsible for validating that a message whose session was
+        closed is sent again with a new session.
+        """
+
+        backend = self._get_backend(sink=sink)
+        self._send(sink=sink)
+        backend.pool._idle[0][0].close()
+
+        assert self._send(sink=sink) == 1
+        assert sink.messages == 2
+        assert sink.connections == 2
+
+    def test_reconnect_failed(self, sink, email_pool) -> None:
+        """
+        This test is responsible for validating that the remaining messages are not
+        sent when the session can not be opened again, without failing if the
+        errors are silenced.
+        """
+
+        self._send(sink=sink)
+        backend = self._get_backend(sink=sink)
+        backend.fail_silently = True
+        backend.pool._idle[0][0].close()
+        messages = [
+            EmailMessage(subject="Subject", body="Body", to=["user@email.com"])
+            for _ in range(2)
+        ]
+
+        with patch.object(
+            PooledEmailBackend,
+            "_connect",
+            side_effect=smtplib.SMTPConnectError(421, "Unavailable."),
+        ):
+            assert backend.send_messages(email_messages=messages) == 0
+
+        assert sink.messages == 1
+
+    def test_pool_exhausted(self, sink, email_pool) -> None:
+        """
+        This test is responsible for validating that the number of sessions is
+        bounded.
+        """
+
+        backend = self._get_backend(sink=sink)
+        connection = backend.pool.acquire(connect=backend._connect)
+
+        with pytest.raises(smtplib.SMTPConnectError):
+            self._send(sink=sink)
+
+        backend.pool.release(connection=connection)
+
+        assert self._send(sink=sink) == 1
+        assert sink.connections == 1
@@ -0,0 +1,149 @@
+from apps.emails.rendering import EmailTemplate, get_email_template, inline_css
+from apps.emails.paths import TEMPLATES
+from django.template.loader import render_to_string
+from django.utils.http import urlsafe_base64_encode
+from django.utils.encoding import force_bytes
+from uuid import uuid4
+import pytest
+
+
+EMAIL_BODY = TEMPLATES["account_management"]["activation"]["email_body"]
+FIELDS = ("email", "user_uuidb64", "token")
+
+
+class TestInlineCSS:
+    """
+    This class encapsulates the tests of the inlining of the CSS rules of the email
+    templates.
+    """
+
+    def test_inline_css(self) -> None:
+        """
+        This test is responsible for validating that the rules that can be inlined
+        are moved to the elements of the body, before their own styles, and that
+        the media queries and the rules of the email clients are kept.
+        """
+
+        html = inline_css(
+            html=(
+                "<html><head><style>"
+                "* { box-sizing: border-box; } "
+                "p { margin: 0; } "
+                ".box p { color: red; } "
+                "a[x-apple-data-detectors], .link { color: inherit; } "
+                "@media (max-width:620px) { .box { width: 100% !important; } }"
+                "</style></head>"
+                '<body><div class="box"><p style="color: blue;">Text</p>'
+                '<img src="logo.png"><a class="link" href="#">Link</a></div>'
+                "<p>Other</p></body></html>"
+            )
+        )
+
+        assert "<head><style>" in html
+        assert "a[x-apple-data-detectors] { color: inherit; }" in html
+        assert (
+            "@media (max-width:620px) { .box { width: 100% !important; } }" in html
+        )
+        assert "box-sizing: border-box; }" not in html
+        assert '<body style="box-sizing: border-box">' in html
+        assert (
+            '<p style="box-sizing: border-box; margin: 0; color: red; color: blue;">'
+            in html
+        )
+        assert '<img src="logo.png" style="box-sizing: border-box">' in html
+        assert (
+            '<a class="link" href="#" style="box-sizing: border-box; color: inherit">'
+            in html
+        )
+        assert '<p style="box-sizing: border-box; margin: 0">Other</p>' in html
+
+    def test_email_body(self) -> None:
+        """
+        This test is responsible for validating that only the rules that can not be
+        inlined are kept in the style block of the activation email.
+        """
+
+        html = inline_css(
+            html=render_to_string(
+                template_name=EMAIL_BODY,
+                context={
+                    "email": "user@email.com",
+                    "user_uuidb64": "dXNlcg",
+                    "token": "token",
+                    "domain": "example.com",
+                },
+            )
+        )
+        style = html[html.index("<style>") : html.index("</style>")]
+
+        assert "@media" in style
+        assert "a[x-apple-data-detectors]" in style
+        assert "box-sizing" not in style
+        assert "line-height: inherit" not in style
+
+
+class TestEmailTemplate:
+    """
+    This class encapsulates the tests of the skeletons of the email templates,
+    rendered once with placeholders for the fields of each message.
+    """
+
+    def _get_context(self, email: str) -> dict:
+        return {
+            "email": email,
+            "user_uuidb64": urlsafe_base64_encode(s=force_bytes(s=uuid4())),
+            "token": "c9k2lq-0e8b7a4c1f3d9e2b6a5c",
+        }
+
+    @pytest.mark.parametrize(
+        argnames="email",
+        argvalues=["user@email.com", "<b>user</b>&'\"@email.com"],
+        ids=["plain", "escaped"],
+    )
+    def test_render(self, email: str) -> None:
+        """
+        This test is responsible for validating that a message rendered from the
+        skeleton is the same as the one rendered by the template engine.
+        """
+
+        context = self._get_context(email=email)
+        template = EmailTemplate(
+            template_name=EMAIL_BODY, fields=FIELDS, domain="example.com"
+        )
+
+        assert template.render(**context) == inline_css(
+            html=render_to_string(
+                template_name=EMAIL_BODY,
+                context={**context, "domain": "example.com"},
+            )
+        )
+
+    def test_missing_field(self) -> None:
+        """
+        This test is responsible for validating that an error is raised when the
+        value of a field is missing.
+        """
+
+        template = EmailTemplate(
+            template_name=EMAIL_BODY, fields=FIELDS, domain="example.com"
+        )
+
+        with pytest.raises(KeyError):
+            template.render(email="user@email.com")
+
+    def test_cache(self) -> None:
+        """
+        This test is responsible for validating that the skeleton is rendered once
+        per template and domain.
+        """
+
+        template = get_email_template(
+            template_name=EMAIL_BODY, fields=FIELDS, domain="example.com"
+        )
+
+        assert template is get_email_template(
+            template_name=EMAIL_BODY, fields=FIELDS, domain="example.com"
+        )
+        assert template is not get_email_template(
+            template_name=EMAIL_BODY, fields=FIELDS, domain="other.com"
+        )
@@ -0,0 +1,145 @@
+from apps.emails.applications.account_management import AccountActivation
+from apps.emails.constants import TOKEN_EXPIRATION
+from apps.emails.models import Token
+from apps.users.models import BaseUser
+from utils.generators import TokenGenerator
+from tests.factory import UserFactory
+from rest_framework_simplejwt.utils import aware_utcnow
+from django.core.management import call_command
+from django.core import mail
+from unittest.mock import patch
+from datetime import timedelta
+from pathlib import Path
+from io import StringIO
+import smtplib
+import json
+import pytest
+
+
+@pytest.mark.django_db
+class TestResendActivationMailsCommand:
+    """
+    This class encapsulates the tests of the command in charge of sending a new
+    activation email to the users whose activation link has expired.
+    """
+
+    user_factory = UserFactory
+
+    @pytest.fixture
+    def users(self) -> list[BaseUser]:
+        """
+        Creates three users whose activation link expired, a recent one and an active
+        one.
+        """
+
+        users = [
+            self.user_factory.searcher_user(
+                active=active, save=True, add_perm=False
+            )[0]
+            for active in (False, False, False, False, True)
+        ]
+        BaseUser.objects.exclude(uuid=users[3].uuid).update(
+            date_joined=aware_utcnow() - TOKEN_EXPIRATION - timedelta(minutes=1)
+        )
+
+        return sorted(
+            BaseUser.objects.filter(is_active=False).exclude(uuid=users[3].uuid),
+            key=lambda user: user.uuid,
+        )
+
+    def _call(self, checkpoint: Path, *args: str) -> str:
+        stdout = StringIO()
+        call_command(
+            "resendactivationmails",
+            "--domain",
+            "example.com",
+            "--chunk-size",
+            "2",
+            "--rate",
+            "60000",
+            "--checkpoint",
+            str(checkpoint),
+            *args,
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+
+        return stdout.getvalue()
+
+    def test_resend(self, users, tmp_path) -> None:
+        """
+        This test is responsible for validating that the users whose activation link
+        expired receive a valid token, and that the checkpoint is removed.
+        """
+
+        checkpoint = tmp_path / "checkpoint.json"
+        self._call(checkpoint)
+
+        assert sorted(message.to[0] for message in mail.outbox) == sorted(
+            user.email for user in users
+        )
+        assert Token.objects.count() == len(users)
+        assert not checkpoint.exists()
+
+        for token in Token.objects.all():
+            assert any(
+                TokenGenerator().check_token(user=user, token=token.token)
+                for user in users
+            )
+
+    def test_dry_run(self, users, tmp_path) -> None:
+        """
+        This test is responsible for validating that the dry run only counts the
+        users.
+        """
+
+        output = self._call(tmp_path / "checkpoint.json", "--dry-run")
+
+        assert f"{len(users)} users" in output
+        assert len(mail.outbox) == 0
+        assert Token.objects.count() == 0
+
+    def test_resume(self, users, tmp_path) -> None:
+        """
+        This test is responsible for validating that a campaign resumes after the
+        last user of the checkpoint.
+        """
+
+        checkpoint = tmp_path / "checkpoint.json"
+        checkpoint.write_text(
+            json.dumps(
+                {
+                    "joined_before": (
+                        aware_utcnow() - TOKEN_EXPIRATION
+                    ).isoformat(),
+                    "cursor": str(users[0].uuid),
+                    "sent": 1,
+                    "failed": 0,
+                }
+            )
+        )
+        self._call(checkpoint)
+
+        assert sorted(message.to[0] for message in mail.outbox) == sorted(
+            user.email for user in users[1:]
+        )
+
+    def test_failed_email(self, users, tmp_path) -> None:
+        """
+        This test is responsible for validating that a failed email does not stop the
+        campaign.
+        """
+
+        dispatch = AccountActivation.dispatch
+
+        def fail_first(self, user, **kwargs) -> None:
+            if user.uuid == users[0].uuid:
+                raise smtplib.SMTPRecipientsRefused(recipients={})
+
+            dispatch(self, user=user, **kwargs)
+
+        with patch.object(AccountActivation, "dispatch", new=fail_first):
+            output = self._call(tmp_path / "checkpoint.json")
+
+        assert len(mail.outbox) == len(users) - 1
+        assert "1 failed" in output
@@ -2,6 +2,7 @@ from apps.api_exceptions import (
     DatabaseConnectionAPIError,
     ResourceNotFoundAPIError,
     AccountActivationAPIError,
+    ThrottledAPIError,
 )
 from utils.messages import ActivationErrors
 from tests.factory import UserFactory
@@ -155,3 +156,36 @@ class TestSendAccountActivationTokenAPIView:
         assert response.status_code == status_code_expected
         assert response.data["code"] == response_code_expected
         assert response.data["detail"] == response_data_expected
+
+    def test_if_rate_limited(self, rate_limits, settings) -> None:
+        """
+        This test is responsible for validating that the emails sent to a user are
+        limited, the throttled requests are rejected before querying the database.
+        """
+
+        settings.RATE_LIMITS = {
+            **settings.RATE_LIMITS,
+            "SCOPES": {
+                **settings.RATE_LIMITS["SCOPES"],
+                "send_token": {"user": (1, 3600), "ip": (10, 3600)},
+            },
+        }
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=False, add_perm=False, save=True
+        )
+        path = self._get_path(user_uuid=base_user.uuid)
+
+        # Simulating the requests
+        response = self.client.get(path=path, content_type="application/json")
+
+        assert response.status_code == status.HTTP_200_OK
+
+        with patch(
+            target="apps.emails.infrastructure.views.account_management.send_token.UserRepository.get_base_data"
+        ) as get_base_data:
+            response = self.client.get(path=path, content_type="application/json")
+
+        # Asserting that response data is correct
+        assert response.status_code == ThrottledAPIError.status_code
+        assert response.data["code"] == ThrottledAPIError.default_code
+        get_base_data.assert_not_called()
@@ -0,0 +1,174 @@
+from apps.monitoring.benchmarks import BenchmarkResult, run_benchmark
+from apps.users.models import BaseUser
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from unittest.mock import patch
+from io import StringIO
+import pytest
+
+
+def test_run_benchmark() -> None:
+    """
+    This test is responsible for validating that only the measured iterations are
+    reported.
+    """
+
+    calls = []
+    result = run_benchmark(
+        name="append", operation=lambda: calls.append(1), iterations=5, warmup=2
+    )
+
+    assert len(calls) == 7
+    assert result.name == "append"
+    assert len(result.timings) == 5
+
+
+def test_benchmark_result() -> None:
+    """
+    This test is responsible for validating the throughput and the percentiles of a
+    benchmark.
+    """
+
+    result = BenchmarkResult(name="test", timings=[0.4, 0.1, 0.3, 0.2])
+
+    assert result.throughput == pytest.approx(4)
+    assert result.percentile(50) == 0.2
+    assert result.percentile(99) == 0.4
+
+
+@pytest.mark.django_db
+class TestBenchmarkCommand:
+    """
+    This class encapsulates the tests of the command in charge of running the
+    benchmarks of the project.
+    """
+
+    def test_update_token(self) -> None:
+        """
+        This test is responsible for validating that the benchmark of the
+        `/auth/update` view is run and its data is rolled back.
+        """
+
+        stdout = StringIO()
+        users = BaseUser.objects.count()
+        call_command(
+            "benchmark",
+            "auth.update",
+            "--iterations",
+            "3",
+            "--warmup",
+            "1",
+            stdout=stdout,
+        )
+        lines = stdout.getvalue().splitlines()
+
+        assert len(lines) == 2
+        assert lines[1].startswith("auth.update")
+        assert BaseUser.objects.count() == users
+
+    @patch(target="apps.users.benchmarks.BREACHED_PASSWORDS", new=1000)
+    def test_breached_password(self) -> None:
+        """
+        This test is responsible for validating that the lookup benchmark of the
+        breached passwords filter reports the private memory of the process.
+        """
+
+        stdout = StringIO()
+        call_command(
+            "benchmark",
+            "users.breached_password",
+            "--iterations",
+            "10",
+            stdout=stdout,
+        )
+        name, *columns = stdout.getvalue().splitlines()[1].split()
+
+        assert name == "users.breached_password"
+        assert len(columns) == 4
+
+    @patch(target="apps.emails.benchmarks.HANDSHAKE_DELAY", new=0)
+    def test_pooled_smtp(self) -> None:
+        """
+        This test is responsible for validating that the benchmark of the pooled
+        email backend sends the messages to the local SMTP sink.
+        """
+
+        stdout = StringIO()
+        call_command(
+            "benchmark",
+            "emails.smtp",
+            "emails.pooled_smtp",
+            "--iterations",
+            "5",
+            stdout=stdout,
+        )
+        lines = stdout.getvalue().splitlines()
+
+        assert len(lines) == 3
+        assert lines[2].startswith("emails.pooled_smtp")
+
+    @patch(target="apps.users.benchmarks.RENDERED_PROFILES", new=10)
+    def test_render_json(self) -> None:
+        """
+        This test is responsible for validating that the rendering benchmarks of the
+        JSON renderers are run.
+        """
+
+        stdout = StringIO()
+        call_command(
+            "benchmark",
+            "users.render_json",
+            "users.render_orjson",
+            "--iterations",
+            "3",
+            stdout=stdout,
+        )
+        lines = stdout.getvalue().splitlines()
+
+        assert len(lines) == 3
+        assert lines[2].startswith("users.render_orjson")
+
+    def test_gzip(self) -> None:
+        """
+        This test is responsible for validating that the compression benchmark
+        reports the bytes saved.
+        """
+
+        stdout = StringIO()
+        call_command(
+            "benchmark", "deployment.gzip", "--iterations", "3", stdout=stdout
+        )
+        lines = stdout.getvalue().splitlines()
+
+        assert len(lines) == 3
+        assert lines[2].strip().startswith("gzip:")
+        assert lines[2].endswith("saved")
+
+    def test_middleware_chains(self) -> None:
+        """
+        This test is responsible for validating that the benchmarks of the
+        middleware chains of the admin and the API are run.
+        """
+
+        stdout = StringIO()
+        call_command(
+            "benchmark",
+            "deployment.full_chain",
+            "deployment.lean_chain",
+            "--iterations",
+            "3",
+            stdout=stdout,
+        )
+        lines = stdout.getvalue().splitlines()
+
+        assert len(lines) == 3
+        assert lines[2].startswith("deployment.lean_chain")
+
+    def test_unknown_benchmark(self) -> None:
+        """
+        This test is responsible for validating that an error is raised when the
+        benchmark does not exist.
+        """
+
+        with pytest.raises(CommandError):
+            call_command("benchmark", "unknown")
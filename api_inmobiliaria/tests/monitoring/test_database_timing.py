@@ -0,0 +1,99 @@
+from apps.monitoring.middleware import DatabaseTimingMiddleware
+from django.test import RequestFactory
+from django.http.response import HttpResponse
+from django.db import connection
+import pytest
+
+
+class TestPersistentConnection:
+    """
+    This class encapsulates the tests of the database backend in charge of managing
+    persistent connections.
+    """
+
+    @pytest.mark.django_db(transaction=True)
+    def test_close_after_max_uses(self) -> None:
+        """
+        This test is responsible for validating that a connection is closed when it
+        reaches its maximum number of uses.
+        """
+
+        max_age = connection.settings_dict["CONN_MAX_AGE"]
+        connection.settings_dict["CONN_MAX_AGE"] = None
+        connection.settings_dict["CONN_MAX_USES"] = 2
+        connection.close()
+
+        try:
+            for _ in range(2):
+                connection.close_if_unusable_or_obsolete()
+
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+
+            # Asserting that the connection is kept open until it reaches the limit
+            assert connection.connection is not None
+            assert connection.connection_uses == 2
+
+            connection.close_if_unusable_or_obsolete()
+
+            # Asserting that the connection was closed
+            assert connection.connection is None
+        finally:
+            connection.settings_dict["CONN_MAX_AGE"] = max_age
+            connection.settings_dict.pop("CONN_MAX_USES")
+
+    @pytest.mark.django_db(transaction=True)
+    def test_setup_time_is_measured(self) -> None:
+        """
+        This test is responsible for validating that the time spent establishing a
+        connection is measured.
+        """
+
+        connection.close()
+        connection.connection_setup_time = 0.0
+        connection.ensure_connection()
+
+        assert connection.connection_setup_time > 0
+        assert connection.connection_uses == 0
+
+
+@pytest.mark.django_db
+class TestDatabaseTimingMiddleware:
+    """
+    This class encapsulates the tests of the middleware that reports the connection
+    setup time versus the query time of each request.
+    """
+
+    middleware_class = DatabaseTimingMiddleware
+
+    def test_server_timing_header(self, settings) -> None:
+        """
+        This test is responsible for validating that the timings are added to the
+        response when the `DATABASE_TIMING_HEADER` setting is enabled.
+        """
+
+        settings.DATABASE_TIMING_HEADER = True
+
+        def get_response(request) -> HttpResponse:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.execute("SELECT 2")
+
+            return HttpResponse()
+
+        middleware = self.middleware_class(get_response=get_response)
+        response = middleware(RequestFactory().get("/"))
+
+        assert "db-connect;dur=" in response["Server-Timing"]
+        assert 'desc="2 queries"' in response["Server-Timing"]
+
+    def test_header_disabled_by_default(self) -> None:
+        """
+        This test is responsible for validating that the timings are not exposed
+        when the `DATABASE_TIMING_HEADER` setting is disabled.
+        """
+
+        middleware = self.middleware_class(get_response=lambda r: HttpResponse())
+        response = middleware(RequestFactory().get("/"))
+
+        assert not response.has_header("Server-Timing")
@@ -0,0 +1,63 @@
+from apps.monitoring.importtime import parse_import_times, ImportTime
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from io import StringIO
+import pytest
+
+
+def test_parse_import_times() -> None:
+    """
+    This test is responsible for validating that the report of the `-X importtime`
+    option of the interpreter is parsed.
+    """
+
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:        81 |         81 |   _io",
+            "import time:       163 |        421 | _frozen_importlib_external",
+            "Traceback (most recent call last):",
+        ]
+    )
+
+    assert parse_import_times(output=output) == [
+        ImportTime(module="_io", self_time=81, cumulative_time=81, depth=1),
+        ImportTime(
+            module="_frozen_importlib_external",
+            self_time=163,
+            cumulative_time=421,
+            depth=0,
+        ),
+    ]
+
+
+class TestProfileImportsCommand:
+    """
+    This class encapsulates the tests of the command in charge of reporting the
+    slowest imports performed when a worker boots.
+    """
+
+    def test_report(self) -> None:
+        """
+        This test is responsible for validating that the slowest imports of the
+        given prefix are reported.
+        """
+
+        stdout = StringIO()
+        call_command(
+            "profileimports", "--prefix", "apps.", "--limit", "3", stdout=stdout
+        )
+        lines = stdout.getvalue().splitlines()
+
+        assert len(lines) == 5
+        assert all(" apps." in line for line in lines[1:4])
+        assert "in total" in lines[-1]
+
+    def test_import_error(self) -> None:
+        """
+        This test is responsible for validating that an error is raised when a
+        module can not be imported.
+        """
+
+        with pytest.raises(CommandError):
+            call_command("profileimports", "missing_module", stdout=StringIO())
@@ -0,0 +1,170 @@
+from apps.monitoring.metrics import Counter, Histogram, MetricsRegistry
+from django.test import Client
+from django.urls import reverse
+from pathlib import Path
+import json
+import pytest
+
+
+class TestMetricsRegistry:
+    """
+    This class encapsulates the tests of the registry in charge of exposing the
+    metrics in the Prometheus text format.
+    """
+
+    def test_render(self) -> None:
+        """
+        This test is responsible for validating the samples of the counters and the
+        histograms in the Prometheus text format.
+        """
+
+        registry = MetricsRegistry()
+        counter = Counter(
+            name="requests_total",
+            documentation="Requests.",
+            labelnames=("status",),
+            registry=registry,
+        )
+        histogram = Histogram(
+            name="latency_seconds",
+            documentation="Latency.",
+            labelnames=("route",),
+            buckets=(0.1, 1),
+            registry=registry,
+        )
+        counter.inc(status=200)
+        counter.inc(status=200)
+        histogram.observe(0.05, route='a"b')
+        histogram.observe(2, route='a"b')
+        content = registry.render()
+
+        assert "# TYPE requests_total counter" in content
+        assert 'requests_total{status="200"} 2.0' in content
+        assert "# TYPE latency_seconds histogram" in content
+        assert 'latency_seconds_bucket{route="a\\"b",le="0.1"} 1' in content
+        assert 'latency_seconds_bucket{route="a\\"b",le="1"} 1' in content
+        assert 'latency_seconds_bucket{route="a\\"b",le="+Inf"} 2' in content
+        assert 'latency_seconds_count{route="a\\"b"} 2' in content
+
+    def test_missing_label(self) -> None:
+        """
+        This test is responsible for validating that a value cannot be recorded
+        without all the labels of the metric.
+        """
+
+        counter = Counter(
+            name="requests_total",
+            documentation="Requests.",
+            labelnames=("status",),
+            registry=MetricsRegistry(),
+        )
+
+        with pytest.raises(ValueError):
+            counter.inc()
+
+    def test_merge_processes(self, settings, tmp_path: Path) -> None:
+        """
+        This test is responsible for validating that the values written by other
+        processes are added to the values of the current process.
+        """
+
+        settings.METRICS = {"DIRECTORY": str(tmp_path), "FLUSH_INTERVAL": 0}
+        registry = MetricsRegistry()
+        counter = Counter(
+            name="requests_total",
+            documentation="Requests.",
+            labelnames=("status",),
+            registry=registry,
+        )
+        counter.inc(status=200)
+        registry.flush()
+
+        # Simulating the file of another worker
+        (tmp_path / "metrics_1.json").write_text(
+            json.dumps({"requests_total": [[["200"], 3.0], [["500"], 1.0]]})
+        )
+        collected = registry.collect()
+
+        # Asserting that the file of the current process is not counted twice
+        assert collected["requests_total"] == {("200",): 4.0, ("500",): 1.0}
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    """
+    This class encapsulates the tests of the internal view that exposes the metrics.
+    """
+
+    path = reverse(viewname="metrics")
+
+    def test_scrape(self, client: Client) -> None:
+        """
+        This test is responsible for validating that the metrics of the previous
+        requests are exposed.
+        """
+
+        client.get(self.path)
+        response = client.get(self.path)
+        content = response.content.decode()
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'http_responses_total{route="monitoring/metrics/",method="GET",status="200"}'
+            in content
+        )
+        assert "http_request_db_duration_seconds_bucket" in content
+
+    def test_not_allowed_ip(self, client: Client) -> None:
+        """
+        This test is responsible for validating that the metrics are hidden from the
+        addresses that are not allowed.
+        """
+
+        response = client.get(self.path, REMOTE_ADDR="10.0.0.1")
+
+        assert response.status_code == 404
+
+    def test_proxied_request(self, client: Client, settings) -> None:
+        """
+        This test is responsible for validating that the metrics are hidden from the
+        clients outside forwarded by a reverse proxy of the same host.
+        """
+
+        settings.RATE_LIMITS = {
+            **settings.RATE_LIMITS,
+            "CLIENT_IP_HEADER": "HTTP_X_FORWARDED_FOR",
+            "NUM_PROXIES": 1,
+        }
+
+        response = client.get(
+            self.path,
+            REMOTE_ADDR="127.0.0.1",
+            HTTP_X_FORWARDED_FOR="127.0.0.1, 203.0.113.7",
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize(
+        argnames="authorization, status_code",
+        argvalues=[(None, 404), ("Bearer other", 404), ("Bearer secret", 200)],
+        ids=["missing_token", "invalid_token", "valid_token"],
+    )
+    def test_token(
+        self,
+        client: Client,
+        settings,
+        authorization: str | None,
+        status_code: int,
+    ) -> None:
+        """
+        This test is responsible for validating that the bearer token of the
+        metrics is required when it is set.
+        """
+
+        settings.METRICS = {**settings.METRICS, "TOKEN": "secret"}
+        headers = {"HTTP_AUTHORIZATION": authorization} if authorization else {}
+
+        response = client.get(self.path, **headers)
+
+        assert response.status_code == status_code
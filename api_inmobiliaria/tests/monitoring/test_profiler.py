@@ -0,0 +1,151 @@
+from apps.monitoring.middleware import ProfilingMiddleware
+from apps.monitoring.profiler import SAMPLER, fold_stack
+from apps.users.models import BaseUser
+from django.core.management import call_command
+from django.http.response import HttpResponse
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from pathlib import Path
+from types import SimpleNamespace
+from time import perf_counter
+import pytest
+
+
+def slow_view(request) -> HttpResponse:
+    """
+    View that keeps the CPU busy long enough to be sampled several times.
+    """
+
+    start = perf_counter()
+
+    while perf_counter() - start < 0.05:
+        pass
+
+    return HttpResponse()
+
+
+@pytest.fixture
+def profiler_settings(settings):
+    """
+    Enables the profiler for every request and clears the collected stacks.
+    """
+
+    settings.PROFILER = {
+        "ENABLED": True,
+        "SAMPLE_RATE": 1,
+        "INTERVAL": 0.001,
+        "MAX_STACKS": 2000,
+    }
+    SAMPLER.clear()
+
+    yield settings
+
+    SAMPLER.clear()
+
+
+class TestProfilingMiddleware:
+    """
+    This class encapsulates the tests of the middleware that profiles a sample of the
+    requests.
+    """
+
+    def test_folded_stacks(self, profiler_settings) -> None:
+        """
+        This test is responsible for validating that the stacks of a profiled request
+        are aggregated by its route in the collapsed-stack format.
+        """
+
+        middleware = ProfilingMiddleware(get_response=slow_view)
+        middleware(RequestFactory().get("/"))
+        content = SAMPLER.render(route="<unmatched>")
+
+        assert content.startswith("<unmatched>;")
+        assert "tests.monitoring.test_profiler:slow_view" in content
+
+        # Asserting that every line ends with the number of samples of the stack
+        for line in content.splitlines():
+            assert int(line.rsplit(" ", 1)[1]) > 0
+
+    def test_not_sampled(self, profiler_settings) -> None:
+        """
+        This test is responsible for validating that the requests outside the sample
+        are not profiled.
+        """
+
+        profiler_settings.PROFILER["SAMPLE_RATE"] = 0
+        middleware = ProfilingMiddleware(get_response=slow_view)
+        middleware(RequestFactory().get("/"))
+
+        assert SAMPLER.render() == ""
+
+    def test_dump_command(self, profiler_settings, tmp_path: Path) -> None:
+        """
+        This test is responsible for validating that the command writes the stacks
+        of the server processes to a collapsed-stack file.
+        """
+
+        profiler_settings.PROFILER["DIRECTORY"] = str(tmp_path)
+        middleware = ProfilingMiddleware(get_response=slow_view)
+        middleware(RequestFactory().get("/"))
+        SAMPLER.flush(force=True)
+        output = tmp_path / "profile.folded"
+        call_command("dumpprofile", output=str(output))
+
+        assert "slow_view" in output.read_text()
+
+
+@pytest.mark.django_db
+class TestProfileView:
+    """
+    This class encapsulates the tests of the admin-only view that serves the folded
+    stacks.
+    """
+
+    path = reverse(viewname="profile")
+
+    def test_staff_member(self, client: Client, profiler_settings) -> None:
+        """
+        This test is responsible for validating that the staff can download the
+        collapsed-stack file.
+        """
+
+        ProfilingMiddleware(get_response=slow_view)(RequestFactory().get("/"))
+        user = BaseUser.objects.create_superuser(
+            email="admin@email.com", password="contraseña1234"
+        )
+        client.force_login(user=user)
+        response = client.get(self.path, data={"route": "<unmatched>"})
+
+        assert response.status_code == 200
+        assert "profile.folded" in response["Content-Disposition"]
+        assert response.content.decode().startswith("<unmatched>;")
+
+    def test_anonymous_user(self, client: Client) -> None:
+        """
+        This test is responsible for validating that the folded stacks are not
+        served to users who are not staff.
+        """
+
+        response = client.get(self.path)
+
+        assert response.status_code == 302
+
+
+def test_fold_stack_without_qualified_names() -> None:
+    """
+    This test is responsible for validating that the stacks are folded with the
+    plain names of the code objects on Python 3.10, which has no qualified names.
+    """
+
+    outer = SimpleNamespace(
+        f_globals={"__name__": "apps.users"},
+        f_code=SimpleNamespace(co_name="get"),
+        f_back=None,
+    )
+    inner = SimpleNamespace(
+        f_globals={"__name__": "utils.views"},
+        f_code=SimpleNamespace(co_name="dispatch"),
+        f_back=outer,
+    )
+
+    assert fold_stack(frame=inner) == "apps.users:get;utils.views:dispatch"
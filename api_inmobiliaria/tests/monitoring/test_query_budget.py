@@ -0,0 +1,111 @@
+from apps.monitoring.middleware import QueryBudgetMiddleware
+from apps.monitoring.exceptions import QueryBudgetExceededError
+from apps.monitoring.collectors import get_fingerprint
+from django.core.exceptions import MiddlewareNotUsed
+from django.http.response import HttpResponse
+from django.views.generic import View
+from django.test import RequestFactory
+from django.db import connection
+import pytest
+
+
+class BudgetView(View):
+    """
+    View that declares a query budget for each HTTP method.
+    """
+
+    query_budget_mapping = {"GET": 2, "POST": 3}
+
+
+def test_fingerprint_ignores_parameters() -> None:
+    """
+    This test is responsible for validating that queries that only differ in their
+    parameters share the same fingerprint.
+    """
+
+    assert get_fingerprint(
+        sql="SELECT * FROM t WHERE id IN (%s, %s) LIMIT 21"
+    ) == get_fingerprint(sql="SELECT  *  FROM t WHERE id IN (%s, %s, %s) LIMIT 1")
+
+
+@pytest.mark.django_db
+class TestQueryBudgetMiddleware:
+    """
+    This class encapsulates the tests of the middleware that checks the number of
+    queries executed by a view against its declared budget.
+    """
+
+    middleware_class = QueryBudgetMiddleware
+
+    @staticmethod
+    def _get_response(middleware: QueryBudgetMiddleware, queries: int):
+        """
+        Returns a view function that executes the given number of queries, simulating
+        the `process_view` hook that Django calls before the view.
+        """
+
+        view_func = BudgetView.as_view()
+
+        def get_response(request) -> HttpResponse:
+            middleware.process_view(
+                request=request, view_func=view_func, view_args=(), view_kwargs={}
+            )
+
+            with connection.cursor() as cursor:
+                for number in range(queries):
+                    cursor.execute("SELECT %s", [number])
+
+            return HttpResponse()
+
+        return get_response
+
+    @pytest.mark.parametrize(
+        argnames="method, queries",
+        argvalues=[("get", 2), ("post", 3), ("put", 10)],
+        ids=["get_budget", "post_budget", "without_budget"],
+    )
+    def test_within_budget(self, method: str, queries: int, settings) -> None:
+        """
+        This test is responsible for validating that nothing is raised when the
+        view does not exceed its budget or does not declare one.
+        """
+
+        settings.QUERY_BUDGETS = {"ENABLED": True, "RAISE_EXCEPTION": True}
+        middleware = self.middleware_class(get_response=None)
+        middleware.get_response = self._get_response(
+            middleware=middleware, queries=queries
+        )
+        response = middleware(getattr(RequestFactory(), method)("/"))
+
+        assert response.status_code == 200
+
+    def test_budget_exceeded(self, settings) -> None:
+        """
+        This test is responsible for validating that an exception with the repeated
+        queries is raised when the view exceeds its budget.
+        """
+
+        settings.QUERY_BUDGETS = {"ENABLED": True, "RAISE_EXCEPTION": True}
+        middleware = self.middleware_class(get_response=None)
+        middleware.get_response = self._get_response(
+            middleware=middleware, queries=3
+        )
+
+        with pytest.raises(QueryBudgetExceededError) as exc_info:
+            middleware(RequestFactory().get("/"))
+
+        assert "executed 3 queries, exceeding its budget of 2" in str(
+            exc_info.value
+        )
+        assert "3x SELECT %s" in str(exc_info.value)
+
+    def test_disabled(self, settings) -> None:
+        """
+        This test is responsible for validating that the middleware is not used when
+        it is disabled in the settings.
+        """
+
+        settings.QUERY_BUDGETS = {"ENABLED": False}
+
+        with pytest.raises(MiddlewareNotUsed):
+            self.middleware_class(get_response=None)
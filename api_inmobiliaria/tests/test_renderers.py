@@ -0,0 +1,93 @@
+from utils.renderers import JSONRenderer
+from utils.parsers import JSONParser
+from utils.views import AsyncAPIView
+from rest_framework.renderers import JSONRenderer as DRFJSONRenderer
+from rest_framework.exceptions import ParseError
+from phonenumber_field.phonenumber import PhoneNumber
+from django.utils.translation import gettext_lazy
+from unittest.mock import patch
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+from uuid import uuid4
+import pytest
+
+
+DATA = {
+    "uuid": uuid4(),
+    "date": datetime(2024, 6, 1, 12, 30, tzinfo=timezone.utc),
+    "phone_number": PhoneNumber.from_string("+573111111111"),
+    "message": gettext_lazy("Este campo es requerido."),
+    "price": Decimal("1.5"),
+    "text": "Línea\u2028separada",
+    "numbers": {1: [True, None]},
+}
+
+
+@pytest.mark.parametrize(
+    argnames="orjson_installed", argvalues=[True, False], ids=["orjson", "json"]
+)
+def test_render(orjson_installed: bool) -> None:
+    """
+    This test is responsible for validating that the data is rendered as the JSON
+    renderer of DRF does, with or without orjson.
+    """
+
+    renderer = JSONRenderer()
+
+    if orjson_installed:
+        pytest.importorskip("orjson")
+        content = renderer.render(data=DATA)
+    else:
+        with patch(target="utils.renderers.orjson", new=None):
+            content = renderer.render(data=DATA)
+
+    expected = DRFJSONRenderer().render(
+        data={**DATA, "phone_number": str(DATA["phone_number"])}
+    )
+
+    assert JSONParser().parse(stream=BytesIO(content)) == JSONParser().parse(
+        stream=BytesIO(expected)
+    )
+    assert b"\\u2028" in content
+
+
+def test_render_none() -> None:
+    """
+    This test is responsible for validating that no data is rendered as an empty
+    body.
+    """
+
+    assert JSONRenderer().render(data=None) == b""
+
+
+def test_async_response() -> None:
+    """
+    This test is responsible for validating that the responses of the async views
+    are rendered as the responses of the DRF views.
+    """
+
+    response = AsyncAPIView.response(data=DATA, status=201)
+
+    assert response.status_code == 201
+    assert response["Content-Type"] == "application/json"
+    assert response.content == JSONRenderer().render(data=DATA)
+
+
+@pytest.mark.parametrize(
+    argnames="orjson_installed", argvalues=[True, False], ids=["orjson", "json"]
+)
+def test_parse_invalid(orjson_installed: bool) -> None:
+    """
+    This test is responsible for validating that an invalid body raises a parse
+    error, with or without orjson.
+    """
+
+    parser = JSONParser()
+
+    with patch(
+        target="utils.parsers.orjson",
+        new=pytest.importorskip("orjson") if orjson_installed else None,
+    ):
+        with pytest.raises(ParseError):
+            parser.parse(stream=BytesIO(b'{"email": NaN}'))
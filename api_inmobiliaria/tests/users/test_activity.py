@@ -0,0 +1,162 @@
+from apps.users.activity import ACTIVITY_TRACKER, flush_activity
+from apps.users.constants import UserRoles
+from apps.users.models import BaseUser
+from apps.api_exceptions import DatabaseConnectionAPIError
+from tests.factory import UserFactory
+from rest_framework import status
+from django.core.signals import request_finished
+from django.db import close_old_connections
+from django.test import Client
+from django.urls import reverse
+from unittest.mock import patch
+import pytest
+
+
+@pytest.fixture
+def activity_tracking(settings) -> None:
+    """
+    Enables the activity tracking with an empty tracker.
+    """
+
+    settings.ACTIVITY_TRACKING = {
+        **settings.ACTIVITY_TRACKING,
+        "ENABLED": True,
+        "BATCH_SIZE": 2,
+    }
+    ACTIVITY_TRACKER._reset()
+
+    yield
+
+    ACTIVITY_TRACKER._reset()
+
+
+@pytest.mark.django_db
+class TestActivityTracker:
+    """
+    This class encapsulates the tests of the tracker in charge of recording the
+    activity of the users in memory and writing it to their last login in batches.
+    """
+
+    user_factory = UserFactory
+
+    def _users(self, count: int):
+        return [
+            self.user_factory.user(
+                user_role=UserRoles.SEARCHER.value,
+                active=True,
+                save=True,
+                add_perm=False,
+            )[0]
+            for _ in range(count)
+        ]
+
+    def test_flush(self, activity_tracking, django_assert_num_queries) -> None:
+        """
+        This test is responsible for validating that the activity is written with a
+        single UPDATE per batch.
+        """
+
+        users = self._users(count=3)
+
+        for base_user in users:
+            ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
+        with django_assert_num_queries(num=2):
+            assert ACTIVITY_TRACKER.flush(force=True) == 3
+
+        assert not BaseUser.objects.filter(
+            uuid__in=[base_user.uuid for base_user in users], last_login=None
+        ).exists()
+
+    def test_window(self, activity_tracking) -> None:
+        """
+        This test is responsible for validating that the activity of a user is not
+        written again within the window.
+        """
+
+        base_user = self._users(count=1)[0]
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+        ACTIVITY_TRACKER.flush(force=True)
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
+        assert ACTIVITY_TRACKER.flush(force=True) == 0
+
+    def test_flush_interval(self, activity_tracking) -> None:
+        """
+        This test is responsible for validating that the activity is not written
+        before the flush interval ends.
+        """
+
+        base_user = self._users(count=1)[0]
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
+        assert ACTIVITY_TRACKER.flush() == 0
+        assert ACTIVITY_TRACKER.flush(force=True) == 1
+
+    @patch(
+        target="apps.users.activity.UserRepository.update_last_login",
+        side_effect=DatabaseConnectionAPIError,
+    )
+    def test_database_error(self, update_last_login, activity_tracking) -> None:
+        """
+        This test is responsible for validating that the activity is kept for the
+        next flush when the database is not available.
+        """
+
+        base_user = self._users(count=1)[0]
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
+        assert ACTIVITY_TRACKER.flush(force=True) == 0
+
+        update_last_login.side_effect = None
+
+        assert ACTIVITY_TRACKER.flush(force=True) == 1
+
+    def test_disabled(self) -> None:
+        """
+        This test is responsible for validating that no activity is recorded when the
+        tracking is disabled.
+        """
+
+        base_user = self._users(count=1)[0]
+        ACTIVITY_TRACKER.record(user_uuid=base_user.uuid)
+
+        assert ACTIVITY_TRACKER.flush(force=True) == 0
+
+    def test_login(self, activity_tracking, setup_database, settings) -> None:
+        """
+        This test is responsible for validating that the login is recorded and
+        written once the request has finished.
+        """
+
+        settings.ACTIVITY_TRACKING = {
+            **settings.ACTIVITY_TRACKING,
+            "FLUSH_INTERVAL": 0,
+        }
+        base_user, _, data = self.user_factory.user(
+            user_role=UserRoles.SEARCHER.value,
+            active=True,
+            save=True,
+            add_perm=True,
+        )
+        response = Client().post(
+            path=reverse(viewname="login_jwt"),
+            data={"email": data["email"], "password": data["password"]},
+            content_type="application/json",
+        )
+        base_user.refresh_from_db()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert base_user.last_login is not None
+
+    def test_flush_before_closing_connections(self) -> None:
+        """
+        This test is responsible for validating that the activity is flushed before
+        the database connections of the request are closed.
+        """
+
+        receivers, _ = request_finished._live_receivers(sender=None)
+
+        assert receivers.index(flush_activity) < receivers.index(
+            close_old_connections
+        )
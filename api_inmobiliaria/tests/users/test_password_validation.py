@@ -0,0 +1,197 @@
+from apps.users.password_validation import BreachedPasswordValidator
+from utils.bloom import BloomFilter
+from utils.messages import ERROR_MESSAGES
+from rest_framework import status
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import Client
+from django.urls import reverse
+from pathlib import Path
+from io import StringIO
+import hashlib
+import pytest
+import os
+
+
+BREACHED_PASSWORDS = ["Contraseña1234", "Password1234", "Qwerty1234"]
+
+
+def sha1(password: str) -> bytes:
+    return hashlib.sha1(password.encode()).digest()
+
+
+@pytest.fixture
+def filter_path(tmp_path: Path) -> Path:
+    """
+    Builds a filter with the breached passwords of the tests.
+    """
+
+    path = tmp_path / "breached_passwords.bloom"
+    BloomFilter.build(
+        digests=[sha1(password) for password in BREACHED_PASSWORDS],
+        count=len(BREACHED_PASSWORDS),
+        path=path,
+    )
+
+    return path
+
+
+class TestBloomFilter:
+    """
+    This class encapsulates the tests of the memory-mapped Bloom filter of SHA-1
+    digests.
+    """
+
+    def test_lookup(self, tmp_path: Path) -> None:
+        """
+        This test is responsible for validating that the added digests are always
+        found and the others are found with the false positive rate of the filter.
+        """
+
+        path = tmp_path / "filter.bloom"
+        digests = [os.urandom(20) for _ in range(5000)]
+        added = BloomFilter.build(
+            digests=digests,
+            count=len(digests),
+            path=path,
+            false_positive_rate=0.01,
+        )
+        bloom_filter = BloomFilter(path=path)
+
+        assert added == len(digests)
+        assert all(digest in bloom_filter for digest in digests)
+
+        false_positives = sum(os.urandom(20) in bloom_filter for _ in range(5000))
+
+        assert false_positives < 5000 * 0.03
+
+        bloom_filter.close()
+
+    def test_invalid_file(self, tmp_path: Path) -> None:
+        """
+        This test is responsible for validating that an error is raised when the file
+        is not a filter.
+        """
+
+        path = tmp_path / "filter.bloom"
+        path.write_bytes(b"not a filter")
+
+        with pytest.raises(ValueError):
+            BloomFilter(path=path)
+
+
+class TestBreachedPasswordValidator:
+    """
+    This class encapsulates the tests of the validator in charge of rejecting the
+    passwords that have appeared in a data breach.
+    """
+
+    def test_validate(self, filter_path: Path) -> None:
+        """
+        This test is responsible for validating that the breached passwords are
+        rejected and the others are accepted.
+        """
+
+        validator = BreachedPasswordValidator(filter_path=filter_path)
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate(password=BREACHED_PASSWORDS[0])
+
+        assert exc_info.value.code == "password_breached"
+
+        validator.validate(password="ContraseñaSegura1234")
+
+    def test_missing_filter(self, tmp_path: Path) -> None:
+        """
+        This test is responsible for validating that all the passwords are accepted
+        when the filter has not been built.
+        """
+
+        validator = BreachedPasswordValidator(
+            filter_path=tmp_path / "missing.bloom"
+        )
+        validator.validate(password=BREACHED_PASSWORDS[0])
+
+    @pytest.mark.django_db
+    def test_register(self, filter_path: Path, setup_database, settings) -> None:
+        """
+        This test is responsible for validating that the users can not register with
+        a breached password.
+        """
+
+        settings.AUTH_PASSWORD_VALIDATORS = [
+            {
+                "NAME": "apps.users.password_validation.BreachedPasswordValidator",
+                "OPTIONS": {"filter_path": filter_path},
+            }
+        ]
+        response = Client().post(
+            path=reverse(viewname="searcher"),
+            data={
+                "name": "Nombre del usuario",
+                "last_name": "Apellido del usuario",
+                "email": "user1@email.com",
+                "password": BREACHED_PASSWORDS[0],
+                "confirm_password": BREACHED_PASSWORDS[0],
+            },
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"]["password"] == [
+            ERROR_MESSAGES["password_breached"]
+        ]
+
+
+class TestBuildBreachedFilterCommand:
+    """
+    This class encapsulates the tests of the command in charge of building the
+    breached passwords filter from a list of SHA-1 hashes.
+    """
+
+    def test_build(self, tmp_path: Path) -> None:
+        """
+        This test is responsible for validating that the filter is built with the
+        hashes seen at least `--min-count` times, skipping the invalid lines.
+        """
+
+        source = tmp_path / "hashes.txt"
+        source.write_text(
+            "\n".join(
+                [
+                    f"{sha1(BREACHED_PASSWORDS[0]).hex().upper()}:10",
+                    f"{sha1(BREACHED_PASSWORDS[1]).hex()}",
+                    f"{sha1(BREACHED_PASSWORDS[2]).hex().upper()}:1",
+                    "invalid:3",
+                ]
+            )
+        )
+        output = tmp_path / "filter.bloom"
+        stdout = StringIO()
+        call_command(
+            "buildbreachedfilter",
+            str(source),
+            "--output",
+            str(output),
+            "--min-count",
+            "2",
+            stdout=stdout,
+        )
+        bloom_filter = BloomFilter(path=output)
+
+        assert sha1(BREACHED_PASSWORDS[0]) in bloom_filter
+        assert sha1(BREACHED_PASSWORDS[1]) in bloom_filter
+        assert "2 hashes" in stdout.getvalue()
+        assert "1 invalid lines skipped" in stdout.getvalue()
+
+        bloom_filter.close()
+
+    def test_missing_source(self, tmp_path: Path) -> None:
+        """
+        This test is responsible for validating that an error is raised when the
+        source does not exist.
+        """
+
+        with pytest.raises(CommandError):
+            call_command("buildbreachedfilter", str(tmp_path / "missing.txt"))
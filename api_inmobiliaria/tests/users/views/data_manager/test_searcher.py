@@ -12,6 +12,8 @@ from tests.factory import UserFactory, JWTFactory
 from tests.utils import fake
 from rest_framework import status
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.urls import reverse
 from unittest.mock import Mock, patch
 from typing import Dict, Any
@@ -95,6 +97,93 @@ class TestGetSearcherUserAPIView:
         assert role_data["phone_number"] == user_role.phone_number
         assert role_data["is_phone_verified"] == user_role.is_phone_verified
 
+    def test_if_get_user_with_fields(self, setup_database) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when only some fields of the role data are requested.
+        """
+
+        # Creating the JWTs to be used in the test
+        base_user, user_role, _ = self.user_factory.searcher_user(
+            active=True, save=True, add_perm=True
+        )
+
+        access_token = self.jwt_factory.access(
+            user_role=base_user.content_type.model,
+            user=base_user,
+            exp=False,
+            save=True,
+        ).get("token")
+
+        # Simulating the request
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                path=f"{self.path}?fields=name,last_name",
+                HTTP_AUTHORIZATION=f"Bearer {access_token}",
+                content_type="application/json",
+            )
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["base_data"]["email"] == base_user.email
+        assert response.data["role_data"] == {
+            "name": user_role.name,
+            "last_name": user_role.last_name,
+        }
+
+        # Asserting that only the requested columns are loaded
+        role_query = [
+            query["sql"]
+            for query in context.captured_queries
+            if Searcher._meta.db_table in query["sql"]
+        ][-1]
+
+        assert '"last_name"' in role_query
+        assert '"phone_number"' not in role_query
+
+    @pytest.mark.parametrize(
+        argnames="fields, error_messages",
+        argvalues=[
+            (
+                "name,password",
+                [ERROR_MESSAGES["invalid_choice"].format(input="password")],
+            ),
+            (",", [ERROR_MESSAGES["blank"]]),
+        ],
+        ids=["unknown_field", "empty_fields"],
+    )
+    def test_if_invalid_fields(
+        self, fields: str, error_messages: list, setup_database
+    ) -> None:
+        """
+        This test is responsible for validating the expected behavior of the view
+        when the requested fields are not fields of the role data.
+        """
+
+        # Creating the JWTs to be used in the test
+        base_user, _, _ = self.user_factory.searcher_user(
+            active=True, save=True, add_perm=True
+        )
+
+        access_token = self.jwt_factory.access(
+            user_role=base_user.content_type.model,
+            user=base_user,
+            exp=False,
+            save=True,
+        ).get("token")
+
+        # Simulating the request
+        response = self.client.get(
+            path=f"{self.path}?fields={fields}",
+            HTTP_AUTHORIZATION=f"Bearer {access_token}",
+            content_type="application/json",
+        )
+
+        # Asserting that response data is correct
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["code"] == "invalid_request_data"
+        assert response.data["detail"]["fields"] == error_messages
+
     def test_if_user_has_not_permission(self, setup_database) -> None:
         """
         This test is responsible for validating the expected behavior of the view
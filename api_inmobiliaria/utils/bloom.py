@@ -0,0 +1,152 @@
+from typing import Iterable, Tuple
+from pathlib import Path
+from math import ceil, log
+import struct
+import mmap
+import os
+
+
+class BloomFilter:
+    """
+    A Bloom filter of SHA-1 digests stored in a file, which is memory-mapped
+    read-only. The pages of the file are shared by all the processes that map it,
+    so the filter does not grow the memory of each worker and only the pages that
+    are looked up are read from disk.
+
+    The file starts with a header with the number of bits and hash functions,
+    followed by the bit array. The positions of a digest are derived from its own
+    bytes with double hashing, a SHA-1 digest is already uniformly distributed.
+    """
+
+    MAGIC = b"BLMF"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHxxQI4x")
+    # The positions derived from a digest repeat themselves in very small filters
+    MIN_BITS = 8192
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Maps the filter stored in the given file.
+
+        #### Parameters:
+        - path: The path of the filter file.
+
+        #### Raises:
+        - OSError: If the file can not be read.
+        - ValueError: If the file is not a filter.
+        """
+
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, self.num_bits, self.num_hashes = (
+                self.HEADER.unpack_from(self._mmap)
+            )
+        except struct.error:
+            magic, version = None, None
+
+        if (
+            magic != self.MAGIC
+            or version != self.VERSION
+            or len(self._mmap) < self.HEADER.size + ceil(self.num_bits / 8)
+        ):
+            self._mmap.close()
+
+            raise ValueError(f"{path} is not a valid Bloom filter file.")
+
+    @staticmethod
+    def _get_positions(
+        digest: bytes, num_bits: int, num_hashes: int
+    ) -> Iterable[int]:
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+
+        return ((h1 + i * h2) % num_bits for i in range(num_hashes))
+
+    def __contains__(self, digest: bytes) -> bool:
+        """
+        Returns whether the given SHA-1 digest may be in the filter. A digest that
+        was added is always found, one that was not is found with the false positive
+        rate of the filter.
+        """
+
+        offset = self.HEADER.size
+
+        for position in self._get_positions(
+            digest, self.num_bits, self.num_hashes
+        ):
+            if not self._mmap[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+
+        return True
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    @classmethod
+    def get_parameters(
+        cls, count: int, false_positive_rate: float
+    ) -> Tuple[int, int]:
+        """
+        Returns the optimal number of bits and hash functions of a filter with the
+        given number of items and false positive rate.
+        """
+
+        count = max(count, 1)
+        num_bits = max(
+            ceil(-count * log(false_positive_rate) / log(2) ** 2), cls.MIN_BITS
+        )
+        # Optimal for the number of bits of the false positive rate, a larger filter
+        # only lowers the rate
+        num_hashes = max(round(-log(false_positive_rate) / log(2)), 1)
+
+        return num_bits, num_hashes
+
+    @classmethod
+    def build(
+        cls,
+        digests: Iterable[bytes],
+        count: int,
+        path: str | Path,
+        false_positive_rate: float = 0.001,
+    ) -> int:
+        """
+        Builds a filter with the given SHA-1 digests and stores it in the given file,
+        replacing it atomically. Returns the number of digests added.
+
+        #### Parameters:
+        - digests: The SHA-1 digests to add.
+        - count: The expected number of digests, used to size the filter.
+        - path: The path of the filter file.
+        - false_positive_rate: The expected false positive rate once the filter
+        holds `count` digests.
+        """
+
+        num_bits, num_hashes = cls.get_parameters(
+            count=count, false_positive_rate=false_positive_rate
+        )
+        bits = bytearray(ceil(num_bits / 8))
+        added = 0
+
+        for digest in digests:
+            for position in cls._get_positions(digest, num_bits, num_hashes):
+                bits[position >> 3] |= 1 << (position & 7)
+
+            added += 1
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.tmp")
+
+        with open(temporary_path, "wb") as file:
+            file.write(
+                cls.HEADER.pack(cls.MAGIC, cls.VERSION, num_bits, num_hashes)
+            )
+            file.write(bits)
+
+        # The workers that mapped the previous file keep reading it until they reopen
+        # the filter
+        os.replace(temporary_path, path)
+
+        return added
@@ -0,0 +1,75 @@
+from typing import Any
+from time import perf_counter
+
+
+class PersistentConnectionMixin:
+    """
+    A mixin for Django database wrappers that manages persistent connections.
+
+    Django already closes a persistent connection when it outlives `CONN_MAX_AGE` and
+    checks its health before reusing it when `CONN_HEALTH_CHECKS` is enabled. This
+    mixin adds the `CONN_MAX_USES` setting, which limits the number of requests that
+    a connection can serve before it is closed, and measures the time spent
+    establishing new connections so it can be compared with the query time.
+
+    Any class that inherits from PersistentConnectionMixin must also inherit from a
+    `DatabaseWrapper` class of a Django database backend.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.connection_uses = 0
+        self.connection_setup_time = 0.0
+        self._checked_out = False
+
+    @property
+    def max_uses(self) -> int | None:
+        """
+        Returns the maximum number of requests that a connection can serve, `None`
+        or `0` means that the number of uses is unlimited.
+        """
+
+        return self.settings_dict.get("CONN_MAX_USES")
+
+    def connect(self) -> None:
+        """
+        Connect to the database and accumulate the time it took in the
+        `connection_setup_time` attribute.
+        """
+
+        start = perf_counter()
+        super().connect()
+        self.connection_setup_time += perf_counter() - start
+        self.connection_uses = 0
+        self._checked_out = False
+
+    def _cursor(self, name: str = None) -> Any:
+        """
+        Create a cursor, opening a connection if necessary. The first cursor created
+        after the connection is checked out counts as a new use of the connection.
+        """
+
+        cursor = super()._cursor(name)
+
+        if not self._checked_out:
+            self._checked_out = True
+            self.connection_uses += 1
+
+        return cursor
+
+    def close_if_unusable_or_obsolete(self) -> None:
+        """
+        Close the current connection if unrecoverable errors have occurred, if it
+        outlived its maximum age or if it reached its maximum number of uses.
+        """
+
+        super().close_if_unusable_or_obsolete()
+
+        if (
+            self.connection is not None
+            and self.max_uses
+            and self.connection_uses >= self.max_uses
+        ):
+            self.close()
+
+        self._checked_out = False
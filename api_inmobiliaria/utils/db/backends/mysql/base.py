@@ -0,0 +1,8 @@
+from utils.db.backends.mixins import PersistentConnectionMixin
+from django.db.backends.mysql import base
+
+
+class DatabaseWrapper(PersistentConnectionMixin, base.DatabaseWrapper):
+    """
+    MySQL database wrapper with managed persistent connections.
+    """
@@ -0,0 +1,8 @@
+from utils.db.backends.mixins import PersistentConnectionMixin
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(PersistentConnectionMixin, base.DatabaseWrapper):
+    """
+    SQLite database wrapper with managed persistent connections.
+    """
@@ -7,7 +7,30 @@ from django.http.request import HttpRequest
 from django.http.response import HttpResponse
 from django.shortcuts import render
 from django.http import Http404
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+
+def get_api_exception_data(
+    exc: APIException,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Returns the data and the headers of the response for an API exception.
+
+    Args:
+    - exc: The exception instance to be handled.
+    """
+
+    headers = {}
+
+    if getattr(exc, "auth_header", None):
+        headers["WWW-Authenticate"] = exc.auth_header
+    elif getattr(exc, "wait", None):
+        headers["Retry-After"] = "%d" % exc.wait
+
+    data = {"detail": exc.detail}
+    data["code"] = exc.code
+
+    return data, headers
 
 
 def api_view_exception_handler(
@@ -24,15 +47,7 @@ def api_view_exception_handler(
     if isinstance(exc, Http404):
         exc = NotFound(*(exc.args))
     elif isinstance(exc, APIException):
-        headers = {}
-
-        if getattr(exc, "auth_header", None):
-            headers["WWW-Authenticate"] = exc.auth_header
-        elif getattr(exc, "wait", None):
-            headers["Retry-After"] = "%d" % exc.wait
-
-        data = {"detail": exc.detail}
-        data["code"] = exc.code
+        data, headers = get_api_exception_data(exc=exc)
         set_rollback()
 
         return Response(data, status=exc.status_code, headers=headers)
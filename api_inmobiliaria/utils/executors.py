@@ -0,0 +1,144 @@
+from apps.api_exceptions import ServiceUnavailableAPIError
+from django.conf import settings
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from functools import partial
+from time import monotonic, sleep
+import threading
+import asyncio
+import os
+
+
+class BoundedExecutor:
+    """
+    A thread pool to run blocking or CPU-bound functions from async code, without
+    blocking the event loop.
+
+    The number of calls in flight, running or waiting for a thread, is limited to
+    `MAX_WORKERS + MAX_PENDING` of the setting with the given name. Further calls are
+    rejected with a `ServiceUnavailableAPIError`, so the clients retry them after
+    `RETRY_AFTER` seconds instead of piling up in the queue.
+    """
+
+    def __init__(self, setting_name: str) -> None:
+        self.setting_name = setting_name
+        self._reset()
+
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        """
+        Initializes the state of the executor, a forked process starts without the
+        threads of its parent.
+        """
+
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self.in_flight = 0
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return getattr(settings, self.setting_name)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config["MAX_WORKERS"],
+                thread_name_prefix=self.setting_name.lower(),
+            )
+
+        return self._executor
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs the function in the thread pool and returns its result.
+
+        #### Parameters:
+        - func: The function to run.
+        - args: Positional arguments of the function.
+        - kwargs: Keyword arguments of the function.
+
+        #### Raises:
+        - ServiceUnavailableAPIError: If the maximum number of calls in flight has
+        been reached.
+        """
+
+        config = self.config
+
+        with self._lock:
+            if self.in_flight >= config["MAX_WORKERS"] + config["MAX_PENDING"]:
+                raise ServiceUnavailableAPIError(wait=config["RETRY_AFTER"])
+
+            self.in_flight += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, partial(func, *args, **kwargs)
+            )
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class RateLimitedExecutor:
+    """
+    A thread pool that starts at most `rate` calls per `period` seconds, spaced
+    evenly, to call services with quotas such as the outgoing mail providers without
+    exceeding them in bursts.
+    """
+
+    def __init__(self, max_workers: int, rate: int, period: float = 60) -> None:
+        """
+        #### Parameters:
+        - max_workers: Number of calls run at the same time.
+        - rate: Maximum number of calls started per period.
+        - period: Length of the period in seconds.
+        """
+
+        self.interval = period / rate
+        self._lock = threading.Lock()
+        self._next_start = monotonic()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rate_limited"
+        )
+
+    def _wait(self) -> None:
+        """
+        Waits for the next slot of the rate.
+        """
+
+        with self._lock:
+            now = monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+
+        if start > now:
+            sleep(start - now)
+
+    def _run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        self._wait()
+
+        return func(*args, **kwargs)
+
+    def submit(self, func: Callable, *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedules the function to run in the thread pool once its slot arrives.
+
+        #### Parameters:
+        - func: The function to run.
+        - args: Positional arguments of the function.
+        - kwargs: Keyword arguments of the function.
+        """
+
+        return self._executor.submit(self._run, func, *args, **kwargs)
+
+    def shutdown(self, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=cancel_futures)
+
+    def __enter__(self) -> "RateLimitedExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        # The pending calls are not started if the caller failed
+        self.shutdown(cancel_futures=exc_info[0] is not None)
@@ -1,5 +1,7 @@
+from apps.emails.constants import TOKEN_EXPIRATION
 from apps.users.models import BaseUser
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.utils.http import base36_to_int
 import base64
 import six
 
@@ -49,3 +51,35 @@ class TokenGenerator(PasswordResetTokenGenerator):
         )
 
         return token
+
+    def get_timestamp(self, token: str) -> int | None:
+        """
+        Returns the timestamp embedded in the token, `None` if the token is
+        malformed.
+
+        #### Parameters:
+        - token: The token to be parsed.
+        """
+
+        try:
+            ts_b36, _ = token.split("-")
+
+            return base36_to_int(ts_b36)
+        except ValueError:
+            return None
+
+    def is_expired(self, token: str) -> bool:
+        """
+        Check if the timestamp embedded in the token is older than the expiration of
+        the tokens. The integrity of the token is checked by `check_token`.
+
+        #### Parameters:
+        - token: A token whose timestamp can be parsed.
+        """
+
+        timestamp = self.get_timestamp(token=token)
+
+        return not (
+            self._num_seconds(self._now()) - timestamp
+            < TOKEN_EXPIRATION.total_seconds()
+        )
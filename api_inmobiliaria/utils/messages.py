@@ -12,6 +12,7 @@ ERROR_MESSAGES = {
     # Password errors
     "password_mismatch": "Las contraseñas no coinciden.",
     "password_common": "Esta contraseña es demasiado común.",
+    "password_breached": "Esta contraseña ha aparecido en una filtración de datos, por favor elige otra.",
     "password_no_upper_lower": "La contraseña debe contener al menos una mayuscula o una minuscula.",
     # Invalid data
     "invalid": "El valor ingresado es inválido.",
@@ -59,6 +60,13 @@ class JWTErrorMessages(Enum):
     DIFFERENT_TOKEN = "The access token does not belong to the update token."
     USER_NOT_MATCH = "The user of the access token does not match the user of the refresh token."
     ACCESS_NOT_EXPIRED = "Access token is not expired."
+    REFRESH_REUSED = (
+        "Refresh token has already been used, its session has been revoked."
+    )
+    UPDATE_DISABLED = {
+        "code": "update_disabled",
+        "detail": "The access tokens are renewed with the refresh tokens.",
+    }
 
 
 class ActionLinkManagerErrors(Enum):
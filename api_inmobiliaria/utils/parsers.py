@@ -0,0 +1,32 @@
+from utils.renderers import JSONRenderer, orjson
+from rest_framework.parsers import JSONParser as BaseJSONParser
+from rest_framework.exceptions import ParseError
+from typing import Any, IO, Mapping
+
+
+class JSONParser(BaseJSONParser):
+    """
+    Parses the JSON request bodies with `orjson`, if it is installed and the body
+    is encoded in UTF-8, or with the parser of DRF otherwise.
+    """
+
+    renderer_class = JSONRenderer
+
+    def parse(
+        self,
+        stream: IO[bytes],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(
+                stream=stream, media_type=media_type, parser_context=parser_context
+            )
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
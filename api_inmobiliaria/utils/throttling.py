@@ -0,0 +1,189 @@
+from apps.api_exceptions import ThrottledAPIError
+from django.core.cache import caches, BaseCache
+from django.http.request import HttpRequest
+from django.conf import settings
+from typing import Any, Dict, List, Tuple
+from math import ceil
+import hashlib
+import time
+
+
+def get_client_ip(request: HttpRequest) -> str | None:
+    """
+    Returns the IP of the client of the request. Behind a reverse proxy, the IP is
+    read from the `CLIENT_IP_HEADER` of the `RATE_LIMITS` setting, where each of the
+    `NUM_PROXIES` trusted proxies appends the address it received the request from;
+    the addresses before them are set by the client and are ignored.
+
+    #### Parameters:
+    - request: The request of the client.
+    """
+
+    config = settings.RATE_LIMITS
+    header = config.get("CLIENT_IP_HEADER")
+
+    if header:
+        addresses = [
+            address.strip()
+            for address in request.META.get(header, "").split(",")
+            if address.strip()
+        ]
+
+        if addresses:
+            return addresses[-min(config.get("NUM_PROXIES", 1), len(addresses))]
+
+    return request.META.get("REMOTE_ADDR")
+
+
+class SlidingWindowRateLimiter:
+    """
+    Limits the attempts of an operation per key, for example per email and per
+    client IP, with a sliding window over the cache of the `RATE_LIMITS` setting.
+
+    Each key has a counter per fixed window, incremented atomically by the cache.
+    The attempts in the sliding window are estimated from the counter of the
+    current window and the counter of the previous one, weighted by the part of the
+    previous window that is still inside the sliding window. The limits of each key
+    are declared in the scope of the limiter, as `(limit, window in seconds)`.
+
+    The cache must be shared by all the processes of the server to limit the
+    attempts across them, the default local memory cache limits them per process.
+    """
+
+    prefix = "ratelimit"
+
+    def __init__(self, scope: str) -> None:
+        self.scope = scope
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return settings.RATE_LIMITS
+
+    def _get_cache(self) -> BaseCache:
+        return caches[self.config["CACHE_ALIAS"]]
+
+    def _get_rules(
+        self, keys: Dict[str, str]
+    ) -> List[Tuple[str, str, int, int, float]]:
+        """
+        Returns the cache keys of the current and previous windows of each key, along
+        with its limit and window.
+        """
+
+        limits = self.config["SCOPES"][self.scope]
+        now = time.time()
+        rules = []
+
+        for name, value in keys.items():
+            if not value:
+                continue
+
+            limit, window = limits[name]
+            # The values are hashed, they may be emails or other user input
+            digest = hashlib.sha256(
+                str(value).strip().lower().encode()
+            ).hexdigest()
+            key = f"{self.prefix}:{self.scope}:{name}:{digest}"
+            current = int(now // window)
+            rules.append(
+                (f"{key}:{current}", f"{key}:{current - 1}", limit, window, now)
+            )
+
+        return rules
+
+    @staticmethod
+    def _get_wait(
+        current: int, previous: int, limit: int, window: int, now: float
+    ) -> int | None:
+        """
+        Returns the seconds until the estimated attempts in the sliding window are
+        below the limit, `None` if they already are.
+        """
+
+        offset = now % window
+        weight = 1 - offset / window
+
+        if current + previous * weight <= limit:
+            return None
+
+        if current >= limit or not previous:
+            wait = window - offset
+        else:
+            # The weight of the previous window at which the limit is reached
+            wait = (1 - (limit - current) / previous) * window - offset
+
+        return max(ceil(wait), 1)
+
+    def _raise(self, waits: List[int | None]) -> None:
+        waits = [wait for wait in waits if wait is not None]
+
+        if waits:
+            raise ThrottledAPIError(wait=max(waits))
+
+    def check(self, **keys: str) -> None:
+        """
+        Counts an attempt for each of the given keys, rejecting it if any of them has
+        exceeded its limit. The throttled attempts are counted too, so a client that
+        keeps retrying stays throttled.
+
+        #### Parameters:
+        - keys: The values to limit by the name of their limit in the scope, the
+        empty values are ignored.
+
+        #### Raises:
+        - ThrottledAPIError: If the attempt is throttled.
+        """
+
+        if not self.config["ENABLED"]:
+            return
+
+        cache = self._get_cache()
+        waits = []
+
+        for current_key, previous_key, limit, window, now in self._get_rules(keys):
+            # Twice the window, the counter is read as the previous window
+            cache.add(current_key, 0, timeout=2 * window)
+
+            try:
+                current = cache.incr(current_key)
+            except ValueError:
+                # The counter expired between both calls
+                cache.set(current_key, 1, timeout=2 * window)
+                current = 1
+
+            previous = cache.get(previous_key, 0)
+            waits.append(self._get_wait(current, previous, limit, window, now))
+
+        self._raise(waits=waits)
+
+    async def acheck(self, **keys: str) -> None:
+        """
+        Async counterpart of `check`.
+
+        #### Parameters:
+        - keys: The values to limit by the name of their limit in the scope, the
+        empty values are ignored.
+
+        #### Raises:
+        - ThrottledAPIError: If the attempt is throttled.
+        """
+
+        if not self.config["ENABLED"]:
+            return
+
+        cache = self._get_cache()
+        waits = []
+
+        for current_key, previous_key, limit, window, now in self._get_rules(keys):
+            await cache.aadd(current_key, 0, timeout=2 * window)
+
+            try:
+                current = await cache.aincr(current_key)
+            except ValueError:
+                await cache.aset(current_key, 1, timeout=2 * window)
+                current = 1
+
+            previous = await cache.aget(previous_key, 0)
+            waits.append(self._get_wait(current, previous, limit, window, now))
+
+        self._raise(waits=waits)
@@ -1,12 +1,22 @@
 from apps.api_exceptions import (
+    APIException,
     NotAuthenticatedAPIError,
     PermissionDeniedAPIError,
 )
+from utils.exceptions import get_api_exception_data
+from utils.renderers import JSONRenderer
 from rest_framework.serializers import Serializer
 from rest_framework.request import Request
 from rest_framework.permissions import BasePermission
 from rest_framework.generics import GenericAPIView
+from rest_framework import status
+from django.contrib.auth.models import AnonymousUser
+from django.views.decorators.csrf import csrf_exempt
+from django.http.request import HttpRequest
+from django.http.response import HttpResponse
+from django.views.generic import View
 from typing import Dict, List, Any, Callable
+import json
 
 
 class MethodHTTPMapped:
@@ -17,7 +27,9 @@ class MethodHTTPMapped:
     This class configures a view so that it can have different behavior based on
     the HTTP method of the request. For example, you might want to use different
     serializers for GET and POST requests, or apply different permissions for
-    different methods.
+    different methods. It can also declare the maximum number of database queries
+    that each method is expected to execute, which is checked by
+    `apps.monitoring.middleware.QueryBudgetMiddleware`.
 
     Any class that inherits from MethodHTTPMapped must also inherit from GenericAPIView.
     """
@@ -26,6 +38,7 @@ class MethodHTTPMapped:
     authentication_mapping: Dict[str, Any]
     permission_mapping: Dict[str, Any]
     serializer_mapping: Dict[str, Any]
+    query_budget_mapping: Dict[str, int]
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -139,3 +152,117 @@ class PermissionMixin:
                     message=getattr(permission, "message", None),
                     code=getattr(permission, "code", None),
                 )
+
+
+class AsyncAPIView(View):
+    """
+    Base class for async API views.
+
+    Django REST framework does not support async views, so this class provides the
+    parts of `APIView` used by the API: the JSON data of the request in
+    `request.data`, the authentication, the permissions and the error responses of
+    `utils.exceptions.api_view_exception_handler`. The authentication classes must
+    implement an async `aauthenticate` method, and the handlers of the HTTP methods
+    must be coroutines.
+    """
+
+    authentication_classes: List[Any] = []
+    permission_classes: List[Any] = []
+
+    @classmethod
+    def as_view(cls, **initkwargs) -> Callable:
+        """
+        Returns the view function, exempt from the CSRF check like the views of
+        Django REST framework.
+        """
+
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> HttpResponse:
+        try:
+            request.data = json.loads(request.body or b"{}")
+        except ValueError:
+            return self.response(
+                data={
+                    "code": "invalid_request_data",
+                    "detail": "JSON parse error.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            await self.perform_authentication(request=request)
+            self.check_permissions(request=request)
+
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            data, headers = get_api_exception_data(exc=exc)
+
+            return self.response(
+                data=data, status=exc.status_code, headers=headers
+            )
+
+    async def perform_authentication(self, request: HttpRequest) -> None:
+        """
+        Sets the user and the token of the first authentication class that
+        authenticates the request.
+
+        #### Parameters:
+        - request: The incoming request object.
+        """
+
+        request.user, request.auth = AnonymousUser(), None
+
+        for authentication_class in self.authentication_classes:
+            user_auth = await authentication_class().aauthenticate(request)
+
+            if user_auth is not None:
+                request.user, request.auth = user_auth
+                return
+
+    def check_permissions(self, request: HttpRequest) -> None:
+        """
+        Check if the request should be permitted. Raises an appropriate exception
+        if the request is not permitted.
+
+        #### Parameters:
+        - request: The incoming request object.
+        """
+
+        for permission_class in self.permission_classes:
+            permission = permission_class()
+
+            if permission.has_permission(request=request, view=self):
+                continue
+            elif self.authentication_classes and request.auth is None:
+                raise NotAuthenticatedAPIError()
+
+            raise PermissionDeniedAPIError(
+                detail=getattr(permission, "message", None),
+                code=getattr(permission, "code", None),
+            )
+
+    @staticmethod
+    def response(
+        data: Dict[str, Any] = None,
+        status: int = status.HTTP_200_OK,
+        headers: Dict[str, str] = None,
+    ) -> HttpResponse:
+        """
+        Returns a JSON response with the given data, rendered with the same renderer
+        as the responses of Django REST framework.
+
+        #### Parameters:
+        - data: The data of the response.
+        - status: The status code of the response.
+        - headers: The headers of the response.
+        """
+
+        return HttpResponse(
+            content=JSONRenderer().render(data=data),
+            status=status,
+            headers=headers,
+            content_type="application/json",
+        )